@@ -0,0 +1,17 @@
+"""
+Configuración de la aplicación de analytics
+"""
+
+from django.apps import AppConfig
+
+
+class AnalyticsConfig(AppConfig):
+    name = "apps.analytics"
+    label = "analytics"
+
+    def ready(self):
+        # Captura de consultas lentas en todas las conexiones (requests,
+        # pools de hilos y comandos); no hace nada si el umbral es 0
+        from apps.analytics.infrastructure.metricas import ConsultasLentas
+
+        ConsultasLentas.instalar()
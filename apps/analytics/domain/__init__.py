@@ -11,6 +11,8 @@ from .enums import (
     Departamento,
     ModeloIA,
     CalidadLogo,
+    EstadoJobReporte,
+    OperacionCambio,
 )
 
 # Entidades principales
@@ -22,6 +24,7 @@ from .entities.historial_estado_marca import HistorialEstadoMarca
 # Entidades agregadas
 from .entities.dashboard_data import DashboardData
 from .entities.reporte_data import ReporteData
+from .entities.reporte_job import ReporteJob
 
 # Interfaces de repositorios
 from .repositories.marca_repository import MarcaGanadoBovinoRepository
@@ -30,6 +33,7 @@ from .repositories.kpi_repository import KPIGanadoBovinoRepository
 from .repositories.historial_repository import HistorialEstadoMarcaRepository
 from .repositories.dashboard_repository import DashboardRepository
 from .repositories.reporte_repository import ReporteRepository
+from .repositories.reporte_job_repository import ReporteJobRepository
 
 __all__ = [
     # Enumeraciones
@@ -39,6 +43,8 @@ __all__ = [
     "Departamento",
     "ModeloIA",
     "CalidadLogo",
+    "EstadoJobReporte",
+    "OperacionCambio",
     # Entidades principales
     "MarcaGanadoBovino",
     "LogoMarcaBovina",
@@ -47,6 +53,7 @@ __all__ = [
     # Entidades agregadas
     "DashboardData",
     "ReporteData",
+    "ReporteJob",
     # Interfaces de repositorios
     "MarcaGanadoBovinoRepository",
     "LogoMarcaBovinaRepository",
@@ -54,4 +61,5 @@ __all__ = [
     "HistorialEstadoMarcaRepository",
     "DashboardRepository",
     "ReporteRepository",
+    "ReporteJobRepository",
 ]
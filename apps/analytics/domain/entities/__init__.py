@@ -9,6 +9,7 @@ from .kpi_ganado_bovino import KPIGanadoBovino
 from .historial_estado_marca import HistorialEstadoMarca
 from .dashboard_data import DashboardData
 from .reporte_data import ReporteData
+from .reporte_job import ReporteJob
 
 __all__ = [
     "MarcaGanadoBovino",
@@ -17,4 +18,5 @@ __all__ = [
     "HistorialEstadoMarca",
     "DashboardData",
     "ReporteData",
+    "ReporteJob",
 ]
@@ -0,0 +1,74 @@
+# apps/analytics/domain/entities/reporte_job.py
+"""
+Entidad de dominio para trabajos asíncronos de reportes
+Representa la solicitud de un reporte que se genera fuera del request HTTP
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..enums import EstadoJobReporte
+
+
+@dataclass
+class ReporteJob:
+    """
+    Entidad de dominio para trabajos asíncronos de reportes
+    Representa la solicitud de un reporte que se genera fuera del request HTTP
+    """
+
+    tipo_reporte: str
+    parametros: Dict[str, Any] = field(default_factory=dict)
+    estado: EstadoJobReporte = EstadoJobReporte.PENDIENTE
+    progreso: int = 0
+    firma: str = ""
+    usuario_solicitante: Optional[str] = None
+    mensaje_error: Optional[str] = None
+
+    # Resultado almacenado en ReporteData
+    reporte_id: Optional[int] = None
+
+    # Tiempos de ejecución
+    fecha_creacion: Optional[datetime] = None
+    fecha_inicio_ejecucion: Optional[datetime] = None
+    fecha_fin_ejecucion: Optional[datetime] = None
+
+    # ID para persistencia (opcional)
+    id: Optional[int] = None
+
+    def __post_init__(self):
+        """Validaciones de dominio"""
+        if not self.tipo_reporte:
+            raise ValueError("El tipo de reporte es requerido")
+
+        if not 0 <= self.progreso <= 100:
+            raise ValueError("El progreso debe estar entre 0 y 100")
+
+        if not self.firma:
+            self.firma = self.calcular_firma(self.tipo_reporte, self.parametros)
+
+    @staticmethod
+    def calcular_firma(tipo_reporte: str, parametros: Dict[str, Any]) -> str:
+        """Hash estable de tipo y parámetros para detectar trabajos idénticos"""
+        contenido = json.dumps(
+            {"tipo_reporte": tipo_reporte, "parametros": parametros},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(contenido.encode("utf-8")).hexdigest()
+
+    @property
+    def esta_en_curso(self) -> bool:
+        """Retorna True si el trabajo todavía no terminó"""
+        return self.estado in EstadoJobReporte.en_curso()
+
+    @property
+    def duracion_segundos(self) -> Optional[float]:
+        """Duración de la ejecución si ya comenzó"""
+        if not self.fecha_inicio_ejecucion:
+            return None
+        fin = self.fecha_fin_ejecucion or datetime.now()
+        return (fin - self.fecha_inicio_ejecucion).total_seconds()
@@ -20,6 +20,10 @@ class EstadoMarca(Enum):
         """Retorna las opciones para Django forms"""
         return [(member.value, member.value) for member in cls]
 
+    def display_name(self):
+        """Nombre legible para respuestas de la API"""
+        return self.value.replace("_", " ").title()
+
 
 class RazaBovino(Enum):
     """Razas de ganado bovino"""
@@ -42,6 +46,10 @@ class RazaBovino(Enum):
         """Retorna las opciones para Django forms"""
         return [(member.value, member.value) for member in cls]
 
+    def display_name(self):
+        """Nombre legible para respuestas de la API"""
+        return self.value.replace("_", " ").title()
+
 
 class PropositoGanado(Enum):
     """Propósitos del ganado bovino"""
@@ -56,6 +64,10 @@ class PropositoGanado(Enum):
         """Retorna las opciones para Django forms"""
         return [(member.value, member.value) for member in cls]
 
+    def display_name(self):
+        """Nombre legible para respuestas de la API"""
+        return self.value.replace("_", " ").title()
+
 
 class Departamento(Enum):
     """Departamentos de Bolivia"""
@@ -75,6 +87,10 @@ class Departamento(Enum):
         """Retorna las opciones para Django forms"""
         return [(member.value, member.value) for member in cls]
 
+    def display_name(self):
+        """Nombre legible para respuestas de la API"""
+        return self.value.replace("_", " ").title()
+
 
 class ModeloIA(Enum):
     """Modelos de IA para generación de logos"""
@@ -91,6 +107,10 @@ class ModeloIA(Enum):
         """Retorna las opciones para Django forms"""
         return [(member.value, member.value) for member in cls]
 
+    def display_name(self):
+        """Nombre legible para respuestas de la API (el nombre comercial)"""
+        return self.value.replace("_", " ")
+
 
 class CalidadLogo(Enum):
     """Calidades de logos generados"""
@@ -103,3 +123,39 @@ class CalidadLogo(Enum):
     def choices(cls):
         """Retorna las opciones para Django forms"""
         return [(member.value, member.value) for member in cls]
+
+    def display_name(self):
+        """Nombre legible para respuestas de la API"""
+        return self.value.replace("_", " ").title()
+
+
+class EstadoJobReporte(Enum):
+    """Estados de un trabajo asíncrono de generación de reportes"""
+
+    PENDIENTE = "PENDIENTE"
+    EN_PROCESO = "EN_PROCESO"
+    COMPLETADO = "COMPLETADO"
+    FALLIDO = "FALLIDO"
+
+    @classmethod
+    def choices(cls):
+        """Retorna las opciones para Django forms"""
+        return [(member.value, member.value) for member in cls]
+
+    @classmethod
+    def en_curso(cls):
+        """Estados en los que el trabajo todavía no terminó"""
+        return [cls.PENDIENTE, cls.EN_PROCESO]
+
+
+class OperacionCambio(Enum):
+    """Operaciones registradas en el outbox de cambios"""
+
+    CREAR = "CREAR"
+    ACTUALIZAR = "ACTUALIZAR"
+    ELIMINAR = "ELIMINAR"
+
+    @classmethod
+    def choices(cls):
+        """Retorna las opciones para Django forms"""
+        return [(member.value, member.value) for member in cls]
@@ -9,6 +9,7 @@ from .kpi_repository import KPIGanadoBovinoRepository
 from .historial_repository import HistorialEstadoMarcaRepository
 from .dashboard_repository import DashboardRepository
 from .reporte_repository import ReporteRepository
+from .reporte_job_repository import ReporteJobRepository
 
 __all__ = [
     "MarcaGanadoBovinoRepository",
@@ -17,4 +18,5 @@ __all__ = [
     "HistorialEstadoMarcaRepository",
     "DashboardRepository",
     "ReporteRepository",
+    "ReporteJobRepository",
 ]
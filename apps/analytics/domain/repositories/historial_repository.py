@@ -4,7 +4,8 @@ Interfaz para repositorio de historial de estados
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date
+from typing import Any, Dict, List, Optional
 
 from ..entities.historial_estado_marca import HistorialEstadoMarca
 
@@ -36,3 +37,25 @@ class HistorialEstadoMarcaRepository(ABC):
     def delete(self, historial_id: int) -> bool:
         """Elimina un registro de historial por ID"""
         pass
+
+    @abstractmethod
+    def obtener_eficiencia_evaluadores(
+        self, fecha_inicio: date, fecha_fin: date
+    ) -> Dict[str, Any]:
+        """
+        Métricas por evaluador (usuario_responsable) en el período: volumen de
+        transiciones, tiempo mediano y p90 desde la transición anterior de la
+        misma marca y mezcla de aprobaciones/rechazos
+        """
+        pass
+
+    @abstractmethod
+    def obtener_feed_actividad(
+        self, desde_secuencia: Optional[int], limite: int, espera_segundos: float
+    ) -> Dict[str, Any]:
+        """
+        Eventos de historial y marcas posteriores a la marca de agua
+        `desde_secuencia`, esperando hasta `espera_segundos` si aún no hay
+        ninguno. Retorna {"eventos": [...], "marca_agua": int}
+        """
+        pass
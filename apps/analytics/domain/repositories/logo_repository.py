@@ -4,6 +4,7 @@ Interfaz para repositorio de logos de marcas bovinas
 """
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import List, Optional, Dict, Any
 
 from ..entities.logo_marca_bovina import LogoMarcaBovina
@@ -51,3 +52,56 @@ class LogoMarcaBovinaRepository(ABC):
     def get_estadisticas_generacion(self) -> Dict[str, Any]:
         """Obtiene estadísticas de generación de logos"""
         pass
+
+    @abstractmethod
+    def generar_en_lote(
+        self, solicitudes: List[Dict[str, Any]], usar_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Genera con el servicio de IA y guarda un logo por solicitud
+        ({"marca_id", "prompt", "modelo_ia": ModeloIA}); los fallos se guardan
+        con exito=False. Con usar_cache se reutilizan logos exitosos con el
+        mismo prompt, modelo y parámetros en vez de llamar a la IA.
+        Retorna {"logos": [LogoMarcaBovina], "metadata": {...}}
+        """
+        pass
+
+    @abstractmethod
+    def obtener_imagen(
+        self, huella_imagen: str, tamaño: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Imagen del almacén local: la original o, con `tamaño`, su miniatura.
+        Retorna {"ruta", "content_type", "etag", "tamaño_bytes"} o None si no
+        existe
+
+        Raises:
+            ValueError: Si el tamaño de miniatura no está permitido
+        """
+        pass
+
+    @abstractmethod
+    def obtener_percentiles_latencia(
+        self,
+        fecha_inicio: Optional[date] = None,
+        fecha_fin: Optional[date] = None,
+        por_dia: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Percentiles del tiempo de generación por modelo de IA (y por día con
+        por_dia) en el período inclusive: {"modelo_ia_usado", ["fecha"],
+        "muestras", "tiempo_promedio", "latencia_p50", "latencia_p90",
+        "latencia_p99"}. Excluye los logos reutilizados del cache de prompts.
+        """
+        pass
+
+    @abstractmethod
+    def obtener_analisis_prompts(
+        self, min_soporte: int, limite: int, termino: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Términos de los prompts más asociados a fallos y a calidad alta/baja
+        (lift y z contra la tasa global) usando el índice invertido; con
+        `termino`, agrega su detalle y los ids de sus logos fallidos
+        """
+        pass
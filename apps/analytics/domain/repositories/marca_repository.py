@@ -99,3 +99,10 @@ class MarcaGanadoBovinoRepository(ABC):
     def get_estadisticas_por_proposito(self) -> Dict[str, Any]:
         """Obtiene estadísticas agrupadas por propósito"""
         pass
+
+    @abstractmethod
+    def list_sin_logo(
+        self, limit: int = 100, departamento: Optional[Departamento] = None
+    ) -> List[MarcaGanadoBovino]:
+        """Lista marcas que todavía no tienen ningún logo (las más antiguas primero)"""
+        pass
@@ -0,0 +1,74 @@
+# apps/analytics/domain/repositories/reporte_job_repository.py
+"""
+Interfaz para repositorio de trabajos asíncronos de reportes
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Tuple
+
+from ..entities.reporte_job import ReporteJob
+
+
+class ReporteJobRepository(ABC):
+    """Interfaz para repositorio de trabajos asíncronos de reportes"""
+
+    @abstractmethod
+    def crear(self, job: ReporteJob) -> ReporteJob:
+        """Registra un nuevo trabajo"""
+        pass
+
+    @abstractmethod
+    def obtener_por_id(self, job_id: int) -> Optional[ReporteJob]:
+        """Obtiene un trabajo por ID"""
+        pass
+
+    @abstractmethod
+    def crear_o_reutilizar(
+        self, job: ReporteJob, creado_desde: datetime
+    ) -> Tuple[ReporteJob, bool]:
+        """
+        Registra el trabajo salvo que uno idéntico creado desde `creado_desde`
+        siga en curso; retorna (trabajo, True si se creó)
+        """
+        pass
+
+    @abstractmethod
+    def fallar_en_curso_anteriores(self, antes_de: datetime, mensaje_error: str) -> int:
+        """Marca como fallidos los trabajos en curso creados antes de `antes_de`"""
+        pass
+
+    @abstractmethod
+    def marcar_en_proceso(self, job_id: int) -> None:
+        """Marca el inicio de la ejecución"""
+        pass
+
+    @abstractmethod
+    def actualizar_progreso(self, job_id: int, progreso: int) -> None:
+        """Actualiza el porcentaje de avance"""
+        pass
+
+    @abstractmethod
+    def marcar_completado(
+        self,
+        job_id: int,
+        datos: Dict[str, Any],
+        periodo_inicio: date,
+        periodo_fin: date,
+        crear_reporte: bool = True,
+    ) -> ReporteJob:
+        """
+        Almacena el resultado en ReporteData (o en el propio trabajo si
+        crear_reporte es False) y marca el trabajo completado
+        """
+        pass
+
+    @abstractmethod
+    def marcar_fallido(self, job_id: int, mensaje_error: str) -> None:
+        """Marca el trabajo como fallido"""
+        pass
+
+    @abstractmethod
+    def obtener_resultado(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """Obtiene los datos del reporte (o el resultado) del trabajo"""
+        pass
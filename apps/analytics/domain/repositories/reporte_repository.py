@@ -4,7 +4,7 @@ Interfaz para repositorio de reportes
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import date
 
 from ..entities.reporte_data import ReporteData
@@ -34,3 +34,30 @@ class ReporteRepository(ABC):
     def generar_reporte_personalizado(self, filtros: Dict[str, Any]) -> ReporteData:
         """Genera reporte personalizado según filtros"""
         pass
+
+    @abstractmethod
+    def consultar_reporte_personalizado(
+        self, especificacion: Dict[str, Any]
+    ) -> ReporteData:
+        """Ejecuta una especificación de filtros, métricas y agrupaciones"""
+        pass
+
+    @abstractmethod
+    def exportar_datos_excel(
+        self,
+        fecha_inicio: date,
+        fecha_fin: date,
+        filtros: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Exporta los datos del periodo a un archivo Excel"""
+        pass
+
+    @abstractmethod
+    def renderizar_pdf(self, reporte_id: int) -> Dict[str, Any]:
+        """Genera (o reutiliza) el PDF de un reporte almacenado"""
+        pass
+
+    @abstractmethod
+    def obtener_pdf(self, reporte_id: int) -> Optional[Dict[str, Any]]:
+        """Obtiene el PDF ya generado del reporte, si existe"""
+        pass
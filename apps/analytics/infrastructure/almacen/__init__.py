@@ -0,0 +1,18 @@
+"""
+Almacén local de imágenes para la aplicación de analytics
+Logos direccionados por contenido y miniaturas generadas bajo demanda
+"""
+
+from .almacen_logos import (
+    AlmacenLogos,
+    ArchivoImagen,
+    ErrorAlmacenLogos,
+)
+from .importador_imagenes import ImportadorImagenesLogos
+
+__all__ = [
+    "AlmacenLogos",
+    "ArchivoImagen",
+    "ErrorAlmacenLogos",
+    "ImportadorImagenesLogos",
+]
@@ -0,0 +1,219 @@
+"""
+Almacén local de imágenes de logos direccionado por contenido
+Responsabilidad única: Guardar cada imagen una sola vez bajo el SHA-256 de sus
+bytes y generar miniaturas bajo demanda, cacheadas en disco
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, Tuple
+
+import requests
+from django.conf import settings
+
+PATRON_HUELLA = re.compile(r"^[0-9a-f]{64}$")
+
+# Formato de Pillow -> (extensión, content type)
+FORMATOS = {
+    "PNG": ("png", "image/png"),
+    "JPEG": ("jpg", "image/jpeg"),
+    "WEBP": ("webp", "image/webp"),
+    "GIF": ("gif", "image/gif"),
+}
+
+
+class ErrorAlmacenLogos(Exception):
+    """La imagen no se pudo descargar o no es una imagen válida"""
+
+
+@dataclass(frozen=True)
+class ArchivoImagen:
+    """Archivo listo para servir; el contenido nunca cambia para una huella"""
+
+    ruta: Path
+    content_type: str
+    etag: str
+    tamaño_bytes: int
+
+
+class AlmacenLogos:
+    """
+    Imágenes en LOGOS_ALMACEN_DIR
+
+    originales/<ab>/<sha256>.<ext> guarda la imagen tal como llegó: dos logos con
+    los mismos bytes (p. ej. los reutilizados del cache de prompts) comparten el
+    archivo. miniaturas/<lado>/<ab>/<sha256>.<ext> se genera con Pillow la
+    primera vez que se pide un lado de LOGOS_MINIATURAS_TAMAÑOS. Las escrituras
+    van a un temporal que luego se renombra, así que un lector nunca ve un
+    archivo a medias; un lock por prefijo evita generar dos veces la misma
+    miniatura en el proceso. Pillow se importa recién al validar o redimensionar.
+    """
+
+    TAMAÑOS_MINIATURA = (64, 128, 256, 512)
+    _locks = [threading.Lock() for _ in range(64)]
+
+    def __init__(self, directorio: Optional[Path] = None):
+        self.directorio = Path(
+            directorio
+            or getattr(
+                settings, "LOGOS_ALMACEN_DIR", Path(settings.MEDIA_ROOT) / "logos"
+            )
+        )
+        self.tamaños = tuple(
+            getattr(settings, "LOGOS_MINIATURAS_TAMAÑOS", self.TAMAÑOS_MINIATURA)
+        )
+        self.formato_miniatura = getattr(settings, "LOGOS_MINIATURAS_FORMATO", "WEBP")
+        self.tamaño_maximo = getattr(
+            settings, "LOGOS_TAMAÑO_MAXIMO_BYTES", 10 * 1024 * 1024
+        )
+        self.timeout = getattr(settings, "LOGOS_DESCARGA_TIMEOUT_SEGUNDOS", 30)
+
+    # ------------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------------
+
+    def guardar(self, contenido: bytes) -> Tuple[str, bool]:
+        """
+        Guarda la imagen si no existía
+
+        Returns:
+            Tuple[str, bool]: (huella, True si ya estaba en el almacén)
+
+        Raises:
+            ErrorAlmacenLogos: Si el contenido no es una imagen soportada
+        """
+        huella = hashlib.sha256(contenido).hexdigest()
+        if self._buscar_original(huella):
+            return huella, True
+
+        extension, _ = FORMATOS[self._validar(contenido)]
+        ruta = self._ruta("originales", huella, extension)
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        _escribir_atomico(ruta, contenido)
+        return huella, False
+
+    def importar_url(self, url: str, sesion=None) -> Tuple[str, bool]:
+        """Descarga la imagen (hasta LOGOS_TAMAÑO_MAXIMO_BYTES) y la guarda"""
+        try:
+            with (sesion or requests).get(
+                url, stream=True, timeout=self.timeout
+            ) as respuesta:
+                respuesta.raise_for_status()
+                contenido = bytearray()
+                for bloque in respuesta.iter_content(64 * 1024):
+                    contenido.extend(bloque)
+                    if len(contenido) > self.tamaño_maximo:
+                        raise ErrorAlmacenLogos(
+                            f"Imagen mayor a {self.tamaño_maximo} bytes: {url}"
+                        )
+        except requests.RequestException as e:
+            raise ErrorAlmacenLogos(f"{type(e).__name__}: {e}")
+        return self.guardar(bytes(contenido))
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    def original(self, huella: str) -> Optional[ArchivoImagen]:
+        """Imagen original o None si no está en el almacén"""
+        ruta = self._buscar_original(huella)
+        if ruta is None:
+            return None
+        return self._archivo(ruta, f'"{huella}"')
+
+    def miniatura(self, huella: str, lado: int) -> Optional[ArchivoImagen]:
+        """
+        Miniatura de `lado` píxeles (el lado mayor), generándola si hace falta
+
+        Raises:
+            ValueError: Si `lado` no está en LOGOS_MINIATURAS_TAMAÑOS
+        """
+        if lado not in self.tamaños:
+            raise ValueError(
+                f"Tamaño de miniatura no válido: {lado}. "
+                f"Opciones: {', '.join(map(str, self.tamaños))}"
+            )
+        extension, _ = FORMATOS[self.formato_miniatura]
+        ruta = self._ruta(f"miniaturas/{lado}", huella, extension)
+        if not ruta.exists():
+            with self._locks[int(huella[:2], 16) % len(self._locks)]:
+                if not ruta.exists():
+                    original = self._buscar_original(huella)
+                    if original is None:
+                        return None
+                    ruta.parent.mkdir(parents=True, exist_ok=True)
+                    _escribir_atomico(ruta, self._redimensionar(original, lado))
+        return self._archivo(ruta, f'"{huella}-{lado}"')
+
+    # ------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------
+
+    def _ruta(self, carpeta: str, huella: str, extension: str) -> Path:
+        return self.directorio / carpeta / huella[:2] / f"{huella}.{extension}"
+
+    def _buscar_original(self, huella: str) -> Optional[Path]:
+        if not PATRON_HUELLA.match(huella):
+            return None
+        for extension, _ in FORMATOS.values():
+            ruta = self._ruta("originales", huella, extension)
+            if ruta.exists():
+                return ruta
+        return None
+
+    @staticmethod
+    def _archivo(ruta: Path, etag: str) -> ArchivoImagen:
+        extension = ruta.suffix.lstrip(".")
+        content_type = next(tipo for ext, tipo in FORMATOS.values() if ext == extension)
+        return ArchivoImagen(ruta, content_type, etag, ruta.stat().st_size)
+
+    @staticmethod
+    def _validar(contenido: bytes) -> str:
+        """Retorna el formato de Pillow si el contenido es una imagen soportada"""
+        from PIL import Image, UnidentifiedImageError
+
+        try:
+            with Image.open(BytesIO(contenido)) as imagen:
+                imagen.verify()
+                formato = imagen.format
+        except (
+            UnidentifiedImageError,
+            Image.DecompressionBombError,
+            OSError,
+            SyntaxError,
+        ) as e:
+            raise ErrorAlmacenLogos(f"Contenido no es una imagen válida: {e}")
+        if formato not in FORMATOS:
+            raise ErrorAlmacenLogos(f"Formato de imagen no soportado: {formato}")
+        return formato
+
+    def _redimensionar(self, original: Path, lado: int) -> bytes:
+        from PIL import Image
+
+        with Image.open(original) as imagen:
+            imagen.draft("RGB", (lado, lado))
+            if imagen.mode not in ("RGB", "RGBA"):
+                imagen = imagen.convert("RGBA")
+            imagen.thumbnail((lado, lado), Image.Resampling.LANCZOS)
+            salida = BytesIO()
+            imagen.save(salida, format=self.formato_miniatura, optimize=True)
+        return salida.getvalue()
+
+
+def _escribir_atomico(ruta: Path, contenido: bytes) -> None:
+    """Escribe en un temporal y lo renombra para no exponer archivos a medias"""
+    descriptor, temporal = tempfile.mkstemp(dir=ruta.parent, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(contenido)
+        os.replace(temporal, ruta)
+    except Exception:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
@@ -0,0 +1,83 @@
+"""
+Importación de las imágenes de logos al almacén local
+Responsabilidad única: Descargar las URLs externas de los logos exitosos que aún
+no tienen copia local y registrar su huella
+"""
+
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from apps.analytics.infrastructure.models import LogoMarcaBovinaModel
+from .almacen_logos import AlmacenLogos, ErrorAlmacenLogos
+
+
+class ImportadorImagenesLogos:
+    """
+    Descarga en paralelo una vez por URL distinta
+
+    Los logos reutilizados del cache de prompts comparten URL, y URLs distintas
+    con los mismos bytes terminan en el mismo archivo del almacén. La huella se
+    guarda con un UPDATE por URL: es un dato de almacenamiento, no un cambio del
+    logo, por lo que no pasa por save() ni genera eventos de outbox.
+    """
+
+    def __init__(self, almacen: Optional[AlmacenLogos] = None, hilos: int = 8):
+        self.almacen = almacen or AlmacenLogos()
+        self.hilos = max(1, hilos)
+
+    def pendientes(self, limite: int) -> Dict[str, List[int]]:
+        """{url: [ids]} de logos exitosos sin copia local (hasta `limite` logos)"""
+        por_url: Dict[str, List[int]] = defaultdict(list)
+        for logo_id, url_logo in (
+            LogoMarcaBovinaModel.objects.filter(exito=True, huella_imagen__isnull=True)
+            .order_by("id")
+            .values_list("id", "url_logo")[:limite]
+        ):
+            por_url[url_logo].append(logo_id)
+        return por_url
+
+    def importar(self, limite: int = 1000) -> Dict[str, Any]:
+        """Importa hasta `limite` logos y retorna el resumen"""
+        inicio = time.perf_counter()
+        por_url = self.pendientes(limite)
+        sesion = requests.Session()
+        adaptador = HTTPAdapter(pool_maxsize=self.hilos)
+        sesion.mount("http://", adaptador)
+        sesion.mount("https://", adaptador)
+
+        def descargar(url: str):
+            try:
+                return url, self.almacen.importar_url(url, sesion), None
+            except ErrorAlmacenLogos as e:
+                return url, None, str(e)
+
+        resumen: Counter = Counter()
+        errores: Counter = Counter()
+        with ThreadPoolExecutor(
+            max_workers=self.hilos, thread_name_prefix="importar-logos"
+        ) as pool:
+            for url, resultado, error in pool.map(descargar, list(por_url)):
+                if error:
+                    resumen["fallidas"] += 1
+                    errores[error.split(":")[0]] += 1
+                    continue
+                huella, existia = resultado
+                resumen["duplicadas" if existia else "nuevas"] += 1
+                resumen["logos"] += LogoMarcaBovinaModel.objects.filter(
+                    id__in=por_url[url]
+                ).update(huella_imagen=huella)
+
+        return {
+            "urls": len(por_url),
+            "imagenes_nuevas": resumen["nuevas"],
+            "imagenes_duplicadas": resumen["duplicadas"],
+            "urls_fallidas": resumen["fallidas"],
+            "logos_actualizados": resumen["logos"],
+            "errores": dict(errores.most_common(5)),
+            "duracion_segundos": round(time.perf_counter() - inicio, 3),
+        }
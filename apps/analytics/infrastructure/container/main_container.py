@@ -3,6 +3,9 @@ Container principal para inyección de dependencias
 Responsabilidad única: Orquestar containers específicos
 """
 
+import threading
+from typing import Optional
+
 from apps.analytics.infrastructure.container.repositories_container import (
     RepositoriesContainer,
 )
@@ -12,12 +15,36 @@ from apps.analytics.infrastructure.container.use_cases_container import (
 
 
 class MainContainer:
-    """Container principal que orquesta todos los containers específicos"""
+    """
+    Container principal que orquesta todos los containers específicos
+
+    Los controllers usan MainContainer.instancia(): un container por proceso,
+    creado la primera vez, cuyos repositorios y use cases se crean al pedirlos
+    y se reutilizan en los siguientes requests.
+    """
+
+    _instancia: Optional["MainContainer"] = None
+    _instancia_lock = threading.Lock()
 
     def __init__(self):
         self.repositories_container = RepositoriesContainer()
         self.use_cases_container = UseCasesContainer(self.repositories_container)
 
+    @classmethod
+    def instancia(cls) -> "MainContainer":
+        """Obtiene el container compartido del proceso"""
+        if cls._instancia is None:
+            with cls._instancia_lock:
+                if cls._instancia is None:
+                    cls._instancia = cls()
+        return cls._instancia
+
+    @classmethod
+    def reiniciar(cls) -> None:
+        """Descarta el container compartido (p. ej. tras cambiar settings en tests)"""
+        with cls._instancia_lock:
+            cls._instancia = None
+
     # Métodos para repositorios
     def get_marca_repository(self):
         return self.repositories_container.get_marca_repository()
@@ -37,6 +64,9 @@ class MainContainer:
     def get_reporte_repository(self):
         return self.repositories_container.get_reporte_repository()
 
+    def get_reporte_job_repository(self):
+        return self.repositories_container.get_reporte_job_repository()
+
     # Métodos para use cases de marca
     def get_crear_marca_use_case(self):
         return self.use_cases_container.get_crear_marca_use_case()
@@ -63,6 +93,15 @@ class MainContainer:
     def get_generar_logo_use_case(self):
         return self.use_cases_container.get_generar_logo_use_case()
 
+    def get_generar_logos_masivo_use_case(self):
+        return self.use_cases_container.get_generar_logos_masivo_use_case()
+
+    def get_regenerar_logo_use_case(self):
+        return self.use_cases_container.get_regenerar_logo_use_case()
+
+    def get_obtener_imagen_logo_use_case(self):
+        return self.use_cases_container.get_obtener_imagen_logo_use_case()
+
     def get_obtener_logo_use_case(self):
         return self.use_cases_container.get_obtener_logo_use_case()
 
@@ -114,6 +153,9 @@ class MainContainer:
     def get_obtener_eficiencia_evaluadores_use_case(self):
         return self.use_cases_container.get_obtener_eficiencia_evaluadores_use_case()
 
+    def get_obtener_feed_actividad_use_case(self):
+        return self.use_cases_container.get_obtener_feed_actividad_use_case()
+
     # Métodos para use cases de reporte
     def get_generar_reporte_mensual_use_case(self):
         return self.use_cases_container.get_generar_reporte_mensual_use_case()
@@ -129,6 +171,9 @@ class MainContainer:
     def get_generar_reporte_personalizado_use_case(self):
         return self.use_cases_container.get_generar_reporte_personalizado_use_case()
 
+    def get_consultar_reporte_personalizado_use_case(self):
+        return self.use_cases_container.get_consultar_reporte_personalizado_use_case()
+
     def get_exportar_reporte_excel_use_case(self):
         return self.use_cases_container.get_exportar_reporte_excel_use_case()
 
@@ -146,6 +191,15 @@ class MainContainer:
     def get_generar_reporte_sostenibilidad_use_case(self):
         return self.use_cases_container.get_generar_reporte_sostenibilidad_use_case()
 
+    def get_encolar_reporte_job_use_case(self):
+        return self.use_cases_container.get_encolar_reporte_job_use_case()
+
+    def get_obtener_reporte_job_use_case(self):
+        return self.use_cases_container.get_obtener_reporte_job_use_case()
+
+    def get_obtener_reporte_pdf_use_case(self):
+        return self.use_cases_container.get_obtener_reporte_pdf_use_case()
+
     # Métodos para use cases de data generation
     def get_generar_datos_mockaroo_use_case(self):
         return self.use_cases_container.get_generar_datos_mockaroo_use_case()
@@ -3,80 +3,106 @@ Container para configuración de repositorios
 Responsabilidad única: Configurar e inyectar repositorios
 """
 
-from typing import Dict, Any
-from apps.analytics.domain.repositories.marca_repository import (
-    MarcaGanadoBovinoRepository,
-)
-from apps.analytics.domain.repositories.logo_repository import LogoMarcaBovinaRepository
-from apps.analytics.domain.repositories.kpi_repository import KPIGanadoBovinoRepository
-from apps.analytics.domain.repositories.historial_repository import (
-    HistorialEstadoMarcaRepository,
-)
-from apps.analytics.domain.repositories.dashboard_repository import DashboardRepository
-from apps.analytics.domain.repositories.reporte_repository import ReporteRepository
-
-from apps.analytics.infrastructure.repositories.marca_repository import (
-    DjangoMarcaRepository,
-)
-from apps.analytics.infrastructure.repositories.logo_repository import (
-    DjangoLogoRepository,
-)
-from apps.analytics.infrastructure.repositories.kpi_repository import (
-    DjangoKpiRepository,
-)
-from apps.analytics.infrastructure.repositories.historial_repository import (
-    DjangoHistorialRepository,
-)
-from apps.analytics.infrastructure.repositories.dashboard_repository import (
-    DjangoDashboardRepository,
-)
-from apps.analytics.infrastructure.repositories.reporte_repository import (
-    DjangoReporteRepository,
-)
+import threading
+from typing import TYPE_CHECKING, Any, Dict
+
+from django.utils.module_loading import import_string
+
+if TYPE_CHECKING:
+    from apps.analytics.domain.repositories.dashboard_repository import (
+        DashboardRepository,
+    )
+    from apps.analytics.domain.repositories.historial_repository import (
+        HistorialEstadoMarcaRepository,
+    )
+    from apps.analytics.domain.repositories.kpi_repository import (
+        KPIGanadoBovinoRepository,
+    )
+    from apps.analytics.domain.repositories.logo_repository import (
+        LogoMarcaBovinaRepository,
+    )
+    from apps.analytics.domain.repositories.marca_repository import (
+        MarcaGanadoBovinoRepository,
+    )
+    from apps.analytics.domain.repositories.reporte_job_repository import (
+        ReporteJobRepository,
+    )
+    from apps.analytics.domain.repositories.reporte_repository import (
+        ReporteRepository,
+    )
+
+_REPOSITORIOS = "apps.analytics.infrastructure.repositories"
+
+# Implementación de cada repositorio; se importa la primera vez que se pide
+PROVEEDORES_REPOSITORIOS: Dict[str, str] = {
+    "marca_repository": f"{_REPOSITORIOS}.marca_repository.DjangoMarcaRepository",
+    "logo_repository": f"{_REPOSITORIOS}.logo_repository.DjangoLogoRepository",
+    "kpi_repository": f"{_REPOSITORIOS}.kpi_repository.DjangoKpiRepository",
+    "historial_repository": (
+        f"{_REPOSITORIOS}.historial_repository.DjangoHistorialRepository"
+    ),
+    "dashboard_repository": (
+        f"{_REPOSITORIOS}.dashboard_repository.DjangoDashboardRepository"
+    ),
+    "reporte_repository": f"{_REPOSITORIOS}.reporte_repository.DjangoReporteRepository",
+    "reporte_job_repository": (
+        f"{_REPOSITORIOS}.reporte_job_repository.DjangoReporteJobRepository"
+    ),
+}
 
 
 class RepositoriesContainer:
-    """Container específico para repositorios"""
+    """
+    Container específico para repositorios
+
+    Los repositorios no guardan estado entre llamadas: cada uno se crea la
+    primera vez que se pide y se reutiliza. La creación se protege con un lock
+    para que dos hilos no creen el mismo repositorio a la vez.
+    """
 
     def __init__(self):
         self._repositories: Dict[str, Any] = {}
-        self._configure_repositories()
-
-    def _configure_repositories(self):
-        """Configura las implementaciones de repositorios"""
-        self._repositories = {
-            "marca_repository": DjangoMarcaRepository(),
-            "logo_repository": DjangoLogoRepository(),
-            "kpi_repository": DjangoKpiRepository(),
-            "historial_repository": DjangoHistorialRepository(),
-            "dashboard_repository": DjangoDashboardRepository(),
-            "reporte_repository": DjangoReporteRepository(),
-        }
-
-    def get_marca_repository(self) -> MarcaGanadoBovinoRepository:
+        self._lock = threading.RLock()
+
+    def obtener(self, nombre: str) -> Any:
+        """Obtiene (y crea si hace falta) el repositorio `nombre`"""
+        repositorio = self._repositories.get(nombre)
+        if repositorio is None:
+            with self._lock:
+                repositorio = self._repositories.get(nombre)
+                if repositorio is None:
+                    repositorio = import_string(PROVEEDORES_REPOSITORIOS[nombre])()
+                    self._repositories[nombre] = repositorio
+        return repositorio
+
+    def get_marca_repository(self) -> "MarcaGanadoBovinoRepository":
         """Obtiene el repositorio de marcas"""
-        return self._repositories["marca_repository"]
+        return self.obtener("marca_repository")
 
-    def get_logo_repository(self) -> LogoMarcaBovinaRepository:
+    def get_logo_repository(self) -> "LogoMarcaBovinaRepository":
         """Obtiene el repositorio de logos"""
-        return self._repositories["logo_repository"]
+        return self.obtener("logo_repository")
 
-    def get_kpi_repository(self) -> KPIGanadoBovinoRepository:
+    def get_kpi_repository(self) -> "KPIGanadoBovinoRepository":
         """Obtiene el repositorio de KPIs"""
-        return self._repositories["kpi_repository"]
+        return self.obtener("kpi_repository")
 
-    def get_historial_repository(self) -> HistorialEstadoMarcaRepository:
+    def get_historial_repository(self) -> "HistorialEstadoMarcaRepository":
         """Obtiene el repositorio de historial"""
-        return self._repositories["historial_repository"]
+        return self.obtener("historial_repository")
 
-    def get_dashboard_repository(self) -> DashboardRepository:
+    def get_dashboard_repository(self) -> "DashboardRepository":
         """Obtiene el repositorio de dashboard"""
-        return self._repositories["dashboard_repository"]
+        return self.obtener("dashboard_repository")
 
-    def get_reporte_repository(self) -> ReporteRepository:
+    def get_reporte_repository(self) -> "ReporteRepository":
         """Obtiene el repositorio de reportes"""
-        return self._repositories["reporte_repository"]
+        return self.obtener("reporte_repository")
+
+    def get_reporte_job_repository(self) -> "ReporteJobRepository":
+        """Obtiene el repositorio de trabajos de reportes"""
+        return self.obtener("reporte_job_repository")
 
     def get_all_repositories(self) -> Dict[str, Any]:
         """Obtiene todos los repositorios"""
-        return self._repositories.copy()
+        return {nombre: self.obtener(nombre) for nombre in PROVEEDORES_REPOSITORIOS}
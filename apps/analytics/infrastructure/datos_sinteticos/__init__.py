@@ -0,0 +1,8 @@
+"""
+Datos sintéticos para pruebas de carga y benchmarks
+Marcas, historial, logos, KPIs y reportes reproducibles a partir de una semilla
+"""
+
+from .generador import GeneradorDatosSinteticos
+
+__all__ = ["GeneradorDatosSinteticos"]
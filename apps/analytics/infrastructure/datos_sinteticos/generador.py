@@ -0,0 +1,882 @@
+"""
+Generador de datos sintéticos
+Responsabilidad única: Poblar las tablas de analytics con volúmenes grandes y
+reproducibles (misma semilla y misma fecha de corte, mismos datos)
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from io import StringIO
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+from django.contrib.admin.models import ADDITION, LogEntry
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connections, transaction
+from django.db.models import Max
+
+from apps.analytics.domain.enums import (
+    CalidadLogo,
+    Departamento,
+    EstadoMarca,
+    ModeloIA,
+    OperacionCambio,
+    PropositoGanado,
+    RazaBovino,
+)
+from apps.analytics.infrastructure.models import (
+    EventoOutboxModel,
+    HistogramaLatenciaModel,
+    HistorialEstadoMarcaModel,
+    KPIGanadoBovinoModel,
+    LogoMarcaBovinaModel,
+    MarcaGanadoBovinoModel,
+    ReporteDataModel,
+    TerminoPromptModel,
+)
+from apps.analytics.infrastructure.models.logo_marca_bovina_model import (
+    calcular_huella_prompt,
+)
+
+# Participación de cada departamento en las solicitudes (llanos > altiplano)
+PESOS_DEPARTAMENTO = {
+    Departamento.SANTA_CRUZ: 34,
+    Departamento.BENI: 22,
+    Departamento.LA_PAZ: 9,
+    Departamento.COCHABAMBA: 9,
+    Departamento.CHUQUISACA: 7,
+    Departamento.TARIJA: 7,
+    Departamento.PANDO: 5,
+    Departamento.POTOSI: 4,
+    Departamento.ORURO: 3,
+}
+
+PREFIJOS_DEPARTAMENTO = {
+    Departamento.SANTA_CRUZ: "SC",
+    Departamento.BENI: "BN",
+    Departamento.LA_PAZ: "LP",
+    Departamento.COCHABAMBA: "CB",
+    Departamento.CHUQUISACA: "CH",
+    Departamento.TARIJA: "TJ",
+    Departamento.PANDO: "PD",
+    Departamento.POTOSI: "PT",
+    Departamento.ORURO: "OR",
+}
+
+MUNICIPIOS = {
+    Departamento.SANTA_CRUZ: ["San Ignacio", "Puerto Suárez", "Cotoca", "Warnes"],
+    Departamento.BENI: ["Trinidad", "Riberalta", "San Borja", "Santa Ana"],
+    Departamento.LA_PAZ: ["Achacachi", "Caranavi", "Ixiamas", "Viacha"],
+    Departamento.COCHABAMBA: ["Punata", "Sacaba", "Chapare", "Quillacollo"],
+    Departamento.CHUQUISACA: ["Monteagudo", "Muyupampa", "Padilla"],
+    Departamento.TARIJA: ["Yacuiba", "Bermejo", "Entre Ríos"],
+    Departamento.PANDO: ["Cobija", "Porvenir", "Filadelfia"],
+    Departamento.POTOSI: ["Tupiza", "Villazón", "Uyuni"],
+    Departamento.ORURO: ["Challapata", "Huanuni", "Caracollo"],
+}
+
+# Región de cada departamento: define razas, tamaño de hato y demoras
+REGIONES = {
+    Departamento.SANTA_CRUZ: "llanos",
+    Departamento.BENI: "llanos",
+    Departamento.PANDO: "llanos",
+    Departamento.COCHABAMBA: "valles",
+    Departamento.CHUQUISACA: "valles",
+    Departamento.TARIJA: "valles",
+    Departamento.LA_PAZ: "altiplano",
+    Departamento.POTOSI: "altiplano",
+    Departamento.ORURO: "altiplano",
+}
+
+PESOS_RAZA = {
+    "llanos": {
+        RazaBovino.NELORE: 30,
+        RazaBovino.BRAHMAN: 22,
+        RazaBovino.CRIOLLO: 12,
+        RazaBovino.MIXTO: 10,
+        RazaBovino.GUZERAT: 8,
+        RazaBovino.SANTA_GERTRUDIS: 8,
+        RazaBovino.ANGUS: 4,
+        RazaBovino.CHAROLAIS: 3,
+        RazaBovino.OTRO: 3,
+    },
+    "valles": {
+        RazaBovino.CRIOLLO: 25,
+        RazaBovino.HOLSTEIN: 22,
+        RazaBovino.MIXTO: 15,
+        RazaBovino.SIMMENTAL: 12,
+        RazaBovino.BRAHMAN: 8,
+        RazaBovino.HEREFORD: 6,
+        RazaBovino.ANGUS: 6,
+        RazaBovino.OTRO: 6,
+    },
+    "altiplano": {
+        RazaBovino.CRIOLLO: 40,
+        RazaBovino.HOLSTEIN: 25,
+        RazaBovino.MIXTO: 15,
+        RazaBovino.HEREFORD: 8,
+        RazaBovino.SIMMENTAL: 6,
+        RazaBovino.OTRO: 6,
+    },
+}
+
+# Mediana de cabezas por hato y demora relativa de la oficina regional
+MEDIANA_CABEZAS = {"llanos": 120, "valles": 35, "altiplano": 15}
+FACTOR_DEMORA = {"llanos": 1.0, "valles": 1.2, "altiplano": 1.5}
+
+# Propósito según la raza (las razas cebuinas y europeas de carne, por defecto)
+PESOS_PROPOSITO_CARNE = {
+    PropositoGanado.CARNE: 75,
+    PropositoGanado.REPRODUCCION: 15,
+    PropositoGanado.DOBLE_PROPOSITO: 10,
+}
+PESOS_PROPOSITO = {
+    RazaBovino.HOLSTEIN: {
+        PropositoGanado.LECHE: 80,
+        PropositoGanado.DOBLE_PROPOSITO: 15,
+        PropositoGanado.REPRODUCCION: 5,
+    },
+    RazaBovino.SIMMENTAL: {
+        PropositoGanado.DOBLE_PROPOSITO: 50,
+        PropositoGanado.LECHE: 30,
+        PropositoGanado.CARNE: 20,
+    },
+    RazaBovino.CRIOLLO: {
+        PropositoGanado.DOBLE_PROPOSITO: 45,
+        PropositoGanado.CARNE: 35,
+        PropositoGanado.LECHE: 15,
+        PropositoGanado.REPRODUCCION: 5,
+    },
+    RazaBovino.MIXTO: {
+        PropositoGanado.DOBLE_PROPOSITO: 40,
+        PropositoGanado.CARNE: 40,
+        PropositoGanado.LECHE: 20,
+    },
+}
+
+# Evaluador -> factor sobre la demora de su oficina
+EVALUADORES = {
+    "mrojas": 0.7,
+    "jquispe": 0.9,
+    "lflores": 1.0,
+    "cmamani": 1.1,
+    "avargas": 1.3,
+    "rgutierrez": 1.6,
+}
+
+# Modelo de IA -> (participación, tasa de éxito, mediana de segundos)
+MODELOS_IA = {
+    ModeloIA.DALL_E_3: (35, 0.94, 12),
+    ModeloIA.MIDJOURNEY: (20, 0.90, 25),
+    ModeloIA.STABLE_DIFFUSION: (20, 0.82, 8),
+    ModeloIA.LEONARDO_AI: (10, 0.88, 15),
+    ModeloIA.DALL_E_2: (10, 0.80, 7),
+    ModeloIA.GPT_4: (5, 0.92, 18),
+}
+PESOS_CALIDAD_EXITO = {
+    CalidadLogo.ALTA: 45,
+    CalidadLogo.MEDIA: 40,
+    CalidadLogo.BAJA: 15,
+}
+
+ESTILOS = ["minimalista", "heráldico", "rústico", "geométrico", "tradicional"]
+NOMBRES = ["Juan", "María", "Carlos", "Rosa", "Luis", "Ana", "Pedro", "Elena"]
+APELLIDOS = ["Pérez", "Mamani", "Quispe", "Rojas", "Flores", "Vargas", "Choque"]
+
+# Arancel de certificación en bolivianos
+MONTO_BASE = Decimal("150.00")
+MONTO_POR_CABEZA = Decimal("2.50")
+
+TASA_APROBACION = 0.85
+# Fracción de marcas que quedan estancadas aunque ya debían resolverse
+TASA_ESTANCADAS = 0.03
+
+# Filas reservadas por marca en los bloques de ids de historial y logos
+MAXIMO_CAMBIOS = 3
+MAXIMO_INTENTOS_LOGO = 3
+
+
+def _acumulada(pesos: Dict, valores: List) -> np.ndarray:
+    """Probabilidades acumuladas de `valores` (peso 0 si no figura)"""
+    vector = np.array([pesos.get(valor, 0) for valor in valores], dtype=float)
+    return np.cumsum(vector) / vector.sum()
+
+
+# Tablas de las distribuciones, indexadas por posición
+DEPARTAMENTOS = list(PESOS_DEPARTAMENTO)
+NOMBRES_REGIONES = ["llanos", "valles", "altiplano"]
+RAZAS = list(RazaBovino)
+PROPOSITOS = list(PropositoGanado)
+MODELOS = list(MODELOS_IA)
+CALIDADES = list(PESOS_CALIDAD_EXITO)
+NOMBRES_EVALUADORES = list(EVALUADORES)
+
+ACUMULADA_DEPARTAMENTO = _acumulada(PESOS_DEPARTAMENTO, DEPARTAMENTOS)
+REGION_DEPARTAMENTO = np.array(
+    [NOMBRES_REGIONES.index(REGIONES[departamento]) for departamento in DEPARTAMENTOS]
+)
+ACUMULADA_RAZA = np.array(
+    [_acumulada(PESOS_RAZA[region], RAZAS) for region in NOMBRES_REGIONES]
+)
+ACUMULADA_PROPOSITO = np.array(
+    [
+        _acumulada(PESOS_PROPOSITO.get(raza, PESOS_PROPOSITO_CARNE), PROPOSITOS)
+        for raza in RAZAS
+    ]
+)
+LOG_MEDIANA_CABEZAS = np.log([MEDIANA_CABEZAS[region] for region in NOMBRES_REGIONES])
+DEMORA_REGION = np.array([FACTOR_DEMORA[region] for region in NOMBRES_REGIONES])
+DEMORA_EVALUADOR = np.array(list(EVALUADORES.values()))
+ACUMULADA_MODELO = _acumulada(
+    {modelo: datos[0] for modelo, datos in MODELOS_IA.items()}, MODELOS
+)
+EXITO_MODELO = np.array([MODELOS_IA[modelo][1] for modelo in MODELOS])
+LOG_SEGUNDOS_MODELO = np.log([MODELOS_IA[modelo][2] for modelo in MODELOS])
+ACUMULADA_CALIDAD = _acumulada(PESOS_CALIDAD_EXITO, CALIDADES)
+
+# Municipios de todos los departamentos en una lista, con su rango por departamento
+MUNICIPIOS_PLANOS = [
+    municipio
+    for departamento in DEPARTAMENTOS
+    for municipio in MUNICIPIOS[departamento]
+]
+CANTIDAD_MUNICIPIOS = np.array(
+    [len(MUNICIPIOS[departamento]) for departamento in DEPARTAMENTOS]
+)
+INICIO_MUNICIPIOS = np.concatenate(([0], np.cumsum(CANTIDAD_MUNICIPIOS)[:-1]))
+
+# Códigos de estado de las columnas
+PENDIENTE, EN_PROCESO, APROBADO, RECHAZADO = range(4)
+ESTADOS = [
+    EstadoMarca.PENDIENTE,
+    EstadoMarca.EN_PROCESO,
+    EstadoMarca.APROBADO,
+    EstadoMarca.RECHAZADO,
+]
+
+# Departamentos con columna propia en los KPIs
+DEPARTAMENTOS_KPI = [Departamento.SANTA_CRUZ, Departamento.BENI, Departamento.LA_PAZ]
+
+
+def _elegir(rng: np.random.Generator, acumuladas: np.ndarray) -> np.ndarray:
+    """Una categoría por fila, con la distribución acumulada de cada fila"""
+    sorteo = rng.random(len(acumuladas))[:, None]
+    return np.minimum((sorteo >= acumuladas).sum(axis=1), acumuladas.shape[1] - 1)
+
+
+def _elegir_vector(
+    rng: np.random.Generator, acumulada: np.ndarray, cantidad: int
+) -> np.ndarray:
+    """`cantidad` categorías con la misma distribución acumulada"""
+    indices = np.searchsorted(acumulada, rng.random(cantidad), side="right")
+    return np.minimum(indices, len(acumulada) - 1)
+
+
+def _horas(valores: np.ndarray) -> np.ndarray:
+    return (valores * 3600 * 10**6).astype("timedelta64[us]")
+
+
+@contextmanager
+def _fechas_explicitas() -> Iterator[None]:
+    """Desactiva auto_now_add para insertar fechas históricas con bulk_create"""
+    campos = [
+        MarcaGanadoBovinoModel._meta.get_field("fecha_registro"),
+        HistorialEstadoMarcaModel._meta.get_field("fecha_cambio"),
+        LogoMarcaBovinaModel._meta.get_field("fecha_generacion"),
+    ]
+    for campo in campos:
+        campo.auto_now_add = False
+    try:
+        yield
+    finally:
+        for campo in campos:
+            campo.auto_now_add = True
+
+
+class GeneradorDatosSinteticos:
+    """
+    Inserta marcas con su historial de estados, logos, KPIs diarios y reportes
+
+    Las columnas de cada lote se sortean con NumPy y dependen unas de otras:
+    el departamento define la región, y la región las razas, el tamaño del
+    hato y la demora; la raza define el propósito. El estado sale de la
+    antigüedad de la marca y de la demora del evaluador, y solo las marcas
+    aprobadas tienen logos (los intentos fallidos se reintentan). Los KPIs se
+    calculan con los mismos datos generados.
+
+    Cada lote se escribe con bulk_create en su propia transacción, sin save()
+    por fila, y los lotes se reparten entre `procesos` procesos. Cada lote
+    usa su propia semilla derivada y un bloque fijo de ids, así que el
+    resultado no depende de la cantidad de procesos. SQLite admite un solo
+    escritor: con SQLite se usa un proceso.
+
+    Con `usuario_auditoria` también registra, en lote, las entradas del
+    historial del admin (LogEntry) y los eventos de outbox que dejaría save().
+    Al final reconstruye las tablas derivadas (histogramas de latencia, índice
+    de prompts y ciclo de vida), salvo con `derivadas=False`.
+    """
+
+    TAMAÑO_LOTE = 5000
+
+    def __init__(
+        self,
+        semilla: int = 42,
+        fecha_fin: Optional[datetime] = None,
+        dias: int = 730,
+        proporcion_logos: float = 0.8,
+        tamaño_lote: Optional[int] = None,
+        procesos: int = 1,
+        usuario_auditoria: Optional[int] = None,
+        derivadas: bool = True,
+    ):
+        self.semilla = semilla
+        self.fecha_fin = fecha_fin or datetime.now().replace(
+            minute=0, second=0, microsecond=0
+        )
+        self.dias = dias
+        self.proporcion_logos = proporcion_logos
+        self.tamaño_lote = tamaño_lote or self.TAMAÑO_LOTE
+        self.procesos = max(procesos, 1)
+        self.usuario_auditoria = usuario_auditoria
+        self.derivadas = derivadas
+        self.primer_dia = (self.fecha_fin - timedelta(days=dias)).date()
+        self._ids: Dict[str, int] = {}
+
+    def poblar(
+        self,
+        marcas: int,
+        reportes: int = 12,
+        al_avanzar: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Inserta `marcas` marcas con sus filas relacionadas
+
+        Returns:
+            Filas creadas por tabla
+        """
+        self._ids = {
+            modelo: (modelo_django.objects.aggregate(m=Max("id"))["m"] or 0) + 1
+            for modelo, modelo_django in (
+                ("marca", MarcaGanadoBovinoModel),
+                ("historial", HistorialEstadoMarcaModel),
+                ("logo", LogoMarcaBovinaModel),
+            )
+        }
+        lotes = range(0, (marcas + self.tamaño_lote - 1) // self.tamaño_lote)
+        self._marcas = marcas
+
+        creadas = {"marcas": 0, "historial": 0, "logos": 0}
+        diario: Dict[str, np.ndarray] = {}
+        hechas = 0
+        for resultado in self._ejecutar_lotes(lotes):
+            for tabla, filas in resultado["filas"].items():
+                creadas[tabla] += filas
+            for metrica, valores in resultado["diario"].items():
+                diario[metrica] = diario.get(metrica, 0) + valores
+            hechas += resultado["filas"]["marcas"]
+            if al_avanzar:
+                al_avanzar(hechas, marcas)
+
+        creadas["kpis"] = self._crear_kpis(diario)
+        creadas["reportes"] = self._crear_reportes(diario, reportes)
+        if self.derivadas:
+            HistogramaLatenciaModel.reconstruir()
+            TerminoPromptModel.reconstruir()
+            call_command("reconstruir_ciclo_vida", stdout=StringIO())
+        return creadas
+
+    def _ejecutar_lotes(self, lotes: range) -> Iterator[Dict[str, Any]]:
+        procesos = min(self.procesos, len(lotes))
+        if connections["default"].vendor == "sqlite":
+            procesos = 1
+        if procesos <= 1:
+            yield from map(self._poblar_lote, lotes)
+            return
+
+        # Los hijos heredan el proceso por fork: no deben compartir conexiones
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=procesos, mp_context=multiprocessing.get_context("fork")
+        ) as ejecutor:
+            yield from ejecutor.map(self._poblar_lote, lotes)
+
+    # ------------------------------------------------------------------
+    # Un lote (corre en el proceso hijo)
+    # ------------------------------------------------------------------
+
+    def _poblar_lote(self, indice: int) -> Dict[str, Any]:
+        inicio = indice * self.tamaño_lote
+        cantidad = min(self.tamaño_lote, self._marcas - inicio)
+        rng = np.random.default_rng([self.semilla, indice])
+
+        columnas = self._columnas_marcas(rng, cantidad)
+        ids = self._ids["marca"] + inicio + np.arange(cantidad)
+        # Bloques de ids fijos por lote: no dependen del orden de los procesos
+        base_historial = self._ids["historial"] + inicio * MAXIMO_CAMBIOS
+        base_logos = self._ids["logo"] + inicio * MAXIMO_INTENTOS_LOGO
+
+        marcas = self._marcas_modelo(ids, columnas)
+        historial = self._historial_modelo(ids, columnas, base_historial)
+        logos, columnas_logos = self._logos(rng, ids, columnas, base_logos)
+
+        with _fechas_explicitas(), transaction.atomic():
+            MarcaGanadoBovinoModel.objects.bulk_create(marcas)
+            HistorialEstadoMarcaModel.objects.bulk_create(historial)
+            LogoMarcaBovinaModel.objects.bulk_create(logos)
+            if self.usuario_auditoria is not None:
+                self._auditar(marcas, historial, logos)
+
+        return {
+            "filas": {
+                "marcas": len(marcas),
+                "historial": len(historial),
+                "logos": len(logos),
+            },
+            "diario": self._resumen_diario(columnas, columnas_logos),
+        }
+
+    def _columnas_marcas(
+        self, rng: np.random.Generator, cantidad: int
+    ) -> Dict[str, np.ndarray]:
+        departamento = _elegir_vector(rng, ACUMULADA_DEPARTAMENTO, cantidad)
+        region = REGION_DEPARTAMENTO[departamento]
+        raza = _elegir(rng, ACUMULADA_RAZA[region])
+        proposito = _elegir(rng, ACUMULADA_PROPOSITO[raza])
+        cabezas = np.clip(
+            rng.lognormal(LOG_MEDIANA_CABEZAS[region], 0.9), 1, 10000
+        ).astype(np.int64)
+
+        # Más solicitudes recientes que antiguas (el registro crece)
+        antiguedad = self.dias * 24 * (1 - np.sqrt(rng.random(cantidad)))
+        evaluador = rng.integers(0, len(NOMBRES_EVALUADORES), cantidad)
+        espera = rng.exponential(24, cantidad)
+        revision = (
+            rng.lognormal(np.log(72), 0.6, cantidad)
+            * DEMORA_REGION[region]
+            * DEMORA_EVALUADOR[evaluador]
+        )
+        resuelta = (espera + revision <= antiguedad) & (
+            rng.random(cantidad) >= TASA_ESTANCADAS
+        )
+        aprobada = rng.random(cantidad) < TASA_APROBACION
+        estado = np.select(
+            [resuelta & aprobada, resuelta, espera <= antiguedad],
+            [APROBADO, RECHAZADO, EN_PROCESO],
+            PENDIENTE,
+        )
+
+        fin = np.datetime64(self.fecha_fin, "us")
+        registro = fin - _horas(antiguedad)
+        return {
+            "departamento": departamento,
+            "raza": raza,
+            "proposito": proposito,
+            "cabezas": cabezas,
+            "estado": estado,
+            "evaluador": evaluador,
+            "registro": registro,
+            "inicio_revision": registro + _horas(espera),
+            "procesamiento": registro + _horas(espera + revision),
+            "horas": np.floor(espera + revision).astype(np.int64),
+            "municipio": INICIO_MUNICIPIOS[departamento]
+            + (rng.random(cantidad) * CANTIDAD_MUNICIPIOS[departamento]).astype(
+                np.int64
+            ),
+            "nombre": rng.integers(0, len(NOMBRES), cantidad),
+            "apellidos": rng.integers(0, len(APELLIDOS), (cantidad, 2)),
+            "ci": rng.integers(1000000, 10000000, cantidad),
+            "telefono": rng.integers(0, 10000000, cantidad),
+        }
+
+    def _marcas_modelo(
+        self, ids: np.ndarray, columnas: Dict[str, np.ndarray]
+    ) -> List[MarcaGanadoBovinoModel]:
+        resueltas = columnas["estado"] >= APROBADO
+        filas = zip(
+            ids.tolist(),
+            columnas["departamento"].tolist(),
+            columnas["raza"].tolist(),
+            columnas["proposito"].tolist(),
+            columnas["cabezas"].tolist(),
+            columnas["estado"].tolist(),
+            columnas["registro"].tolist(),
+            columnas["procesamiento"].tolist(),
+            columnas["horas"].tolist(),
+            resueltas.tolist(),
+            columnas["municipio"].tolist(),
+            columnas["nombre"].tolist(),
+            columnas["apellidos"].tolist(),
+            columnas["ci"].tolist(),
+            columnas["telefono"].tolist(),
+        )
+        marcas = []
+        for (
+            marca_id,
+            departamento,
+            raza,
+            proposito,
+            cabezas,
+            estado,
+            registro,
+            procesamiento,
+            horas,
+            resuelta,
+            municipio,
+            nombre,
+            (apellido, segundo_apellido),
+            ci,
+            telefono,
+        ) in filas:
+            departamento = DEPARTAMENTOS[departamento]
+            marcas.append(
+                MarcaGanadoBovinoModel(
+                    id=marca_id,
+                    numero_marca=f"{PREFIJOS_DEPARTAMENTO[departamento]}-{marca_id:07d}",
+                    nombre_productor=(
+                        f"{NOMBRES[nombre]} {APELLIDOS[apellido]} "
+                        f"{APELLIDOS[segundo_apellido]}"
+                    ),
+                    fecha_registro=registro,
+                    fecha_procesamiento=procesamiento if resuelta else None,
+                    estado=ESTADOS[estado].value,
+                    monto_certificacion=MONTO_BASE + MONTO_POR_CABEZA * cabezas,
+                    raza_bovino=RAZAS[raza].value,
+                    proposito_ganado=PROPOSITOS[proposito].value,
+                    cantidad_cabezas=cabezas,
+                    departamento=departamento.value,
+                    municipio=MUNICIPIOS_PLANOS[municipio],
+                    ci_productor=str(ci),
+                    telefono_productor=f"7{telefono:07d}",
+                    tiempo_procesamiento_horas=horas if resuelta else None,
+                    creado_por="sintetico",
+                )
+            )
+        return marcas
+
+    def _historial_modelo(
+        self, ids: np.ndarray, columnas: Dict[str, np.ndarray], base_id: int
+    ) -> List[HistorialEstadoMarcaModel]:
+        """Registro → revisión → resolución, según hasta dónde llegó cada marca"""
+        cambios = []
+        posiciones = np.arange(len(ids)) * MAXIMO_CAMBIOS + base_id
+        for (
+            historial_id,
+            marca_id,
+            estado,
+            evaluador,
+            registro,
+            inicio_revision,
+            procesamiento,
+        ) in zip(
+            posiciones.tolist(),
+            ids.tolist(),
+            columnas["estado"].tolist(),
+            columnas["evaluador"].tolist(),
+            columnas["registro"].tolist(),
+            columnas["inicio_revision"].tolist(),
+            columnas["procesamiento"].tolist(),
+        ):
+            cambios.append(
+                HistorialEstadoMarcaModel(
+                    id=historial_id,
+                    marca_id=marca_id,
+                    estado_anterior=None,
+                    estado_nuevo=EstadoMarca.PENDIENTE.value,
+                    fecha_cambio=registro,
+                    usuario_responsable="sintetico",
+                    observaciones_cambio="Solicitud registrada",
+                )
+            )
+            if estado == PENDIENTE:
+                continue
+            usuario = NOMBRES_EVALUADORES[evaluador]
+            cambios.append(
+                HistorialEstadoMarcaModel(
+                    id=historial_id + 1,
+                    marca_id=marca_id,
+                    estado_anterior=EstadoMarca.PENDIENTE.value,
+                    estado_nuevo=EstadoMarca.EN_PROCESO.value,
+                    fecha_cambio=inicio_revision,
+                    usuario_responsable=usuario,
+                )
+            )
+            if estado == EN_PROCESO:
+                continue
+            cambios.append(
+                HistorialEstadoMarcaModel(
+                    id=historial_id + 2,
+                    marca_id=marca_id,
+                    estado_anterior=EstadoMarca.EN_PROCESO.value,
+                    estado_nuevo=ESTADOS[estado].value,
+                    fecha_cambio=procesamiento,
+                    usuario_responsable=usuario,
+                    observaciones_cambio=(
+                        "Documentación observada" if estado == RECHAZADO else None
+                    ),
+                )
+            )
+        return cambios
+
+    def _logos(
+        self,
+        rng: np.random.Generator,
+        ids: np.ndarray,
+        columnas: Dict[str, np.ndarray],
+        base_id: int,
+    ):
+        """
+        Intentos de generación de las marcas aprobadas: se reintenta con otro
+        modelo mientras falle, hasta MAXIMO_INTENTOS_LOGO intentos
+        """
+        cantidad = len(ids)
+        activa = (columnas["estado"] == APROBADO) & (
+            rng.random(cantidad) < self.proporcion_logos
+        )
+        fecha = columnas["procesamiento"]
+        fin = np.datetime64(self.fecha_fin, "us")
+
+        intentos = []
+        for intento in range(MAXIMO_INTENTOS_LOGO):
+            # Se sortea para todas las filas: el resultado no depende de cuántas
+            # quedaron activas en el intento anterior
+            modelo = _elegir_vector(rng, ACUMULADA_MODELO, cantidad)
+            exito = rng.random(cantidad) < EXITO_MODELO[modelo]
+            segundos = rng.lognormal(LOG_SEGUNDOS_MODELO[modelo], 0.5)
+            segundos = np.maximum(np.where(exito, segundos, segundos * 1.5), 1)
+            fecha = np.minimum(fecha + _horas(rng.exponential(0.5, cantidad)), fin)
+            calidad = np.where(
+                exito,
+                _elegir_vector(rng, ACUMULADA_CALIDAD, cantidad),
+                CALIDADES.index(CalidadLogo.BAJA),
+            )
+            estilo = rng.integers(0, len(ESTILOS), cantidad)
+            filas = np.flatnonzero(activa)
+            intentos.append(
+                {
+                    "fila": filas,
+                    "intento": np.full(len(filas), intento),
+                    "modelo": modelo[filas],
+                    "exito": exito[filas],
+                    "segundos": segundos[filas].astype(np.int64),
+                    "fecha": fecha[filas],
+                    "calidad": calidad[filas],
+                    "estilo": estilo[filas],
+                }
+            )
+            activa = activa & ~exito
+
+        logos_columnas = {
+            clave: np.concatenate(
+                [columnas_intento[clave] for columnas_intento in intentos]
+            )
+            for clave in intentos[0]
+        }
+        logos = []
+        for fila, intento, modelo, exito, segundos, fecha, calidad, estilo in zip(
+            *(logos_columnas[clave].tolist() for clave in intentos[0])
+        ):
+            marca_id = int(ids[fila])
+            departamento = DEPARTAMENTOS[columnas["departamento"][fila]]
+            numero_marca = f"{PREFIJOS_DEPARTAMENTO[departamento]}-{marca_id:07d}"
+            modelo = MODELOS[modelo].value
+            prompt = (
+                f"Logo para marca ganadera de "
+                f"{RAZAS[columnas['raza'][fila]].value.lower()} "
+                f"({PROPOSITOS[columnas['proposito'][fila]].value.lower()}) en "
+                f"{MUNICIPIOS_PLANOS[columnas['municipio'][fila]]}, "
+                f"estilo {ESTILOS[estilo]}"
+            )
+            logos.append(
+                LogoMarcaBovinaModel(
+                    id=base_id + fila * MAXIMO_INTENTOS_LOGO + intento,
+                    marca_id=marca_id,
+                    url_logo=(
+                        f"https://logos.ganaderia.bo/{numero_marca}/{intento + 1}.png"
+                    ),
+                    fecha_generacion=fecha,
+                    exito=exito,
+                    tiempo_generacion_segundos=segundos,
+                    modelo_ia_usado=modelo,
+                    prompt_usado=prompt,
+                    calidad_logo=CALIDADES[calidad].value,
+                    huella_prompt=calcular_huella_prompt(prompt, modelo),
+                )
+            )
+        return logos, logos_columnas
+
+    def _auditar(self, marcas: List, historial: List, logos: List) -> None:
+        """Lo que save() registra por fila, en lote: outbox y LogEntry"""
+        for entidad, filas in (
+            ("marca", marcas),
+            ("historial", historial),
+            ("logo", logos),
+        ):
+            if filas:
+                EventoOutboxModel.registrar_lote(
+                    entidad,
+                    [fila.pk for fila in filas],
+                    OperacionCambio.CREAR,
+                    EventoOutboxModel.todos_los_campos(filas[0]),
+                )
+
+        numeros = {marca.pk: marca.numero_marca for marca in marcas}
+        tipo_marca = ContentType.objects.get_for_model(MarcaGanadoBovinoModel).pk
+        tipo_logo = ContentType.objects.get_for_model(LogoMarcaBovinaModel).pk
+        entradas = [
+            LogEntry(
+                user_id=self.usuario_auditoria,
+                content_type_id=tipo_marca,
+                object_id=str(marca.pk),
+                object_repr=str(marca)[:200],
+                action_flag=ADDITION,
+                change_message="Marca registrada",
+            )
+            for marca in marcas
+        ] + [
+            LogEntry(
+                user_id=self.usuario_auditoria,
+                content_type_id=tipo_logo,
+                object_id=str(logo.pk),
+                object_repr=f"Logo {numeros[logo.marca_id]} - {logo.modelo_ia_usado}",
+                action_flag=ADDITION,
+                change_message="Logo creado automáticamente",
+            )
+            for logo in logos
+        ]
+        LogEntry.objects.bulk_create(entradas, batch_size=self.tamaño_lote)
+
+    # ------------------------------------------------------------------
+    # Agregados
+    # ------------------------------------------------------------------
+
+    def _resumen_diario(
+        self, columnas: Dict[str, np.ndarray], logos: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """Sumas por día del período (índice 0 = primer_dia) para los KPIs"""
+        primer_dia = np.datetime64(self.primer_dia, "D")
+        largo = self.dias + 1
+        dia = np.clip(
+            (columnas["registro"].astype("datetime64[D]") - primer_dia).astype(int),
+            0,
+            largo - 1,
+        )
+        dia_logo = np.clip(
+            (logos["fecha"].astype("datetime64[D]") - primer_dia).astype(int),
+            0,
+            largo - 1,
+        )
+        resuelta = columnas["estado"] >= APROBADO
+
+        def sumar(indices, pesos=None):
+            return np.bincount(indices, weights=pesos, minlength=largo)
+
+        resumen = {
+            "marcas": sumar(dia),
+            "aprobadas": sumar(dia, columnas["estado"] == APROBADO),
+            "cabezas": sumar(dia, columnas["cabezas"]),
+            "procesadas": sumar(dia, resuelta),
+            "horas": sumar(dia, np.where(resuelta, columnas["horas"], 0)),
+            "logos": sumar(dia_logo),
+            "logos_exitosos": sumar(dia_logo, logos["exito"]),
+            "segundos_logos": sumar(dia_logo, logos["segundos"]),
+        }
+        for posicion, proposito in enumerate(PROPOSITOS):
+            resumen[f"proposito_{proposito.value}"] = sumar(
+                dia, columnas["proposito"] == posicion
+            )
+        for departamento in DEPARTAMENTOS_KPI:
+            resumen[f"departamento_{departamento.value}"] = sumar(
+                dia, columnas["departamento"] == DEPARTAMENTOS.index(departamento)
+            )
+        return resumen
+
+    def _crear_kpis(self, diario: Dict[str, np.ndarray]) -> int:
+        """Un KPI por día del período, calculado de las marcas generadas"""
+        existentes = set(
+            KPIGanadoBovinoModel.objects.filter(fecha__gte=self.primer_dia).values_list(
+                "fecha", flat=True
+            )
+        )
+        kpis = []
+        for posicion in range(self.dias + 1):
+            dia = self.primer_dia + timedelta(days=posicion)
+            if dia not in existentes:
+                kpis.append(
+                    self._kpi(dia, {m: int(v[posicion]) for m, v in diario.items()})
+                )
+        KPIGanadoBovinoModel.objects.bulk_create(kpis, batch_size=self.tamaño_lote)
+        return len(kpis)
+
+    @staticmethod
+    def _kpi(dia: date, resumen: Dict[str, int]) -> KPIGanadoBovinoModel:
+        marcas = resumen.get("marcas", 0)
+        logos = resumen.get("logos", 0)
+        por_departamento = [
+            resumen.get(f"departamento_{departamento.value}", 0)
+            for departamento in DEPARTAMENTOS_KPI
+        ]
+        return KPIGanadoBovinoModel(
+            fecha=dia,
+            marcas_registradas_mes=marcas,
+            tiempo_promedio_procesamiento=(
+                resumen["horas"] / resumen["procesadas"]
+                if resumen.get("procesadas")
+                else 0
+            ),
+            porcentaje_aprobacion=(
+                resumen["aprobadas"] * 100 / marcas if marcas else 0
+            ),
+            ingresos_mes=MONTO_BASE * marcas
+            + MONTO_POR_CABEZA * resumen.get("cabezas", 0),
+            total_cabezas_registradas=resumen.get("cabezas", 0),
+            promedio_cabezas_por_marca=(resumen["cabezas"] / marcas if marcas else 0),
+            marcas_carne=resumen.get("proposito_CARNE", 0),
+            marcas_leche=resumen.get("proposito_LECHE", 0),
+            marcas_doble_proposito=resumen.get("proposito_DOBLE_PROPOSITO", 0),
+            marcas_reproduccion=resumen.get("proposito_REPRODUCCION", 0),
+            marcas_santa_cruz=por_departamento[0],
+            marcas_beni=por_departamento[1],
+            marcas_la_paz=por_departamento[2],
+            marcas_otros_departamentos=marcas - sum(por_departamento),
+            tasa_exito_logos=(resumen["logos_exitosos"] * 100 / logos if logos else 0),
+            total_logos_generados=logos,
+            tiempo_promedio_generacion_logos=(
+                resumen["segundos_logos"] / logos if logos else 0
+            ),
+        )
+
+    def _crear_reportes(self, diario: Dict[str, np.ndarray], cantidad: int) -> int:
+        """Reportes mensuales almacenados (los usan obtener_pdf/renderizar_pdf)"""
+        por_mes: Dict[date, Dict[str, int]] = {}
+        for posicion in range(self.dias + 1):
+            mes = (self.primer_dia + timedelta(days=posicion)).replace(day=1)
+            acumulado = por_mes.setdefault(mes, {})
+            for metrica, valores in diario.items():
+                acumulado[metrica] = acumulado.get(metrica, 0) + int(valores[posicion])
+
+        meses = sorted(por_mes, reverse=True)[:cantidad]
+        for mes in meses:
+            resumen = por_mes[mes]
+            siguiente = (mes + timedelta(days=32)).replace(day=1)
+            ReporteDataModel(
+                tipo_reporte="mensual",
+                periodo_inicio=mes,
+                periodo_fin=siguiente - timedelta(days=1),
+                datos={
+                    "total_marcas": resumen.get("marcas", 0),
+                    "marcas_aprobadas": resumen.get("aprobadas", 0),
+                    "total_cabezas": resumen.get("cabezas", 0),
+                    "ingresos": float(
+                        MONTO_BASE * resumen.get("marcas", 0)
+                        + MONTO_POR_CABEZA * resumen.get("cabezas", 0)
+                    ),
+                    "logos_generados": resumen.get("logos", 0),
+                    "logos_exitosos": resumen.get("logos_exitosos", 0),
+                },
+                usuario_generador="sintetico",
+            ).save()
+        return len(meses)
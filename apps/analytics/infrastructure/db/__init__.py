@@ -0,0 +1,20 @@
+"""
+Enrutamiento de base de datos para la aplicación de analytics
+Lecturas analíticas a la réplica y escrituras a la primaria
+"""
+
+from .router_replica import (
+    ReplicaAnaliticaRouter,
+    alias_replica,
+    ambito_lectura,
+    en_replica,
+    lectura_replica,
+)
+
+__all__ = [
+    "ReplicaAnaliticaRouter",
+    "alias_replica",
+    "ambito_lectura",
+    "en_replica",
+    "lectura_replica",
+]
@@ -0,0 +1,138 @@
+"""
+Router de réplica de lectura para consultas analíticas
+Responsabilidad única: Decidir si una lectura va a la réplica (DB_REPLICA_ALIAS)
+o a la primaria, respetando lo que la sesión acaba de escribir
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Iterator, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+APP_LABEL = "analytics"
+
+
+class _Ambito:
+    """Escrituras de un request (o de un bloque en_replica sin request)"""
+
+    __slots__ = ("escribio", "_pegado", "_escritura_previa")
+
+    def __init__(self, escritura_previa: Optional[Callable[[], bool]] = None):
+        self.escribio = False
+        self._pegado: Optional[bool] = None
+        self._escritura_previa = escritura_previa
+
+    def lee_primaria(self) -> bool:
+        if self.escribio:
+            return True
+        if self._pegado is None:
+            # Se evalúa en la primera lectura: para entonces DRF ya autenticó
+            self._pegado = bool(self._escritura_previa and self._escritura_previa())
+        return self._pegado
+
+
+_ambito: ContextVar[Optional[_Ambito]] = ContextVar(
+    "analytics_ambito_lectura", default=None
+)
+_preferir_replica: ContextVar[bool] = ContextVar(
+    "analytics_preferir_replica", default=False
+)
+
+
+def alias_replica() -> Optional[str]:
+    """Alias de la réplica si está configurada en DATABASES"""
+    alias = getattr(settings, "DB_REPLICA_ALIAS", "")
+    return alias if alias and alias in settings.DATABASES else None
+
+
+@contextmanager
+def ambito_lectura(
+    escritura_previa: Optional[Callable[[], bool]] = None,
+) -> Iterator[_Ambito]:
+    """
+    Abre el ámbito de escrituras de un request
+
+    Dentro del ámbito, después de escribir un modelo de analytics las lecturas
+    vuelven a la primaria (read-your-writes). `escritura_previa` indica si la
+    sesión escribió hace poco, en un request anterior.
+    """
+    ambito = _Ambito(escritura_previa)
+    token = _ambito.set(ambito)
+    try:
+        yield ambito
+    finally:
+        _ambito.reset(token)
+
+
+@contextmanager
+def en_replica() -> Iterator[None]:
+    """
+    Bloque de lecturas analíticas: sus consultas van a la réplica salvo en
+    estos casos:
+    - no hay réplica configurada;
+    - hay una transacción abierta en la primaria;
+    - el request o la sesión escribieron hace poco.
+    """
+    tokens = [_preferir_replica.set(True)]
+    if _ambito.get() is None:
+        # Sin request (comandos, hilos): cuenta lo escrito dentro del bloque
+        tokens.append(_ambito.set(_Ambito()))
+    try:
+        yield
+    finally:
+        for token in reversed(tokens):
+            token.var.reset(token)
+
+
+def lectura_replica(metodo):
+    """Decorador de métodos de repositorio de solo lectura (ver en_replica)"""
+
+    @wraps(metodo)
+    def envoltura(*args, **kwargs):
+        with en_replica():
+            return metodo(*args, **kwargs)
+
+    return envoltura
+
+
+class ReplicaAnaliticaRouter:
+    """
+    Lecturas dentro de en_replica a la réplica; el resto, a la primaria
+
+    Las escrituras siempre van a la primaria, aunque la instancia se haya
+    leído desde la réplica. Las migraciones no corren en la réplica: la
+    replicación le copia el esquema.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _preferir_replica.get():
+            return None
+        alias = alias_replica()
+        if alias is None:
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        ambito = _ambito.get()
+        if ambito is not None and ambito.lee_primaria():
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        ambito = _ambito.get()
+        if ambito is not None and model._meta.app_label == APP_LABEL:
+            ambito.escribio = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        bases = {DEFAULT_DB_ALIAS, alias_replica()}
+        if obj1._state.db in bases and obj2._state.db in bases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == alias_replica():
+            return False
+        return None
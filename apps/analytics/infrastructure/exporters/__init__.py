@@ -0,0 +1,14 @@
+"""
+Exportadores de infraestructura para la aplicación de analytics
+Generan archivos descargables (Excel, PDF) a partir de los modelos Django
+"""
+
+from .excel_exporter import ExcelReporteExporter, ArchivoExportacionTemporal
+from .pdf_exporter import PdfReporteRenderer, CacheGraficos
+
+__all__ = [
+    "ExcelReporteExporter",
+    "ArchivoExportacionTemporal",
+    "PdfReporteRenderer",
+    "CacheGraficos",
+]
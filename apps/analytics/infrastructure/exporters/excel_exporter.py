@@ -0,0 +1,340 @@
+"""
+Exportador de reportes a Excel usando xlsxwriter en modo constant_memory
+Responsabilidad única: Escribir hojas de Excel fila por fila desde la base de datos
+"""
+
+import os
+import tempfile
+import time
+from datetime import date, datetime, time as dt_time
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from django.db.models import Avg, Count, Q, Sum
+from django.utils import timezone
+
+from apps.analytics.domain.enums import EstadoMarca
+from apps.analytics.infrastructure.models import (
+    KPIGanadoBovinoModel,
+    LogoMarcaBovinaModel,
+    MarcaGanadoBovinoModel,
+)
+
+CONTENT_TYPE_XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+class ArchivoExportacionTemporal:
+    """Archivo de solo lectura que se elimina del disco al cerrarse
+
+    Permite entregar el Excel con FileResponse (streaming por bloques)
+    sin dejar archivos temporales huérfanos en el servidor.
+    """
+
+    def __init__(self, ruta: str):
+        self.name = ruta
+        self._archivo = open(ruta, "rb")
+
+    def read(self, size: int = -1) -> bytes:
+        return self._archivo.read(size)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._archivo.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._archivo.tell()
+
+    def close(self) -> None:
+        self._archivo.close()
+        try:
+            os.remove(self.name)
+        except OSError:
+            pass
+
+
+class ExcelReporteExporter:
+    """Exportador de reportes a Excel en memoria constante
+    Responsabilidad única: Escribir hojas de Excel fila por fila desde la base de datos
+    """
+
+    TAMAÑO_LOTE = 2000
+
+    # Filtros admitidos sobre marcas (también se aplican a logos vía la marca)
+    FILTROS_PERMITIDOS = ("departamento", "estado", "raza_bovino", "proposito_ganado")
+
+    HOJA_MARCAS = "Marcas"
+    HOJA_DEPARTAMENTOS = "Resumen Departamentos"
+    HOJA_LOGOS = "Logos"
+    HOJA_KPIS = "KPIs"
+
+    COLUMNAS_MARCAS: Sequence[Tuple[str, str, int]] = (
+        ("numero_marca", "Número de Marca", 16),
+        ("nombre_productor", "Productor", 30),
+        ("ci_productor", "CI Productor", 14),
+        ("departamento", "Departamento", 14),
+        ("municipio", "Municipio", 18),
+        ("raza_bovino", "Raza", 16),
+        ("proposito_ganado", "Propósito", 16),
+        ("cantidad_cabezas", "Cabezas", 10),
+        ("estado", "Estado", 12),
+        ("monto_certificacion", "Monto (Bs.)", 14),
+        ("fecha_registro", "Fecha Registro", 18),
+        ("fecha_procesamiento", "Fecha Procesamiento", 18),
+        ("tiempo_procesamiento_horas", "Tiempo Proc. (h)", 14),
+    )
+
+    COLUMNAS_LOGOS: Sequence[Tuple[str, str, int]] = (
+        ("marca__numero_marca", "Número de Marca", 16),
+        ("modelo_ia_usado", "Modelo IA", 18),
+        ("exito", "Éxito", 8),
+        ("calidad_logo", "Calidad", 10),
+        ("tiempo_generacion_segundos", "Tiempo (s)", 10),
+        ("fecha_generacion", "Fecha Generación", 18),
+        ("url_logo", "URL", 50),
+    )
+
+    COLUMNAS_KPIS: Sequence[Tuple[str, str, int]] = (
+        ("fecha", "Fecha", 12),
+        ("marcas_registradas_mes", "Marcas Registradas", 12),
+        ("porcentaje_aprobacion", "% Aprobación", 12),
+        ("tiempo_promedio_procesamiento", "Tiempo Prom. (h)", 12),
+        ("ingresos_mes", "Ingresos (Bs.)", 14),
+        ("total_cabezas_registradas", "Cabezas", 12),
+        ("tasa_exito_logos", "% Éxito Logos", 12),
+        ("total_logos_generados", "Logos Generados", 12),
+    )
+
+    COLUMNAS_DEPARTAMENTOS: Sequence[Tuple[str, str, int]] = (
+        ("departamento", "Departamento", 16),
+        ("total", "Total Marcas", 12),
+        ("aprobadas", "Aprobadas", 12),
+        ("rechazadas", "Rechazadas", 12),
+        ("pendientes", "Pendientes", 12),
+        ("cabezas", "Cabezas", 12),
+        ("ingresos", "Ingresos (Bs.)", 14),
+        ("tiempo_promedio", "Tiempo Prom. (h)", 14),
+    )
+
+    def __init__(self, tamaño_lote: int = TAMAÑO_LOTE):
+        if tamaño_lote <= 0:
+            raise ValueError("El tamaño de lote debe ser mayor a cero")
+        self.tamaño_lote = tamaño_lote
+
+    def exportar(
+        self,
+        fecha_inicio: date,
+        fecha_fin: date,
+        filtros: Optional[Dict[str, Any]] = None,
+        ruta_destino: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Escribe el libro de Excel con las hojas de marcas, resumen por
+        departamento, logos y KPIs del periodo
+
+        Args:
+            fecha_inicio: Fecha de inicio del periodo
+            fecha_fin: Fecha de fin del periodo
+            filtros: Filtros sobre marcas (ver FILTROS_PERMITIDOS)
+            ruta_destino: Ruta del archivo; si se omite se crea un temporal
+
+        Returns:
+            Dict[str, Any]: Metadatos de la exportación y ruta del archivo
+
+        Raises:
+            ValueError: Si el periodo o los filtros son inválidos
+        """
+        # xlsxwriter solo se necesita al exportar
+        import xlsxwriter
+
+        filtros = self._validar_filtros(filtros or {})
+        inicio, fin = self._rango_periodo(fecha_inicio, fecha_fin)
+        ruta = ruta_destino or self._crear_ruta_temporal()
+
+        tiempo_inicio = time.perf_counter()
+        workbook = xlsxwriter.Workbook(
+            ruta,
+            {
+                "constant_memory": True,
+                "default_date_format": "yyyy-mm-dd hh:mm",
+                "remove_timezone": True,
+            },
+        )
+        try:
+            filas_por_hoja = self._escribir_libro(workbook, inicio, fin, filtros)
+        except Exception:
+            # No dejar archivos temporales a medio escribir
+            if ruta_destino is None and os.path.exists(ruta):
+                os.remove(ruta)
+            raise
+
+        return {
+            "ruta_archivo": ruta,
+            "nombre_archivo": f"reporte_{inicio.date()}_{fin.date()}.xlsx",
+            "formato": "xlsx",
+            "content_type": CONTENT_TYPE_XLSX,
+            "tamaño_bytes": os.path.getsize(ruta),
+            "hojas_incluidas": list(filas_por_hoja.keys()),
+            "filas_por_hoja": filas_por_hoja,
+            "filtros_aplicados": filtros,
+            "fecha_exportacion": timezone.now().isoformat(),
+            "tiempo_procesamiento": round(time.perf_counter() - tiempo_inicio, 3),
+        }
+
+    def _escribir_libro(
+        self, workbook, inicio: datetime, fin: datetime, filtros: Dict[str, Any]
+    ) -> Dict[str, int]:
+        """Escribe todas las hojas del libro y lo cierra; retorna filas por hoja"""
+        try:
+            formato_encabezado = workbook.add_format(
+                {"bold": True, "bg_color": "#2E7D32", "font_color": "#FFFFFF"}
+            )
+            formato_fecha = workbook.add_format({"num_format": "yyyy-mm-dd"})
+
+            marcas = MarcaGanadoBovinoModel.objects.filter(
+                fecha_registro__gte=inicio, fecha_registro__lte=fin, **filtros
+            )
+            logos = LogoMarcaBovinaModel.objects.filter(
+                fecha_generacion__gte=inicio,
+                fecha_generacion__lte=fin,
+                **{f"marca__{campo}": valor for campo, valor in filtros.items()},
+            )
+            kpis = KPIGanadoBovinoModel.objects.filter(
+                fecha__gte=inicio.date(), fecha__lte=fin.date()
+            )
+
+            return {
+                self.HOJA_MARCAS: self._escribir_hoja(
+                    workbook,
+                    self.HOJA_MARCAS,
+                    self.COLUMNAS_MARCAS,
+                    self._iterar_por_lotes(marcas, self.COLUMNAS_MARCAS),
+                    formato_encabezado,
+                ),
+                self.HOJA_DEPARTAMENTOS: self._escribir_hoja(
+                    workbook,
+                    self.HOJA_DEPARTAMENTOS,
+                    self.COLUMNAS_DEPARTAMENTOS,
+                    self._resumen_departamentos(marcas),
+                    formato_encabezado,
+                ),
+                self.HOJA_LOGOS: self._escribir_hoja(
+                    workbook,
+                    self.HOJA_LOGOS,
+                    self.COLUMNAS_LOGOS,
+                    self._iterar_por_lotes(logos, self.COLUMNAS_LOGOS),
+                    formato_encabezado,
+                ),
+                self.HOJA_KPIS: self._escribir_hoja(
+                    workbook,
+                    self.HOJA_KPIS,
+                    self.COLUMNAS_KPIS,
+                    self._iterar_por_lotes(kpis, self.COLUMNAS_KPIS),
+                    formato_encabezado,
+                    formatos_columna={0: formato_fecha},
+                ),
+            }
+        finally:
+            workbook.close()
+
+    def _escribir_hoja(
+        self,
+        workbook,
+        nombre: str,
+        columnas: Sequence[Tuple[str, str, int]],
+        filas: Iterator[Sequence[Any]],
+        formato_encabezado,
+        formatos_columna: Optional[Dict[int, Any]] = None,
+    ) -> int:
+        """Escribe encabezado y filas en orden; retorna el número de filas de datos"""
+        worksheet = workbook.add_worksheet(nombre)
+        formatos_columna = formatos_columna or {}
+
+        for indice, (_, titulo, ancho) in enumerate(columnas):
+            worksheet.set_column(indice, indice, ancho)
+            worksheet.write(0, indice, titulo, formato_encabezado)
+        worksheet.freeze_panes(1, 0)
+
+        # En modo constant_memory cada fila se vuelca a disco al pasar a la
+        # siguiente, por lo que la memoria no depende del total de filas
+        total = 0
+        for total, fila in enumerate(filas, start=1):
+            for indice, valor in enumerate(fila):
+                if valor is None:
+                    continue
+                worksheet.write(total, indice, valor, formatos_columna.get(indice))
+        return total
+
+    def _iterar_por_lotes(
+        self, queryset, columnas: Sequence[Tuple[str, str, int]]
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Recorre el queryset por lotes usando paginación por clave (id)
+
+        Evita OFFSET y no depende de cursores del lado del servidor, de modo que
+        cada consulta trae como máximo `tamaño_lote` filas en cualquier motor.
+        """
+        campos = [campo for campo, _, _ in columnas]
+        ultimo_id = 0
+        while True:
+            lote = list(
+                queryset.filter(id__gt=ultimo_id)
+                .order_by("id")
+                .values_list("id", *campos)[: self.tamaño_lote]
+            )
+            if not lote:
+                return
+            for fila in lote:
+                yield fila[1:]
+            ultimo_id = lote[-1][0]
+
+    def _resumen_departamentos(self, marcas) -> Iterator[Tuple[Any, ...]]:
+        """Agrega las marcas del periodo por departamento en una sola consulta"""
+        resumen = (
+            marcas.order_by()
+            .values("departamento")
+            .annotate(
+                total=Count("id"),
+                aprobadas=Count("id", filter=Q(estado=EstadoMarca.APROBADO.value)),
+                rechazadas=Count("id", filter=Q(estado=EstadoMarca.RECHAZADO.value)),
+                pendientes=Count("id", filter=Q(estado=EstadoMarca.PENDIENTE.value)),
+                cabezas=Sum("cantidad_cabezas"),
+                ingresos=Sum("monto_certificacion"),
+                tiempo_promedio=Avg("tiempo_procesamiento_horas"),
+            )
+            .order_by("departamento")
+        )
+        campos = [campo for campo, _, _ in self.COLUMNAS_DEPARTAMENTOS]
+        for fila in resumen:
+            yield tuple(fila[campo] for campo in campos)
+
+    def _validar_filtros(self, filtros: Dict[str, Any]) -> Dict[str, Any]:
+        """Valida que solo se usen filtros admitidos y descarta valores vacíos"""
+        no_soportados = set(filtros) - set(self.FILTROS_PERMITIDOS)
+        if no_soportados:
+            raise ValueError(
+                f"Filtros no soportados para exportación: {', '.join(sorted(no_soportados))}"
+            )
+        return {campo: valor for campo, valor in filtros.items() if valor}
+
+    def _rango_periodo(
+        self, fecha_inicio: date, fecha_fin: date
+    ) -> Tuple[datetime, datetime]:
+        """Convierte fechas a un rango de datetimes inclusivo"""
+        inicio = (
+            fecha_inicio
+            if isinstance(fecha_inicio, datetime)
+            else datetime.combine(fecha_inicio, dt_time.min)
+        )
+        fin = (
+            fecha_fin
+            if isinstance(fecha_fin, datetime)
+            else datetime.combine(fecha_fin, dt_time.max)
+        )
+        if inicio > fin:
+            raise ValueError(
+                "La fecha de inicio no puede ser mayor que la fecha de fin"
+            )
+        return inicio, fin
+
+    def _crear_ruta_temporal(self) -> str:
+        """Crea un archivo temporal vacío para el libro de Excel"""
+        descriptor, ruta = tempfile.mkstemp(prefix="reporte_", suffix=".xlsx")
+        os.close(descriptor)
+        return ruta
@@ -0,0 +1,375 @@
+"""
+Renderizador de reportes a PDF usando reportlab
+Responsabilidad única: Convertir los datos de un reporte en un PDF paginado con
+gráficos, guardando gráficos y PDFs en disco según la firma del contenido
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+CONTENT_TYPE_PDF = "application/pdf"
+
+# (nombre, título, tipo, etiquetas, valores)
+Grafico = Tuple[str, str, str, List[str], List[float]]
+
+
+def calcular_firma_reporte(tipo_reporte: str, periodo: str, datos: Dict) -> str:
+    """Hash estable del contenido del reporte; cambia si cambian los datos"""
+    contenido = json.dumps(
+        {"tipo_reporte": tipo_reporte, "periodo": periodo, "datos": datos},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(contenido.encode("utf-8")).hexdigest()
+
+
+class CacheGraficos:
+    """Gráficos PNG en disco, uno por (firma del reporte, gráfico)
+
+    matplotlib se importa recién al dibujar el primer gráfico que no está en
+    cache, por lo que los procesos web que solo sirven PDFs ya generados no lo
+    cargan nunca. Se usa la API orientada a objetos (Figure + FigureCanvasAgg)
+    en lugar de pyplot para no compartir estado global entre hilos.
+    """
+
+    def __init__(self, directorio: Path):
+        self.directorio = Path(directorio)
+
+    def obtener(self, firma: str, grafico: Grafico) -> Tuple[Path, bool]:
+        """Retorna (ruta del PNG, True si ya estaba en cache)"""
+        nombre = grafico[0]
+        ruta = self.directorio / firma[:2] / firma / f"{nombre}.png"
+        if ruta.exists():
+            return ruta, True
+
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        _escribir_atomico(ruta, self._dibujar(grafico))
+        return ruta, False
+
+    def _dibujar(self, grafico: Grafico) -> bytes:
+        """Dibuja el gráfico y retorna el PNG"""
+        from io import BytesIO
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        _, titulo, tipo, etiquetas, valores = grafico
+
+        figura = Figure(figsize=(7, 3.2), dpi=110)
+        FigureCanvasAgg(figura)
+        ejes = figura.add_subplot(1, 1, 1)
+
+        if tipo == "linea":
+            ejes.plot(etiquetas, valores, marker="o", color="#2c7a3f")
+            ejes.tick_params(axis="x", labelrotation=45, labelsize=7)
+        else:
+            ejes.bar(etiquetas, valores, color="#2c7a3f")
+            ejes.tick_params(axis="x", labelrotation=30, labelsize=8)
+
+        ejes.set_title(titulo, fontsize=10)
+        ejes.grid(axis="y", alpha=0.3)
+        figura.tight_layout()
+
+        buffer = BytesIO()
+        figura.savefig(buffer, format="png")
+        return buffer.getvalue()
+
+
+class PdfReporteRenderer:
+    """Renderizador de reportes a PDF
+    Responsabilidad única: Convertir los datos de un reporte en un PDF paginado"""
+
+    MAX_GRAFICOS = 8
+    MAX_FILAS_TABLA = 500
+
+    # Datos técnicos de la generación, no del negocio
+    CLAVES_EXCLUIDAS = ("metadata",)
+
+    def __init__(self, directorio: Optional[Path] = None):
+        self.directorio = Path(
+            directorio
+            or getattr(settings, "REPORTES_PDF_DIR", None)
+            or Path(settings.MEDIA_ROOT) / "reportes"
+        )
+        self.cache_graficos = CacheGraficos(self.directorio / "graficos")
+
+    def ruta_pdf(self, reporte_id: int, firma: str) -> Path:
+        """Ruta del PDF para una versión concreta del reporte"""
+        return self.directorio / "pdf" / f"reporte_{reporte_id}_{firma[:16]}.pdf"
+
+    def obtener_existente(
+        self, reporte_id: int, tipo_reporte: str, periodo: str, datos: Dict
+    ) -> Optional[Path]:
+        """Ruta del PDF si ya fue generado para el contenido actual"""
+        firma = calcular_firma_reporte(tipo_reporte, periodo, datos)
+        ruta = self.ruta_pdf(reporte_id, firma)
+        return ruta if ruta.exists() else None
+
+    def renderizar(
+        self, reporte_id: int, tipo_reporte: str, periodo: str, datos: Dict
+    ) -> Dict[str, Any]:
+        """
+        Genera el PDF del reporte (o reutiliza el existente)
+
+        Returns:
+            Dict[str, Any]: Ruta, nombre, tamaño, páginas, gráficos y tiempos
+        """
+        inicio = time.time()
+        firma = calcular_firma_reporte(tipo_reporte, periodo, datos)
+        ruta = self.ruta_pdf(reporte_id, firma)
+        graficos_en_cache = 0
+        paginas = None
+
+        if not ruta.exists():
+            graficos = []
+            for grafico in self._extraer_graficos(datos):
+                ruta_png, en_cache = self.cache_graficos.obtener(firma, grafico)
+                graficos.append((grafico[1], ruta_png))
+                graficos_en_cache += int(en_cache)
+
+            ruta.parent.mkdir(parents=True, exist_ok=True)
+            contenido, paginas = self._construir_pdf(
+                tipo_reporte, periodo, datos, graficos
+            )
+            _escribir_atomico(ruta, contenido)
+            total_graficos = len(graficos)
+        else:
+            total_graficos = len(list(self._extraer_graficos(datos)))
+
+        return {
+            "ruta_archivo": str(ruta),
+            "nombre_archivo": f"reporte_{tipo_reporte}_{reporte_id}.pdf",
+            "content_type": CONTENT_TYPE_PDF,
+            "tamaño_bytes": ruta.stat().st_size,
+            "paginas": paginas,
+            "firma": firma,
+            "graficos": total_graficos,
+            "graficos_en_cache": graficos_en_cache,
+            "fecha_renderizado": timezone.now().isoformat(),
+            "tiempo_procesamiento": round(time.time() - inicio, 3),
+        }
+
+    def _construir_pdf(
+        self,
+        tipo_reporte: str,
+        periodo: str,
+        datos: Dict,
+        graficos: Sequence[Tuple[str, Path]],
+    ) -> Tuple[bytes, int]:
+        """Arma el documento con reportlab y retorna (bytes, páginas)"""
+        from io import BytesIO
+
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.lib.units import cm
+        from reportlab.platypus import (
+            Image,
+            KeepTogether,
+            Paragraph,
+            SimpleDocTemplate,
+            Spacer,
+            Table,
+            TableStyle,
+        )
+
+        estilos = getSampleStyleSheet()
+        titulo = f"Reporte {tipo_reporte.replace('_', ' ').title()}"
+        paginas = {"total": 0}
+
+        def pie_de_pagina(canvas, documento):
+            paginas["total"] = documento.page
+            canvas.saveState()
+            canvas.setFont("Helvetica", 8)
+            canvas.setFillColor(colors.grey)
+            canvas.drawString(2 * cm, 1.2 * cm, f"{titulo} - {periodo}")
+            canvas.drawRightString(A4[0] - 2 * cm, 1.2 * cm, f"Página {documento.page}")
+            canvas.restoreState()
+
+        estilo_tabla = TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2c7a3f")),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                ("FONTSIZE", (0, 0), (-1, -1), 8),
+                ("GRID", (0, 0), (-1, -1), 0.25, colors.lightgrey),
+                (
+                    "ROWBACKGROUNDS",
+                    (0, 1),
+                    (-1, -1),
+                    [colors.white, colors.HexColor("#f3f7f4")],
+                ),
+            ]
+        )
+
+        historia = [
+            Paragraph(titulo, estilos["Title"]),
+            Paragraph(f"Periodo: {periodo}", estilos["Normal"]),
+            Paragraph(
+                f"Generado: {timezone.now().strftime('%Y-%m-%d %H:%M')}",
+                estilos["Normal"],
+            ),
+            Spacer(1, 0.5 * cm),
+        ]
+
+        for seccion, filas in self._secciones(datos):
+            tabla = Table(filas, repeatRows=1, hAlign="LEFT")
+            tabla.setStyle(estilo_tabla)
+            historia.append(Paragraph(seccion, estilos["Heading3"]))
+            historia.append(tabla)
+            historia.append(Spacer(1, 0.4 * cm))
+
+        for titulo_grafico, ruta_png in graficos:
+            historia.append(
+                KeepTogether(
+                    [
+                        Paragraph(titulo_grafico, estilos["Heading4"]),
+                        Image(str(ruta_png), width=16 * cm, height=7.3 * cm),
+                    ]
+                )
+            )
+
+        buffer = BytesIO()
+        documento = SimpleDocTemplate(
+            buffer, pagesize=A4, title=titulo, bottomMargin=2 * cm
+        )
+        documento.build(historia, onFirstPage=pie_de_pagina, onLaterPages=pie_de_pagina)
+        return buffer.getvalue(), paginas["total"]
+
+    def _secciones(
+        self, datos: Dict[str, Any], prefijo: str = ""
+    ) -> Iterator[Tuple[str, List[List[Any]]]]:
+        """Convierte el diccionario del reporte en tablas (título, filas)"""
+        escalares = [
+            [self._etiqueta(clave), self._formatear(valor)]
+            for clave, valor in datos.items()
+            if not isinstance(valor, (dict, list))
+        ]
+        if escalares:
+            yield prefijo or "Resumen", [["Indicador", "Valor"]] + escalares
+
+        for clave, valor in datos.items():
+            if clave in self.CLAVES_EXCLUIDAS:
+                continue
+            titulo = self._etiqueta(f"{prefijo} {clave}" if prefijo else clave)
+            if isinstance(valor, dict) and valor:
+                if all(isinstance(v, dict) for v in valor.values()):
+                    columnas = sorted({c for v in valor.values() for c in v})
+                    filas = [
+                        [self._etiqueta(clave)] + [self._etiqueta(c) for c in columnas]
+                    ]
+                    filas += [
+                        [nombre] + [self._formatear(v.get(c)) for c in columnas]
+                        for nombre, v in valor.items()
+                    ]
+                    yield titulo, filas[: self.MAX_FILAS_TABLA + 1]
+                else:
+                    yield from self._secciones(valor, titulo)
+            elif isinstance(valor, list) and valor and isinstance(valor[0], dict):
+                columnas = list(valor[0].keys())
+                filas = [[self._etiqueta(c) for c in columnas]]
+                filas += [
+                    [self._formatear(fila.get(c)) for c in columnas]
+                    for fila in valor[: self.MAX_FILAS_TABLA]
+                ]
+                yield titulo, filas
+
+    def _extraer_graficos(
+        self, datos: Dict[str, Any], ruta: Tuple[str, ...] = ()
+    ) -> Iterator[Grafico]:
+        """Detecta series graficables dentro de los datos del reporte"""
+        emitidos = 0
+        for clave, valor in datos.items():
+            if emitidos >= self.MAX_GRAFICOS:
+                return
+            if clave in self.CLAVES_EXCLUIDAS:
+                continue
+            nombre = "_".join(ruta + (clave,))
+            titulo = self._etiqueta(" ".join(ruta + (clave,)))
+
+            if isinstance(valor, dict) and len(valor) >= 2:
+                if all(isinstance(v, dict) and "total" in v for v in valor.values()):
+                    yield (
+                        nombre,
+                        f"{titulo} (total)",
+                        "barras",
+                        [str(k) for k in valor],
+                        [float(v["total"] or 0) for v in valor.values()],
+                    )
+                    emitidos += 1
+                    continue
+                if all(isinstance(v, (int, float)) for v in valor.values()):
+                    yield (
+                        nombre,
+                        titulo,
+                        "barras",
+                        [str(k) for k in valor],
+                        [float(v) for v in valor.values()],
+                    )
+                    emitidos += 1
+                    continue
+
+            es_mapa_de_categorias = isinstance(valor, dict) and any(
+                isinstance(v, dict) and "total" in v for v in valor.values()
+            )
+            if isinstance(valor, dict) and len(ruta) < 2 and not es_mapa_de_categorias:
+                for grafico in self._extraer_graficos(valor, ruta + (clave,)):
+                    if emitidos >= self.MAX_GRAFICOS:
+                        return
+                    yield grafico
+                    emitidos += 1
+            elif (
+                isinstance(valor, list)
+                and len(valor) >= 2
+                and isinstance(valor[0], dict)
+                and "fecha" in valor[0]
+            ):
+                serie = next(
+                    (
+                        c
+                        for c, v in valor[0].items()
+                        if c != "fecha" and isinstance(v, (int, float))
+                    ),
+                    None,
+                )
+                if serie:
+                    yield (
+                        nombre,
+                        f"{titulo}: {self._etiqueta(serie)}",
+                        "linea",
+                        [str(fila.get("fecha")) for fila in valor],
+                        [float(fila.get(serie) or 0) for fila in valor],
+                    )
+                    emitidos += 1
+
+    @staticmethod
+    def _etiqueta(clave: str) -> str:
+        return str(clave).replace("_", " ").strip().capitalize()
+
+    @staticmethod
+    def _formatear(valor: Any) -> str:
+        if valor is None:
+            return "-"
+        if isinstance(valor, float):
+            return f"{valor:,.2f}"
+        return str(valor)
+
+
+def _escribir_atomico(ruta: Path, contenido: bytes) -> None:
+    """Escribe en un temporal y lo renombra para no exponer archivos a medias"""
+    descriptor, temporal = tempfile.mkstemp(dir=ruta.parent, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(contenido)
+        os.replace(temporal, ruta)
+    except Exception:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
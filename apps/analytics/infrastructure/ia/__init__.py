@@ -0,0 +1,32 @@
+"""
+Integración con el servicio de IA para la aplicación de analytics
+Clientes intercambiables, generación masiva de logos con concurrencia acotada,
+cache de resultados por huella de prompt y límite de tasa por modelo
+"""
+
+from .cache_prompts import CachePromptsIA, ResultadoCacheado
+from .cliente_ia import (
+    ClienteIA,
+    ClienteIAHttp,
+    ClienteIASimulado,
+    ErrorServicioIA,
+    ResultadoIA,
+    obtener_cliente_ia,
+)
+from .limitador_tasa import LimitadorTasaIA, LimiteTasaIAExcedido
+from .pipeline_logos import PipelineGeneracionLogos, SolicitudLogo
+
+__all__ = [
+    "CachePromptsIA",
+    "ResultadoCacheado",
+    "ClienteIA",
+    "ClienteIAHttp",
+    "ClienteIASimulado",
+    "ErrorServicioIA",
+    "ResultadoIA",
+    "obtener_cliente_ia",
+    "LimitadorTasaIA",
+    "LimiteTasaIAExcedido",
+    "PipelineGeneracionLogos",
+    "SolicitudLogo",
+]
@@ -0,0 +1,196 @@
+"""
+Cache de resultados del servicio de IA por huella de prompt
+Responsabilidad única: Encontrar un logo exitoso ya generado con el mismo prompt,
+modelo y parámetros para reutilizarlo en vez de volver a llamar a la IA
+"""
+
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.analytics.domain.enums import CalidadLogo
+from apps.analytics.infrastructure.models import LogoMarcaBovinaModel
+
+
+@dataclass(frozen=True)
+class ResultadoCacheado:
+    """Logo original que puede reutilizarse (vigente hasta fecha + TTL)"""
+
+    logo_id: int
+    url_logo: str
+    calidad: CalidadLogo
+    fecha_generacion: datetime
+
+
+class CachePromptsIA:
+    """
+    Cache en dos niveles indexado por `huella_prompt`
+
+    La base de datos es la fuente de verdad: un logo original (no reutilizado)
+    exitoso con la misma huella y generado dentro de IA_CACHE_PROMPTS_TTL_SEGUNDOS
+    es un acierto. Delante hay un LRU por proceso de IA_CACHE_PROMPTS_MAX_ENTRADAS
+    huellas; sus aciertos se confirman con una consulta por clave primaria para
+    no reutilizar logos borrados o marcados como fallidos. Los contadores son del
+    proceso y se exponen en rendimiento_modelos_ia.
+    """
+
+    _entradas: "OrderedDict[str, ResultadoCacheado]" = OrderedDict()
+    _lock = threading.Lock()
+    _contadores: Counter = Counter()
+
+    def __init__(
+        self,
+        ttl_segundos: Optional[int] = None,
+        max_entradas: Optional[int] = None,
+        activo: Optional[bool] = None,
+    ):
+        self.ttl = timedelta(
+            seconds=(
+                ttl_segundos
+                if ttl_segundos is not None
+                else getattr(settings, "IA_CACHE_PROMPTS_TTL_SEGUNDOS", 604800)
+            )
+        )
+        self.max_entradas = max_entradas or getattr(
+            settings, "IA_CACHE_PROMPTS_MAX_ENTRADAS", 10000
+        )
+        self.activo = (
+            activo
+            if activo is not None
+            else getattr(settings, "IA_CACHE_PROMPTS_ACTIVO", True)
+        )
+
+    def buscar(self, huellas: Iterable[str]) -> Dict[str, ResultadoCacheado]:
+        """Retorna {huella: resultado} para las huellas con un logo reutilizable"""
+        solicitadas = list(huellas)
+        huellas = set(solicitadas)
+        ahora = timezone.now()
+        encontrados: Dict[str, ResultadoCacheado] = {}
+        with self._lock:
+            for huella in huellas:
+                resultado = self._entradas.get(huella)
+                if resultado is None:
+                    continue
+                if resultado.fecha_generacion + self.ttl <= ahora:
+                    del self._entradas[huella]
+                    continue
+                self._entradas.move_to_end(huella)
+                encontrados[huella] = resultado
+
+        if encontrados:
+            vigentes = dict(
+                LogoMarcaBovinaModel.objects.filter(
+                    id__in={r.logo_id for r in encontrados.values()}, exito=True
+                ).values_list("id", "url_logo")
+            )
+            for huella, resultado in list(encontrados.items()):
+                if vigentes.get(resultado.logo_id) != resultado.url_logo:
+                    del encontrados[huella]
+                    self._descartar(huella)
+        en_memoria = set(encontrados)
+
+        faltantes = huellas - encontrados.keys()
+        if faltantes:
+            filas = (
+                LogoMarcaBovinaModel.objects.filter(
+                    huella_prompt__in=faltantes,
+                    exito=True,
+                    reutilizado_de__isnull=True,
+                    fecha_generacion__gt=ahora - self.ttl,
+                )
+                .order_by("-id")
+                .values_list(
+                    "id",
+                    "huella_prompt",
+                    "url_logo",
+                    "calidad_logo",
+                    "fecha_generacion",
+                )
+            )
+            desde_bd = {}
+            for logo_id, huella, url_logo, calidad, fecha in filas:
+                if huella not in desde_bd:
+                    desde_bd[huella] = ResultadoCacheado(
+                        logo_id, url_logo, CalidadLogo(calidad), fecha
+                    )
+            self._recordar(desde_bd)
+            encontrados.update(desde_bd)
+
+        # Los contadores son por solicitud: una huella repetida cuenta cada vez
+        aciertos = Counter(
+            "aciertos_memoria" if huella in en_memoria else "aciertos_bd"
+            for huella in solicitadas
+            if huella in encontrados
+        )
+        with self._lock:
+            self._contadores.update(aciertos)
+            self._contadores["fallos"] += len(solicitadas) - sum(aciertos.values())
+        return encontrados
+
+    def guardar(self, logos: Iterable[LogoMarcaBovinaModel]) -> None:
+        """Recuerda los logos originales exitosos recién persistidos"""
+        self._recordar(
+            {
+                logo.huella_prompt: ResultadoCacheado(
+                    logo.pk,
+                    logo.url_logo,
+                    CalidadLogo(logo.calidad_logo),
+                    logo.fecha_generacion,
+                )
+                for logo in logos
+                if logo.exito
+                and logo.pk
+                and logo.huella_prompt
+                and logo.reutilizado_de_id is None
+            }
+        )
+
+    def registrar_omitidos(self, cantidad: int) -> None:
+        """Cuenta las solicitudes que no consultaron el cache (regeneración forzada)"""
+        with self._lock:
+            self._contadores["omitidos"] += cantidad
+
+    def _recordar(self, resultados: Dict[str, ResultadoCacheado]) -> None:
+        if not resultados:
+            return
+        with self._lock:
+            for huella, resultado in resultados.items():
+                self._entradas[huella] = resultado
+                self._entradas.move_to_end(huella)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+
+    def _descartar(self, huella: str) -> None:
+        with self._lock:
+            self._entradas.pop(huella, None)
+
+    @classmethod
+    def estadisticas(cls) -> Dict[str, Any]:
+        """Aciertos, fallos y tasa de acierto del proceso"""
+        with cls._lock:
+            contadores = dict(cls._contadores)
+            entradas = len(cls._entradas)
+        aciertos = contadores.get("aciertos_memoria", 0) + contadores.get(
+            "aciertos_bd", 0
+        )
+        consultas = aciertos + contadores.get("fallos", 0)
+        return {
+            "aciertos_memoria": contadores.get("aciertos_memoria", 0),
+            "aciertos_bd": contadores.get("aciertos_bd", 0),
+            "fallos": contadores.get("fallos", 0),
+            "omitidos": contadores.get("omitidos", 0),
+            "tasa_acierto": round(aciertos / consultas * 100, 2) if consultas else 0,
+            "entradas_memoria": entradas,
+        }
+
+    @classmethod
+    def limpiar(cls) -> None:
+        """Vacía el LRU y reinicia los contadores"""
+        with cls._lock:
+            cls._entradas.clear()
+            cls._contadores.clear()
@@ -0,0 +1,259 @@
+"""
+Clientes del servicio de IA para generación de logos
+Responsabilidad única: Enviar un prompt al servicio de IA y devolver la URL del
+logo generado, con timeouts, reintentos y límite de tasa
+"""
+
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urljoin
+
+import requests
+from django.conf import settings
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
+
+from apps.analytics.domain.enums import CalidadLogo, ModeloIA
+from .limitador_tasa import LimitadorTasaIA
+
+
+class ErrorServicioIA(Exception):
+    """El servicio de IA no generó el logo (tras agotar los reintentos)"""
+
+    def __init__(self, mensaje: str, intentos: int = 1, espera_segundos: float = 0):
+        super().__init__(mensaje)
+        self.intentos = intentos
+        self.espera_segundos = espera_segundos
+
+
+@dataclass(frozen=True)
+class ResultadoIA:
+    """Logo devuelto por el servicio de IA"""
+
+    url_logo: str
+    calidad: CalidadLogo = CalidadLogo.MEDIA
+    intentos: int = 1
+    # Tiempo esperando turno del limitador (no es latencia del servicio)
+    espera_segundos: float = 0.0
+
+
+class ClienteIA(ABC):
+    """
+    Interfaz de los clientes de IA
+
+    Las implementaciones deben poder usarse desde varios hilos a la vez.
+    """
+
+    @abstractmethod
+    def generar_logo(
+        self,
+        prompt: str,
+        modelo: ModeloIA,
+        parametros: Optional[Dict[str, Any]] = None,
+    ) -> ResultadoIA:
+        """
+        Genera un logo y retorna su URL
+
+        Raises:
+            ErrorServicioIA: Si el servicio no pudo generar el logo
+        """
+        pass
+
+    def verificar_capacidad(self, modelo: ModeloIA) -> None:
+        """
+        Rechaza de entrada el trabajo si el servicio no puede atenderlo pronto
+
+        Raises:
+            LimiteTasaIAExcedido: Si la cola del modelo está llena
+        """
+
+    @property
+    def url_servicio(self) -> str:
+        """URL que se registra en los logos fallidos"""
+        return getattr(settings, "IA_API_URL", "")
+
+
+class ClienteIAHttp(ClienteIA):
+    """
+    Cliente HTTP de IA_API_URL
+
+    POST {IA_API_URL}logos/generar/ con {"prompt", "modelo", "parametros"};
+    responde {"url": str, "calidad": "ALTA" | "MEDIA" | "BAJA"}. Usa una sesión
+    con pool de conexiones del tamaño de la concurrencia máxima y reintenta
+    errores de red, 429 y 5xx con backoff exponencial con jitter (respetando
+    Retry-After).
+
+    Cada intento, reintentos incluidos, toma un turno de LimitadorTasaIA. Un 429
+    no duerme localmente: penaliza el bucket del modelo por el Retry-After (o
+    el backoff) y el siguiente intento espera su turno como todos los demás.
+    """
+
+    RUTA_GENERACION = "logos/generar/"
+    ESTADOS_REINTENTABLES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        url_base: Optional[str] = None,
+        timeout_conexion: Optional[float] = None,
+        timeout_lectura: Optional[float] = None,
+        reintentos: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_maximo: Optional[float] = None,
+        tamaño_pool: Optional[int] = None,
+        limitador: Optional[LimitadorTasaIA] = None,
+    ):
+        self.limitador = limitador or LimitadorTasaIA()
+        self.url_base = url_base or settings.IA_API_URL
+        self.timeout = (
+            timeout_conexion or getattr(settings, "IA_TIMEOUT_CONEXION_SEGUNDOS", 5),
+            timeout_lectura or getattr(settings, "IA_TIMEOUT_LECTURA_SEGUNDOS", 120),
+        )
+        self.reintentos = (
+            reintentos
+            if reintentos is not None
+            else getattr(settings, "IA_REINTENTOS", 3)
+        )
+        self.backoff_base = backoff_base or getattr(
+            settings, "IA_BACKOFF_BASE_SEGUNDOS", 0.5
+        )
+        self.backoff_maximo = backoff_maximo or getattr(
+            settings, "IA_BACKOFF_MAXIMO_SEGUNDOS", 20
+        )
+
+        tamaño_pool = tamaño_pool or getattr(settings, "IA_CONCURRENCIA_MAXIMA", 8)
+        self.sesion = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=1, pool_maxsize=tamaño_pool)
+        self.sesion.mount("http://", adaptador)
+        self.sesion.mount("https://", adaptador)
+        token = getattr(settings, "IA_API_TOKEN", "")
+        if token:
+            self.sesion.headers["Authorization"] = f"Bearer {token}"
+
+    @property
+    def url_servicio(self) -> str:
+        return urljoin(self.url_base, self.RUTA_GENERACION)
+
+    def verificar_capacidad(self, modelo: ModeloIA) -> None:
+        self.limitador.verificar_capacidad(modelo)
+
+    def generar_logo(
+        self,
+        prompt: str,
+        modelo: ModeloIA,
+        parametros: Optional[Dict[str, Any]] = None,
+    ) -> ResultadoIA:
+        cuerpo = {"prompt": prompt, "modelo": modelo.value, "parametros": parametros}
+        ultimo_error = ""
+        espera_limitador = 0.0
+        for intento in range(1, self.reintentos + 2):
+            espera = None
+            espera_limitador += self.limitador.adquirir(modelo)
+            try:
+                respuesta = self.sesion.post(
+                    self.url_servicio, json=cuerpo, timeout=self.timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                ultimo_error = f"{type(e).__name__}: {e}"
+            else:
+                if respuesta.ok:
+                    return self._resultado(respuesta, intento, espera_limitador)
+                ultimo_error = f"HTTP {respuesta.status_code}"
+                if respuesta.status_code not in self.ESTADOS_REINTENTABLES:
+                    break
+                espera = self._retry_after(respuesta)
+                if respuesta.status_code == 429:
+                    self.limitador.penalizar(
+                        modelo, espera if espera is not None else self._backoff(intento)
+                    )
+                    continue
+
+            if intento <= self.reintentos:
+                time.sleep(espera if espera is not None else self._backoff(intento))
+
+        raise ErrorServicioIA(ultimo_error, intento, espera_limitador)
+
+    def _backoff(self, intento: int) -> float:
+        """Full jitter: aleatorio entre 0 y base * 2^(intento-1), con tope"""
+        return random.uniform(
+            0, min(self.backoff_maximo, self.backoff_base * 2 ** (intento - 1))
+        )
+
+    def _retry_after(self, respuesta: requests.Response) -> Optional[float]:
+        try:
+            return min(float(respuesta.headers["Retry-After"]), self.backoff_maximo)
+        except (KeyError, ValueError):
+            return None
+
+    @staticmethod
+    def _resultado(
+        respuesta: requests.Response, intento: int, espera_segundos: float
+    ) -> ResultadoIA:
+        try:
+            datos = respuesta.json()
+            url_logo = datos["url"]
+        except (ValueError, KeyError, TypeError):
+            raise ErrorServicioIA(
+                "Respuesta del servicio de IA sin URL", intento, espera_segundos
+            )
+        try:
+            calidad = CalidadLogo(datos.get("calidad", CalidadLogo.MEDIA.value))
+        except ValueError:
+            calidad = CalidadLogo.MEDIA
+        return ResultadoIA(
+            url_logo=url_logo,
+            calidad=calidad,
+            intentos=intento,
+            espera_segundos=espera_segundos,
+        )
+
+
+class ClienteIASimulado(ClienteIA):
+    """
+    Cliente local sin red (desarrollo y demos)
+
+    Devuelve una URL ficticia tras `latencia_segundos`, como la generación
+    simulada de GenerarLogoUseCase.
+    """
+
+    def __init__(self, latencia_segundos: float = 0.0):
+        self.latencia_segundos = latencia_segundos
+
+    def generar_logo(
+        self,
+        prompt: str,
+        modelo: ModeloIA,
+        parametros: Optional[Dict[str, Any]] = None,
+    ) -> ResultadoIA:
+        if self.latencia_segundos:
+            time.sleep(self.latencia_segundos)
+        return ResultadoIA(
+            url_logo=(
+                "https://storage.example.com/logos/"
+                f"{modelo.value.lower()}_{time.time_ns()}.png"
+            )
+        )
+
+
+_cliente: Optional[ClienteIA] = None
+_cliente_lock = threading.Lock()
+
+
+def obtener_cliente_ia() -> ClienteIA:
+    """Cliente configurado en IA_CLIENTE (ruta a la clase), compartido por proceso"""
+    global _cliente
+    if _cliente is None:
+        with _cliente_lock:
+            if _cliente is None:
+                clase = import_string(
+                    getattr(
+                        settings,
+                        "IA_CLIENTE",
+                        "apps.analytics.infrastructure.ia.ClienteIAHttp",
+                    )
+                )
+                _cliente = clase()
+    return _cliente
@@ -0,0 +1,278 @@
+"""
+Limitador de tasa de llamadas al servicio de IA
+Responsabilidad única: Repartir entre todos los procesos el cupo de llamadas por
+modelo de IA (token bucket en el cache de Django) con una cola de espera acotada
+"""
+
+import math
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.analytics.domain.enums import ModeloIA
+
+
+class LimiteTasaIAExcedido(Exception):
+    """La cola de espera del modelo está llena: reintentar más tarde"""
+
+    def __init__(self, modelo: ModeloIA, reintentar_en: float):
+        super().__init__(
+            f"Límite de tasa de {modelo.value} alcanzado; "
+            f"reintentar en {math.ceil(reintentar_en)} s"
+        )
+        self.modelo = modelo
+        self.reintentar_en = reintentar_en
+
+
+class LimitadorTasaIA:
+    """
+    Token bucket por modelo compartido en el cache de Django
+
+    Cada modelo acumula hasta IA_LIMITE_RAFAGA tokens a
+    IA_LIMITE_TASA_POR_SEGUNDO (o su valor en IA_LIMITE_TASA_POR_MODELO). Una
+    llamada reserva un token aunque el saldo quede negativo y espera lo que
+    tarda en reponerse, así las esperas salen en orden sin sondear el cache; el
+    saldo negativo es la cola y no puede pasar de IA_LIMITE_COLA_MAXIMA
+    reservas (LimiteTasaIAExcedido). Un 429 del servicio vacía el bucket por el
+    Retry-After para que todos los procesos frenen a la vez.
+
+    La lectura y escritura del bucket se protege con un lock de cache.add. Si el
+    cache no responde, la llamada pasa sin límite (se cuenta en
+    errores_cache). Las métricas son del proceso, como las de CachePromptsIA.
+    """
+
+    PREFIJO_CACHE = "ia_limite_tasa"
+    TASA_POR_SEGUNDO = 2.0
+    RAFAGA = 5
+    COLA_MAXIMA = 20
+    ESPERA_LOCK_SEGUNDOS = 2.0
+    TIMEOUT_LOCK_SEGUNDOS = 5
+
+    _lock = threading.Lock()
+    _metricas: Dict[str, Counter] = defaultdict(Counter)
+    _esperas_maximas: Dict[str, float] = defaultdict(float)
+
+    def __init__(
+        self,
+        tasa_por_segundo: Optional[float] = None,
+        tasa_por_modelo: Optional[Dict[str, float]] = None,
+        rafaga: Optional[int] = None,
+        cola_maxima: Optional[int] = None,
+        activo: Optional[bool] = None,
+    ):
+        self.tasa_por_segundo = tasa_por_segundo or getattr(
+            settings, "IA_LIMITE_TASA_POR_SEGUNDO", self.TASA_POR_SEGUNDO
+        )
+        self.tasa_por_modelo = (
+            tasa_por_modelo
+            if tasa_por_modelo is not None
+            else getattr(settings, "IA_LIMITE_TASA_POR_MODELO", {})
+        )
+        self.rafaga = rafaga or getattr(settings, "IA_LIMITE_RAFAGA", self.RAFAGA)
+        self.cola_maxima = (
+            cola_maxima
+            if cola_maxima is not None
+            else getattr(settings, "IA_LIMITE_COLA_MAXIMA", self.COLA_MAXIMA)
+        )
+        self.activo = (
+            activo
+            if activo is not None
+            else getattr(settings, "IA_LIMITE_TASA_ACTIVO", True)
+        )
+
+    # ------------------------------------------------------------------
+    # Reservas
+    # ------------------------------------------------------------------
+
+    def adquirir(self, modelo: ModeloIA) -> float:
+        """
+        Espera el turno de una llamada a `modelo`
+
+        Returns:
+            float: Segundos esperados
+
+        Raises:
+            LimiteTasaIAExcedido: Si la cola del modelo está llena
+        """
+        if not self.activo:
+            return 0.0
+        espera = self._reservar(modelo)
+        if espera > 0:
+            time.sleep(espera)
+        self._registrar(modelo, "reservas", espera)
+        return espera
+
+    def verificar_capacidad(self, modelo: ModeloIA) -> None:
+        """
+        Rechaza de entrada el trabajo para un modelo con la cola llena
+        (no reserva)
+
+        Raises:
+            LimiteTasaIAExcedido: Si la cola del modelo está llena
+        """
+        if not self.activo:
+            return
+        tasa = self._tasa(modelo)
+        tokens = self._saldo(modelo)
+        if tokens is not None and tokens - 1 < -self.cola_maxima:
+            self._registrar(modelo, "rechazos")
+            raise LimiteTasaIAExcedido(modelo, (-self.cola_maxima - tokens + 1) / tasa)
+
+    def penalizar(self, modelo: ModeloIA, segundos: float) -> None:
+        """Deja el bucket sin tokens por `segundos` (respuesta 429 del servicio)"""
+        if not self.activo or segundos <= 0:
+            return
+        try:
+            with self._bloqueo(modelo):
+                tokens, ahora = self._leer(modelo)
+                self._escribir(
+                    modelo, min(tokens, -segundos * self._tasa(modelo)), ahora
+                )
+        except Exception:
+            self._registrar(modelo, "errores_cache")
+            return
+        self._registrar(modelo, "penalizaciones")
+
+    def _reservar(self, modelo: ModeloIA) -> float:
+        tasa = self._tasa(modelo)
+        try:
+            with self._bloqueo(modelo):
+                tokens, ahora = self._leer(modelo)
+                if tokens - 1 < -self.cola_maxima:
+                    self._registrar(modelo, "rechazos")
+                    raise LimiteTasaIAExcedido(
+                        modelo, (-self.cola_maxima - tokens + 1) / tasa
+                    )
+                tokens -= 1
+                self._escribir(modelo, tokens, ahora)
+        except LimiteTasaIAExcedido:
+            raise
+        except Exception:
+            self._registrar(modelo, "errores_cache")
+            return 0.0
+        return max(-tokens, 0) / tasa
+
+    # ------------------------------------------------------------------
+    # Estado en el cache
+    # ------------------------------------------------------------------
+
+    def _clave(self, modelo: ModeloIA) -> str:
+        return f"{self.PREFIJO_CACHE}:{modelo.value}"
+
+    def _tasa(self, modelo: ModeloIA) -> float:
+        return float(self.tasa_por_modelo.get(modelo.value, self.tasa_por_segundo))
+
+    def _leer(self, modelo: ModeloIA) -> Tuple[float, float]:
+        """Saldo repuesto hasta ahora (el bucket arranca lleno)"""
+        ahora = time.time()
+        estado = cache.get(self._clave(modelo))
+        if estado is None:
+            return float(self.rafaga), ahora
+        tokens, marca = estado
+        return min(self.rafaga, tokens + (ahora - marca) * self._tasa(modelo)), ahora
+
+    def _escribir(self, modelo: ModeloIA, tokens: float, ahora: float) -> None:
+        # Pasado este tiempo el bucket estaría lleno otra vez: la clave puede expirar
+        vigencia = (self.rafaga - tokens) / self._tasa(modelo)
+        cache.set(self._clave(modelo), (tokens, ahora), math.ceil(vigencia) + 60)
+
+    def _saldo(self, modelo: ModeloIA) -> Optional[float]:
+        try:
+            return self._leer(modelo)[0]
+        except Exception:
+            self._registrar(modelo, "errores_cache")
+            return None
+
+    @contextmanager
+    def _bloqueo(self, modelo: ModeloIA):
+        """
+        Lock entre procesos con cache.add; expira solo si el dueño muere.
+        Pasado ESPERA_LOCK_SEGUNDOS se sigue sin él (mejor una llamada de más
+        que frenar la generación)
+        """
+        clave = f"{self._clave(modelo)}:lock"
+        dueño = uuid.uuid4().hex
+        limite = time.monotonic() + self.ESPERA_LOCK_SEGUNDOS
+        adquirido = cache.add(clave, dueño, self.TIMEOUT_LOCK_SEGUNDOS)
+        while not adquirido and time.monotonic() < limite:
+            time.sleep(0.002)
+            adquirido = cache.add(clave, dueño, self.TIMEOUT_LOCK_SEGUNDOS)
+        try:
+            yield
+        finally:
+            if adquirido and cache.get(clave) == dueño:
+                cache.delete(clave)
+
+    # ------------------------------------------------------------------
+    # Métricas
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _registrar(
+        cls, modelo: ModeloIA, evento: str, espera: Optional[float] = None
+    ) -> None:
+        with cls._lock:
+            metricas = cls._metricas[modelo.value]
+            metricas[evento] += 1
+            if espera:
+                metricas["esperas"] += 1
+                metricas["espera_total_segundos"] += espera
+                cls._esperas_maximas[modelo.value] = max(
+                    cls._esperas_maximas[modelo.value], espera
+                )
+
+    @classmethod
+    def estadisticas(cls) -> Dict[str, Any]:
+        """
+        Por modelo: reservas, esperas y rechazos del proceso y la cola actual
+        (reservas esperando un token en todos los procesos)
+        """
+        limitador = cls()
+        with cls._lock:
+            metricas = {modelo: dict(c) for modelo, c in cls._metricas.items()}
+            esperas_maximas = dict(cls._esperas_maximas)
+
+        resultado = {}
+        for modelo in ModeloIA:
+            propias = metricas.get(modelo.value, {})
+            saldo = limitador._saldo(modelo) if limitador.activo else None
+            reservas = propias.get("reservas", 0)
+            resultado[modelo.value] = {
+                "tasa_por_segundo": limitador._tasa(modelo),
+                "tokens_disponibles": (
+                    round(max(saldo, 0), 2) if saldo is not None else None
+                ),
+                "cola_actual": math.ceil(-saldo) if saldo and saldo < 0 else 0,
+                "reservas": reservas,
+                "esperas": propias.get("esperas", 0),
+                "espera_promedio_segundos": (
+                    round(propias.get("espera_total_segundos", 0) / reservas, 3)
+                    if reservas
+                    else 0
+                ),
+                "espera_maxima_segundos": round(
+                    esperas_maximas.get(modelo.value, 0), 3
+                ),
+                "rechazos": propias.get("rechazos", 0),
+                "penalizaciones": propias.get("penalizaciones", 0),
+                "errores_cache": propias.get("errores_cache", 0),
+            }
+        return {
+            "activo": limitador.activo,
+            "rafaga": limitador.rafaga,
+            "cola_maxima": limitador.cola_maxima,
+            "modelos": resultado,
+        }
+
+    @classmethod
+    def limpiar(cls) -> None:
+        """Reinicia las métricas del proceso"""
+        with cls._lock:
+            cls._metricas.clear()
+            cls._esperas_maximas.clear()
@@ -0,0 +1,295 @@
+"""
+Pipeline de generación masiva de logos
+Responsabilidad única: Llamar al servicio de IA con concurrencia acotada (global
+y por modelo), reutilizando resultados cacheados, y persistir en lotes
+"""
+
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from apps.analytics.domain.enums import CalidadLogo, ModeloIA
+from apps.analytics.infrastructure.models import LogoMarcaBovinaModel
+from apps.analytics.infrastructure.models.logo_marca_bovina_model import (
+    calcular_huella_prompt,
+)
+from .cache_prompts import CachePromptsIA, ResultadoCacheado
+from .cliente_ia import ClienteIA, ErrorServicioIA, obtener_cliente_ia
+from .limitador_tasa import LimiteTasaIAExcedido
+
+
+@dataclass(frozen=True)
+class SolicitudLogo:
+    """Logo a generar para una marca"""
+
+    marca_id: int
+    prompt: str
+    modelo: ModeloIA
+    parametros: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def huella(self) -> str:
+        return calcular_huella_prompt(self.prompt, self.modelo.value, self.parametros)
+
+
+class PipelineGeneracionLogos:
+    """
+    Genera logos en paralelo sin serializarse en la latencia de red
+
+    Cada modelo tiene su propio pool de hilos del tamaño de su límite
+    (IA_CONCURRENCIA_POR_MODELO) y un semáforo común limita las llamadas en
+    vuelo a IA_CONCURRENCIA_MAXIMA. Los hilos solo hablan con el servicio de IA;
+    el hilo que llama persiste los resultados con bulk_create cada
+    IA_LOTE_PERSISTENCIA logos, a medida que van llegando. Los fallos también se
+    guardan (exito=False) para poder regenerarlos.
+
+    Antes de llamar a la IA se consulta CachePromptsIA por la huella de cada
+    solicitud: un acierto se guarda como un logo nuevo con la URL del original
+    (reutilizado_de) sin tocar la red, y las solicitudes repetidas dentro del
+    mismo lote esperan al resultado de la primera. Con usar_cache=False se llama
+    siempre a la IA y el resultado nuevo reemplaza al cacheado.
+
+    Si la cola del limitador de tasa de algún modelo ya está llena, el lote se
+    rechaza entero con LimiteTasaIAExcedido antes de llamar a la IA o guardar
+    nada. La espera por el limitador no cuenta en tiempo_generacion_segundos.
+    """
+
+    CONCURRENCIA_MAXIMA = 8
+    LOTE_PERSISTENCIA = 200
+
+    def __init__(
+        self,
+        cliente: Optional[ClienteIA] = None,
+        concurrencia_maxima: Optional[int] = None,
+        concurrencia_por_modelo: Optional[Dict[str, int]] = None,
+        lote_persistencia: Optional[int] = None,
+        cache: Optional[CachePromptsIA] = None,
+    ):
+        self.cliente = cliente or obtener_cliente_ia()
+        self.cache = cache or CachePromptsIA()
+        self.concurrencia_maxima = concurrencia_maxima or getattr(
+            settings, "IA_CONCURRENCIA_MAXIMA", self.CONCURRENCIA_MAXIMA
+        )
+        self.concurrencia_por_modelo = (
+            concurrencia_por_modelo
+            if concurrencia_por_modelo is not None
+            else getattr(settings, "IA_CONCURRENCIA_POR_MODELO", {})
+        )
+        self.lote_persistencia = lote_persistencia or getattr(
+            settings, "IA_LOTE_PERSISTENCIA", self.LOTE_PERSISTENCIA
+        )
+
+    def ejecutar(
+        self, solicitudes: List[SolicitudLogo], usar_cache: bool = True
+    ) -> Tuple[List[LogoMarcaBovinaModel], Dict[str, Any]]:
+        """
+        Genera y persiste los logos
+
+        Returns:
+            Tuple: (logos guardados en el orden de las solicitudes, metadata)
+
+        Raises:
+            LimiteTasaIAExcedido: Si un modelo no tiene lugar en su cola
+        """
+        inicio = time.perf_counter()
+        usar_cache = usar_cache and self.cache.activo
+        huellas = [solicitud.huella for solicitud in solicitudes]
+        if usar_cache:
+            cacheados = self.cache.buscar(huellas)
+        else:
+            cacheados = {}
+            self.cache.registrar_omitidos(len(solicitudes))
+
+        logos: List[Optional[LogoMarcaBovinaModel]] = [None] * len(solicitudes)
+        pendientes: List[LogoMarcaBovinaModel] = []
+        por_modelo: Dict[ModeloIA, List[int]] = defaultdict(list)
+        # Solicitudes repetidas en el lote: huella -> índices que esperan al primero
+        en_espera: Dict[str, List[int]] = defaultdict(list)
+        for indice, (solicitud, huella) in enumerate(zip(solicitudes, huellas)):
+            if huella in cacheados:
+                logos[indice] = self._reutilizar(solicitud, huella, cacheados[huella])
+                pendientes.append(logos[indice])
+            elif usar_cache and huella in en_espera:
+                en_espera[huella].append(indice)
+            else:
+                if usar_cache:
+                    en_espera[huella] = []
+                por_modelo[solicitud.modelo].append(indice)
+        deduplicados = sum(len(indices) for indices in en_espera.values())
+        for modelo in por_modelo:
+            self.cliente.verificar_capacidad(modelo)
+
+        en_vuelo = threading.BoundedSemaphore(self.concurrencia_maxima)
+        pools = {
+            modelo: ThreadPoolExecutor(
+                max_workers=self._limite_modelo(modelo),
+                thread_name_prefix=f"logos-{modelo.value.lower()}",
+            )
+            for modelo in por_modelo
+        }
+        llamadas: Counter = Counter()
+        errores: Counter = Counter()
+        esperas: Counter = Counter()
+        try:
+            futuros = {
+                pools[modelo].submit(
+                    self._generar, solicitudes[i], huellas[i], en_vuelo
+                ): i
+                for modelo, indices in por_modelo.items()
+                for i in indices
+            }
+            while futuros:
+                listos, _ = wait(futuros, return_when=FIRST_COMPLETED)
+                for futuro in listos:
+                    indice = futuros.pop(futuro)
+                    logo, intentos, error, espera = futuro.result()
+                    llamadas[solicitudes[indice].modelo.value] += intentos
+                    esperas[solicitudes[indice].modelo.value] += espera
+                    if error:
+                        errores[error] += 1
+                        # Sin resultado que compartir: cada repetida llama a la IA
+                        for i in en_espera.pop(huellas[indice], []):
+                            futuros[
+                                pools[solicitudes[i].modelo].submit(
+                                    self._generar, solicitudes[i], huellas[i], en_vuelo
+                                )
+                            ] = i
+                    logos[indice] = logo
+                    pendientes.append(logo)
+                if len(pendientes) >= self.lote_persistencia:
+                    self._persistir(pendientes, solicitudes, logos, en_espera)
+                    pendientes = []
+            self._persistir(pendientes, solicitudes, logos, en_espera)
+        finally:
+            for pool in pools.values():
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        exitosos = sum(1 for logo in logos if logo.exito)
+        return logos, {
+            "total": len(logos),
+            "exitosos": exitosos,
+            "fallidos": len(logos) - exitosos,
+            "llamadas_por_modelo": dict(llamadas),
+            "espera_limite_tasa_segundos": {
+                modelo: round(segundos, 3) for modelo, segundos in esperas.items()
+            },
+            "errores": dict(errores.most_common(5)),
+            "cache": {
+                "usado": usar_cache,
+                "aciertos": sum(1 for huella in huellas if huella in cacheados),
+                "repetidos_en_lote": deduplicados,
+            },
+            "concurrencia_maxima": self.concurrencia_maxima,
+            "concurrencia_por_modelo": {
+                modelo.value: self._limite_modelo(modelo) for modelo in por_modelo
+            },
+            "duracion_segundos": round(time.perf_counter() - inicio, 3),
+        }
+
+    def _persistir(
+        self,
+        pendientes: List[LogoMarcaBovinaModel],
+        solicitudes: List[SolicitudLogo],
+        logos: List[Optional[LogoMarcaBovinaModel]],
+        en_espera: Dict[str, List[int]],
+    ) -> None:
+        """
+        Guarda los logos, los recuerda en el cache y crea (ya con el id del
+        original) los de las solicitudes repetidas que esperaban por ellos
+        """
+        while pendientes:
+            LogoMarcaBovinaModel.crear_en_lote(pendientes)
+            self.cache.guardar(pendientes)
+            repetidos = []
+            for logo in pendientes:
+                if not logo.exito or logo.reutilizado_de_id is not None:
+                    continue
+                original = ResultadoCacheado(
+                    logo.pk,
+                    logo.url_logo,
+                    CalidadLogo(logo.calidad_logo),
+                    logo.fecha_generacion,
+                )
+                for i in en_espera.pop(logo.huella_prompt, []):
+                    logos[i] = self._reutilizar(
+                        solicitudes[i], logo.huella_prompt, original
+                    )
+                    repetidos.append(logos[i])
+            pendientes = repetidos
+
+    @staticmethod
+    def _reutilizar(
+        solicitud: SolicitudLogo, huella: str, original: ResultadoCacheado
+    ) -> LogoMarcaBovinaModel:
+        """Logo nuevo para la marca con el resultado de otro ya generado"""
+        return LogoMarcaBovinaModel(
+            marca_id=solicitud.marca_id,
+            url_logo=original.url_logo,
+            exito=True,
+            tiempo_generacion_segundos=0,
+            modelo_ia_usado=solicitud.modelo.value,
+            prompt_usado=solicitud.prompt,
+            calidad_logo=original.calidad.value,
+            huella_prompt=huella,
+            reutilizado_de_id=original.logo_id,
+        )
+
+    def _limite_modelo(self, modelo: ModeloIA) -> int:
+        return max(
+            1,
+            min(
+                self.concurrencia_por_modelo.get(
+                    modelo.value, self.concurrencia_maxima
+                ),
+                self.concurrencia_maxima,
+            ),
+        )
+
+    def _generar(
+        self,
+        solicitud: SolicitudLogo,
+        huella: str,
+        en_vuelo: threading.BoundedSemaphore,
+    ) -> Tuple[LogoMarcaBovinaModel, int, Optional[str], float]:
+        """Llama al servicio de IA (sin tocar la base de datos)"""
+        with en_vuelo:
+            inicio = time.perf_counter()
+            try:
+                resultado = self.cliente.generar_logo(
+                    solicitud.prompt, solicitud.modelo, solicitud.parametros
+                )
+                intentos, error = resultado.intentos, None
+                espera = resultado.espera_segundos
+            except LimiteTasaIAExcedido as e:
+                resultado, intentos, error, espera = None, 0, str(e), 0.0
+            except ErrorServicioIA as e:
+                resultado, intentos, error = None, e.intentos, str(e)
+                espera = e.espera_segundos
+            except Exception as e:
+                resultado, intentos, error = None, 1, f"{type(e).__name__}: {e}"
+                espera = 0.0
+            duracion = max(time.perf_counter() - inicio - espera, 0)
+
+        logo = LogoMarcaBovinaModel(
+            marca_id=solicitud.marca_id,
+            # Un logo fallido no tiene URL: se registra la del servicio con un
+            # identificador único para poder distinguir cada intento
+            url_logo=(
+                resultado.url_logo
+                if resultado
+                else f"{self.cliente.url_servicio}#fallido-{uuid.uuid4().hex}"
+            ),
+            exito=resultado is not None,
+            tiempo_generacion_segundos=round(duracion),
+            modelo_ia_usado=solicitud.modelo.value,
+            prompt_usado=solicitud.prompt,
+            calidad_logo=(resultado.calidad if resultado else CalidadLogo.BAJA).value,
+            huella_prompt=huella,
+        )
+        return logo, intentos, error, espera
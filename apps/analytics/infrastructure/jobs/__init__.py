@@ -0,0 +1,22 @@
+"""
+Ejecución en segundo plano para la aplicación de analytics
+Trabajos de reportes que no deben correr dentro del request HTTP
+"""
+
+from .fan_out import EjecutorFanOut
+from .reporte_job_handlers import (
+    MANEJADORES_REPORTE_JOB,
+    TIPOS_SIN_REPORTE,
+    VALIDADORES_REPORTE_JOB,
+    registrar_manejador,
+)
+from .reporte_job_executor import ReporteJobExecutor
+
+__all__ = [
+    "EjecutorFanOut",
+    "MANEJADORES_REPORTE_JOB",
+    "TIPOS_SIN_REPORTE",
+    "VALIDADORES_REPORTE_JOB",
+    "registrar_manejador",
+    "ReporteJobExecutor",
+]
@@ -0,0 +1,121 @@
+"""
+Ejecución concurrente de subreportes independientes
+Responsabilidad única: Lanzar tareas de solo lectura en paralelo, cada una con su
+propia conexión a la base de datos, y devolver resultados y tiempos
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+Tarea = Callable[[], Any]
+
+
+class EjecutorFanOut:
+    """
+    Ejecuta un conjunto de tareas independientes y reúne sus resultados
+
+    El pool es propio (distinto del de ReporteJobExecutor) para que un trabajo
+    en segundo plano pueda hacer fan-out sin esperar por hilos de su mismo pool.
+    Dentro de un bloque atomic las tareas se ejecutan en serie: otra conexión no
+    vería los datos no confirmados de la transacción actual.
+    """
+
+    _pool: Optional[ThreadPoolExecutor] = None
+    _pool_lock = threading.Lock()
+
+    def __init__(self, paralelo: Optional[bool] = None):
+        if paralelo is None:
+            paralelo = getattr(settings, "REPORTE_FAN_OUT_PARALELO", True)
+        self.paralelo = paralelo
+
+    @classmethod
+    def _obtener_pool(cls) -> ThreadPoolExecutor:
+        """Crea el pool la primera vez que se necesita"""
+        if cls._pool is None:
+            with cls._pool_lock:
+                if cls._pool is None:
+                    cls._pool = ThreadPoolExecutor(
+                        max_workers=getattr(settings, "REPORTE_FAN_OUT_MAX_WORKERS", 4),
+                        thread_name_prefix="reporte-fan-out",
+                    )
+        return cls._pool
+
+    def ejecutar(
+        self,
+        tareas: Dict[str, Tarea],
+        al_completar: Optional[Callable[[str, int, int], None]] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Ejecuta las tareas y retorna (resultados, metadata)
+
+        Args:
+            tareas: Nombre de la tarea -> función sin argumentos
+            al_completar: Callback (nombre, completadas, total) tras cada tarea
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, Any]]: Resultados por nombre y
+                metadata con modo de ejecución y tiempos por tarea en segundos
+
+        Raises:
+            Exception: La primera excepción lanzada por una tarea
+        """
+        inicio = time.perf_counter()
+        resultados: Dict[str, Any] = {}
+        tiempos: Dict[str, float] = {}
+        total = len(tareas)
+        paralelo = self.paralelo and total > 1 and not connection.in_atomic_block
+
+        if paralelo:
+            # Cada tarea hereda el contexto del llamador (p. ej. si el request
+            # ya escribió y debe leer de la primaria en vez de la réplica)
+            futuros = {
+                self._obtener_pool().submit(
+                    contextvars.copy_context().run, self._ejecutar_en_worker, tarea
+                ): nombre
+                for nombre, tarea in tareas.items()
+            }
+            for completadas, futuro in enumerate(as_completed(futuros), start=1):
+                nombre = futuros[futuro]
+                resultados[nombre], tiempos[nombre] = futuro.result()
+                if al_completar:
+                    al_completar(nombre, completadas, total)
+        else:
+            for completadas, (nombre, tarea) in enumerate(tareas.items(), start=1):
+                resultados[nombre], tiempos[nombre] = self._medir(tarea)
+                if al_completar:
+                    al_completar(nombre, completadas, total)
+
+        metadata = {
+            "modo_ejecucion": "paralelo" if paralelo else "serie",
+            "tiempos_subreportes": {
+                nombre: round(tiempos[nombre], 4) for nombre in tareas
+            },
+            "tiempo_total_segundos": round(time.perf_counter() - inicio, 4),
+        }
+        return {nombre: resultados[nombre] for nombre in tareas}, metadata
+
+    @staticmethod
+    def _medir(tarea: Tarea) -> Tuple[Any, float]:
+        """Ejecuta la tarea y mide su duración"""
+        inicio = time.perf_counter()
+        resultado = tarea()
+        return resultado, time.perf_counter() - inicio
+
+    def _ejecutar_en_worker(self, tarea: Tarea) -> Tuple[Any, float]:
+        """
+        Ejecuta la tarea con la conexión propia del hilo worker
+
+        La conexión se reutiliza entre tareas del mismo hilo y se cierra según
+        CONN_MAX_AGE, igual que al inicio y fin de un request.
+        """
+        close_old_connections()
+        try:
+            return self._medir(tarea)
+        finally:
+            close_old_connections()
@@ -0,0 +1,150 @@
+"""
+Ejecutor de trabajos de reportes en segundo plano
+Responsabilidad única: Correr los manejadores fuera del request HTTP y
+registrar estado, progreso y resultado de cada trabajo
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections
+
+from apps.analytics.domain.repositories.reporte_job_repository import (
+    ReporteJobRepository,
+)
+from apps.analytics.domain.repositories.reporte_repository import ReporteRepository
+from .reporte_job_handlers import (
+    MANEJADORES_REPORTE_JOB,
+    TIPOS_SIN_REPORTE,
+    VALIDADORES_REPORTE_JOB,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReporteJobExecutor:
+    """
+    Ejecuta trabajos de reportes en un pool de hilos compartido por el proceso
+
+    Con REPORTE_JOBS_EAGER=True el trabajo se ejecuta en el hilo que lo envía,
+    útil para pruebas y para entornos sin workers. Al crearse por primera vez en
+    un proceso marca como fallidos los trabajos abandonados (ver
+    _fallar_abandonados).
+    """
+
+    _pool: Optional[ThreadPoolExecutor] = None
+    _pool_lock = threading.Lock()
+    _abandonados_revisados = False
+
+    def __init__(
+        self,
+        reporte_job_repository: ReporteJobRepository,
+        reporte_repository: ReporteRepository,
+    ):
+        self.reporte_job_repository = reporte_job_repository
+        self.reporte_repository = reporte_repository
+        self._fallar_abandonados()
+
+    def _fallar_abandonados(self) -> None:
+        """
+        Una vez por proceso: los trabajos del pool mueren con el proceso que los
+        ejecutaba, así que los que siguen pendientes o en proceso después de
+        REPORTE_JOBS_TIMEOUT_MINUTOS se marcan fallidos y liberan su firma
+        """
+        with ReporteJobExecutor._pool_lock:
+            if ReporteJobExecutor._abandonados_revisados:
+                return
+            ReporteJobExecutor._abandonados_revisados = True
+
+        minutos = getattr(settings, "REPORTE_JOBS_TIMEOUT_MINUTOS", 60)
+        try:
+            total = self.reporte_job_repository.fallar_en_curso_anteriores(
+                datetime.now() - timedelta(minutes=minutos),
+                f"Trabajo abandonado: seguía en curso después de {minutos} minutos "
+                "(el proceso que lo ejecutaba terminó)",
+            )
+        except DatabaseError:
+            logger.warning("No se pudieron revisar los trabajos abandonados")
+            return
+        if total:
+            logger.warning(
+                "%s trabajos de reportes abandonados marcados fallidos", total
+            )
+
+    @classmethod
+    def _obtener_pool(cls) -> ThreadPoolExecutor:
+        """Crea el pool la primera vez que se necesita"""
+        if cls._pool is None:
+            with cls._pool_lock:
+                if cls._pool is None:
+                    cls._pool = ThreadPoolExecutor(
+                        max_workers=getattr(settings, "REPORTE_JOBS_MAX_WORKERS", 2),
+                        thread_name_prefix="reporte-job",
+                    )
+        return cls._pool
+
+    def tipos_soportados(self) -> List[str]:
+        """Tipos de reporte que pueden encolarse"""
+        return sorted(MANEJADORES_REPORTE_JOB)
+
+    def validar_parametros(
+        self, tipo_reporte: str, parametros: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Parámetros normalizados del tipo; ValueError si no son válidos"""
+        return VALIDADORES_REPORTE_JOB[tipo_reporte](parametros)
+
+    def enviar(self, job_id: int) -> None:
+        """Envía el trabajo al pool (o lo ejecuta de inmediato en modo eager)"""
+        if getattr(settings, "REPORTE_JOBS_EAGER", False):
+            self.ejecutar(job_id)
+            return
+
+        self._obtener_pool().submit(self._ejecutar_en_worker, job_id)
+
+    def _ejecutar_en_worker(self, job_id: int) -> None:
+        """Ejecuta el trabajo con una conexión propia del hilo worker"""
+        close_old_connections()
+        try:
+            self.ejecutar(job_id)
+        finally:
+            # Con CONN_MAX_AGE la conexión del hilo se reutiliza entre trabajos
+            close_old_connections()
+
+    def ejecutar(self, job_id: int) -> None:
+        """Ejecuta el manejador del trabajo y registra el resultado"""
+        job = self.reporte_job_repository.obtener_por_id(job_id)
+        if job is None:
+            logger.warning("Trabajo de reporte %s no encontrado", job_id)
+            return
+
+        try:
+            manejador = MANEJADORES_REPORTE_JOB[job.tipo_reporte]
+        except KeyError:
+            self.reporte_job_repository.marcar_fallido(
+                job_id, f"Tipo de reporte no soportado: {job.tipo_reporte}"
+            )
+            return
+
+        self.reporte_job_repository.marcar_en_proceso(job_id)
+
+        def reportar_progreso(progreso: int) -> None:
+            self.reporte_job_repository.actualizar_progreso(job_id, progreso)
+
+        try:
+            datos, periodo_inicio, periodo_fin = manejador(
+                self.reporte_repository, job.parametros, reportar_progreso
+            )
+            self.reporte_job_repository.marcar_completado(
+                job_id,
+                datos,
+                periodo_inicio,
+                periodo_fin,
+                crear_reporte=job.tipo_reporte not in TIPOS_SIN_REPORTE,
+            )
+        except Exception as e:
+            logger.exception("Error ejecutando trabajo de reporte %s", job_id)
+            self.reporte_job_repository.marcar_fallido(job_id, str(e))
@@ -0,0 +1,271 @@
+"""
+Manejadores de trabajos de reportes
+Cada manejador traduce los parámetros del trabajo a llamadas del repositorio de
+reportes y devuelve los datos a almacenar junto con el periodo cubierto. Su
+validador normaliza los parámetros antes de encolar el trabajo
+"""
+
+from datetime import MAXYEAR, MINYEAR, date, datetime, time, timedelta
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from apps.analytics.domain.repositories.reporte_repository import ReporteRepository
+
+# (datos, periodo_inicio, periodo_fin)
+ResultadoManejador = Tuple[Dict[str, Any], date, date]
+ReportarProgreso = Callable[[int], None]
+Manejador = Callable[
+    [ReporteRepository, Dict[str, Any], ReportarProgreso], ResultadoManejador
+]
+# Valida los parámetros y retorna su forma normalizada (lanza ValueError)
+Validador = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+MANEJADORES_REPORTE_JOB: Dict[str, Manejador] = {}
+VALIDADORES_REPORTE_JOB: Dict[str, Validador] = {}
+# Tipos cuyo resultado se guarda en el trabajo y no como un ReporteData nuevo
+TIPOS_SIN_REPORTE: Set[str] = set()
+
+
+def registrar_manejador(
+    tipo_reporte: str, validar: Validador, crea_reporte: bool = True
+) -> Callable[[Manejador], Manejador]:
+    """Registra un manejador para un tipo de reporte y su validador"""
+
+    def decorador(manejador: Manejador) -> Manejador:
+        MANEJADORES_REPORTE_JOB[tipo_reporte] = manejador
+        VALIDADORES_REPORTE_JOB[tipo_reporte] = validar
+        if not crea_reporte:
+            TIPOS_SIN_REPORTE.add(tipo_reporte)
+        return manejador
+
+    return decorador
+
+
+def _requerido(parametros: Dict[str, Any], nombre: str) -> Any:
+    valor = parametros.get(nombre)
+    if valor is None or valor == "":
+        raise ValueError(f"Parámetro {nombre} requerido")
+    return valor
+
+
+def _fecha(parametros: Dict[str, Any], nombre: str) -> date:
+    valor = _requerido(parametros, nombre)
+    try:
+        return date.fromisoformat(str(valor))
+    except ValueError:
+        raise ValueError(f"Parámetro {nombre} inválido (formato YYYY-MM-DD): {valor}")
+
+
+def _entero(
+    parametros: Dict[str, Any],
+    nombre: str,
+    minimo: int = 1,
+    maximo: Optional[int] = None,
+) -> int:
+    """Entero o texto con un entero; rechaza booleanos y decimales"""
+    valor = _requerido(parametros, nombre)
+    try:
+        if isinstance(valor, bool):
+            raise ValueError
+        entero = int(str(valor).strip())
+    except ValueError:
+        raise ValueError(f"Parámetro {nombre} inválido: {valor!r}")
+    if entero < minimo or (maximo is not None and entero > maximo):
+        rango = (
+            f"estar entre {minimo} y {maximo}"
+            if maximo is not None
+            else f"ser mayor o igual a {minimo}"
+        )
+        raise ValueError(f"Parámetro {nombre} debe {rango}")
+    return entero
+
+
+def _periodo(parametros: Dict[str, Any]) -> Tuple[date, date]:
+    fecha_inicio = _fecha(parametros, "fecha_inicio")
+    fecha_fin = _fecha(parametros, "fecha_fin")
+    if fecha_inicio > fecha_fin:
+        raise ValueError("La fecha de inicio no puede ser mayor que la fecha de fin")
+    return fecha_inicio, fecha_fin
+
+
+def _rango_periodo(parametros: Dict[str, Any]) -> Tuple[datetime, datetime]:
+    """Obtiene el rango [inicio 00:00, fin 23:59] desde fechas ISO"""
+    fecha_inicio, fecha_fin = _periodo(parametros)
+    return (
+        datetime.combine(fecha_inicio, time.min),
+        datetime.combine(fecha_fin, time.max),
+    )
+
+
+def _anio(parametros: Dict[str, Any]) -> int:
+    return _entero(parametros, "anio", MINYEAR, MAXYEAR)
+
+
+def _mes(parametros: Dict[str, Any]) -> int:
+    return _entero(parametros, "mes", 1, 12)
+
+
+def _rango_anio(anio: int) -> Tuple[datetime, datetime]:
+    return datetime(anio, 1, 1), datetime.combine(date(anio, 12, 31), time.max)
+
+
+def _validar_periodo(parametros: Dict[str, Any]) -> Dict[str, Any]:
+    fecha_inicio, fecha_fin = _periodo(parametros)
+    return {
+        "fecha_inicio": fecha_inicio.isoformat(),
+        "fecha_fin": fecha_fin.isoformat(),
+    }
+
+
+def _validar_anio(parametros: Dict[str, Any]) -> Dict[str, Any]:
+    return {"anio": _anio(parametros)}
+
+
+def _validar_mes(parametros: Dict[str, Any]) -> Dict[str, Any]:
+    return {"anio": _anio(parametros), "mes": _mes(parametros)}
+
+
+def _validar_personalizado(parametros: Dict[str, Any]) -> Dict[str, Any]:
+    """Periodo obligatorio en filtros; el resto lo valida el compilador"""
+    from apps.analytics.infrastructure.queries.reporte_personalizado_compiler import (
+        CompiladorReportePersonalizado,
+    )
+
+    filtros = parametros.get("filtros") or {}
+    if not isinstance(filtros, dict):
+        raise ValueError("filtros debe ser un objeto")
+    especificacion = {
+        **parametros,
+        "filtros": {**filtros, **_validar_periodo(filtros)},
+    }
+    # Deja el plan en cache para el worker
+    CompiladorReportePersonalizado().compilar(especificacion)
+    return especificacion
+
+
+def _validar_pdf(parametros: Dict[str, Any]) -> Dict[str, Any]:
+    return {"reporte_id": _entero(parametros, "reporte_id")}
+
+
+def _generar_consolidado(
+    reporte_repository: ReporteRepository,
+    inicio: datetime,
+    fin: datetime,
+    reportar_progreso: ReportarProgreso,
+) -> ResultadoManejador:
+    """Genera el consolidado informando progreso por subreporte terminado"""
+    reporte = reporte_repository.generar_reporte_consolidado(
+        inicio,
+        fin,
+        al_completar=lambda nombre, completadas, total: reportar_progreso(
+            int(completadas / total * 90)
+        ),
+    )
+    return reporte.datos, inicio.date(), fin.date()
+
+
+@registrar_manejador("marcas", _validar_periodo)
+def manejar_reporte_marcas(reporte_repository, parametros, reportar_progreso):
+    """Reporte de marcas del periodo"""
+    inicio, fin = _rango_periodo(parametros)
+    reporte = reporte_repository.generar_reporte_marcas(inicio, fin)
+    return reporte.datos, inicio.date(), fin.date()
+
+
+@registrar_manejador("logos", _validar_periodo)
+def manejar_reporte_logos(reporte_repository, parametros, reportar_progreso):
+    """Reporte de logos del periodo"""
+    inicio, fin = _rango_periodo(parametros)
+    reporte = reporte_repository.generar_reporte_logos(inicio, fin)
+    return reporte.datos, inicio.date(), fin.date()
+
+
+@registrar_manejador("kpis", _validar_periodo)
+def manejar_reporte_kpis(reporte_repository, parametros, reportar_progreso):
+    """Reporte de KPIs del periodo"""
+    inicio, fin = _rango_periodo(parametros)
+    reporte = reporte_repository.generar_reporte_kpis(inicio, fin)
+    return reporte.datos, inicio.date(), fin.date()
+
+
+@registrar_manejador("consolidado", _validar_periodo)
+def manejar_reporte_consolidado(reporte_repository, parametros, reportar_progreso):
+    """Reporte consolidado (marcas, logos y KPIs) del periodo"""
+    inicio, fin = _rango_periodo(parametros)
+    return _generar_consolidado(reporte_repository, inicio, fin, reportar_progreso)
+
+
+@registrar_manejador("anual", _validar_anio)
+def manejar_reporte_anual(reporte_repository, parametros, reportar_progreso):
+    """Reporte consolidado de un año completo"""
+    return _generar_consolidado(
+        reporte_repository, *_rango_anio(_anio(parametros)), reportar_progreso
+    )
+
+
+@registrar_manejador("ejecutivo_mensual", _validar_mes)
+def manejar_reporte_ejecutivo_mensual(
+    reporte_repository, parametros, reportar_progreso
+):
+    """Reporte consolidado de un mes (anio y mes)"""
+    anio = _anio(parametros)
+    mes = _mes(parametros)
+    siguiente = date(anio + 1, 1, 1) if mes == 12 else date(anio, mes + 1, 1)
+    return _generar_consolidado(
+        reporte_repository,
+        datetime(anio, mes, 1),
+        datetime.combine(siguiente - timedelta(days=1), time.max),
+        reportar_progreso,
+    )
+
+
+@registrar_manejador("comparativo_departamentos", _validar_periodo)
+def manejar_reporte_comparativo_departamentos(
+    reporte_repository, parametros, reportar_progreso
+):
+    """Comparativo por departamento del periodo"""
+    inicio, fin = _rango_periodo(parametros)
+    reporte = reporte_repository.generar_reporte_comparativo_departamentos(
+        inicio.date(), fin.date()
+    )
+    return reporte.datos, inicio.date(), fin.date()
+
+
+@registrar_manejador("personalizado", _validar_personalizado)
+def manejar_reporte_personalizado(reporte_repository, parametros, reportar_progreso):
+    """
+    Reporte compilado (filtros, metricas, agrupaciones); los filtros deben
+    incluir fecha_inicio y fecha_fin para acotar el periodo almacenado
+    """
+    inicio, fin = _rango_periodo(parametros.get("filtros") or {})
+    reporte = reporte_repository.consultar_reporte_personalizado(parametros)
+    return reporte.datos, inicio.date(), fin.date()
+
+
+@registrar_manejador("sostenibilidad", _validar_anio)
+@registrar_manejador("impacto_economico", _validar_anio)
+def manejar_reporte_sectorial_anual(reporte_repository, parametros, reportar_progreso):
+    """Reportes sectoriales anuales: consolidado del año (como sus use cases)"""
+    return _generar_consolidado(
+        reporte_repository, *_rango_anio(_anio(parametros)), reportar_progreso
+    )
+
+
+@registrar_manejador("innovacion_tecnologica", _validar_anio)
+def manejar_reporte_innovacion_tecnologica(
+    reporte_repository, parametros, reportar_progreso
+):
+    """Reporte de logos generados por IA durante el año"""
+    inicio, fin = _rango_anio(_anio(parametros))
+    reporte = reporte_repository.generar_reporte_logos(inicio, fin)
+    return reporte.datos, inicio.date(), fin.date()
+
+
+@registrar_manejador("pdf", _validar_pdf, crea_reporte=False)
+def manejar_pdf(reporte_repository, parametros, reportar_progreso):
+    """PDF con gráficos de un reporte ya almacenado (ruta y tamaño en el trabajo)"""
+    resultado = reporte_repository.renderizar_pdf(_entero(parametros, "reporte_id"))
+    return (
+        resultado,
+        date.fromisoformat(resultado["periodo_inicio"]),
+        date.fromisoformat(resultado["periodo_fin"]),
+    )
@@ -0,0 +1,16 @@
+"""
+Métricas de rendimiento para la aplicación de analytics
+Histogramas por endpoint (duración, consultas SQL, tamaño) en formato Prometheus
+y captura de consultas lentas con su plan de EXPLAIN
+"""
+
+from .consultas_lentas import ConsultasLentas
+from .medidor_sql import MedidorSQL
+from .metricas_endpoints import ORDENES_PEORES, MetricasEndpoints
+
+__all__ = [
+    "ConsultasLentas",
+    "MedidorSQL",
+    "MetricasEndpoints",
+    "ORDENES_PEORES",
+]
@@ -0,0 +1,259 @@
+"""
+Captura de consultas SQL lentas
+Responsabilidad única: Guardar en un buffer circular las consultas que superan
+el umbral, con su origen en el código y el plan de EXPLAIN
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+# Solo los frames del proyecto (controllers, use cases, repositorios, modelos)
+RAIZ_APPS = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Envolturas sin información de origen (este módulo, el router de réplica)
+DIRECTORIOS_OMITIDOS = tuple(
+    os.path.join(RAIZ_APPS, *partes) + os.sep
+    for partes in (
+        ("infrastructure", "metricas"),
+        ("infrastructure", "db"),
+        ("presentation", "middleware"),
+    )
+)
+
+SENTENCIAS_EXPLICABLES = ("SELECT", "WITH")
+LARGO_MAXIMO_SQL = 4000
+PLANES_EN_CACHE = 256
+
+# SQLite: "SCAN tabla" o "SCAN tabla USING INDEX x" (recorre toda la tabla,
+# en el orden del índice); un índice cubriente no cuenta. MySQL: type = ALL
+ESCANEO_SQLITE = re.compile(r"^SCAN (?:TABLE )?(\w+)\b(?! USING COVERING INDEX)")
+
+
+class ConsultasLentas:
+    """
+    Wrapper de ejecución instalado en cada conexión nueva (de cualquier hilo)
+
+    Cada consulta que tarda CONSULTAS_LENTAS_UMBRAL_MS o más se registra en el
+    log con su origen. También se guarda en el buffer circular del proceso
+    (CONSULTAS_LENTAS_CAPACIDAD entradas) que muestra el admin. El EXPLAIN se
+    ejecuta solo para SELECT, una vez por texto de consulta (los parámetros
+    no cuentan), en la misma conexión y con los mismos parámetros.
+    """
+
+    CAPACIDAD = 200
+    PROFUNDIDAD_ORIGEN = 8
+
+    _lock = threading.Lock()
+    _entradas: deque = deque(maxlen=CAPACIDAD)
+    _resumen: Dict[str, Dict[str, Any]] = {}
+    _planes: Dict[str, Dict[str, Any]] = {}
+    _local = threading.local()
+    _instalado = False
+
+    @classmethod
+    def instalar(cls) -> None:
+        """Engancha el wrapper en las conexiones que se abran desde ahora"""
+        if cls._instalado or not cls._umbral_segundos():
+            return
+        with cls._lock:
+            if cls._instalado:
+                return
+            capacidad = getattr(settings, "CONSULTAS_LENTAS_CAPACIDAD", cls.CAPACIDAD)
+            cls._entradas = deque(cls._entradas, maxlen=capacidad)
+            connection_created.connect(
+                cls._al_conectar, dispatch_uid="analytics_consultas_lentas"
+            )
+            cls._instalado = True
+        # Conexiones ya abiertas en este hilo (p. ej. durante las migraciones)
+        for conexion in connections.all(initialized_only=True):
+            cls._al_conectar(None, conexion)
+
+    @classmethod
+    def _al_conectar(cls, sender, connection, **kwargs) -> None:
+        # El objeto de conexión se reutiliza al reconectar: no duplicar
+        if cls.ejecutar not in connection.execute_wrappers:
+            connection.execute_wrappers.insert(0, cls.ejecutar)
+
+    @classmethod
+    def ejecutar(cls, execute, sql, params, many, context):
+        """Firma de connection.execute_wrapper"""
+        inicio = time.perf_counter()
+        resultado = execute(sql, params, many, context)
+        duracion = time.perf_counter() - inicio
+        umbral = cls._umbral_segundos()
+        if (
+            umbral
+            and duracion >= umbral
+            and not getattr(cls._local, "explicando", False)
+        ):
+            try:
+                cls._registrar(sql, params, many, context["connection"], duracion)
+            except Exception:
+                logger.exception("No se pudo registrar la consulta lenta")
+        return resultado
+
+    @classmethod
+    def _registrar(cls, sql, params, many, conexion, duracion) -> None:
+        origen = cls._origen()
+        plan = None if many else cls._plan(sql, params, conexion)
+        entrada = {
+            "fecha": datetime.now(),
+            "duracion_ms": round(duracion * 1000, 1),
+            "alias": conexion.alias,
+            "hilo": threading.current_thread().name,
+            "sql": sql[:LARGO_MAXIMO_SQL],
+            "origen": origen,
+            "plan": plan,
+        }
+        with cls._lock:
+            cls._entradas.append(entrada)
+            resumen = cls._resumen.get(sql)
+            if resumen is None:
+                if len(cls._resumen) >= cls._entradas.maxlen:
+                    cls._resumen.pop(
+                        min(cls._resumen, key=lambda k: cls._resumen[k]["total_ms"])
+                    )
+                resumen = cls._resumen[sql] = {
+                    "sql": entrada["sql"],
+                    "veces": 0,
+                    "total_ms": 0.0,
+                    "maximo_ms": 0.0,
+                    "origen": origen,
+                    "plan": plan,
+                }
+            resumen["veces"] += 1
+            resumen["total_ms"] = round(resumen["total_ms"] + entrada["duracion_ms"], 1)
+            resumen["maximo_ms"] = max(resumen["maximo_ms"], entrada["duracion_ms"])
+            resumen["ultima"] = entrada["fecha"]
+
+        logger.warning(
+            "Consulta lenta (%.1f ms) desde %s: %s",
+            entrada["duracion_ms"],
+            origen[-1] if origen else "?",
+            entrada["sql"][:500],
+            extra={
+                "consulta_lenta": {**entrada, "fecha": entrada["fecha"].isoformat()}
+            },
+        )
+
+    @classmethod
+    def _origen(cls) -> List[str]:
+        """Frames del proyecto del más externo al más interno"""
+        frames = []
+        for frame in traceback.extract_stack()[:-1]:
+            archivo = os.path.abspath(frame.filename)
+            if not archivo.startswith(RAIZ_APPS) or archivo.startswith(
+                DIRECTORIOS_OMITIDOS
+            ):
+                continue
+            relativo = os.path.relpath(archivo, RAIZ_APPS)
+            frames.append(f"{relativo}:{frame.lineno} {frame.name}")
+        return frames[-cls.PROFUNDIDAD_ORIGEN :]
+
+    @classmethod
+    def _plan(cls, sql, params, conexion) -> Optional[Dict[str, Any]]:
+        if not getattr(settings, "CONSULTAS_LENTAS_EXPLAIN", True):
+            return None
+        if not sql.lstrip().upper().startswith(SENTENCIAS_EXPLICABLES):
+            return None
+        with cls._lock:
+            plan = cls._planes.get(sql)
+        if plan is not None:
+            return plan
+
+        cls._local.explicando = True
+        try:
+            prefijo = conexion.ops.explain_query_prefix()
+            with conexion.cursor() as cursor:
+                cursor.execute(f"{prefijo} {sql}", params)
+                columnas = [columna[0] for columna in cursor.description]
+                filas = [dict(zip(columnas, fila)) for fila in cursor.fetchall()]
+            plan = {
+                "lineas": [_linea_plan(fila) for fila in filas],
+                "escaneos_completos": _escaneos_completos(conexion.vendor, filas),
+                "ordenamiento_temporal": _ordenamiento_temporal(conexion.vendor, filas),
+            }
+        except Exception as error:
+            plan = {
+                "lineas": [f"EXPLAIN falló: {error}"],
+                "escaneos_completos": [],
+                "ordenamiento_temporal": False,
+            }
+        finally:
+            cls._local.explicando = False
+
+        with cls._lock:
+            if len(cls._planes) >= PLANES_EN_CACHE:
+                cls._planes.clear()
+            cls._planes[sql] = plan
+        return plan
+
+    @classmethod
+    def _umbral_segundos(cls) -> float:
+        return getattr(settings, "CONSULTAS_LENTAS_UMBRAL_MS", 0) / 1000
+
+    # ------------------------------------------------------------------
+    # Consultas para el admin
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def recientes(cls, limite: int = 50) -> List[Dict[str, Any]]:
+        """Últimas consultas lentas (la más reciente primero)"""
+        with cls._lock:
+            return list(reversed(cls._entradas))[:limite]
+
+    @classmethod
+    def agrupadas(cls, limite: int = 50) -> List[Dict[str, Any]]:
+        """Consultas lentas agrupadas por texto, por tiempo total descendente"""
+        with cls._lock:
+            resumenes = [dict(resumen) for resumen in cls._resumen.values()]
+        resumenes.sort(key=lambda resumen: resumen["total_ms"], reverse=True)
+        return resumenes[:limite]
+
+    @classmethod
+    def limpiar(cls) -> None:
+        """Vacía el buffer, el resumen y los planes en cache"""
+        with cls._lock:
+            cls._entradas.clear()
+            cls._resumen.clear()
+            cls._planes.clear()
+
+
+def _linea_plan(fila: Dict[str, Any]) -> str:
+    if "detail" in fila:  # SQLite (EXPLAIN QUERY PLAN)
+        return fila["detail"]
+    return " | ".join(f"{clave}={valor}" for clave, valor in fila.items())
+
+
+def _escaneos_completos(vendor: str, filas: List[Dict[str, Any]]) -> List[str]:
+    """Tablas recorridas completas (candidatas a un índice)"""
+    tablas = []
+    for fila in filas:
+        if vendor == "sqlite":
+            coincidencia = ESCANEO_SQLITE.match(fila.get("detail", ""))
+            if coincidencia:
+                tablas.append(coincidencia.group(1))
+        elif vendor == "mysql" and fila.get("type") == "ALL":
+            tablas.append(str(fila.get("table")))
+    return tablas
+
+
+def _ordenamiento_temporal(vendor: str, filas: List[Dict[str, Any]]) -> bool:
+    """El ORDER BY no sale de un índice (filesort / temp b-tree)"""
+    if vendor == "sqlite":
+        return any("TEMP B-TREE" in fila.get("detail", "") for fila in filas)
+    if vendor == "mysql":
+        return any("filesort" in str(fila.get("Extra") or "") for fila in filas)
+    return False
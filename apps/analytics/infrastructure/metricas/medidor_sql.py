@@ -0,0 +1,39 @@
+"""
+Medidor de consultas SQL de un request
+Responsabilidad única: Contar y cronometrar las consultas que pasan por
+connection.execute_wrapper
+"""
+
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+
+class MedidorSQL:
+    """Wrapper de ejecución que acumula consultas y segundos en SQL"""
+
+    __slots__ = ("consultas", "segundos")
+
+    def __init__(self):
+        self.consultas = 0
+        self.segundos = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.segundos += time.perf_counter() - inicio
+            self.consultas += 1
+
+    @contextmanager
+    def midiendo(self):
+        """
+        Instala el wrapper en todas las bases de datos del hilo actual. Las
+        consultas de otros hilos (pools del pipeline o del fan-out) no cuentan
+        """
+        with ExitStack() as pila:
+            for conexion in connections.all():
+                pila.enter_context(conexion.execute_wrapper(self))
+            yield self
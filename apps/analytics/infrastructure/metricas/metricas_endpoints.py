@@ -0,0 +1,348 @@
+"""
+Métricas de rendimiento por endpoint
+Responsabilidad única: Acumular en histogramas del proceso la duración, consultas
+SQL y tamaño de respuesta de cada ruta, y exponerlos en formato Prometheus
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+# Límites superiores de las cubetas (la última, +Inf, es implícita)
+CUBETAS: Dict[str, Tuple[float, ...]] = {
+    "duracion_segundos": (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+    ),
+    "consultas_sql": (1, 2, 5, 10, 25, 50, 100, 250, 500),
+    "tiempo_sql_segundos": (
+        0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5,
+    ),
+    "tamaño_respuesta_bytes": (
+        256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304,
+    ),
+}  # fmt: skip
+
+# Nombre y ayuda de cada histograma en /metrics
+NOMBRES_PROMETHEUS = {
+    "duracion_segundos": (
+        "analytics_http_request_duration_seconds",
+        "Duración de la respuesta por ruta",
+    ),
+    "consultas_sql": (
+        "analytics_http_request_db_queries",
+        "Consultas SQL por request",
+    ),
+    "tiempo_sql_segundos": (
+        "analytics_http_request_db_seconds",
+        "Tiempo en consultas SQL por request",
+    ),
+    "tamaño_respuesta_bytes": (
+        "analytics_http_response_size_bytes",
+        "Tamaño del cuerpo de la respuesta",
+    ),
+}
+
+ORDENES_PEORES = (
+    "tiempo_total_segundos",
+    "duracion_p95",
+    "consultas_promedio",
+    "tiempo_sql_promedio",
+    "tamaño_promedio_bytes",
+    "errores_5xx",
+)
+
+
+class _Histograma:
+    __slots__ = ("conteos", "suma")
+
+    def __init__(self, cubetas: int):
+        self.conteos = [0] * (cubetas + 1)
+        self.suma = 0.0
+
+
+class MetricasEndpoints:
+    """
+    Histogramas por (ruta, método) compartidos por los hilos del proceso
+
+    Con METRICAS_DIRECTORIO_MULTIPROCESO cada proceso vuelca su instantánea a
+    un archivo propio del directorio (como mucho cada
+    METRICAS_INTERVALO_VOLCADO_SEGUNDOS) y /metrics suma los de todos los
+    procesos, así cualquier worker responde con el total. Los archivos de
+    workers que ya terminaron siguen sumando: el directorio se vacía al
+    desplegar. Sin directorio, /metrics muestra solo el proceso que responde.
+    """
+
+    _lock = threading.Lock()
+    _histogramas: Dict[Tuple[str, str, str], _Histograma] = {}
+    _respuestas: Counter = Counter()
+    _ultimo_volcado = 0.0
+
+    @classmethod
+    def registrar(
+        cls,
+        ruta: str,
+        metodo: str,
+        estado: int,
+        duracion: float,
+        consultas: int,
+        tiempo_sql: float,
+        tamaño: Optional[int] = None,
+    ) -> None:
+        """Registra un request ya respondido"""
+        valores = {
+            "duracion_segundos": duracion,
+            "consultas_sql": consultas,
+            "tiempo_sql_segundos": tiempo_sql,
+            "tamaño_respuesta_bytes": tamaño,
+        }
+        with cls._lock:
+            for metrica, valor in valores.items():
+                if valor is None:
+                    continue
+                clave = (ruta, metodo, metrica)
+                histograma = cls._histogramas.get(clave)
+                if histograma is None:
+                    histograma = cls._histogramas[clave] = _Histograma(
+                        len(CUBETAS[metrica])
+                    )
+                histograma.conteos[bisect_left(CUBETAS[metrica], valor)] += 1
+                histograma.suma += valor
+            cls._respuestas[(ruta, metodo, str(estado))] += 1
+        cls._volcar_si_corresponde()
+
+    # ------------------------------------------------------------------
+    # Instantáneas y agregación entre procesos
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def instantanea(cls) -> Dict[str, List[list]]:
+        """Estado del proceso serializable a JSON"""
+        with cls._lock:
+            return {
+                "histogramas": [
+                    [ruta, metodo, metrica, list(h.conteos), h.suma]
+                    for (ruta, metodo, metrica), h in cls._histogramas.items()
+                ],
+                "respuestas": [
+                    [ruta, metodo, estado, conteo]
+                    for (ruta, metodo, estado), conteo in cls._respuestas.items()
+                ],
+            }
+
+    @classmethod
+    def agregado(cls) -> Dict[str, List[list]]:
+        """Suma de este proceso y de los archivos de los demás procesos"""
+        instantaneas = [cls.instantanea()]
+        directorio = cls._directorio()
+        if directorio is not None:
+            propio = cls._archivo_propio()
+            for archivo in directorio.glob("metricas_*.json"):
+                if archivo == propio:
+                    continue
+                try:
+                    instantaneas.append(json.loads(archivo.read_text()))
+                except (OSError, ValueError):
+                    continue  # Archivo a medio reemplazar o de otra versión
+
+        histogramas: Dict[Tuple[str, str, str], list] = {}
+        respuestas: Counter = Counter()
+        for instantanea in instantaneas:
+            for ruta, metodo, metrica, conteos, suma in instantanea["histogramas"]:
+                if len(conteos) != len(CUBETAS.get(metrica, ())) + 1:
+                    continue  # Cubetas de otra versión del código
+                actual = histogramas.get((ruta, metodo, metrica))
+                if actual is None:
+                    histogramas[(ruta, metodo, metrica)] = [list(conteos), suma]
+                else:
+                    actual[0] = [a + b for a, b in zip(actual[0], conteos)]
+                    actual[1] += suma
+            for ruta, metodo, estado, conteo in instantanea["respuestas"]:
+                respuestas[(ruta, metodo, estado)] += conteo
+        return {
+            "histogramas": [[*clave, *valor] for clave, valor in histogramas.items()],
+            "respuestas": [[*clave, conteo] for clave, conteo in respuestas.items()],
+        }
+
+    @classmethod
+    def volcar(cls) -> None:
+        """Escribe la instantánea del proceso en el directorio compartido"""
+        directorio = cls._directorio()
+        if directorio is None:
+            return
+        directorio.mkdir(parents=True, exist_ok=True)
+        contenido = json.dumps(cls.instantanea())
+        # Escritura atómica: quien lee nunca ve un archivo a medias
+        descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+        with os.fdopen(descriptor, "w") as archivo:
+            archivo.write(contenido)
+        os.replace(temporal, cls._archivo_propio())
+
+    @classmethod
+    def _volcar_si_corresponde(cls) -> None:
+        if cls._directorio() is None:
+            return
+        ahora = time.monotonic()
+        intervalo = getattr(settings, "METRICAS_INTERVALO_VOLCADO_SEGUNDOS", 5)
+        with cls._lock:
+            if ahora - cls._ultimo_volcado < intervalo:
+                return
+            cls._ultimo_volcado = ahora
+        try:
+            cls.volcar()
+        except OSError:
+            pass  # Las métricas nunca deben romper un request
+
+    @staticmethod
+    def _directorio() -> Optional[Path]:
+        directorio = getattr(settings, "METRICAS_DIRECTORIO_MULTIPROCESO", "")
+        return Path(directorio) if directorio else None
+
+    @classmethod
+    def _archivo_propio(cls) -> Path:
+        return cls._directorio() / f"metricas_{os.getpid()}.json"
+
+    # ------------------------------------------------------------------
+    # Salidas
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def texto_prometheus(cls) -> str:
+        """Histogramas y conteo de respuestas en el formato de texto de Prometheus"""
+        datos = cls.agregado()
+        lineas = []
+        por_metrica: Dict[str, list] = {}
+        for ruta, metodo, metrica, conteos, suma in sorted(datos["histogramas"]):
+            por_metrica.setdefault(metrica, []).append((ruta, metodo, conteos, suma))
+
+        for metrica, (nombre, ayuda) in NOMBRES_PROMETHEUS.items():
+            lineas.append(f"# HELP {nombre} {ayuda}")
+            lineas.append(f"# TYPE {nombre} histogram")
+            for ruta, metodo, conteos, suma in por_metrica.get(metrica, []):
+                etiquetas = f'ruta="{_escapar(ruta)}",metodo="{metodo}"'
+                acumulado = 0
+                for limite, conteo in zip(CUBETAS[metrica] + ("+Inf",), conteos):
+                    acumulado += conteo
+                    lineas.append(
+                        f'{nombre}_bucket{{{etiquetas},le="{limite}"}} {acumulado}'
+                    )
+                lineas.append(f"{nombre}_sum{{{etiquetas}}} {suma}")
+                lineas.append(f"{nombre}_count{{{etiquetas}}} {acumulado}")
+
+        nombre = "analytics_http_responses_total"
+        lineas.append(f"# HELP {nombre} Respuestas por ruta, método y estado HTTP")
+        lineas.append(f"# TYPE {nombre} counter")
+        for ruta, metodo, estado, conteo in sorted(datos["respuestas"]):
+            lineas.append(
+                f'{nombre}{{ruta="{_escapar(ruta)}",metodo="{metodo}",'
+                f'estado="{estado}"}} {conteo}'
+            )
+        return "\n".join(lineas) + "\n"
+
+    @classmethod
+    def peores_endpoints(
+        cls, orden: str = "tiempo_total_segundos", limite: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Rutas ordenadas por `orden` (de mayor a menor), con promedios y
+        percentiles estimados desde los histogramas
+
+        Raises:
+            ValueError: Si el orden no es uno de ORDENES_PEORES
+        """
+        if orden not in ORDENES_PEORES:
+            raise ValueError(
+                f"Orden inválido: {orden}. Opciones: {', '.join(ORDENES_PEORES)}"
+            )
+        datos = cls.agregado()
+        series: Dict[Tuple[str, str], Dict[str, list]] = {}
+        for ruta, metodo, metrica, conteos, suma in datos["histogramas"]:
+            series.setdefault((ruta, metodo), {})[metrica] = [conteos, suma]
+        errores: Counter = Counter()
+        for ruta, metodo, estado, conteo in datos["respuestas"]:
+            if estado.startswith("5"):
+                errores[(ruta, metodo)] += conteo
+
+        filas = []
+        for (ruta, metodo), metricas in series.items():
+            conteos, suma = metricas["duracion_segundos"]
+            solicitudes = sum(conteos)
+            if not solicitudes:
+                continue
+            fila = {
+                "ruta": ruta,
+                "metodo": metodo,
+                "solicitudes": solicitudes,
+                "errores_5xx": errores[(ruta, metodo)],
+                "tiempo_total_segundos": round(suma, 3),
+                "duracion_promedio": round(suma / solicitudes, 4),
+                "duracion_p50": _percentil("duracion_segundos", conteos, 0.5),
+                "duracion_p95": _percentil("duracion_segundos", conteos, 0.95),
+                "duracion_p99": _percentil("duracion_segundos", conteos, 0.99),
+            }
+            for metrica, campo in (
+                ("consultas_sql", "consultas_promedio"),
+                ("tiempo_sql_segundos", "tiempo_sql_promedio"),
+                ("tamaño_respuesta_bytes", "tamaño_promedio_bytes"),
+            ):
+                conteos_m, suma_m = metricas.get(metrica, [[0], 0.0])
+                fila[campo] = round(suma_m / sum(conteos_m), 4) if any(conteos_m) else 0
+            fila["consultas_p95"] = (
+                _percentil("consultas_sql", metricas["consultas_sql"][0], 0.95)
+                if "consultas_sql" in metricas
+                else 0
+            )
+            fila["porcentaje_sql"] = (
+                round(fila["tiempo_sql_promedio"] / fila["duracion_promedio"] * 100, 1)
+                if fila["duracion_promedio"]
+                else 0
+            )
+            filas.append(fila)
+
+        filas.sort(key=lambda fila: fila[orden], reverse=True)
+        return filas[:limite]
+
+    @classmethod
+    def limpiar(cls) -> None:
+        """Reinicia las métricas del proceso"""
+        with cls._lock:
+            cls._histogramas.clear()
+            cls._respuestas.clear()
+
+
+def _percentil(metrica: str, conteos: List[int], fraccion: float) -> float:
+    """Interpolación lineal dentro de la cubeta (como histogram_quantile)"""
+    total = sum(conteos)
+    if not total:
+        return 0.0
+    limites = CUBETAS[metrica]
+    objetivo = fraccion * total
+    acumulado = 0
+    for indice, conteo in enumerate(conteos):
+        if conteo and acumulado + conteo >= objetivo:
+            if indice >= len(limites):
+                return float(limites[-1])  # Cubeta +Inf: el último límite conocido
+            inferior = limites[indice - 1] if indice else 0.0
+            return round(
+                inferior
+                + (limites[indice] - inferior) * (objetivo - acumulado) / conteo,
+                4,
+            )
+        acumulado += conteo
+    return float(limites[-1])
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+# Al terminar el worker queda su último estado para los demás procesos
+atexit.register(lambda: MetricasEndpoints.volcar())
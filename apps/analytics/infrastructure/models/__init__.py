@@ -4,18 +4,30 @@ Modelos Django separados por responsabilidad - Clean Architecture
 Cada modelo en su propio archivo siguiendo Single Responsibility Principle
 """
 
+from .evento_outbox_model import EventoOutboxModel
+from .outbox_checkpoint_model import OutboxCheckpointModel
 from .marca_ganado_bovino_model import MarcaGanadoBovinoModel
 from .logo_marca_bovina_model import LogoMarcaBovinaModel
 from .kpi_ganado_bovino_model import KPIGanadoBovinoModel
+from .marca_ciclo_vida_model import MarcaCicloVidaModel
+from .histograma_latencia_model import HistogramaLatenciaModel
+from .termino_prompt_model import TerminoPromptModel
 from .historial_estado_marca_model import HistorialEstadoMarcaModel
 from .dashboard_data_model import DashboardDataModel
 from .reporte_data_model import ReporteDataModel
+from .reporte_job_model import ReporteJobModel
 
 __all__ = [
     "MarcaGanadoBovinoModel",
     "LogoMarcaBovinaModel",
     "KPIGanadoBovinoModel",
     "HistorialEstadoMarcaModel",
+    "MarcaCicloVidaModel",
+    "HistogramaLatenciaModel",
+    "TerminoPromptModel",
     "DashboardDataModel",
     "ReporteDataModel",
+    "ReporteJobModel",
+    "EventoOutboxModel",
+    "OutboxCheckpointModel",
 ]
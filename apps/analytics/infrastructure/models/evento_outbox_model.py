@@ -0,0 +1,111 @@
+# apps/analytics/infrastructure/models/evento_outbox_model.py
+"""
+Modelo Django para el outbox de cambios - Single Responsibility
+Responsabilidad única: Registrar en la misma transacción cada mutación de marcas,
+logos e historial como un evento ordenado por secuencia
+"""
+
+from typing import Iterable, List, Optional
+
+from django.db import models
+
+from apps.analytics.domain.enums import OperacionCambio
+
+
+class EventoOutboxModel(models.Model):
+    """
+    Evento de cambio; el id autoincremental es la secuencia del feed
+
+    Solo se registran los cambios hechos con save()/delete() del modelo.
+    QuerySet.update(), bulk_create() y los borrados en cascada no generan
+    eventos.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    entidad = models.CharField(max_length=30)
+    entidad_id = models.BigIntegerField()
+    operacion = models.CharField(max_length=20, choices=OperacionCambio.choices())
+    campos_modificados = models.JSONField(default=list, blank=True)
+    fecha_creacion = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "evento_outbox"
+        verbose_name = "Evento de Outbox"
+        verbose_name_plural = "Eventos de Outbox"
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["entidad", "entidad_id"]),
+        ]
+
+    def __str__(self):
+        return f"#{self.id} {self.operacion} {self.entidad}:{self.entidad_id}"
+
+    @property
+    def secuencia(self) -> int:
+        return self.id
+
+    @classmethod
+    def registrar(
+        cls,
+        entidad: str,
+        entidad_id: int,
+        operacion: OperacionCambio,
+        campos_modificados: Optional[List[str]] = None,
+    ) -> "EventoOutboxModel":
+        """Inserta el evento; debe llamarse dentro de la transacción del cambio"""
+        return cls.objects.create(
+            entidad=entidad,
+            entidad_id=entidad_id,
+            operacion=operacion.value,
+            campos_modificados=campos_modificados or [],
+        )
+
+    @classmethod
+    def registrar_lote(
+        cls,
+        entidad: str,
+        entidad_ids: List[int],
+        operacion: OperacionCambio,
+        campos_modificados: Optional[List[str]] = None,
+    ) -> None:
+        """Inserta con bulk_create un evento por id (misma operación y campos)"""
+        cls.objects.bulk_create(
+            [
+                cls(
+                    entidad=entidad,
+                    entidad_id=entidad_id,
+                    operacion=operacion.value,
+                    campos_modificados=campos_modificados or [],
+                )
+                for entidad_id in entidad_ids
+            ]
+        )
+
+    @staticmethod
+    def diferencias(
+        original: models.Model,
+        actual: models.Model,
+        update_fields: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """Nombres de los campos concretos cuyo valor cambió (y que se guardan)"""
+        guardados = set(update_fields) if update_fields is not None else None
+        return [
+            campo.name
+            for campo in actual._meta.concrete_fields
+            if not campo.primary_key
+            and (
+                guardados is None
+                or campo.name in guardados
+                or campo.attname in guardados
+            )
+            and getattr(original, campo.attname) != getattr(actual, campo.attname)
+        ]
+
+    @staticmethod
+    def todos_los_campos(instancia: models.Model) -> List[str]:
+        """Campos concretos (sin la clave primaria) de una instancia nueva"""
+        return [
+            campo.name
+            for campo in instancia._meta.concrete_fields
+            if not campo.primary_key
+        ]
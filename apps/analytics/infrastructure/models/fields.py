@@ -0,0 +1,110 @@
+# apps/analytics/infrastructure/models/fields.py
+"""
+Campos Django personalizados - Single Responsibility
+Responsabilidad única: Almacenar JSON comprimido de forma transparente
+"""
+
+import json
+import zlib
+from typing import Any, Dict
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+NIVEL_COMPRESION = 6
+
+
+class PayloadComprimido(bytes):
+    """Bytes ya comprimidos que el campo guarda sin volver a comprimir"""
+
+
+def serializar_datos(datos: Any) -> bytes:
+    """JSON compacto en UTF-8 (misma forma para medir y para comprimir)"""
+    return json.dumps(
+        datos, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def comprimir_datos(datos: Any) -> bytes:
+    """Serializa y comprime los datos con zlib"""
+    return zlib.compress(serializar_datos(datos), NIVEL_COMPRESION)
+
+
+def descomprimir_datos(contenido: bytes) -> Any:
+    """Descomprime y deserializa los datos"""
+    return json.loads(zlib.decompress(bytes(contenido)).decode("utf-8"))
+
+
+def contar_niveles_anidamiento(valor: Any, nivel: int = 0) -> int:
+    """Cuenta los niveles de anidamiento de dicts y listas"""
+    if isinstance(valor, dict) and valor:
+        return max(contar_niveles_anidamiento(v, nivel + 1) for v in valor.values())
+    if isinstance(valor, list) and valor:
+        return max(contar_niveles_anidamiento(v, nivel + 1) for v in valor)
+    return nivel
+
+
+def analizar_datos(datos: Any) -> Dict[str, Any]:
+    """
+    Serializa, comprime y describe los datos en una sola pasada
+
+    Returns:
+        Dict[str, Any]: contenido comprimido, tamaños y estructura
+    """
+    contenido = serializar_datos(datos)
+    comprimido = zlib.compress(contenido, NIVEL_COMPRESION)
+    return {
+        "comprimido": PayloadComprimido(comprimido),
+        "bytes_datos": len(contenido),
+        "bytes_comprimidos": len(comprimido),
+        "claves_datos": len(datos) if isinstance(datos, (dict, list)) else 0,
+        "niveles_anidamiento": contar_niveles_anidamiento(datos),
+        "tipos_datos": (
+            len({type(v).__name__ for v in datos.values()})
+            if isinstance(datos, dict)
+            else 0
+        ),
+    }
+
+
+class JSONComprimidoField(models.BinaryField):
+    """
+    JSON almacenado comprimido con zlib en una columna binaria
+
+    En Python el valor se usa como un JSONField normal (dict/list). Como es un
+    BinaryField, no es editable en formularios y no admite lookups sobre claves
+    del JSON.
+    """
+
+    description = "JSON comprimido con zlib"
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return descomprimir_datos(value)
+
+    def to_python(self, value):
+        if isinstance(value, (bytes, memoryview)):
+            return descomprimir_datos(value)
+        if isinstance(value, str):
+            # Forma usada por value_to_string (dumpdata/loaddata)
+            return json.loads(value)
+        return value
+
+    def pre_save(self, model_instance, add):
+        valor = getattr(model_instance, self.attname)
+        # El modelo pudo haber comprimido ya estos mismos datos en save()
+        cache = getattr(model_instance, "_payload_comprimido", None)
+        if cache is not None and cache[0] is valor:
+            return cache[1]
+        return valor
+
+    def get_prep_value(self, value):
+        if value is None:
+            return None
+        if isinstance(value, PayloadComprimido):
+            return bytes(value)
+        return comprimir_datos(value)
+
+    def value_to_string(self, obj):
+        return json.dumps(self.value_from_object(obj), cls=DjangoJSONEncoder)
@@ -0,0 +1,161 @@
+# apps/analytics/infrastructure/models/histograma_latencia_model.py
+"""
+Modelo Django para histogramas de latencia de modelos IA - Single Responsibility
+Responsabilidad única: Mantener por modelo y día la distribución de los tiempos de
+generación en cubetas fijas de escala logarítmica
+"""
+
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, Iterable, Tuple
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+
+# Bordes inferiores de las cubetas en segundos: [0, 1) y luego cuartos de octava
+# desde 1 s hasta 4096 s (~19% de ancho relativo). La última cubeta no tiene
+# borde superior.
+BORDES_CUBETAS = (0.0,) + tuple(2 ** (k / 4) for k in range(49))
+TOTAL_CUBETAS = len(BORDES_CUBETAS)
+
+# (modelo, fecha, cubeta) -> (conteo, suma de segundos)
+Incrementos = Dict[Tuple[str, object, int], Tuple[int, int]]
+
+
+def cubeta_latencia(segundos: float) -> int:
+    """Índice de la cubeta que contiene `segundos`"""
+    return max(bisect_right(BORDES_CUBETAS, segundos) - 1, 0)
+
+
+def incrementos_de_logos(nuevos: Iterable, anteriores: Iterable = ()) -> Incrementos:
+    """
+    Agrupa los aportes de los logos a los histogramas: suma los `nuevos` y
+    descuenta los `anteriores` (versión previa de un logo editado o borrado)
+
+    Los logos reutilizados del cache de prompts no llamaron a la IA, así que no
+    aportan latencia.
+    """
+    conteos = Counter()
+    sumas = Counter()
+    for signo, logos in ((1, nuevos), (-1, anteriores)):
+        for logo in logos:
+            if logo.reutilizado_de_id is not None or logo.fecha_generacion is None:
+                continue
+            clave = (
+                logo.modelo_ia_usado,
+                logo.fecha_generacion.date(),
+                cubeta_latencia(logo.tiempo_generacion_segundos),
+            )
+            conteos[clave] += signo
+            sumas[clave] += signo * logo.tiempo_generacion_segundos
+    return {clave: (conteos[clave], sumas[clave]) for clave in conteos}
+
+
+class HistogramaLatenciaModel(models.Model):
+    """
+    Una fila por (modelo IA, día, cubeta) con cuántos logos cayeron en ella
+
+    Se actualiza al guardar, editar o borrar logos y se puede reconstruir con
+    `reconstruir_histogramas_latencia`. Los percentiles se calculan sobre estas
+    filas, sin recorrer la tabla de logos.
+    """
+
+    modelo_ia_usado = models.CharField(max_length=100)
+    fecha = models.DateField()
+    cubeta = models.PositiveSmallIntegerField()
+    conteo = models.IntegerField(default=0)
+    suma_segundos = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "histograma_latencia_ia"
+        verbose_name = "Histograma de Latencia IA"
+        verbose_name_plural = "Histogramas de Latencia IA"
+        unique_together = [("modelo_ia_usado", "fecha", "cubeta")]
+        indexes = [models.Index(fields=["fecha", "modelo_ia_usado"])]
+
+    def __str__(self):
+        return (
+            f"{self.modelo_ia_usado} {self.fecha} "
+            f"cubeta {self.cubeta}: {self.conteo}"
+        )
+
+    @classmethod
+    def registrar(cls, incrementos: Incrementos) -> None:
+        """
+        Suma los incrementos con UPDATE atómico (F) y crea las filas que falten
+
+        Si otra transacción crea la misma fila a la vez, la inserción choca con
+        la restricción única y se reintenta como UPDATE.
+        """
+        for (modelo, fecha, cubeta), (conteo, suma) in incrementos.items():
+            if conteo == 0 and suma == 0:
+                continue
+            filtro = {"modelo_ia_usado": modelo, "fecha": fecha, "cubeta": cubeta}
+            actualizados = cls.objects.filter(**filtro).update(
+                conteo=F("conteo") + conteo,
+                suma_segundos=F("suma_segundos") + suma,
+            )
+            if actualizados or conteo <= 0:
+                # Sin fila que descontar: la tabla ya estaba desfasada y la
+                # corrige la reconstrucción
+                continue
+            try:
+                with transaction.atomic():
+                    cls.objects.create(conteo=conteo, suma_segundos=suma, **filtro)
+            except IntegrityError:
+                cls.objects.filter(**filtro).update(
+                    conteo=F("conteo") + conteo,
+                    suma_segundos=F("suma_segundos") + suma,
+                )
+
+    @classmethod
+    def reconstruir(cls, tamaño_lote: int = 2000) -> int:
+        """Recalcula todas las filas desde los logos; retorna las filas creadas"""
+        from .logo_marca_bovina_model import LogoMarcaBovinaModel
+
+        return reconstruir_histogramas(LogoMarcaBovinaModel, cls, tamaño_lote)
+
+
+def reconstruir_histogramas(logo_model, histograma_model, tamaño_lote: int) -> int:
+    """
+    Recorre los logos por lotes (keyset sobre id) acumulando en memoria y
+    reemplaza la tabla de histogramas
+
+    Recibe los modelos para poder usarse también desde migraciones.
+    """
+    acumulado = Counter()
+    sumas = Counter()
+    ultimo_id = 0
+    while True:
+        lote = list(
+            logo_model.objects.filter(id__gt=ultimo_id, reutilizado_de__isnull=True)
+            .order_by("id")
+            .values_list(
+                "id",
+                "modelo_ia_usado",
+                "fecha_generacion",
+                "tiempo_generacion_segundos",
+            )[:tamaño_lote]
+        )
+        if not lote:
+            break
+        for _, modelo, fecha_generacion, segundos in lote:
+            clave = (modelo, fecha_generacion.date(), cubeta_latencia(segundos))
+            acumulado[clave] += 1
+            sumas[clave] += segundos
+        ultimo_id = lote[-1][0]
+
+    filas = [
+        histograma_model(
+            modelo_ia_usado=modelo,
+            fecha=fecha,
+            cubeta=cubeta,
+            conteo=conteo,
+            suma_segundos=sumas[(modelo, fecha, cubeta)],
+        )
+        for (modelo, fecha, cubeta), conteo in acumulado.items()
+    ]
+    with transaction.atomic():
+        histograma_model.objects.all().delete()
+        histograma_model.objects.bulk_create(filas, batch_size=tamaño_lote)
+    return len(filas)
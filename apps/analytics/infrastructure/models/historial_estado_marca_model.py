@@ -4,8 +4,11 @@ Modelo Django para historial de estados de marcas - Single Responsibility
 Responsabilidad única: Gestionar auditoría de cambios de estado
 """
 
-from django.db import models
+from django.db import models, transaction
 from .marca_ganado_bovino_model import MarcaGanadoBovinoModel
+from .marca_ciclo_vida_model import MarcaCicloVidaModel
+from .evento_outbox_model import EventoOutboxModel
+from apps.analytics.domain.enums import OperacionCambio
 
 
 class HistorialEstadoMarcaModel(models.Model):
@@ -34,8 +37,50 @@ class HistorialEstadoMarcaModel(models.Model):
         verbose_name = "Historial de Estado"
         verbose_name_plural = "Historiales de Estados"
         ordering = ["-fecha_cambio"]
+        indexes = [
+            models.Index(fields=["marca", "fecha_cambio"]),
+            models.Index(fields=["estado_nuevo", "fecha_cambio"]),
+            models.Index(fields=["usuario_responsable", "fecha_cambio"]),
+            models.Index(fields=["fecha_cambio"]),
+        ]
 
     def __str__(self):
         return (
             f"{self.marca.numero_marca}: {self.estado_anterior} → {self.estado_nuevo}"
         )
+
+    def save(self, *args, **kwargs):
+        """Guarda el cambio y actualiza el ciclo de vida de la marca y el outbox"""
+        nuevo = self._state.adding
+        with transaction.atomic():
+            if nuevo:
+                super().save(*args, **kwargs)
+                MarcaCicloVidaModel.registrar_transicion(self)
+                EventoOutboxModel.registrar(
+                    "historial",
+                    self.pk,
+                    OperacionCambio.CREAR,
+                    EventoOutboxModel.todos_los_campos(self),
+                )
+            else:
+                original = HistorialEstadoMarcaModel.objects.filter(pk=self.pk).first()
+                super().save(*args, **kwargs)
+                MarcaCicloVidaModel.reconstruir_marca(self.marca_id)
+                campos = (
+                    EventoOutboxModel.diferencias(
+                        original, self, kwargs.get("update_fields")
+                    )
+                    if original
+                    else EventoOutboxModel.todos_los_campos(self)
+                )
+                if campos:
+                    EventoOutboxModel.registrar(
+                        "historial", self.pk, OperacionCambio.ACTUALIZAR, campos
+                    )
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            EventoOutboxModel.registrar("historial", self.pk, OperacionCambio.ELIMINAR)
+            resultado = super().delete(*args, **kwargs)
+            MarcaCicloVidaModel.reconstruir_marca(self.marca_id)
+        return resultado
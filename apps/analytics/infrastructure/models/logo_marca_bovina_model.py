@@ -4,12 +4,35 @@ Modelo Django para logos de marcas bovinas - Single Responsibility
 Responsabilidad única: Gestionar datos de logos generados por IA
 """
 
-from django.db import models
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from django.db import models, transaction
 from django.core.validators import MinValueValidator
 from django.contrib.admin.models import LogEntry, CHANGE, ADDITION, DELETION
 from django.contrib.contenttypes.models import ContentType
 from .marca_ganado_bovino_model import MarcaGanadoBovinoModel
-from apps.analytics.domain.enums import ModeloIA, CalidadLogo
+from .evento_outbox_model import EventoOutboxModel
+from .histograma_latencia_model import HistogramaLatenciaModel, incrementos_de_logos
+from .termino_prompt_model import TerminoPromptModel
+from apps.analytics.domain.enums import ModeloIA, CalidadLogo, OperacionCambio
+
+
+def calcular_huella_prompt(
+    prompt: str, modelo: str, parametros: Optional[Dict[str, Any]] = None
+) -> str:
+    """SHA-256 de (prompt con espacios normalizados, modelo, parámetros)"""
+    contenido = json.dumps(
+        {
+            "prompt": " ".join((prompt or "").split()),
+            "modelo": modelo,
+            "parametros": parametros or {},
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(contenido.encode("utf-8")).hexdigest()
 
 
 class LogoMarcaBovinaModel(models.Model):
@@ -41,23 +64,64 @@ class LogoMarcaBovinaModel(models.Model):
         default=CalidadLogo.MEDIA.value,
         help_text="Calidad percibida del logo generado",
     )
+    huella_prompt = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text="Hash de prompt, modelo y parámetros (cache de resultados de IA)",
+    )
+    reutilizado_de = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="reutilizaciones",
+        help_text="Logo original cuando el resultado salió del cache de prompts",
+    )
+    huella_imagen = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text="SHA-256 de la imagen en el almacén local (LOGOS_ALMACEN_DIR)",
+    )
 
     class Meta:
         db_table = "logo_marca_bovina"
         verbose_name = "Logo de Marca Bovina"
         verbose_name_plural = "Logos de Marcas Bovinas"
         ordering = ["-fecha_generacion"]
+        indexes = [
+            # Logos de una marca, del más reciente al más antiguo
+            models.Index(fields=["marca", "fecha_generacion"]),
+            models.Index(fields=["modelo_ia_usado", "fecha_generacion"]),
+        ]
 
     def __str__(self):
         return f"Logo {self.marca.numero_marca} - {self.modelo_ia_usado}"
 
+    @transaction.atomic
     def save(self, *args, **kwargs):
-        """Sobrescribir save para registrar cambios en el historial"""
+        """
+        Sobrescribir save para registrar cambios en el historial, el outbox,
+        los histogramas de latencia y el índice de prompts
+        """
         is_new = self.pk is None
+        if is_new and not self.huella_prompt:
+            self.huella_prompt = calcular_huella_prompt(
+                self.prompt_usado, self.modelo_ia_usado
+            )
+        campos_outbox = None
+        anteriores = []
         if not is_new:
             # Obtener el objeto original de la base de datos
             try:
                 original = LogoMarcaBovinaModel.objects.get(pk=self.pk)
+                anteriores.append(original)
+                campos_outbox = EventoOutboxModel.diferencias(
+                    original, self, kwargs.get("update_fields")
+                )
                 # Comparar campos importantes
                 changed_fields = []
                 if original.url_logo != self.url_logo:
@@ -92,14 +156,102 @@ class LogoMarcaBovinaModel(models.Model):
 
         super().save(*args, **kwargs)
 
+        # Mover el aporte a la latencia si cambió el modelo, el tiempo o el origen
+        HistogramaLatenciaModel.registrar(incrementos_de_logos([self], anteriores))
+        TerminoPromptModel.indexar([self], anteriores)
+
         # Registrar creación
         if is_new:
             self._log_creation()
 
+        if campos_outbox is None:
+            EventoOutboxModel.registrar(
+                "logo",
+                self.pk,
+                OperacionCambio.CREAR,
+                EventoOutboxModel.todos_los_campos(self),
+            )
+        elif campos_outbox:
+            EventoOutboxModel.registrar(
+                "logo", self.pk, OperacionCambio.ACTUALIZAR, campos_outbox
+            )
+
+    @transaction.atomic
     def delete(self, *args, **kwargs):
-        """Sobrescribir delete para registrar eliminación en el historial"""
+        """
+        Sobrescribir delete para registrar eliminación en el historial, el
+        outbox, los histogramas de latencia y el índice de prompts
+        """
         self._log_deletion()
-        super().delete(*args, **kwargs)
+        HistogramaLatenciaModel.registrar(incrementos_de_logos([], [self]))
+        TerminoPromptModel.indexar([], [self])
+        EventoOutboxModel.registrar("logo", self.pk, OperacionCambio.ELIMINAR)
+        return super().delete(*args, **kwargs)
+
+    @classmethod
+    @transaction.atomic
+    def crear_en_lote(
+        cls, logos: List["LogoMarcaBovinaModel"]
+    ) -> List["LogoMarcaBovinaModel"]:
+        """
+        Inserta los logos con bulk_create y registra, también en lote, sus
+        eventos de outbox, entradas del historial del admin y aportes a los
+        histogramas de latencia y al índice de prompts
+        """
+        if not logos:
+            return []
+        creados = cls.objects.bulk_create(logos)
+        if any(logo.pk is None for logo in creados):
+            cls._asignar_ids(creados)
+
+        HistogramaLatenciaModel.registrar(incrementos_de_logos(creados))
+        TerminoPromptModel.indexar(creados)
+
+        EventoOutboxModel.registrar_lote(
+            "logo",
+            [logo.pk for logo in creados],
+            OperacionCambio.CREAR,
+            EventoOutboxModel.todos_los_campos(creados[0]),
+        )
+
+        numeros = dict(
+            MarcaGanadoBovinoModel.objects.filter(
+                id__in={logo.marca_id for logo in creados}
+            ).values_list("id", "numero_marca")
+        )
+        content_type_id = ContentType.objects.get_for_model(cls).pk
+        LogEntry.objects.bulk_create(
+            [
+                LogEntry(
+                    user_id=3,  # Usuario existente (melina)
+                    content_type_id=content_type_id,
+                    object_id=str(logo.pk),
+                    object_repr=(
+                        f"Logo {numeros.get(logo.marca_id)} - {logo.modelo_ia_usado}"
+                    )[:200],
+                    action_flag=ADDITION,
+                    change_message="Logo creado automáticamente",
+                )
+                for logo in creados
+            ]
+        )
+        return creados
+
+    @classmethod
+    def _asignar_ids(cls, logos: List["LogoMarcaBovinaModel"]) -> None:
+        """
+        Recupera los ids cuando la base de datos no los devuelve en bulk_create
+        (MySQL): el par (marca, url) identifica al logo recién insertado
+        """
+        ids = {}
+        for id_logo, marca_id, url_logo in cls.objects.filter(
+            marca_id__in={logo.marca_id for logo in logos},
+            url_logo__in={logo.url_logo for logo in logos},
+        ).values_list("id", "marca_id", "url_logo"):
+            clave = (marca_id, url_logo)
+            ids[clave] = max(id_logo, ids.get(clave, 0))
+        for logo in logos:
+            logo.pk = ids.get((logo.marca_id, logo.url_logo))
 
     def _log_creation(self):
         """Registrar creación en el historial"""
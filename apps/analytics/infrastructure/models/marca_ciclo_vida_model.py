@@ -0,0 +1,153 @@
+# apps/analytics/infrastructure/models/marca_ciclo_vida_model.py
+"""
+Modelo Django para el ciclo de vida materializado de marcas - Single Responsibility
+Responsabilidad única: Mantener por marca la entrada y permanencia en cada estado
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from django.db import models, transaction
+
+from apps.analytics.domain.enums import EstadoMarca
+from .marca_ganado_bovino_model import MarcaGanadoBovinoModel
+
+# Estado -> (campo de primera entrada, campo de horas acumuladas)
+CAMPOS_POR_ESTADO = {
+    estado.value: (
+        f"fecha_entrada_{estado.value.lower()}",
+        f"horas_{estado.value.lower()}",
+    )
+    for estado in EstadoMarca
+}
+
+
+class MarcaCicloVidaModel(models.Model):
+    """
+    Una fila por marca con su recorrido por los estados
+
+    Las horas acumuladas solo incluyen permanencias cerradas; el tramo del estado
+    actual se obtiene con fecha_estado_actual. Se actualiza al registrar cada
+    transición y se puede reconstruir con `reconstruir_ciclo_vida`.
+    """
+
+    marca = models.OneToOneField(
+        MarcaGanadoBovinoModel,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="ciclo_vida",
+    )
+    estado_actual = models.CharField(max_length=20, blank=True, null=True)
+    fecha_estado_actual = models.DateTimeField(blank=True, null=True)
+
+    fecha_entrada_pendiente = models.DateTimeField(blank=True, null=True)
+    fecha_entrada_en_proceso = models.DateTimeField(blank=True, null=True)
+    fecha_entrada_aprobado = models.DateTimeField(blank=True, null=True)
+    fecha_entrada_rechazado = models.DateTimeField(blank=True, null=True)
+
+    horas_pendiente = models.FloatField(default=0)
+    horas_en_proceso = models.FloatField(default=0)
+    horas_aprobado = models.FloatField(default=0)
+    horas_rechazado = models.FloatField(default=0)
+
+    total_transiciones = models.PositiveIntegerField(default=0)
+    fecha_ultima_transicion = models.DateTimeField(blank=True, null=True)
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "marca_ciclo_vida"
+        verbose_name = "Ciclo de Vida de Marca"
+        verbose_name_plural = "Ciclos de Vida de Marcas"
+        indexes = [
+            models.Index(fields=["estado_actual"]),
+            models.Index(fields=["fecha_entrada_aprobado"]),
+        ]
+
+    def __str__(self):
+        return f"Ciclo de vida marca {self.marca_id}: {self.estado_actual}"
+
+    def aplicar_transicion(
+        self,
+        estado_anterior: Optional[str],
+        estado_nuevo: str,
+        fecha: datetime,
+        fecha_registro: Optional[datetime] = None,
+    ) -> None:
+        """
+        Acumula una transición (en orden cronológico) sobre esta fila
+
+        En la primera transición, el estado anterior se toma como vigente desde
+        el registro de la marca.
+        """
+        if self.estado_actual is None and estado_anterior:
+            self.estado_actual = estado_anterior
+            if fecha_registro and fecha_registro <= fecha:
+                self.fecha_estado_actual = fecha_registro
+                self._marcar_entrada(estado_anterior, fecha_registro)
+
+        if self.estado_actual in CAMPOS_POR_ESTADO and self.fecha_estado_actual:
+            campo_horas = CAMPOS_POR_ESTADO[self.estado_actual][1]
+            horas = (fecha - self.fecha_estado_actual).total_seconds() / 3600
+            setattr(self, campo_horas, getattr(self, campo_horas) + max(horas, 0))
+
+        self.estado_actual = estado_nuevo
+        self.fecha_estado_actual = fecha
+        self._marcar_entrada(estado_nuevo, fecha)
+        self.total_transiciones += 1
+        self.fecha_ultima_transicion = fecha
+
+    def _marcar_entrada(self, estado: str, fecha: datetime) -> None:
+        if estado in CAMPOS_POR_ESTADO:
+            campo_entrada = CAMPOS_POR_ESTADO[estado][0]
+            if getattr(self, campo_entrada) is None:
+                setattr(self, campo_entrada, fecha)
+
+    @classmethod
+    def registrar_transicion(cls, historial) -> "MarcaCicloVidaModel":
+        """
+        Actualiza incrementalmente la fila de la marca con un nuevo historial
+
+        Si la transición llega fuera de orden se recalcula la marca completa.
+        """
+        with transaction.atomic():
+            ciclo, _ = cls.objects.select_for_update().get_or_create(
+                marca_id=historial.marca_id
+            )
+            if (
+                ciclo.fecha_ultima_transicion
+                and historial.fecha_cambio < ciclo.fecha_ultima_transicion
+            ):
+                return cls.reconstruir_marca(historial.marca_id)
+
+            ciclo.aplicar_transicion(
+                historial.estado_anterior,
+                historial.estado_nuevo,
+                historial.fecha_cambio,
+                MarcaGanadoBovinoModel.objects.filter(id=historial.marca_id)
+                .values_list("fecha_registro", flat=True)
+                .first(),
+            )
+            ciclo.save()
+            return ciclo
+
+    @classmethod
+    def reconstruir_marca(cls, marca_id: int) -> "MarcaCicloVidaModel":
+        """Recalcula la fila de una marca desde todo su historial"""
+        from .historial_estado_marca_model import HistorialEstadoMarcaModel
+
+        fecha_registro = (
+            MarcaGanadoBovinoModel.objects.filter(id=marca_id)
+            .values_list("fecha_registro", flat=True)
+            .first()
+        )
+        ciclo = cls(marca_id=marca_id)
+        for estado_anterior, estado_nuevo, fecha in (
+            HistorialEstadoMarcaModel.objects.filter(marca_id=marca_id)
+            .order_by("fecha_cambio", "id")
+            .values_list("estado_anterior", "estado_nuevo", "fecha_cambio")
+        ):
+            ciclo.aplicar_transicion(
+                estado_anterior, estado_nuevo, fecha, fecha_registro
+            )
+        ciclo.save()
+        return ciclo
@@ -4,16 +4,18 @@ Modelo Django para marca de ganado bovino - Single Responsibility
 Responsabilidad única: Gestionar datos de marcas bovinas en la base de datos
 """
 
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.admin.models import LogEntry, CHANGE, ADDITION, DELETION
 from django.contrib.contenttypes.models import ContentType
 from datetime import datetime
+from .evento_outbox_model import EventoOutboxModel
 from apps.analytics.domain.enums import (
     EstadoMarca,
     RazaBovino,
     PropositoGanado,
     Departamento,
+    OperacionCambio,
 )
 
 
@@ -125,8 +127,9 @@ class MarcaGanadoBovinoModel(models.Model):
         verbose_name_plural = "Marcas de Ganado Bovino"
         indexes = [
             models.Index(fields=["numero_marca"]),
-            models.Index(fields=["estado"]),
-            models.Index(fields=["departamento"]),
+            # Filtros por estado/departamento con el orden por defecto
+            models.Index(fields=["estado", "fecha_registro"]),
+            models.Index(fields=["departamento", "fecha_registro"]),
             models.Index(fields=["fecha_registro"]),
         ]
 
@@ -154,13 +157,18 @@ class MarcaGanadoBovinoModel(models.Model):
             return (datetime.now().date() - self.fecha_registro.date()).days
         return 0
 
+    @transaction.atomic
     def save(self, *args, **kwargs):
-        """Sobrescribir save para registrar cambios en el historial"""
+        """Sobrescribir save para registrar cambios en el historial y el outbox"""
         is_new = self.pk is None
+        campos_outbox = None
         if not is_new:
             # Obtener el objeto original de la base de datos
             try:
                 original = MarcaGanadoBovinoModel.objects.get(pk=self.pk)
+                campos_outbox = EventoOutboxModel.diferencias(
+                    original, self, kwargs.get("update_fields")
+                )
                 # Comparar campos importantes
                 changed_fields = []
                 if original.estado != self.estado:
@@ -218,10 +226,24 @@ class MarcaGanadoBovinoModel(models.Model):
         if is_new:
             self._log_creation()
 
+        if campos_outbox is None:
+            EventoOutboxModel.registrar(
+                "marca",
+                self.pk,
+                OperacionCambio.CREAR,
+                EventoOutboxModel.todos_los_campos(self),
+            )
+        elif campos_outbox:
+            EventoOutboxModel.registrar(
+                "marca", self.pk, OperacionCambio.ACTUALIZAR, campos_outbox
+            )
+
+    @transaction.atomic
     def delete(self, *args, **kwargs):
-        """Sobrescribir delete para registrar eliminación en el historial"""
+        """Sobrescribir delete para registrar eliminación en el historial y el outbox"""
         self._log_deletion()
-        super().delete(*args, **kwargs)
+        EventoOutboxModel.registrar("marca", self.pk, OperacionCambio.ELIMINAR)
+        return super().delete(*args, **kwargs)
 
     def _log_creation(self):
         """Registrar creación en el historial"""
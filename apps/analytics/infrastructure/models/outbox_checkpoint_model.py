@@ -0,0 +1,23 @@
+# apps/analytics/infrastructure/models/outbox_checkpoint_model.py
+"""
+Modelo Django para checkpoints de consumidores del outbox - Single Responsibility
+Responsabilidad única: Recordar hasta qué secuencia procesó cada consumidor
+"""
+
+from django.db import models
+
+
+class OutboxCheckpointModel(models.Model):
+    """Última secuencia confirmada por un consumidor del outbox"""
+
+    consumidor = models.CharField(max_length=100, unique=True)
+    ultima_secuencia = models.BigIntegerField(default=0)
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "outbox_checkpoint"
+        verbose_name = "Checkpoint de Outbox"
+        verbose_name_plural = "Checkpoints de Outbox"
+
+    def __str__(self):
+        return f"{self.consumidor} @ {self.ultima_secuencia}"
@@ -6,6 +6,8 @@ Responsabilidad única: Gestionar datos de reportes generados
 
 from django.db import models
 
+from .fields import JSONComprimidoField, analizar_datos
+
 
 class ReporteDataModel(models.Model):
     """Modelo Django para datos de reportes - Nueva Arquitectura"""
@@ -15,14 +17,53 @@ class ReporteDataModel(models.Model):
     periodo_inicio = models.DateField()
     periodo_fin = models.DateField()
     formato = models.CharField(max_length=20, default="json")
-    datos = models.JSONField()
+    datos = JSONComprimidoField()
     usuario_generador = models.CharField(max_length=100, blank=True, null=True)
 
+    # Metadatos de los datos calculados al guardar (evitan cargar el payload)
+    bytes_datos = models.PositiveBigIntegerField(
+        default=0, help_text="Tamaño del JSON sin comprimir"
+    )
+    bytes_comprimidos = models.PositiveBigIntegerField(
+        default=0, help_text="Tamaño almacenado (zlib)"
+    )
+    claves_datos = models.PositiveIntegerField(
+        default=0, help_text="Claves del primer nivel"
+    )
+    niveles_anidamiento = models.PositiveSmallIntegerField(default=0)
+    tipos_datos = models.PositiveSmallIntegerField(
+        default=0, help_text="Tipos distintos en el primer nivel"
+    )
+
     class Meta:
         db_table = "reporte_data"
         verbose_name = "Datos de Reporte"
         verbose_name_plural = "Datos de Reportes"
         ordering = ["-fecha_generacion"]
+        indexes = [
+            models.Index(fields=["tipo_reporte"]),
+            models.Index(fields=["usuario_generador", "fecha_generacion"]),
+        ]
 
     def __str__(self):
         return f"Reporte {self.tipo_reporte} - {self.fecha_generacion}"
+
+    def save(self, *args, **kwargs):
+        """Comprime los datos una sola vez y actualiza sus metadatos"""
+        update_fields = kwargs.get("update_fields")
+        if "datos" in self.get_deferred_fields() or (
+            update_fields is not None and "datos" not in update_fields
+        ):
+            return super().save(*args, **kwargs)
+
+        analisis = analizar_datos(self.datos)
+        self._payload_comprimido = (self.datos, analisis.pop("comprimido"))
+        for campo, valor in analisis.items():
+            setattr(self, campo, valor)
+        if update_fields is not None:
+            kwargs["update_fields"] = set(update_fields) | set(analisis)
+
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            del self._payload_comprimido
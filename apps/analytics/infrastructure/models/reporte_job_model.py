@@ -0,0 +1,69 @@
+# apps/analytics/infrastructure/models/reporte_job_model.py
+"""
+Modelo Django para trabajos asíncronos de reportes - Single Responsibility
+Responsabilidad única: Gestionar estado y progreso de reportes en segundo plano
+"""
+
+from django.db import models
+from django.core.validators import MinValueValidator, MaxValueValidator
+
+from apps.analytics.domain.enums import EstadoJobReporte
+from .reporte_data_model import ReporteDataModel
+
+
+class ReporteJobModel(models.Model):
+    """Modelo Django para trabajos asíncronos de reportes - Nueva Arquitectura"""
+
+    tipo_reporte = models.CharField(max_length=50)
+    parametros = models.JSONField(default=dict, blank=True)
+    firma = models.CharField(
+        max_length=64,
+        help_text="Hash de tipo y parámetros para deduplicar trabajos idénticos",
+    )
+    firma_activa = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        unique=True,
+        help_text=(
+            "Firma mientras el trabajo está en curso (NULL al terminar): el "
+            "índice único impide dos trabajos idénticos en curso"
+        ),
+    )
+    estado = models.CharField(
+        max_length=20,
+        choices=[(choice.value, choice.value) for choice in EstadoJobReporte],
+        default=EstadoJobReporte.PENDIENTE.value,
+    )
+    progreso = models.PositiveSmallIntegerField(
+        default=0, validators=[MinValueValidator(0), MaxValueValidator(100)]
+    )
+    reporte = models.ForeignKey(
+        ReporteDataModel,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="jobs",
+    )
+    resultado = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Resultado de trabajos que no generan un reporte (p. ej. PDF)",
+    )
+    mensaje_error = models.TextField(blank=True, null=True)
+    usuario_solicitante = models.CharField(max_length=100, blank=True, null=True)
+    fecha_creacion = models.DateTimeField(auto_now_add=True)
+    fecha_inicio_ejecucion = models.DateTimeField(null=True, blank=True)
+    fecha_fin_ejecucion = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "reporte_job"
+        verbose_name = "Trabajo de Reporte"
+        verbose_name_plural = "Trabajos de Reportes"
+        ordering = ["-fecha_creacion"]
+        indexes = [
+            models.Index(fields=["firma", "estado"]),
+        ]
+
+    def __str__(self):
+        return f"Job {self.pk} {self.tipo_reporte} - {self.estado} ({self.progreso}%)"
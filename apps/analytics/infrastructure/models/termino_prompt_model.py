@@ -0,0 +1,256 @@
+# apps/analytics/infrastructure/models/termino_prompt_model.py
+"""
+Modelo Django para el índice invertido de prompts - Single Responsibility
+Responsabilidad única: Mantener por término de prompt los logos que lo usan y sus
+conteos de éxito y calidad
+"""
+
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Set
+
+from django.db import models, transaction
+from django.db.models import F
+
+from apps.analytics.domain.enums import CalidadLogo
+
+# Fila especial con los totales de todos los logos indexados (el tokenizador
+# nunca produce "*")
+TERMINO_TOTAL = "*"
+LARGO_MINIMO_TERMINO = 3
+LARGO_MAXIMO_TERMINO = 64
+PATRON_TERMINO = re.compile(r"[a-z0-9]+")
+PALABRAS_VACIAS = frozenset("""
+    and con del las los para por que una uno unos unas sus the with este esta
+    estos estas como sin sobre entre hacia desde muy mas pero son ser
+    """.split())
+
+CAMPOS_CONTEO = ("logos", "exitosos", "calidad_alta", "calidad_media", "calidad_baja")
+CAMPO_CALIDAD = {
+    CalidadLogo.ALTA.value: "calidad_alta",
+    CalidadLogo.MEDIA.value: "calidad_media",
+    CalidadLogo.BAJA.value: "calidad_baja",
+}
+
+
+def tokenizar_prompt(prompt: str) -> Set[str]:
+    """
+    Términos distintos del prompt: minúsculas, sin tildes, alfanuméricos de al
+    menos LARGO_MINIMO_TERMINO caracteres y sin palabras vacías
+    """
+    texto = unicodedata.normalize("NFKD", (prompt or "").lower())
+    texto = texto.encode("ascii", "ignore").decode("ascii")
+    return {
+        termino[:LARGO_MAXIMO_TERMINO]
+        for termino in PATRON_TERMINO.findall(texto)
+        if len(termino) >= LARGO_MINIMO_TERMINO and termino not in PALABRAS_VACIAS
+    }
+
+
+def indexable(logo) -> bool:
+    """Los logos reutilizados del cache repiten el prompt de su original"""
+    return logo.reutilizado_de_id is None
+
+
+def _firma(logo) -> tuple:
+    return (indexable(logo), logo.prompt_usado, logo.exito, logo.calidad_logo)
+
+
+def ids_terminos(termino_model, terminos: Set[str]) -> Dict[str, int]:
+    """Ids de los términos, creando con conteos en cero los que falten"""
+    ids = dict(
+        termino_model.objects.filter(termino__in=terminos).values_list("termino", "id")
+    )
+    faltantes = set(terminos) - set(ids)
+    if faltantes:
+        # ignore_conflicts: otro proceso pudo crearlos entre medio; los ids se
+        # leen después porque MySQL no los devuelve en bulk_create
+        termino_model.objects.bulk_create(
+            [termino_model(termino=termino) for termino in faltantes],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+        ids.update(
+            termino_model.objects.filter(termino__in=faltantes).values_list(
+                "termino", "id"
+            )
+        )
+    return ids
+
+
+def conteos_de_logos(nuevos: Iterable, anteriores: Iterable = ()) -> Dict[str, Counter]:
+    """
+    Aportes por término: suma los `nuevos` y descuenta los `anteriores`
+    (versión previa de un logo editado o borrado)
+    """
+    conteos: Dict[str, Counter] = {}
+    for signo, logos in ((1, nuevos), (-1, anteriores)):
+        for logo in logos:
+            if not indexable(logo):
+                continue
+            aporte = {"logos": signo, "exitosos": signo if logo.exito else 0}
+            campo_calidad = CAMPO_CALIDAD.get(logo.calidad_logo)
+            if campo_calidad:
+                aporte[campo_calidad] = signo
+            for termino in tokenizar_prompt(logo.prompt_usado) | {TERMINO_TOTAL}:
+                conteos.setdefault(termino, Counter()).update(aporte)
+    return conteos
+
+
+class TerminoPromptModel(models.Model):
+    """
+    Una fila por término con cuántos logos lo usan y cómo les fue
+
+    La relación `logos_indexados` es la lista de postings (término -> logos).
+    Se actualiza al crear, editar o borrar logos y se puede reconstruir con
+    `reconstruir_indice_prompts`. La fila TERMINO_TOTAL guarda los totales
+    para calcular el lift sin contar la tabla de logos.
+    """
+
+    termino = models.CharField(max_length=LARGO_MAXIMO_TERMINO, unique=True)
+    logos = models.IntegerField(default=0)
+    exitosos = models.IntegerField(default=0)
+    calidad_alta = models.IntegerField(default=0)
+    calidad_media = models.IntegerField(default=0)
+    calidad_baja = models.IntegerField(default=0)
+    logos_indexados = models.ManyToManyField(
+        "LogoMarcaBovinaModel",
+        related_name="terminos_prompt",
+        db_table="termino_prompt_logo",
+        blank=True,
+    )
+
+    class Meta:
+        db_table = "termino_prompt"
+        verbose_name = "Término de Prompt"
+        verbose_name_plural = "Términos de Prompts"
+        indexes = [models.Index(fields=["logos"])]
+
+    def __str__(self):
+        return f"{self.termino}: {self.logos} logos"
+
+    @classmethod
+    def indexar(cls, nuevos: List, anteriores: List = ()) -> None:
+        """
+        Aplica los aportes de los logos a los conteos (UPDATE con F) y a los
+        postings
+
+        Un logo editado solo se reindexa si cambió su prompt, éxito, calidad u
+        origen, y entonces sus postings se rehacen completos. Los de un logo
+        borrado los elimina la cascada de la tabla intermedia.
+        """
+        previos = {logo.pk: _firma(logo) for logo in anteriores}
+        sin_cambios = {
+            logo.pk for logo in nuevos if previos.get(logo.pk) == _firma(logo)
+        }
+        nuevos = [logo for logo in nuevos if logo.pk not in sin_cambios]
+        anteriores = [logo for logo in anteriores if logo.pk not in sin_cambios]
+        if not nuevos and not anteriores:
+            return
+
+        tokens = {
+            logo.pk: tokenizar_prompt(logo.prompt_usado)
+            for logo in nuevos
+            if indexable(logo)
+        }
+        ids = ids_terminos(
+            cls, set().union(*tokens.values(), {TERMINO_TOTAL} if tokens else ())
+        )
+        # Un UPDATE por combinación de incrementos: los términos de un mismo
+        # logo cambian todos igual
+        por_incremento = defaultdict(list)
+        for termino, conteo in conteos_de_logos(nuevos, anteriores).items():
+            por_incremento[tuple(conteo[campo] for campo in CAMPOS_CONTEO)].append(
+                termino
+            )
+        for incrementos, terminos in por_incremento.items():
+            cambios = {
+                campo: F(campo) + incremento
+                for campo, incremento in zip(CAMPOS_CONTEO, incrementos)
+                if incremento
+            }
+            if cambios:
+                cls.objects.filter(termino__in=terminos).update(**cambios)
+
+        Posting = cls.logos_indexados.through
+        editados = [logo.pk for logo in nuevos if logo.pk in previos]
+        if editados:
+            Posting.objects.filter(logomarcabovinamodel_id__in=editados).delete()
+        Posting.objects.bulk_create(
+            [
+                Posting(terminopromptmodel_id=ids[termino], logomarcabovinamodel_id=pk)
+                for pk, terminos in tokens.items()
+                for termino in terminos
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def reconstruir(cls, tamaño_lote: int = 2000) -> int:
+        """Recalcula el índice desde los logos; retorna los términos creados"""
+        from .logo_marca_bovina_model import LogoMarcaBovinaModel
+
+        return reconstruir_indice(LogoMarcaBovinaModel, cls, tamaño_lote)
+
+
+def reconstruir_indice(logo_model, termino_model, tamaño_lote: int) -> int:
+    """
+    Recorre los logos por lotes (keyset sobre id) y reemplaza términos y
+    postings
+
+    Los conteos se acumulan en memoria por término y se escriben al final; los
+    postings se insertan por lote. Recibe los modelos para poder usarse también
+    desde migraciones.
+    """
+    Posting = termino_model.logos_indexados.through
+    with transaction.atomic():
+        Posting.objects.all().delete()
+        termino_model.objects.all().delete()
+
+        conteos: Dict[str, Counter] = {}
+        ids: Dict[str, int] = {}
+        ultimo_id = 0
+        while True:
+            lote = list(
+                logo_model.objects.filter(id__gt=ultimo_id, reutilizado_de__isnull=True)
+                .order_by("id")
+                .only("id", "prompt_usado", "exito", "calidad_logo", "reutilizado_de")[
+                    :tamaño_lote
+                ]
+            )
+            if not lote:
+                break
+
+            tokens = {logo.id: tokenizar_prompt(logo.prompt_usado) for logo in lote}
+            nuevos = set().union(*tokens.values(), {TERMINO_TOTAL}) - ids.keys()
+            ids.update(ids_terminos(termino_model, nuevos))
+            for termino, conteo in conteos_de_logos(lote).items():
+                conteos.setdefault(termino, Counter()).update(conteo)
+            Posting.objects.bulk_create(
+                [
+                    Posting(
+                        terminopromptmodel_id=ids[termino],
+                        logomarcabovinamodel_id=logo_id,
+                    )
+                    for logo_id, terminos in tokens.items()
+                    for termino in terminos
+                ],
+                batch_size=tamaño_lote,
+            )
+            ultimo_id = lote[-1].id
+
+        termino_model.objects.bulk_update(
+            [
+                termino_model(
+                    id=ids[termino],
+                    termino=termino,
+                    **{campo: conteo[campo] for campo in CAMPOS_CONTEO},
+                )
+                for termino, conteo in conteos.items()
+            ],
+            list(CAMPOS_CONTEO),
+            batch_size=tamaño_lote,
+        )
+    return len(ids)
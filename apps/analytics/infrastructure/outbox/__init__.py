@@ -0,0 +1,13 @@
+"""
+Feed de cambios (outbox) para la aplicación de analytics
+Lectura ordenada y por lotes de las mutaciones de marcas, logos e historial
+"""
+
+from .consumidor_outbox import ConsumidorOutbox, EventoCambio
+from .feed_actividad import FeedActividad
+
+__all__ = [
+    "ConsumidorOutbox",
+    "EventoCambio",
+    "FeedActividad",
+]
@@ -0,0 +1,182 @@
+"""
+Consumidor del outbox de cambios
+Responsabilidad única: Leer eventos desde un checkpoint, en orden y por lotes, y
+avanzar el checkpoint cuando el lote fue procesado
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from apps.analytics.infrastructure.models import (
+    EventoOutboxModel,
+    OutboxCheckpointModel,
+)
+
+
+@dataclass(frozen=True)
+class EventoCambio:
+    """Evento del outbox entregado a los consumidores"""
+
+    secuencia: int
+    entidad: str
+    entidad_id: int
+    operacion: str
+    campos_modificados: List[str]
+    fecha_creacion: datetime
+
+
+class ConsumidorOutbox:
+    """
+    Lee el outbox a partir de la última secuencia confirmada por un consumidor
+
+    Las secuencias se asignan al insertar pero se hacen visibles al confirmar
+    cada transacción, así que puede aparecer un hueco que se llena después. Un
+    lote se corta en el primer hueco cuyo siguiente evento es más reciente que
+    OUTBOX_MARGEN_VISIBILIDAD_SEGUNDOS; pasado ese margen el hueco se considera
+    una transacción revertida y se salta.
+    """
+
+    TAMAÑO_LOTE = 500
+    MARGEN_VISIBILIDAD_SEGUNDOS = 5
+
+    def __init__(
+        self,
+        nombre: Optional[str] = None,
+        tamaño_lote: Optional[int] = None,
+        entidades: Optional[Iterable[str]] = None,
+        desde: Optional[int] = None,
+    ):
+        """
+        Args:
+            nombre: Consumidor con checkpoint persistente; sin nombre la posición
+                solo se guarda en memoria
+            tamaño_lote: Eventos leídos por consulta
+            entidades: Si se indica, solo se entregan eventos de estas entidades
+                (el checkpoint avanza igual sobre el resto)
+            desde: Secuencia inicial cuando el consumidor no tiene checkpoint
+        """
+        self.nombre = nombre
+        self.tamaño_lote = tamaño_lote or self.TAMAÑO_LOTE
+        self.entidades = set(entidades) if entidades else None
+        self.margen = timedelta(
+            seconds=getattr(
+                settings,
+                "OUTBOX_MARGEN_VISIBILIDAD_SEGUNDOS",
+                self.MARGEN_VISIBILIDAD_SEGUNDOS,
+            )
+        )
+        self._desde = desde or 0
+        self._posicion = None if nombre is not None else self._desde
+
+    @classmethod
+    def ultima_secuencia(cls) -> int:
+        """Secuencia del último evento registrado (0 si el outbox está vacío)"""
+        return (
+            EventoOutboxModel.objects.order_by("-id")
+            .values_list("id", flat=True)
+            .first()
+            or 0
+        )
+
+    def checkpoint(self) -> int:
+        """Última secuencia confirmada"""
+        if self._posicion is None:
+            checkpoint, _ = OutboxCheckpointModel.objects.get_or_create(
+                consumidor=self.nombre, defaults={"ultima_secuencia": self._desde}
+            )
+            self._posicion = checkpoint.ultima_secuencia
+        return self._posicion
+
+    def leer_lote(self) -> List[EventoCambio]:
+        """Siguiente lote de eventos a partir del checkpoint (sin confirmarlo)"""
+        eventos, _ = self._leer()
+        return eventos
+
+    def confirmar(self, secuencia: int) -> None:
+        """Avanza el checkpoint hasta `secuencia` (nunca retrocede)"""
+        if secuencia <= self.checkpoint():
+            return
+        self._posicion = secuencia
+        if self.nombre is not None:
+            OutboxCheckpointModel.objects.filter(
+                consumidor=self.nombre, ultima_secuencia__lt=secuencia
+            ).update(ultima_secuencia=secuencia, fecha_actualizacion=timezone.now())
+
+    def procesar_pendientes(
+        self,
+        manejador: Callable[[List[EventoCambio]], None],
+        max_lotes: Optional[int] = None,
+    ) -> int:
+        """
+        Entrega lotes al manejador y confirma cada uno después de procesarlo
+
+        Si el manejador lanza una excepción el lote no se confirma y se volverá
+        a entregar. Retorna el número de eventos entregados.
+        """
+        entregados = 0
+        lotes = 0
+        while max_lotes is None or lotes < max_lotes:
+            eventos, hasta = self._leer()
+            if hasta is None:
+                break
+            if eventos:
+                manejador(eventos)
+                entregados += len(eventos)
+            self.confirmar(hasta)
+            lotes += 1
+        return entregados
+
+    def seguir(
+        self,
+        manejador: Callable[[List[EventoCambio]], None],
+        intervalo: float = 1.0,
+        detener: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """Procesa el outbox en bucle, esperando `intervalo` segundos si no hay nada"""
+        while not (detener and detener()):
+            close_old_connections()
+            if not self.procesar_pendientes(manejador, max_lotes=1):
+                time.sleep(intervalo)
+
+    def _leer(self):
+        """
+        Retorna (eventos filtrados, última secuencia segura leída) o
+        ([], None) si no hay nada nuevo visible
+        """
+        anterior = self.checkpoint()
+        filas = list(
+            EventoOutboxModel.objects.filter(id__gt=anterior).order_by("id")[
+                : self.tamaño_lote
+            ]
+        )
+
+        limite_hueco = timezone.now() - self.margen
+        visibles = []
+        for fila in filas:
+            if fila.id != anterior + 1 and fila.fecha_creacion > limite_hueco:
+                break
+            visibles.append(fila)
+            anterior = fila.id
+
+        if not visibles:
+            return [], None
+
+        eventos = [
+            EventoCambio(
+                secuencia=fila.id,
+                entidad=fila.entidad,
+                entidad_id=fila.entidad_id,
+                operacion=fila.operacion,
+                campos_modificados=fila.campos_modificados,
+                fecha_creacion=fila.fecha_creacion,
+            )
+            for fila in visibles
+            if self.entidades is None or fila.entidad in self.entidades
+        ]
+        return eventos, visibles[-1].id
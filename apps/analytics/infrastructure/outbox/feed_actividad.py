@@ -0,0 +1,221 @@
+"""
+Feed de actividad reciente sobre el outbox
+Responsabilidad única: Servir por marca de agua (secuencia) los eventos de
+historial y marcas desde un buffer circular en memoria compartido por proceso
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from apps.analytics.infrastructure.models import (
+    HistorialEstadoMarcaModel,
+    MarcaGanadoBovinoModel,
+)
+from .consumidor_outbox import ConsumidorOutbox, EventoCambio
+
+
+class FeedActividad:
+    """
+    Buffer circular con los últimos eventos de historial y marcas
+
+    Un solo hilo a la vez consulta el outbox (id > última secuencia, por la
+    clave primaria) y como mucho una vez cada ACTIVIDAD_FEED_REFRESCO_SEGUNDOS;
+    el resto de lecturas y esperas se sirven desde memoria. Si la marca de agua
+    pedida es anterior a lo que cubre el buffer se lee directamente del outbox.
+    """
+
+    ENTIDADES = ("historial", "marca")
+    CAPACIDAD = 1000
+    REFRESCO_SEGUNDOS = 1.0
+
+    _instancia: Optional["FeedActividad"] = None
+    _instancia_lock = threading.Lock()
+
+    def __init__(
+        self,
+        capacidad: Optional[int] = None,
+        refresco_segundos: Optional[float] = None,
+    ):
+        self.capacidad = capacidad or getattr(
+            settings, "ACTIVIDAD_FEED_CAPACIDAD", self.CAPACIDAD
+        )
+        self.refresco_segundos = (
+            refresco_segundos
+            if refresco_segundos is not None
+            else getattr(
+                settings, "ACTIVIDAD_FEED_REFRESCO_SEGUNDOS", self.REFRESCO_SEGUNDOS
+            )
+        )
+        self._eventos: deque = deque()
+        self._lock = threading.Lock()
+        self._refresco_lock = threading.Lock()
+        self._consumidor: Optional[ConsumidorOutbox] = None
+        # Última secuencia incorporada (avanza junto con el buffer)
+        self._posicion = 0
+        # Secuencia a partir de la cual el buffer tiene todos los eventos
+        self._cubre_desde = 0
+        self._ultimo_refresco = 0.0
+
+    @classmethod
+    def instancia(cls) -> "FeedActividad":
+        """Feed compartido por todos los hilos del proceso"""
+        if cls._instancia is None:
+            with cls._instancia_lock:
+                if cls._instancia is None:
+                    cls._instancia = cls()
+        return cls._instancia
+
+    def eventos_desde(
+        self, desde: Optional[int], limite: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Eventos con secuencia mayor que `desde` (los más antiguos primero)
+
+        Sin `desde` se devuelven los últimos `limite` eventos. Retorna
+        (eventos, marca de agua); la marca de agua es el `desde` de la
+        siguiente llamada.
+        """
+        self._refrescar()
+        with self._lock:
+            posicion = self._posicion
+            if desde is None:
+                eventos = list(self._eventos)[-limite:]
+                return eventos, posicion
+            if desde >= posicion:
+                return [], max(desde, posicion)
+            if desde >= self._cubre_desde:
+                nuevos = []
+                for evento in reversed(self._eventos):
+                    if evento["secuencia"] <= desde:
+                        break
+                    nuevos.append(evento)
+                nuevos.reverse()
+                if len(nuevos) > limite:
+                    return nuevos[:limite], nuevos[limite - 1]["secuencia"]
+                return nuevos, posicion
+
+        return self._leer_outbox(desde, limite, posicion)
+
+    def esperar_eventos(
+        self, desde: Optional[int], limite: int, espera_segundos: float
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Como eventos_desde, pero espera hasta `espera_segundos` si no hay nada"""
+        limite_espera = time.monotonic() + max(espera_segundos, 0)
+        while True:
+            eventos, marca_agua = self.eventos_desde(desde, limite)
+            restante = limite_espera - time.monotonic()
+            if eventos or desde is None or restante <= 0:
+                return eventos, marca_agua
+            time.sleep(min(self.refresco_segundos, restante))
+
+    def _refrescar(self) -> None:
+        """Incorpora al buffer los eventos nuevos del outbox (con throttling)"""
+        if time.monotonic() - self._ultimo_refresco < self.refresco_segundos:
+            return
+        if not self._refresco_lock.acquire(blocking=self._consumidor is None):
+            # Otro hilo ya está consultando; se sirve lo que hay en memoria
+            return
+        try:
+            if self._consumidor is None:
+                inicio = max(ConsumidorOutbox.ultima_secuencia() - self.capacidad, 0)
+                self._consumidor = ConsumidorOutbox(
+                    entidades=self.ENTIDADES, desde=inicio
+                )
+                self._cubre_desde = self._posicion = inicio
+
+            recibidos: List[EventoCambio] = []
+            self._consumidor.procesar_pendientes(recibidos.extend)
+            nuevos = self._enriquecer(recibidos)
+
+            with self._lock:
+                for evento in nuevos:
+                    if len(self._eventos) >= self.capacidad:
+                        self._cubre_desde = self._eventos.popleft()["secuencia"]
+                    self._eventos.append(evento)
+                self._posicion = self._consumidor.checkpoint()
+            self._ultimo_refresco = time.monotonic()
+        finally:
+            self._refresco_lock.release()
+
+    def _leer_outbox(
+        self, desde: int, limite: int, posicion: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Lectura directa para marcas de agua que el buffer ya no cubre"""
+        consumidor = ConsumidorOutbox(
+            tamaño_lote=limite, entidades=self.ENTIDADES, desde=desde
+        )
+        recibidos: List[EventoCambio] = []
+        consumidor.procesar_pendientes(recibidos.extend, max_lotes=1)
+        eventos = [
+            evento
+            for evento in self._enriquecer(recibidos)
+            if evento["secuencia"] <= posicion
+        ]
+        return eventos, min(consumidor.checkpoint(), posicion)
+
+    @staticmethod
+    def _enriquecer(eventos: List[EventoCambio]) -> List[Dict[str, Any]]:
+        """
+        Serializa los eventos con los datos actuales de la marca o del cambio de
+        estado (dos consultas por lote; las filas eliminadas quedan en None)
+        """
+        ids_historial = {e.entidad_id for e in eventos if e.entidad == "historial"}
+        ids_marca = {e.entidad_id for e in eventos if e.entidad == "marca"}
+
+        historiales = {
+            fila["id"]: fila
+            for fila in HistorialEstadoMarcaModel.objects.filter(
+                id__in=ids_historial
+            ).values(
+                "id",
+                "marca_id",
+                "marca__numero_marca",
+                "estado_anterior",
+                "estado_nuevo",
+                "usuario_responsable",
+            )
+        }
+        marcas = {
+            fila["id"]: fila
+            for fila in MarcaGanadoBovinoModel.objects.filter(id__in=ids_marca).values(
+                "id", "numero_marca", "estado", "departamento"
+            )
+        }
+
+        resultado = []
+        for evento in eventos:
+            datos = {
+                "secuencia": evento.secuencia,
+                "entidad": evento.entidad,
+                "entidad_id": evento.entidad_id,
+                "operacion": evento.operacion,
+                "campos_modificados": evento.campos_modificados,
+                "fecha": evento.fecha_creacion.isoformat(),
+            }
+            if evento.entidad == "historial":
+                fila = historiales.get(evento.entidad_id, {})
+                datos.update(
+                    {
+                        "marca_id": fila.get("marca_id"),
+                        "numero_marca": fila.get("marca__numero_marca"),
+                        "estado_anterior": fila.get("estado_anterior"),
+                        "estado_nuevo": fila.get("estado_nuevo"),
+                        "usuario_responsable": fila.get("usuario_responsable"),
+                    }
+                )
+            else:
+                fila = marcas.get(evento.entidad_id, {})
+                datos.update(
+                    {
+                        "marca_id": evento.entidad_id,
+                        "numero_marca": fila.get("numero_marca"),
+                        "estado": fila.get("estado"),
+                        "departamento": fila.get("departamento"),
+                    }
+                )
+            resultado.append(datos)
+        return resultado
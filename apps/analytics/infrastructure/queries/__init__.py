@@ -0,0 +1,17 @@
+"""
+Consultas especializadas de infraestructura para la aplicación de analytics
+Traducen especificaciones de reportes y métricas a consultas del ORM
+"""
+
+from .reporte_personalizado_compiler import CompiladorReportePersonalizado, PlanConsulta
+from .eficiencia_evaluadores import MotorEficienciaEvaluadores
+from .percentiles_latencia import MotorPercentilesLatencia
+from .analisis_prompts import MotorAnalisisPrompts
+
+__all__ = [
+    "CompiladorReportePersonalizado",
+    "PlanConsulta",
+    "MotorEficienciaEvaluadores",
+    "MotorPercentilesLatencia",
+    "MotorAnalisisPrompts",
+]
@@ -0,0 +1,157 @@
+"""
+Motor de análisis de prompts sobre el índice invertido de términos
+Responsabilidad única: Relacionar los términos de los prompts con el éxito y la
+calidad de los logos leyendo solo termino_prompt (sin recorrer prompt_usado)
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from apps.analytics.infrastructure.models import TerminoPromptModel
+from apps.analytics.infrastructure.models.termino_prompt_model import (
+    CAMPOS_CONTEO,
+    TERMINO_TOTAL,
+    tokenizar_prompt,
+)
+
+# |z| a partir del cual la diferencia con la tasa global es significativa (95%)
+Z_SIGNIFICATIVO = 1.96
+
+
+class MotorAnalisisPrompts:
+    """
+    Calcula frecuencia, lift y z de cada término con NumPy
+
+    lift = tasa del término / tasa global (de fallo, calidad alta o calidad
+    baja): 2.0 significa que los logos con ese término fallan el doble que el
+    promedio. z es la prueba de una proporción contra la tasa global y sirve
+    para descartar términos con pocos logos. NumPy se importa al calcular.
+    """
+
+    def calcular(
+        self,
+        min_soporte: int = 20,
+        limite: int = 20,
+        termino: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Términos más asociados a fallos y a cada calidad
+
+        Args:
+            min_soporte: Mínimo de logos con el término para evaluarlo
+            limite: Términos por ranking
+            termino: Si se indica, agrega su detalle con ids de logos fallidos
+
+        Returns:
+            Dict[str, Any]: Totales, rankings y metadata
+        """
+        import numpy as np
+
+        inicio = time.perf_counter()
+        totales = (
+            TerminoPromptModel.objects.filter(termino=TERMINO_TOTAL)
+            .values(*CAMPOS_CONTEO)
+            .first()
+        ) or dict.fromkeys(CAMPOS_CONTEO, 0)
+
+        filas = list(
+            TerminoPromptModel.objects.filter(logos__gte=max(min_soporte, 1))
+            .exclude(termino=TERMINO_TOTAL)
+            .values_list("termino", *CAMPOS_CONTEO)
+        )
+        terminos = [fila[0] for fila in filas]
+        conteos = np.array([fila[1:] for fila in filas], dtype=float).reshape(
+            -1, len(CAMPOS_CONTEO)
+        )
+        logos, exitosos, alta, _, baja = conteos.T
+
+        total = totales["logos"]
+        tasas_globales = (
+            {
+                "fallo": (total - totales["exitosos"]) / total,
+                "calidad_alta": totales["calidad_alta"] / total,
+                "calidad_baja": totales["calidad_baja"] / total,
+            }
+            if total
+            else {}
+        )
+        eventos = {
+            "fallo": logos - exitosos,
+            "calidad_alta": alta,
+            "calidad_baja": baja,
+        }
+
+        rankings = {}
+        for clave, tasa_global in tasas_globales.items():
+            rankings[clave] = self._ranking(
+                np, terminos, logos, eventos[clave], tasa_global, limite
+            )
+
+        resultado = {
+            "total_logos": total,
+            "tasa_fallo_global": round(tasas_globales.get("fallo", 0) * 100, 2),
+            "terminos_fallo": rankings.get("fallo", []),
+            "terminos_alta_calidad": rankings.get("calidad_alta", []),
+            "terminos_baja_calidad": rankings.get("calidad_baja", []),
+        }
+        if termino is not None:
+            resultado["detalle_termino"] = self._detalle(termino, totales)
+        resultado["metadata"] = {
+            "min_soporte": min_soporte,
+            "terminos_evaluados": len(terminos),
+            "duracion_ms": round((time.perf_counter() - inicio) * 1000, 2),
+        }
+        return resultado
+
+    @staticmethod
+    def _ranking(
+        np, terminos: List[str], logos, eventos, tasa_global: float, limite: int
+    ) -> List[Dict[str, Any]]:
+        """Términos con lift > 1, de mayor a menor lift (a igual lift, mayor z)"""
+        if not terminos or not 0 < tasa_global < 1:
+            return []
+        tasas = eventos / logos
+        lift = tasas / tasa_global
+        z = (tasas - tasa_global) / np.sqrt(tasa_global * (1 - tasa_global) / logos)
+
+        candidatos = np.flatnonzero(lift > 1)
+        orden = candidatos[np.lexsort((-z[candidatos], -lift[candidatos]))][:limite]
+        return [
+            {
+                "termino": terminos[i],
+                "logos": int(logos[i]),
+                "eventos": int(eventos[i]),
+                "tasa": round(float(tasas[i]) * 100, 2),
+                "lift": round(float(lift[i]), 3),
+                "z": round(float(z[i]), 2),
+                "significativo": bool(z[i] >= Z_SIGNIFICATIVO),
+            }
+            for i in orden
+        ]
+
+    @staticmethod
+    def _detalle(termino: str, totales: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        """Conteos del término y los últimos logos fallidos que lo usan"""
+        normalizado = next(iter(tokenizar_prompt(termino)), None)
+        fila = (
+            TerminoPromptModel.objects.filter(termino=normalizado)
+            .values("id", "termino", *CAMPOS_CONTEO)
+            .first()
+        )
+        if fila is None:
+            return None
+
+        Posting = TerminoPromptModel.logos_indexados.through
+        fallidos = list(
+            Posting.objects.filter(
+                terminopromptmodel_id=fila.pop("id"),
+                logomarcabovinamodel__exito=False,
+            )
+            .order_by("-logomarcabovinamodel_id")
+            .values_list("logomarcabovinamodel_id", flat=True)[:100]
+        )
+        fila["frecuencia"] = (
+            round(fila["logos"] / totales["logos"] * 100, 2) if totales["logos"] else 0
+        )
+        fila["logos_fallidos"] = fallidos
+        return fila
@@ -0,0 +1,214 @@
+"""
+Motor de eficiencia de evaluadores sobre el historial de estados
+Responsabilidad única: Calcular métricas por usuario_responsable a partir de una
+única consulta con ventana (LAG) sobre las transiciones de cada marca
+"""
+
+import math
+import statistics
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, time as dt_time
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Window
+from django.db.models.functions import Lag
+
+from apps.analytics.domain.enums import EstadoMarca
+from apps.analytics.infrastructure.models import HistorialEstadoMarcaModel
+
+SIN_RESPONSABLE = "SISTEMA"
+
+
+def percentil(valores_ordenados: List[float], p: float) -> Optional[float]:
+    """Percentil con interpolación lineal sobre una lista ya ordenada"""
+    if not valores_ordenados:
+        return None
+    posicion = (len(valores_ordenados) - 1) * p / 100
+    inferior = math.floor(posicion)
+    superior = math.ceil(posicion)
+    if inferior == superior:
+        return valores_ordenados[int(posicion)]
+    return valores_ordenados[inferior] + (
+        valores_ordenados[superior] - valores_ordenados[inferior]
+    ) * (posicion - inferior)
+
+
+class MotorEficienciaEvaluadores:
+    """
+    Calcula throughput, tiempos entre transiciones y mezcla de decisiones
+
+    El tiempo de una transición es el transcurrido desde la transición anterior
+    de la misma marca (LAG sobre marca_id ordenado por fecha_cambio), de modo que
+    mide cuánto tardó el evaluador en mover la marca a su nuevo estado. Los
+    resultados se guardan en el cache de Django por período.
+    """
+
+    PREFIJO_CACHE = "eficiencia_evaluadores"
+    TIMEOUT_CACHE = 900
+
+    def __init__(self, timeout_cache: Optional[int] = None):
+        self.timeout_cache = (
+            timeout_cache
+            if timeout_cache is not None
+            else getattr(
+                settings, "HISTORIAL_EFICIENCIA_CACHE_SEGUNDOS", self.TIMEOUT_CACHE
+            )
+        )
+
+    def calcular(self, fecha_inicio: date, fecha_fin: date) -> Dict[str, Any]:
+        """
+        Métricas por evaluador para las transiciones del período (inclusive)
+
+        Returns:
+            Dict[str, Any]: {"evaluadores": {usuario: métricas}, "sistema": {...},
+                "metadata": {...}}
+        """
+        clave = self._clave(fecha_inicio, fecha_fin)
+        try:
+            resultado = cache.get(clave)
+        except Exception:
+            resultado = None
+        if resultado is not None:
+            resultado["metadata"]["en_cache"] = True
+            return resultado
+
+        resultado = self._calcular(fecha_inicio, fecha_fin)
+        try:
+            cache.set(clave, resultado, self.timeout_cache)
+        except Exception:
+            pass
+        return resultado
+
+    def invalidar(self, fecha_inicio: date, fecha_fin: date) -> None:
+        """Descarta el resultado cacheado de un período"""
+        cache.delete(self._clave(fecha_inicio, fecha_fin))
+
+    def _clave(self, fecha_inicio: date, fecha_fin: date) -> str:
+        return (
+            f"{self.PREFIJO_CACHE}:{fecha_inicio.isoformat()}:{fecha_fin.isoformat()}"
+        )
+
+    def _calcular(self, fecha_inicio: date, fecha_fin: date) -> Dict[str, Any]:
+        inicio_consulta = time.perf_counter()
+        desde = datetime.combine(fecha_inicio, dt_time.min)
+        hasta = datetime.combine(fecha_fin, dt_time.max)
+
+        # La ventana debe ver la transición previa aunque sea anterior al
+        # período, por eso solo se limita a las marcas con actividad en él y el
+        # corte por fecha de inicio se hace al recorrer las filas
+        marcas_activas = HistorialEstadoMarcaModel.objects.filter(
+            fecha_cambio__gte=desde, fecha_cambio__lte=hasta
+        ).values("marca_id")
+        filas = (
+            HistorialEstadoMarcaModel.objects.filter(
+                marca_id__in=marcas_activas, fecha_cambio__lte=hasta
+            )
+            .annotate(
+                fecha_anterior=Window(
+                    expression=Lag("fecha_cambio"),
+                    partition_by=[F("marca_id")],
+                    order_by=[F("fecha_cambio").asc(), F("id").asc()],
+                )
+            )
+            .order_by()
+            .values_list(
+                "usuario_responsable",
+                "marca_id",
+                "estado_nuevo",
+                "fecha_cambio",
+                "fecha_anterior",
+            )
+        )
+
+        transiciones: Counter = Counter()
+        marcas: Dict[str, set] = defaultdict(set)
+        estados: Dict[str, Counter] = defaultdict(Counter)
+        tiempos: Dict[str, List[float]] = defaultdict(list)
+        dias_activos: Dict[str, set] = defaultdict(set)
+
+        for usuario, marca_id, estado, fecha, fecha_anterior in filas.iterator(
+            chunk_size=5000
+        ):
+            if fecha < desde:
+                continue
+            usuario = usuario or SIN_RESPONSABLE
+            transiciones[usuario] += 1
+            marcas[usuario].add(marca_id)
+            estados[usuario][estado] += 1
+            dias_activos[usuario].add(fecha.date())
+            if fecha_anterior is not None:
+                tiempos[usuario].append((fecha - fecha_anterior).total_seconds() / 3600)
+
+        dias_periodo = (fecha_fin - fecha_inicio).days + 1
+        evaluadores = {
+            usuario: self._metricas_usuario(
+                total,
+                len(marcas[usuario]),
+                estados[usuario],
+                sorted(tiempos[usuario]),
+                len(dias_activos[usuario]),
+                dias_periodo,
+            )
+            for usuario, total in transiciones.items()
+        }
+
+        todos_tiempos = sorted(t for lista in tiempos.values() for t in lista)
+        total_transiciones = sum(transiciones.values())
+        return {
+            "periodo": {
+                "fecha_inicio": fecha_inicio.isoformat(),
+                "fecha_fin": fecha_fin.isoformat(),
+                "dias": dias_periodo,
+            },
+            "evaluadores": evaluadores,
+            "sistema": {
+                "total_evaluadores": len(evaluadores),
+                "total_transiciones": total_transiciones,
+                "transiciones_por_dia": round(total_transiciones / dias_periodo, 2),
+                "tiempo_mediano_horas": self._redondear(percentil(todos_tiempos, 50)),
+                "tiempo_p90_horas": self._redondear(percentil(todos_tiempos, 90)),
+            },
+            "metadata": {
+                "en_cache": False,
+                "tiempo_calculo_segundos": round(
+                    time.perf_counter() - inicio_consulta, 4
+                ),
+            },
+        }
+
+    def _metricas_usuario(
+        self,
+        total: int,
+        marcas_distintas: int,
+        estados: Counter,
+        tiempos: List[float],
+        dias_activos: int,
+        dias_periodo: int,
+    ) -> Dict[str, Any]:
+        aprobadas = estados.get(EstadoMarca.APROBADO.value, 0)
+        rechazadas = estados.get(EstadoMarca.RECHAZADO.value, 0)
+        decisiones = aprobadas + rechazadas
+        return {
+            "transiciones": total,
+            "marcas_distintas": marcas_distintas,
+            "dias_activos": dias_activos,
+            "transiciones_por_dia": round(total / dias_periodo, 2),
+            "tiempo_mediano_horas": self._redondear(
+                statistics.median(tiempos) if tiempos else None
+            ),
+            "tiempo_p90_horas": self._redondear(percentil(tiempos, 90)),
+            "tiempo_maximo_horas": self._redondear(tiempos[-1] if tiempos else None),
+            "aprobadas": aprobadas,
+            "rechazadas": rechazadas,
+            "tasa_aprobacion": (
+                round(aprobadas / decisiones * 100, 2) if decisiones else None
+            ),
+            "por_estado": dict(estados),
+        }
+
+    @staticmethod
+    def _redondear(valor: Optional[float]) -> Optional[float]:
+        return round(valor, 2) if valor is not None else None
@@ -0,0 +1,350 @@
+"""
+Compilador de reportes personalizados a consultas GROUP BY
+Responsabilidad única: Validar la especificación del analista contra una lista
+blanca y traducirla a una única consulta agregada del ORM
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Avg, Count, F, QuerySet, Sum
+from django.db.models.functions import TruncMonth
+
+from apps.analytics.domain.enums import (
+    Departamento,
+    EstadoMarca,
+    PropositoGanado,
+    RazaBovino,
+)
+from apps.analytics.infrastructure.models import MarcaGanadoBovinoModel
+
+
+@dataclass(frozen=True)
+class PlanConsulta:
+    """Especificación validada y su consulta lista para ejecutar"""
+
+    firma: str
+    dimensiones: Tuple[str, ...]
+    medidas: Tuple[str, ...]
+    filtros: Tuple[Tuple[str, Any], ...]
+    orden: Tuple[str, ...]
+    limite: int
+    consulta: QuerySet
+
+
+class CompiladorReportePersonalizado:
+    """
+    Traduce {filtros, metricas, agrupaciones} a un único GROUP BY sobre marcas
+
+    Solo se aceptan dimensiones, medidas y filtros de la lista blanca. Los planes
+    compilados se guardan en un LRU por proceso indexado por el hash de la
+    especificación normalizada, así que los reportes repetidos no vuelven a
+    validarse ni a construir la consulta.
+    """
+
+    # Nombre público -> expresión de agrupación
+    DIMENSIONES = {
+        "departamento": "departamento",
+        "raza": "raza_bovino",
+        "proposito": "proposito_ganado",
+        "estado": "estado",
+        "mes": TruncMonth("fecha_registro"),
+    }
+
+    # Nombre público -> agregado
+    MEDIDAS = {
+        "conteo": Count("id"),
+        "suma_cabezas": Sum("cantidad_cabezas"),
+        "suma_monto": Sum("monto_certificacion"),
+        "promedio_tiempo": Avg("tiempo_procesamiento_horas"),
+    }
+
+    # Nombre público -> (campo, valores admitidos)
+    FILTROS = {
+        "departamento": ("departamento", Departamento),
+        "raza": ("raza_bovino", RazaBovino),
+        "proposito": ("proposito_ganado", PropositoGanado),
+        "estado": ("estado", EstadoMarca),
+    }
+
+    ALIAS = {
+        "raza_bovino": "raza",
+        "proposito_ganado": "proposito",
+        "propósito": "proposito",
+        "month": "mes",
+        "count": "conteo",
+        "total": "conteo",
+        "sum_cabezas": "suma_cabezas",
+        "cabezas": "suma_cabezas",
+        "sum_monto": "suma_monto",
+        "monto": "suma_monto",
+        "avg_tiempo": "promedio_tiempo",
+        "tiempo": "promedio_tiempo",
+    }
+
+    MAX_FILAS = 5000
+    TAMAÑO_CACHE_PLANES = 256
+
+    _planes: "OrderedDict[str, PlanConsulta]" = OrderedDict()
+    _planes_lock = threading.Lock()
+
+    def __init__(self, max_filas: Optional[int] = None):
+        self.max_filas = max_filas or getattr(
+            settings, "REPORTE_PERSONALIZADO_MAX_FILAS", self.MAX_FILAS
+        )
+
+    def ejecutar(self, especificacion: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compila (o reutiliza) el plan y ejecuta la consulta
+
+        Args:
+            especificacion: {"filtros": {...}, "metricas": [...],
+                "agrupaciones": [...], "orden": [...], "limite": int}
+
+        Returns:
+            Dict[str, Any]: Filas, columnas, truncado y metadata de ejecución
+
+        Raises:
+            ValueError: Si la especificación usa elementos fuera de la lista blanca
+        """
+        inicio = time.perf_counter()
+        plan, en_cache = self.compilar(especificacion)
+
+        if plan.dimensiones:
+            # Una fila extra indica que el resultado fue truncado
+            filas = list(plan.consulta.all()[: plan.limite + 1])
+        else:
+            # Sin agrupaciones: totales del período en una sola fila
+            filas = [
+                plan.consulta.aggregate(
+                    **{nombre: self.MEDIDAS[nombre] for nombre in plan.medidas}
+                )
+            ]
+        truncado = len(filas) > plan.limite
+        filas = [self._serializar_fila(fila) for fila in filas[: plan.limite]]
+
+        return {
+            "columnas": list(plan.dimensiones + plan.medidas),
+            "filas": filas,
+            "total_filas": len(filas),
+            "truncado": truncado,
+            "limite": plan.limite,
+            "metadata": {
+                "firma_plan": plan.firma,
+                "plan_en_cache": en_cache,
+                "tiempo_consulta_segundos": round(time.perf_counter() - inicio, 4),
+            },
+        }
+
+    def compilar(self, especificacion: Dict[str, Any]) -> Tuple[PlanConsulta, bool]:
+        """Retorna (plan, True si provino del cache)"""
+        normalizada = self._normalizar(especificacion)
+        firma = hashlib.sha256(
+            json.dumps(normalizada, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+        with self._planes_lock:
+            plan = self._planes.get(firma)
+            if plan is not None:
+                self._planes.move_to_end(firma)
+                return plan, True
+
+        plan = self._construir_plan(firma, normalizada)
+
+        with self._planes_lock:
+            self._planes[firma] = plan
+            while len(self._planes) > self.TAMAÑO_CACHE_PLANES:
+                self._planes.popitem(last=False)
+        return plan, False
+
+    def _normalizar(self, especificacion: Dict[str, Any]) -> Dict[str, Any]:
+        """Valida contra la lista blanca y produce una forma canónica"""
+        if not isinstance(especificacion, dict):
+            raise ValueError("La especificación debe ser un objeto")
+
+        metricas = self._lista(especificacion.get("metricas"), "metricas")
+        agrupaciones = self._lista(especificacion.get("agrupaciones"), "agrupaciones")
+        filtros = especificacion.get("filtros") or {}
+        if not isinstance(filtros, dict):
+            raise ValueError("filtros debe ser un objeto")
+
+        medidas = self._validar_nombres(metricas, self.MEDIDAS, "Métrica")
+        dimensiones = self._validar_nombres(
+            agrupaciones, self.DIMENSIONES, "Agrupación"
+        )
+        if not medidas:
+            raise ValueError("Se requiere al menos una métrica")
+
+        filtros_normalizados: Dict[str, Any] = {}
+        for clave, valor in filtros.items():
+            if clave in ("fecha_inicio", "fecha_fin"):
+                filtros_normalizados[clave] = self._fecha(valor, clave).isoformat()
+                continue
+
+            nombre = self.ALIAS.get(clave, clave)
+            if nombre not in self.FILTROS:
+                raise ValueError(f"Filtro no permitido: {clave}")
+
+            _, enum = self.FILTROS[nombre]
+            valores = sorted(
+                {str(v) for v in (valor if isinstance(valor, list) else [valor])}
+            )
+            permitidos = {e.value for e in enum}
+            invalidos = [v for v in valores if v not in permitidos]
+            if invalidos:
+                raise ValueError(
+                    f"Valores no válidos para {clave}: {', '.join(invalidos)}"
+                )
+            filtros_normalizados[nombre] = valores
+
+        if (
+            "fecha_inicio" in filtros_normalizados
+            and "fecha_fin" in filtros_normalizados
+            and filtros_normalizados["fecha_inicio"] > filtros_normalizados["fecha_fin"]
+        ):
+            raise ValueError(
+                "La fecha de inicio no puede ser mayor que la fecha de fin"
+            )
+
+        orden = []
+        for campo in self._lista(especificacion.get("orden"), "orden"):
+            descendente = campo.startswith("-")
+            nombre = self.ALIAS.get(campo.lstrip("-"), campo.lstrip("-"))
+            if nombre not in medidas and nombre not in dimensiones:
+                raise ValueError(
+                    f"Solo se puede ordenar por columnas del reporte: {campo}"
+                )
+            orden.append(f"-{nombre}" if descendente else nombre)
+
+        limite = especificacion.get("limite") or self.max_filas
+        try:
+            limite = int(limite)
+        except (TypeError, ValueError):
+            raise ValueError("limite debe ser un entero")
+        if limite < 1:
+            raise ValueError("limite debe ser mayor que cero")
+
+        return {
+            "dimensiones": dimensiones,
+            "medidas": medidas,
+            "filtros": filtros_normalizados,
+            "orden": orden or [f"-{medidas[0]}"],
+            "limite": min(limite, self.max_filas),
+        }
+
+    def _construir_plan(self, firma: str, normalizada: Dict[str, Any]) -> PlanConsulta:
+        """Construye la consulta: WHERE filtros GROUP BY dimensiones (si las hay)"""
+        consulta = MarcaGanadoBovinoModel.objects.all()
+
+        filtros = normalizada["filtros"]
+        if "fecha_inicio" in filtros:
+            consulta = consulta.filter(
+                fecha_registro__gte=datetime.combine(
+                    date.fromisoformat(filtros["fecha_inicio"]), dt_time.min
+                )
+            )
+        if "fecha_fin" in filtros:
+            consulta = consulta.filter(
+                fecha_registro__lte=datetime.combine(
+                    date.fromisoformat(filtros["fecha_fin"]), dt_time.max
+                )
+            )
+        for nombre, (campo, _) in self.FILTROS.items():
+            if nombre in filtros:
+                consulta = consulta.filter(**{f"{campo}__in": filtros[nombre]})
+
+        # Sin dimensiones values() agruparía por todas las columnas del modelo
+        # (y expondría los datos del productor): se agrega con aggregate() al
+        # ejecutar, sobre la consulta filtrada
+        dimensiones = normalizada["dimensiones"]
+        if not dimensiones:
+            return PlanConsulta(
+                firma=firma,
+                dimensiones=(),
+                medidas=tuple(normalizada["medidas"]),
+                filtros=tuple(sorted((k, str(v)) for k, v in filtros.items())),
+                orden=(),
+                limite=1,
+                consulta=consulta,
+            )
+
+        # Campos cuyo nombre público coincide con el del modelo van por nombre;
+        # el resto se expone con un alias (values no admite alias = campo)
+        por_nombre = [n for n in dimensiones if self.DIMENSIONES[n] == n]
+        con_alias = {
+            n: (
+                F(self.DIMENSIONES[n])
+                if isinstance(self.DIMENSIONES[n], str)
+                else self.DIMENSIONES[n]
+            )
+            for n in dimensiones
+            if self.DIMENSIONES[n] != n
+        }
+        consulta = consulta.values(*por_nombre, **con_alias).annotate(
+            **{nombre: self.MEDIDAS[nombre] for nombre in normalizada["medidas"]}
+        )
+
+        return PlanConsulta(
+            firma=firma,
+            dimensiones=tuple(dimensiones),
+            medidas=tuple(normalizada["medidas"]),
+            filtros=tuple(sorted((k, str(v)) for k, v in filtros.items())),
+            orden=tuple(normalizada["orden"]),
+            limite=normalizada["limite"],
+            consulta=consulta.order_by(*normalizada["orden"]),
+        )
+
+    @staticmethod
+    def _lista(valor: Any, nombre: str) -> List[str]:
+        if valor in (None, ""):
+            return []
+        if isinstance(valor, str):
+            return [valor]
+        if not isinstance(valor, list) or not all(isinstance(v, str) for v in valor):
+            raise ValueError(f"{nombre} debe ser una lista de textos")
+        return valor
+
+    def _validar_nombres(
+        self, nombres: List[str], permitidos: Dict[str, Any], tipo: str
+    ) -> List[str]:
+        resultado = []
+        for nombre in nombres:
+            canonico = self.ALIAS.get(nombre, nombre)
+            if canonico not in permitidos:
+                raise ValueError(
+                    f"{tipo} no permitida: {nombre}. "
+                    f"Opciones: {', '.join(sorted(permitidos))}"
+                )
+            if canonico not in resultado:
+                resultado.append(canonico)
+        return resultado
+
+    @staticmethod
+    def _fecha(valor: Any, nombre: str) -> date:
+        try:
+            return date.fromisoformat(str(valor)[:10])
+        except ValueError:
+            raise ValueError(f"{nombre} debe tener formato YYYY-MM-DD")
+
+    @staticmethod
+    def _serializar_fila(fila: Dict[str, Any]) -> Dict[str, Any]:
+        resultado = {}
+        for clave, valor in fila.items():
+            if isinstance(valor, Decimal):
+                valor = float(valor)
+            elif isinstance(valor, datetime):
+                valor = valor.date().isoformat()[:7]
+            elif isinstance(valor, date):
+                valor = valor.isoformat()[:7]
+            elif isinstance(valor, float):
+                valor = round(valor, 2)
+            resultado[clave] = valor
+        return resultado
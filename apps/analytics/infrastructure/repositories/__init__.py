@@ -9,6 +9,7 @@ from .kpi_repository import DjangoKpiRepository
 from .historial_repository import DjangoHistorialRepository
 from .dashboard_repository import DjangoDashboardRepository
 from .reporte_repository import DjangoReporteRepository
+from .reporte_job_repository import DjangoReporteJobRepository
 
 __all__ = [
     "DjangoMarcaRepository",
@@ -17,4 +18,5 @@ __all__ = [
     "DjangoHistorialRepository",
     "DjangoDashboardRepository",
     "DjangoReporteRepository",
+    "DjangoReporteJobRepository",
 ]
@@ -3,24 +3,25 @@ Implementación de repositorio de dashboard usando Django ORM
 Responsabilidad única: Gestionar datos del dashboard
 """
 
-from typing import List
+from typing import Any, Dict, List
 from datetime import timedelta
 from django.db.models import Avg, Sum
 from django.utils import timezone
 
-from apps.analytics.domain.entities.dashboard_data import DashboardData
 from apps.analytics.domain.repositories.dashboard_repository import DashboardRepository
 from apps.analytics.domain.enums import EstadoMarca
 
 # Importar modelo Django de la nueva arquitectura
 from apps.analytics.infrastructure.models import MarcaGanadoBovinoModel
+from apps.analytics.infrastructure.db import lectura_replica
 
 
 class DjangoDashboardRepository(DashboardRepository):
     """Implementación de repositorio de dashboard usando Django ORM
     Responsabilidad única: Gestionar datos del dashboard"""
 
-    def get_kpis_principales(self) -> DashboardData:
+    @lectura_replica
+    def get_kpis_principales(self) -> Dict[str, Any]:
         """Implementa DashboardRepository.get_kpis_principales"""
         hoy = timezone.now().date()
         inicio_mes = hoy.replace(day=1)
@@ -59,20 +60,17 @@ class DjangoDashboardRepository(DashboardRepository):
             (marcas_aprobadas / total_procesadas * 100) if total_procesadas > 0 else 0
         )
 
-        return DashboardData(
-            tipo_dashboard="kpis_principales",
-            fecha_actualizacion=timezone.now(),
-            datos={
-                "marcas_registradas_mes": total_marcas_mes,
-                "tiempo_promedio_procesamiento": tiempo_promedio,
-                "porcentaje_aprobacion": porcentaje_aprobacion,
-                "ingresos_mes": float(ingresos_mes),
-                "total_cabezas_registradas": total_cabezas,
-                "promedio_cabezas_por_marca": promedio_cabezas,
-            },
-        )
-
-    def get_tendencias_mensuales(self, meses: int = 12) -> List[DashboardData]:
+        return {
+            "marcas_registradas_mes": total_marcas_mes,
+            "tiempo_promedio_procesamiento": tiempo_promedio,
+            "porcentaje_aprobacion": porcentaje_aprobacion,
+            "ingresos_mes": float(ingresos_mes),
+            "total_cabezas_registradas": total_cabezas,
+            "promedio_cabezas_por_marca": promedio_cabezas,
+        }
+
+    @lectura_replica
+    def get_tendencias_mensuales(self, meses: int = 12) -> List[Dict[str, Any]]:
         """Implementa DashboardRepository.get_tendencias_mensuales"""
         tendencias = []
         hoy = timezone.now().date()
@@ -100,21 +98,18 @@ class DjangoDashboardRepository(DashboardRepository):
             )
 
             tendencias.append(
-                DashboardData(
-                    tipo_dashboard="tendencia_mensual",
-                    fecha_actualizacion=timezone.now(),
-                    datos={
-                        "mes": fecha.strftime("%Y-%m"),
-                        "marcas_registradas": total_marcas,
-                        "ingresos": float(ingresos),
-                        "tiempo_promedio": tiempo_promedio,
-                    },
-                )
+                {
+                    "mes": fecha.strftime("%Y-%m"),
+                    "marcas_registradas": total_marcas,
+                    "ingresos": float(ingresos),
+                    "tiempo_promedio": tiempo_promedio,
+                }
             )
 
         return tendencias
 
-    def get_metricas_tiempo_real(self) -> DashboardData:
+    @lectura_replica
+    def get_metricas_tiempo_real(self) -> Dict[str, Any]:
         """Implementa DashboardRepository.get_metricas_tiempo_real"""
         marcas_pendientes = MarcaGanadoBovinoModel.objects.filter(
             estado=EstadoMarca.PENDIENTE.value
@@ -138,28 +133,18 @@ class DjangoDashboardRepository(DashboardRepository):
             or 0
         )
 
-        return DashboardData(
-            tipo_dashboard="metricas_tiempo_real",
-            fecha_actualizacion=timezone.now(),
-            datos={
-                "marcas_pendientes": marcas_pendientes,
-                "marcas_procesando": marcas_procesando,
-                "marcas_aprobadas_hoy": marcas_aprobadas_hoy,
-                "tiempo_promedio_actual": tiempo_promedio_actual,
-            },
-        )
+        return {
+            "marcas_pendientes": marcas_pendientes,
+            "marcas_procesando": marcas_procesando,
+            "marcas_aprobadas_hoy": marcas_aprobadas_hoy,
+            "tiempo_promedio_actual": tiempo_promedio_actual,
+        }
 
-    def get_resumen_ejecutivo(self) -> DashboardData:
+    @lectura_replica
+    def get_resumen_ejecutivo(self) -> Dict[str, Any]:
         """Implementa DashboardRepository.get_resumen_ejecutivo"""
-        kpis = self.get_kpis_principales()
-        metricas = self.get_metricas_tiempo_real()
-
-        return DashboardData(
-            tipo_dashboard="resumen_ejecutivo",
-            fecha_actualizacion=timezone.now(),
-            datos={
-                "kpis_principales": kpis.datos,
-                "metricas_tiempo_real": metricas.datos,
-                "fecha_actualizacion": timezone.now().isoformat(),
-            },
-        )
+        return {
+            "kpis_principales": self.get_kpis_principales(),
+            "metricas_tiempo_real": self.get_metricas_tiempo_real(),
+            "fecha_actualizacion": timezone.now().isoformat(),
+        }
@@ -4,7 +4,7 @@ Responsabilidad única: Gestionar historial de estados de marcas
 """
 
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from django.db.models import Count
 from django.db.models.functions import TruncDate
 from django.utils import timezone
@@ -16,6 +16,9 @@ from apps.analytics.domain.repositories.historial_repository import (
 
 # Importar modelo Django de la nueva arquitectura
 from apps.analytics.infrastructure.models import HistorialEstadoMarcaModel
+from apps.analytics.infrastructure.outbox import FeedActividad
+from apps.analytics.infrastructure.queries import MotorEficienciaEvaluadores
+from apps.analytics.infrastructure.db import lectura_replica
 
 
 class DjangoHistorialRepository(HistorialEstadoMarcaRepository):
@@ -96,6 +99,24 @@ class DjangoHistorialRepository(HistorialEstadoMarcaRepository):
         models = HistorialEstadoMarcaModel.objects.all()[offset : offset + limit]
         return [self._to_entity(model) for model in models]
 
+    # Métodos de la interfaz de dominio
+    def get_by_id(self, historial_id: int) -> Optional[HistorialEstadoMarca]:
+        return self.obtener_por_id(historial_id)
+
+    def get_by_marca_id(self, marca_id: int) -> List[HistorialEstadoMarca]:
+        return self.obtener_por_marca(marca_id)
+
+    def list_all(self, limit: int = 100, offset: int = 0) -> List[HistorialEstadoMarca]:
+        return self.listar_todos(limit, offset)
+
+    def save(self, historial: HistorialEstadoMarca) -> HistorialEstadoMarca:
+        if historial.id:
+            return self.actualizar(historial)
+        return self.crear(historial)
+
+    def delete(self, historial_id: int) -> bool:
+        return self.eliminar(historial_id)
+
     def listar_por_estado(self, estado: str) -> List[HistorialEstadoMarca]:
         """Implementa método adicional para filtrar por estado"""
         models = HistorialEstadoMarcaModel.objects.filter(estado_nuevo=estado).order_by(
@@ -129,6 +150,7 @@ class DjangoHistorialRepository(HistorialEstadoMarcaRepository):
         except HistorialEstadoMarcaModel.DoesNotExist:
             return None
 
+    @lectura_replica
     def obtener_estadisticas(self) -> Dict[str, Any]:
         """Implementa método adicional para estadísticas del historial"""
         total_cambios = HistorialEstadoMarcaModel.objects.count()
@@ -163,6 +185,7 @@ class DjangoHistorialRepository(HistorialEstadoMarcaRepository):
             },
         }
 
+    @lectura_replica
     def obtener_tendencias_cambios(self, dias: int = 30) -> List[Dict[str, Any]]:
         """Implementa método adicional para tendencias de cambios"""
         fecha_limite = timezone.now() - timedelta(days=dias)
@@ -182,3 +205,19 @@ class DjangoHistorialRepository(HistorialEstadoMarcaRepository):
             }
             for item in tendencias
         ]
+
+    @lectura_replica
+    def obtener_eficiencia_evaluadores(
+        self, fecha_inicio: date, fecha_fin: date
+    ) -> Dict[str, Any]:
+        """Implementa HistorialEstadoMarcaRepository.obtener_eficiencia_evaluadores"""
+        return MotorEficienciaEvaluadores().calcular(fecha_inicio, fecha_fin)
+
+    def obtener_feed_actividad(
+        self, desde_secuencia: Optional[int], limite: int, espera_segundos: float
+    ) -> Dict[str, Any]:
+        """Implementa HistorialEstadoMarcaRepository.obtener_feed_actividad"""
+        eventos, marca_agua = FeedActividad.instancia().esperar_eventos(
+            desde_secuencia, limite, espera_segundos
+        )
+        return {"eventos": eventos, "marca_agua": marca_agua}
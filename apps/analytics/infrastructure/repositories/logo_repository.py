@@ -3,6 +3,7 @@ Implementación de repositorio de logos usando Django ORM
 Responsabilidad única: Gestionar logos de marcas bovinas
 """
 
+from datetime import date
 from typing import List, Optional, Dict, Any
 from django.db.models import Count, Avg, Q
 
@@ -12,6 +13,13 @@ from apps.analytics.domain.enums import ModeloIA, CalidadLogo
 
 # Importar modelo Django de la nueva arquitectura
 from apps.analytics.infrastructure.models import LogoMarcaBovinaModel
+from apps.analytics.infrastructure.ia import PipelineGeneracionLogos, SolicitudLogo
+from apps.analytics.infrastructure.almacen import AlmacenLogos
+from apps.analytics.infrastructure.queries import (
+    MotorAnalisisPrompts,
+    MotorPercentilesLatencia,
+)
+from apps.analytics.infrastructure.db import lectura_replica
 
 
 class DjangoLogoRepository(LogoMarcaBovinaRepository):
@@ -109,6 +117,7 @@ class DjangoLogoRepository(LogoMarcaBovinaRepository):
         models = LogoMarcaBovinaModel.objects.filter(calidad_logo=calidad.value)
         return [self._to_entity(model) for model in models]
 
+    @lectura_replica
     def obtener_estadisticas(self) -> Dict[str, Any]:
         """Implementa LogoMarcaBovinaRepository.get_estadisticas_generacion"""
         total_logos = LogoMarcaBovinaModel.objects.count()
@@ -145,16 +154,25 @@ class DjangoLogoRepository(LogoMarcaBovinaRepository):
             "calidades": {c["calidad_logo"]: c["total"] for c in calidades},
         }
 
+    @lectura_replica
     def obtener_rendimiento_modelos(self) -> List[Dict[str, Any]]:
         """Implementa método adicional para análisis de rendimiento por modelo"""
         rendimiento = LogoMarcaBovinaModel.objects.values("modelo_ia_usado").annotate(
             total_generados=Count("id"),
             exitosos=Count("id", filter=Q(exito=True)),
-            tiempo_promedio=Avg("tiempo_generacion_segundos"),
+            reutilizados=Count("id", filter=Q(reutilizado_de__isnull=False)),
+            # Los reutilizados no llamaron a la IA: no cuentan para el tiempo
+            tiempo_promedio=Avg(
+                "tiempo_generacion_segundos", filter=Q(reutilizado_de__isnull=True)
+            ),
             alta_calidad=Count("id", filter=Q(calidad_logo="ALTA")),
             media_calidad=Count("id", filter=Q(calidad_logo="MEDIA")),
             baja_calidad=Count("id", filter=Q(calidad_logo="BAJA")),
         )
+        latencias = {
+            item["modelo_ia_usado"]: item
+            for item in MotorPercentilesLatencia().calcular()
+        }
 
         return [
             {
@@ -168,6 +186,16 @@ class DjangoLogoRepository(LogoMarcaBovinaRepository):
                     else 0
                 ),
                 "tiempo_promedio_generacion": item["tiempo_promedio"] or 0,
+                **{
+                    campo: latencias.get(item["modelo_ia_usado"], {}).get(campo)
+                    for campo in ("latencia_p50", "latencia_p90", "latencia_p99")
+                },
+                "logos_reutilizados": item["reutilizados"],
+                "tasa_reutilizacion": (
+                    (item["reutilizados"] / item["total_generados"] * 100)
+                    if item["total_generados"] > 0
+                    else 0
+                ),
                 "logos_alta_calidad": item["alta_calidad"],
                 "logos_media_calidad": item["media_calidad"],
                 "logos_baja_calidad": item["baja_calidad"],
@@ -179,3 +207,93 @@ class DjangoLogoRepository(LogoMarcaBovinaRepository):
             }
             for item in rendimiento
         ]
+
+    def generar_en_lote(
+        self, solicitudes: List[Dict[str, Any]], usar_cache: bool = True
+    ) -> Dict[str, Any]:
+        """Implementa LogoMarcaBovinaRepository.generar_en_lote"""
+        logos, metadata = PipelineGeneracionLogos().ejecutar(
+            [
+                SolicitudLogo(
+                    marca_id=solicitud["marca_id"],
+                    prompt=solicitud["prompt"],
+                    modelo=solicitud["modelo_ia"],
+                )
+                for solicitud in solicitudes
+            ],
+            usar_cache=usar_cache,
+        )
+        return {
+            "logos": [self._to_entity(logo) for logo in logos],
+            "metadata": metadata,
+        }
+
+    def obtener_imagen(
+        self, huella_imagen: str, tamaño: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Implementa LogoMarcaBovinaRepository.obtener_imagen"""
+        almacen = AlmacenLogos()
+        archivo = (
+            almacen.miniatura(huella_imagen, tamaño)
+            if tamaño
+            else almacen.original(huella_imagen)
+        )
+        if archivo is None:
+            return None
+        return {
+            "ruta": archivo.ruta,
+            "content_type": archivo.content_type,
+            "etag": archivo.etag,
+            "tamaño_bytes": archivo.tamaño_bytes,
+        }
+
+    @lectura_replica
+    def obtener_percentiles_latencia(
+        self,
+        fecha_inicio: Optional[date] = None,
+        fecha_fin: Optional[date] = None,
+        por_dia: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Implementa LogoMarcaBovinaRepository.obtener_percentiles_latencia"""
+        return MotorPercentilesLatencia().calcular(fecha_inicio, fecha_fin, por_dia)
+
+    @lectura_replica
+    def obtener_analisis_prompts(
+        self, min_soporte: int, limite: int, termino: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Implementa LogoMarcaBovinaRepository.obtener_analisis_prompts"""
+        return MotorAnalisisPrompts().calcular(min_soporte, limite, termino)
+
+    # Métodos adicionales requeridos por la interfaz
+    def get_by_id(self, logo_id: int) -> Optional[LogoMarcaBovina]:
+        """Alias para obtener_por_id"""
+        return self.obtener_por_id(logo_id)
+
+    def get_by_marca_id(self, marca_id: int) -> List[LogoMarcaBovina]:
+        """Alias para obtener_por_marca"""
+        return self.obtener_por_marca(marca_id)
+
+    def list_all(self, limit: int = 100, offset: int = 0) -> List[LogoMarcaBovina]:
+        """Alias para listar_todos"""
+        return self.listar_todos(limit, offset)
+
+    def list_exitosos(self) -> List[LogoMarcaBovina]:
+        """Alias para listar_exitosos"""
+        return self.listar_exitosos()
+
+    def list_fallidos(self) -> List[LogoMarcaBovina]:
+        """Lista logos que fallaron en la generación"""
+        models = LogoMarcaBovinaModel.objects.filter(exito=False)
+        return [self._to_entity(model) for model in models]
+
+    def save(self, logo: LogoMarcaBovina) -> LogoMarcaBovina:
+        """Alias para actualizar (crea el logo si no tiene id)"""
+        return self.actualizar(logo)
+
+    def delete(self, logo_id: int) -> bool:
+        """Alias para eliminar"""
+        return self.eliminar(logo_id)
+
+    def get_estadisticas_generacion(self) -> Dict[str, Any]:
+        """Alias para obtener_estadisticas"""
+        return self.obtener_estadisticas()
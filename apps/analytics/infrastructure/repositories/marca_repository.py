@@ -22,6 +22,7 @@ from apps.analytics.infrastructure.models import (
     MarcaGanadoBovinoModel,
     HistorialEstadoMarcaModel,
 )
+from apps.analytics.infrastructure.db import lectura_replica
 
 
 class DjangoMarcaRepository(MarcaGanadoBovinoRepository):
@@ -152,6 +153,7 @@ class DjangoMarcaRepository(MarcaGanadoBovinoRepository):
         models = MarcaGanadoBovinoModel.objects.filter(departamento=departamento.value)
         return [self._to_entity(model) for model in models]
 
+    @lectura_replica
     def obtener_estadisticas(self) -> Dict[str, Any]:
         """Implementa MarcaGanadoBovinoRepository.get_estadisticas_por_departamento/raza/proposito"""
         from django.db.models import Count, Avg, Sum
@@ -275,6 +277,11 @@ class DjangoMarcaRepository(MarcaGanadoBovinoRepository):
         """Alias para actualizar"""
         return self.actualizar(marca)
 
+    def delete(self, marca_id: int) -> bool:
+        """Alias para eliminar"""
+        return self.eliminar(marca_id)
+
+    @lectura_replica
     def get_estadisticas_por_raza(self) -> Dict[str, Any]:
         """Obtiene estadísticas agrupadas por raza"""
         from django.db.models import Count
@@ -284,6 +291,7 @@ class DjangoMarcaRepository(MarcaGanadoBovinoRepository):
         )
         return {stat["raza_bovino"]: stat["total"] for stat in stats}
 
+    @lectura_replica
     def get_estadisticas_por_departamento(self) -> Dict[str, Any]:
         """Obtiene estadísticas agrupadas por departamento"""
         from django.db.models import Count
@@ -293,6 +301,7 @@ class DjangoMarcaRepository(MarcaGanadoBovinoRepository):
         )
         return {stat["departamento"]: stat["total"] for stat in stats}
 
+    @lectura_replica
     def get_estadisticas_por_proposito(self) -> Dict[str, Any]:
         """Obtiene estadísticas agrupadas por propósito"""
         from django.db.models import Count
@@ -301,3 +310,13 @@ class DjangoMarcaRepository(MarcaGanadoBovinoRepository):
             total=Count("id")
         )
         return {stat["proposito_ganado"]: stat["total"] for stat in stats}
+
+    def list_sin_logo(
+        self, limit: int = 100, departamento: Optional[Departamento] = None
+    ) -> List[MarcaGanadoBovino]:
+        """Implementa MarcaGanadoBovinoRepository.list_sin_logo"""
+        models = MarcaGanadoBovinoModel.objects.filter(logos__isnull=True)
+        if departamento:
+            models = models.filter(departamento=departamento.value)
+        models = models.order_by("fecha_registro", "id")[:limit]
+        return [self._to_entity(model) for model in models]
@@ -0,0 +1,176 @@
+"""
+Implementación de repositorio de trabajos de reportes usando Django ORM
+Responsabilidad única: Persistir estado, progreso y resultado de los trabajos
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+
+from apps.analytics.domain.entities.reporte_job import ReporteJob
+from apps.analytics.domain.enums import EstadoJobReporte
+from apps.analytics.domain.repositories.reporte_job_repository import (
+    ReporteJobRepository,
+)
+from apps.analytics.infrastructure.models import ReporteDataModel, ReporteJobModel
+
+
+class DjangoReporteJobRepository(ReporteJobRepository):
+    """Implementación de repositorio de trabajos de reportes usando Django ORM"""
+
+    # INSERT que choca con un trabajo idéntico que terminó o se liberó entre
+    # medio: se reintenta
+    INTENTOS_CREACION = 3
+
+    def _to_entity(self, model: ReporteJobModel) -> ReporteJob:
+        """Convierte modelo Django a entidad de dominio"""
+        return ReporteJob(
+            id=model.id,
+            tipo_reporte=model.tipo_reporte,
+            parametros=model.parametros,
+            firma=model.firma,
+            estado=EstadoJobReporte(model.estado),
+            progreso=model.progreso,
+            reporte_id=model.reporte_id,
+            mensaje_error=model.mensaje_error,
+            usuario_solicitante=model.usuario_solicitante,
+            fecha_creacion=model.fecha_creacion,
+            fecha_inicio_ejecucion=model.fecha_inicio_ejecucion,
+            fecha_fin_ejecucion=model.fecha_fin_ejecucion,
+        )
+
+    def crear(self, job: ReporteJob) -> ReporteJob:
+        """Implementa ReporteJobRepository.crear"""
+        model = ReporteJobModel.objects.create(
+            tipo_reporte=job.tipo_reporte,
+            parametros=job.parametros,
+            firma=job.firma,
+            firma_activa=job.firma if job.esta_en_curso else None,
+            estado=job.estado.value,
+            progreso=job.progreso,
+            usuario_solicitante=job.usuario_solicitante,
+        )
+        return self._to_entity(model)
+
+    def crear_o_reutilizar(
+        self, job: ReporteJob, creado_desde: datetime
+    ) -> Tuple[ReporteJob, bool]:
+        """
+        Implementa ReporteJobRepository.crear_o_reutilizar
+
+        La deduplicación la resuelve el índice único de firma_activa, así que
+        vale entre procesos y servidores: el INSERT que pierde la carrera lee
+        el trabajo ganador. Uno idéntico más antiguo que la ventana se da por
+        abandonado y se marca fallido para liberar su firma.
+        """
+        for _ in range(self.INTENTOS_CREACION):
+            try:
+                with transaction.atomic():
+                    return self.crear(job), True
+            except IntegrityError:
+                existente = ReporteJobModel.objects.filter(
+                    firma_activa=job.firma
+                ).first()
+                if existente is None:
+                    continue
+                if existente.fecha_creacion >= creado_desde:
+                    return self._to_entity(existente), False
+                self.marcar_fallido(
+                    existente.id,
+                    "Reemplazado por un trabajo idéntico: superó la ventana de "
+                    "deduplicación sin terminar",
+                )
+        raise RuntimeError(
+            f"No se pudo registrar el trabajo {job.tipo_reporte}: conflicto "
+            "persistente de firma"
+        )
+
+    def obtener_por_id(self, job_id: int) -> Optional[ReporteJob]:
+        """Implementa ReporteJobRepository.obtener_por_id"""
+        try:
+            return self._to_entity(ReporteJobModel.objects.get(id=job_id))
+        except ReporteJobModel.DoesNotExist:
+            return None
+
+    def fallar_en_curso_anteriores(self, antes_de: datetime, mensaje_error: str) -> int:
+        """Implementa ReporteJobRepository.fallar_en_curso_anteriores"""
+        return ReporteJobModel.objects.filter(
+            estado__in=[estado.value for estado in EstadoJobReporte.en_curso()],
+            fecha_creacion__lt=antes_de,
+        ).update(
+            estado=EstadoJobReporte.FALLIDO.value,
+            firma_activa=None,
+            mensaje_error=mensaje_error,
+            fecha_fin_ejecucion=datetime.now(),
+        )
+
+    def marcar_en_proceso(self, job_id: int) -> None:
+        """Implementa ReporteJobRepository.marcar_en_proceso"""
+        ReporteJobModel.objects.filter(id=job_id).update(
+            estado=EstadoJobReporte.EN_PROCESO.value,
+            fecha_inicio_ejecucion=datetime.now(),
+        )
+
+    def actualizar_progreso(self, job_id: int, progreso: int) -> None:
+        """Implementa ReporteJobRepository.actualizar_progreso"""
+        ReporteJobModel.objects.filter(id=job_id).update(
+            progreso=max(0, min(100, int(progreso)))
+        )
+
+    def marcar_completado(
+        self,
+        job_id: int,
+        datos: Dict[str, Any],
+        periodo_inicio: date,
+        periodo_fin: date,
+        crear_reporte: bool = True,
+    ) -> ReporteJob:
+        """Implementa ReporteJobRepository.marcar_completado"""
+        with transaction.atomic():
+            model = ReporteJobModel.objects.select_for_update().get(id=job_id)
+            if crear_reporte:
+                model.reporte = ReporteDataModel.objects.create(
+                    tipo_reporte=model.tipo_reporte,
+                    periodo_inicio=periodo_inicio,
+                    periodo_fin=periodo_fin,
+                    datos=datos,
+                    usuario_generador=model.usuario_solicitante,
+                )
+            else:
+                model.resultado = datos
+            model.estado = EstadoJobReporte.COMPLETADO.value
+            model.firma_activa = None
+            model.progreso = 100
+            model.fecha_fin_ejecucion = datetime.now()
+            model.save(
+                update_fields=[
+                    "reporte",
+                    "resultado",
+                    "estado",
+                    "firma_activa",
+                    "progreso",
+                    "fecha_fin_ejecucion",
+                ]
+            )
+        return self._to_entity(model)
+
+    def marcar_fallido(self, job_id: int, mensaje_error: str) -> None:
+        """Implementa ReporteJobRepository.marcar_fallido"""
+        ReporteJobModel.objects.filter(id=job_id).update(
+            estado=EstadoJobReporte.FALLIDO.value,
+            firma_activa=None,
+            mensaje_error=mensaje_error,
+            fecha_fin_ejecucion=datetime.now(),
+        )
+
+    def obtener_resultado(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """Implementa ReporteJobRepository.obtener_resultado"""
+        reporte = ReporteDataModel.objects.filter(jobs__id=job_id).only("datos").first()
+        if reporte:
+            return reporte.datos
+        return (
+            ReporteJobModel.objects.filter(id=job_id)
+            .values_list("resultado", flat=True)
+            .first()
+        )
@@ -3,25 +3,39 @@ Implementación de repositorio de reportes usando Django ORM
 Responsabilidad única: Gestionar reportes de datos
 """
 
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Dict, Optional
 from django.db.models import Count, Sum, Avg, Q
-from django.utils import timezone
 
 from apps.analytics.domain.entities.reporte_data import ReporteData
 from apps.analytics.domain.repositories.reporte_repository import ReporteRepository
+from apps.analytics.infrastructure.exporters import ExcelReporteExporter
+from apps.analytics.infrastructure.exporters.pdf_exporter import (
+    CONTENT_TYPE_PDF,
+    PdfReporteRenderer,
+)
+from apps.analytics.infrastructure.jobs.fan_out import EjecutorFanOut
+from apps.analytics.infrastructure.queries import CompiladorReportePersonalizado
 
 # Importar modelo Django de la nueva arquitectura
 from apps.analytics.infrastructure.models import (
     MarcaGanadoBovinoModel,
     LogoMarcaBovinaModel,
     KPIGanadoBovinoModel,
+    ReporteDataModel,
 )
+from apps.analytics.infrastructure.db import lectura_replica
 
 
 class DjangoReporteRepository(ReporteRepository):
     """Implementación de repositorio de reportes usando Django ORM
     Responsabilidad única: Gestionar reportes de datos"""
 
+    def _formatear_periodo(self, fecha_inicio: datetime, fecha_fin: datetime) -> str:
+        """Representación del periodo usada en ReporteData.periodo"""
+        return f"{fecha_inicio.date()} a {fecha_fin.date()}"
+
+    @lectura_replica
     def generar_reporte_marcas(
         self, fecha_inicio: datetime, fecha_fin: datetime
     ) -> ReporteData:
@@ -75,9 +89,7 @@ class DjangoReporteRepository(ReporteRepository):
 
         return ReporteData(
             tipo_reporte="marcas_periodo",
-            fecha_generacion=timezone.now(),
-            periodo_inicio=fecha_inicio,
-            periodo_fin=fecha_fin,
+            periodo=self._formatear_periodo(fecha_inicio, fecha_fin),
             datos={
                 "total_marcas": total_marcas,
                 "marcas_aprobadas": marcas_aprobadas,
@@ -113,6 +125,7 @@ class DjangoReporteRepository(ReporteRepository):
             },
         )
 
+    @lectura_replica
     def generar_reporte_logos(
         self, fecha_inicio: datetime, fecha_fin: datetime
     ) -> ReporteData:
@@ -145,9 +158,7 @@ class DjangoReporteRepository(ReporteRepository):
 
         return ReporteData(
             tipo_reporte="logos_periodo",
-            fecha_generacion=timezone.now(),
-            periodo_inicio=fecha_inicio,
-            periodo_fin=fecha_fin,
+            periodo=self._formatear_periodo(fecha_inicio, fecha_fin),
             datos={
                 "total_logos": total_logos,
                 "logos_exitosos": logos_exitosos,
@@ -168,6 +179,7 @@ class DjangoReporteRepository(ReporteRepository):
             },
         )
 
+    @lectura_replica
     def generar_reporte_kpis(
         self, fecha_inicio: datetime, fecha_fin: datetime
     ) -> ReporteData:
@@ -222,9 +234,7 @@ class DjangoReporteRepository(ReporteRepository):
 
         return ReporteData(
             tipo_reporte="kpis_periodo",
-            fecha_generacion=timezone.now(),
-            periodo_inicio=fecha_inicio,
-            periodo_fin=fecha_fin,
+            periodo=self._formatear_periodo(fecha_inicio, fecha_fin),
             datos={
                 "total_kpis_analizados": total_kpis,
                 "promedio_marcas_mes": promedio_marcas,
@@ -244,14 +254,29 @@ class DjangoReporteRepository(ReporteRepository):
             },
         )
 
+    @lectura_replica
     def generar_reporte_consolidado(
-        self, fecha_inicio: datetime, fecha_fin: datetime
+        self,
+        fecha_inicio: datetime,
+        fecha_fin: datetime,
+        al_completar: Optional[Callable[[str, int, int], None]] = None,
     ) -> ReporteData:
-        """Implementa ReporteRepository.generar_reporte_comparativo_departamentos"""
-        # Obtener reportes individuales
-        reporte_marcas = self.generar_reporte_marcas(fecha_inicio, fecha_fin)
-        reporte_logos = self.generar_reporte_logos(fecha_inicio, fecha_fin)
-        reporte_kpis = self.generar_reporte_kpis(fecha_inicio, fecha_fin)
+        """Implementa ReporteRepository.generar_reporte_comparativo_departamentos
+
+        Los subreportes consultan tablas distintas, por lo que se ejecutan en
+        paralelo; la latencia queda cerca de la del subreporte más lento.
+        """
+        subreportes, metadata = EjecutorFanOut().ejecutar(
+            {
+                "marcas": lambda: self.generar_reporte_marcas(fecha_inicio, fecha_fin),
+                "logos": lambda: self.generar_reporte_logos(fecha_inicio, fecha_fin),
+                "kpis": lambda: self.generar_reporte_kpis(fecha_inicio, fecha_fin),
+            },
+            al_completar=al_completar,
+        )
+        reporte_marcas = subreportes["marcas"]
+        reporte_logos = subreportes["logos"]
+        reporte_kpis = subreportes["kpis"]
 
         # Consolidar datos
         datos_consolidados = {
@@ -265,12 +290,133 @@ class DjangoReporteRepository(ReporteRepository):
             "marcas": reporte_marcas.datos,
             "logos": reporte_logos.datos,
             "kpis": reporte_kpis.datos,
+            "metadata": metadata,
         }
 
         return ReporteData(
             tipo_reporte="consolidado",
-            fecha_generacion=timezone.now(),
-            periodo_inicio=fecha_inicio,
-            periodo_fin=fecha_fin,
+            periodo=self._formatear_periodo(fecha_inicio, fecha_fin),
             datos=datos_consolidados,
         )
+
+    @lectura_replica
+    def generar_reporte_ejecutivo_mensual(self, mes: int, anio: int) -> ReporteData:
+        """Implementa ReporteRepository.generar_reporte_ejecutivo_mensual"""
+        fecha_inicio = datetime(anio, mes, 1)
+        fecha_fin = (
+            datetime(anio + 1, 1, 1) if mes == 12 else datetime(anio, mes + 1, 1)
+        ) - timedelta(microseconds=1)
+        reporte = self.generar_reporte_consolidado(fecha_inicio, fecha_fin)
+        reporte.tipo_reporte = "ejecutivo_mensual"
+        return reporte
+
+    @lectura_replica
+    def generar_reporte_anual(self, anio: int) -> ReporteData:
+        """Implementa ReporteRepository.generar_reporte_anual"""
+        reporte = self.generar_reporte_consolidado(
+            datetime(anio, 1, 1), datetime(anio + 1, 1, 1) - timedelta(microseconds=1)
+        )
+        reporte.tipo_reporte = "anual"
+        return reporte
+
+    @lectura_replica
+    def generar_reporte_comparativo_departamentos(
+        self, fecha_inicio: date, fecha_fin: date
+    ) -> ReporteData:
+        """Implementa ReporteRepository.generar_reporte_comparativo_departamentos"""
+        inicio = datetime.combine(fecha_inicio, time.min)
+        fin = datetime.combine(fecha_fin, time.max)
+        reporte_marcas = self.generar_reporte_marcas(inicio, fin)
+
+        return ReporteData(
+            tipo_reporte="comparativo_departamentos",
+            periodo=self._formatear_periodo(inicio, fin),
+            datos={"departamentos": reporte_marcas.datos["departamentos"]},
+        )
+
+    @lectura_replica
+    def generar_reporte_personalizado(self, filtros: Dict[str, Any]) -> ReporteData:
+        """Implementa ReporteRepository.generar_reporte_personalizado"""
+        inicio = datetime.combine(
+            date.fromisoformat(str(filtros["fecha_inicio"])), time.min
+        )
+        fin = datetime.combine(date.fromisoformat(str(filtros["fecha_fin"])), time.max)
+        reporte = self.generar_reporte_consolidado(inicio, fin)
+        reporte.tipo_reporte = "personalizado"
+        reporte.filtros = filtros
+        return reporte
+
+    @lectura_replica
+    def consultar_reporte_personalizado(
+        self, especificacion: Dict[str, Any]
+    ) -> ReporteData:
+        """Implementa ReporteRepository.consultar_reporte_personalizado"""
+        resultado = CompiladorReportePersonalizado().ejecutar(especificacion)
+        filtros = especificacion.get("filtros") or {}
+
+        return ReporteData(
+            tipo_reporte="personalizado",
+            periodo=(
+                f"{filtros.get('fecha_inicio', 'inicio')} a "
+                f"{filtros.get('fecha_fin', 'hoy')}"
+            ),
+            datos=resultado,
+            filtros=filtros,
+        )
+
+    @lectura_replica
+    def exportar_datos_excel(
+        self,
+        fecha_inicio: date,
+        fecha_fin: date,
+        filtros: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Implementa ReporteRepository.exportar_datos_excel"""
+        return ExcelReporteExporter().exportar(
+            fecha_inicio=fecha_inicio, fecha_fin=fecha_fin, filtros=filtros
+        )
+
+    def renderizar_pdf(self, reporte_id: int) -> Dict[str, Any]:
+        """Implementa ReporteRepository.renderizar_pdf"""
+        reporte = self._obtener_reporte_almacenado(reporte_id)
+        resultado = PdfReporteRenderer().renderizar(
+            reporte.id,
+            reporte.tipo_reporte,
+            f"{reporte.periodo_inicio} a {reporte.periodo_fin}",
+            reporte.datos,
+        )
+        resultado.update(
+            {
+                "reporte_id": reporte.id,
+                "periodo_inicio": reporte.periodo_inicio.isoformat(),
+                "periodo_fin": reporte.periodo_fin.isoformat(),
+            }
+        )
+        return resultado
+
+    def obtener_pdf(self, reporte_id: int) -> Optional[Dict[str, Any]]:
+        """Implementa ReporteRepository.obtener_pdf"""
+        reporte = self._obtener_reporte_almacenado(reporte_id)
+        ruta = PdfReporteRenderer().obtener_existente(
+            reporte.id,
+            reporte.tipo_reporte,
+            f"{reporte.periodo_inicio} a {reporte.periodo_fin}",
+            reporte.datos,
+        )
+        if ruta is None:
+            return None
+
+        return {
+            "reporte_id": reporte.id,
+            "ruta_archivo": str(ruta),
+            "nombre_archivo": f"reporte_{reporte.tipo_reporte}_{reporte.id}.pdf",
+            "content_type": CONTENT_TYPE_PDF,
+            "tamaño_bytes": ruta.stat().st_size,
+        }
+
+    def _obtener_reporte_almacenado(self, reporte_id: int) -> ReporteDataModel:
+        """Obtiene un reporte almacenado o lanza ValueError"""
+        try:
+            return ReporteDataModel.objects.get(id=reporte_id)
+        except ReporteDataModel.DoesNotExist:
+            raise ValueError(f"Reporte {reporte_id} no encontrado")
@@ -0,0 +1,161 @@
+"""
+Comando para generar datos sintéticos de analytics en volumen
+Marcas, historial de estados, logos, KPIs diarios y reportes mensuales
+"""
+
+import os
+import time
+
+from django.apps import apps
+from django.contrib.admin.models import LogEntry
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+from apps.analytics.infrastructure.datos_sinteticos import GeneradorDatosSinteticos
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera marcas con historial, logos, KPIs y reportes realistas en lotes "
+        "con bulk_create repartidos entre procesos (1M de marcas en minutos)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--marcas",
+            "--rows",
+            dest="marcas",
+            type=int,
+            default=1000,
+            help="Cantidad de marcas a generar (default: 1000)",
+        )
+        parser.add_argument(
+            "--logos",
+            type=int,
+            default=80,
+            help="Porcentaje de marcas aprobadas con logos generados (default: 80)",
+        )
+        parser.add_argument(
+            "--semilla",
+            type=int,
+            default=42,
+            help="Semilla de los datos: misma semilla, mismos datos (default: 42)",
+        )
+        parser.add_argument(
+            "--dias",
+            type=int,
+            default=730,
+            help="Días de historia hacia atrás desde hoy (default: 730)",
+        )
+        parser.add_argument(
+            "--lote",
+            type=int,
+            default=GeneradorDatosSinteticos.TAMAÑO_LOTE,
+            help=(
+                "Marcas por lote y transacción "
+                f"(default: {GeneradorDatosSinteticos.TAMAÑO_LOTE})"
+            ),
+        )
+        parser.add_argument(
+            "--procesos",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Procesos que insertan lotes en paralelo (default: núcleos; SQLite usa 1)",
+        )
+        parser.add_argument(
+            "--sin-auditoria",
+            action="store_true",
+            help="No registrar LogEntry ni eventos de outbox (carga más rápida)",
+        )
+        parser.add_argument(
+            "--usuario",
+            help="Usuario de las entradas de auditoría (default: primer superusuario)",
+        )
+        parser.add_argument(
+            "--sin-derivadas",
+            action="store_true",
+            help=(
+                "No reconstruir histogramas, índice de prompts ni ciclo de vida "
+                "(ejecutar luego los comandos reconstruir_*)"
+            ),
+        )
+        parser.add_argument(
+            "--limpiar",
+            action="store_true",
+            help="Vaciar las tablas de analytics antes de generar",
+        )
+
+    def handle(self, *args, **options):
+        usuario_id = None
+        if not options["sin_auditoria"]:
+            usuario_id = self._usuario_auditoria(options["usuario"])
+
+        if options["limpiar"]:
+            self._limpiar()
+            self.stdout.write("🧹 Tablas de analytics vaciadas")
+
+        generador = GeneradorDatosSinteticos(
+            semilla=options["semilla"],
+            dias=options["dias"],
+            proporcion_logos=options["logos"] / 100,
+            tamaño_lote=options["lote"],
+            procesos=options["procesos"],
+            usuario_auditoria=usuario_id,
+            derivadas=not options["sin_derivadas"],
+        )
+
+        inicio = time.perf_counter()
+        creadas = generador.poblar(options["marcas"], al_avanzar=self._avance)
+        segundos = time.perf_counter() - inicio
+
+        self.stdout.write("")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ {creadas['marcas']} marcas, {creadas['historial']} cambios de "
+                f"estado, {creadas['logos']} logos, {creadas['kpis']} KPIs y "
+                f"{creadas['reportes']} reportes generados en {segundos:.1f} s"
+            )
+        )
+        if usuario_id is None:
+            self.stdout.write(
+                self.style.WARNING("⚠️ Sin auditoría: no se registraron LogEntry")
+            )
+
+    def _avance(self, hechas: int, total: int) -> None:
+        self.stdout.write(f"\r   {hechas}/{total} marcas", ending="")
+        self.stdout.flush()
+
+    @staticmethod
+    def _usuario_auditoria(nombre_usuario):
+        usuarios = get_user_model().objects
+        if nombre_usuario:
+            usuario = usuarios.filter(username=nombre_usuario).first()
+            if usuario is None:
+                raise CommandError(f"No existe el usuario {nombre_usuario}")
+            return usuario.pk
+
+        usuario = usuarios.filter(is_superuser=True).order_by("pk").first()
+        if usuario is None:
+            raise CommandError(
+                "No hay superusuario para la auditoría: crear uno, usar "
+                "--usuario o --sin-auditoria"
+            )
+        return usuario.pk
+
+    @staticmethod
+    def _limpiar() -> None:
+        """TRUNCATE (o equivalente) de las tablas de analytics y su auditoría"""
+        modelos = list(
+            apps.get_app_config("analytics").get_models(include_auto_created=True)
+        )
+        tablas = [modelo._meta.db_table for modelo in modelos]
+        with transaction.atomic():
+            LogEntry.objects.filter(
+                content_type__in=ContentType.objects.get_for_models(*modelos).values()
+            ).delete()
+            connection.ops.execute_sql_flush(
+                connection.ops.sql_flush(no_style(), tablas, reset_sequences=True)
+            )
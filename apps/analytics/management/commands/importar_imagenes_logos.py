@@ -0,0 +1,58 @@
+"""
+Comando para copiar las imágenes de los logos al almacén local
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.analytics.infrastructure.almacen import (
+    AlmacenLogos,
+    ImportadorImagenesLogos,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Descarga las imágenes de los logos exitosos sin copia local al almacén "
+        "direccionado por contenido (LOGOS_ALMACEN_DIR) y, opcionalmente, "
+        "pregenera sus miniaturas"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limite", type=int, default=1000)
+        parser.add_argument("--hilos", type=int, default=8)
+        parser.add_argument(
+            "--miniaturas",
+            type=int,
+            nargs="*",
+            help="Lados a pregenerar (por defecto se generan al primer pedido)",
+        )
+
+    def handle(self, *args, **options):
+        almacen = AlmacenLogos()
+        resumen = ImportadorImagenesLogos(almacen, hilos=options["hilos"]).importar(
+            options["limite"]
+        )
+        self.stdout.write(
+            f"🖼️ {resumen['urls']} URLs: {resumen['imagenes_nuevas']} nuevas, "
+            f"{resumen['imagenes_duplicadas']} ya estaban, "
+            f"{resumen['urls_fallidas']} fallidas; "
+            f"{resumen['logos_actualizados']} logos actualizados en "
+            f"{resumen['duracion_segundos']}s"
+        )
+        for error, cantidad in resumen["errores"].items():
+            self.stderr.write(f"  {cantidad} × {error}")
+
+        if options["miniaturas"]:
+            from apps.analytics.infrastructure.models import LogoMarcaBovinaModel
+
+            huellas = (
+                LogoMarcaBovinaModel.objects.filter(huella_imagen__isnull=False)
+                .values_list("huella_imagen", flat=True)
+                .distinct()
+            )
+            total = 0
+            for huella in huellas.iterator():
+                for lado in options["miniaturas"]:
+                    if almacen.miniatura(huella, lado):
+                        total += 1
+            self.stdout.write(f"✅ {total} miniaturas disponibles")
@@ -0,0 +1,75 @@
+"""
+Comando para reconstruir la tabla marca_ciclo_vida desde el historial de estados
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.analytics.infrastructure.models import (
+    HistorialEstadoMarcaModel,
+    MarcaCicloVidaModel,
+    MarcaGanadoBovinoModel,
+)
+
+
+class Command(BaseCommand):
+    help = "Reconstruye el ciclo de vida materializado de las marcas"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--marca", type=int, help="Reconstruir solo la marca con este ID"
+        )
+        parser.add_argument(
+            "--lote",
+            type=int,
+            default=1000,
+            help="Filas de ciclo de vida insertadas por lote (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        if options["marca"]:
+            ciclo = MarcaCicloVidaModel.reconstruir_marca(options["marca"])
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"✅ Marca {ciclo.marca_id}: {ciclo.total_transiciones} "
+                    f"transiciones, estado {ciclo.estado_actual}"
+                )
+            )
+            return
+
+        fechas_registro = dict(
+            MarcaGanadoBovinoModel.objects.values_list("id", "fecha_registro")
+        )
+        transiciones = (
+            HistorialEstadoMarcaModel.objects.order_by("marca_id", "fecha_cambio", "id")
+            .values_list("marca_id", "estado_anterior", "estado_nuevo", "fecha_cambio")
+            .iterator(chunk_size=5000)
+        )
+
+        total = 0
+        lote = []
+        ciclo = None
+        with transaction.atomic():
+            MarcaCicloVidaModel.objects.all().delete()
+            for marca_id, estado_anterior, estado_nuevo, fecha in transiciones:
+                if ciclo is None or ciclo.marca_id != marca_id:
+                    if ciclo is not None:
+                        lote.append(ciclo)
+                    ciclo = MarcaCicloVidaModel(marca_id=marca_id)
+                ciclo.aplicar_transicion(
+                    estado_anterior, estado_nuevo, fecha, fechas_registro.get(marca_id)
+                )
+
+                if len(lote) >= options["lote"]:
+                    MarcaCicloVidaModel.objects.bulk_create(lote)
+                    total += len(lote)
+                    lote = []
+
+            if ciclo is not None:
+                lote.append(ciclo)
+            MarcaCicloVidaModel.objects.bulk_create(lote)
+            total += len(lote)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Ciclo de vida reconstruido para {total} marcas")
+        )
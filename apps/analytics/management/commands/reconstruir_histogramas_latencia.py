@@ -0,0 +1,30 @@
+"""
+Comando para reconstruir los histogramas de latencia desde la tabla de logos
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.analytics.infrastructure.models import HistogramaLatenciaModel
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye los histogramas de latencia de modelos IA (necesario tras "
+        "borrados o actualizaciones masivas que no pasan por save/delete)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lote",
+            type=int,
+            default=2000,
+            help="Logos leídos por lote (default: 2000)",
+        )
+
+    def handle(self, *args, **options):
+        filas = HistogramaLatenciaModel.reconstruir(options["lote"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Histogramas de latencia reconstruidos: {filas} filas"
+            )
+        )
@@ -0,0 +1,30 @@
+"""
+Comando para reconstruir el índice invertido de prompts desde la tabla de logos
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.analytics.infrastructure.models import TerminoPromptModel
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye el índice de términos de prompts (necesario tras cargas o "
+        "actualizaciones masivas que no pasan por save/delete)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lote",
+            type=int,
+            default=2000,
+            help="Logos leídos por lote (default: 2000)",
+        )
+
+    def handle(self, *args, **options):
+        terminos = TerminoPromptModel.reconstruir(options["lote"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Índice de prompts reconstruido: {terminos} términos"
+            )
+        )
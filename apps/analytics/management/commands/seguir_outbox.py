@@ -0,0 +1,83 @@
+"""
+Comando para seguir el outbox de cambios (similar a `tail -f`)
+"""
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from apps.analytics.infrastructure.outbox import ConsumidorOutbox
+
+
+class Command(BaseCommand):
+    help = "Muestra los eventos del outbox de cambios a medida que se registran"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--consumidor",
+            help="Nombre del consumidor; lee desde su checkpoint y lo avanza",
+        )
+        parser.add_argument(
+            "--desde",
+            type=int,
+            help="Secuencia inicial (default: el final actual del outbox)",
+        )
+        parser.add_argument(
+            "--entidad",
+            action="append",
+            choices=["marca", "logo", "historial"],
+            help="Filtrar por entidad (se puede repetir)",
+        )
+        parser.add_argument("--lote", type=int, default=500)
+        parser.add_argument(
+            "--intervalo",
+            type=float,
+            default=1.0,
+            help="Segundos de espera cuando no hay eventos nuevos",
+        )
+        parser.add_argument(
+            "--una-vez",
+            action="store_true",
+            help="Procesar lo pendiente y terminar",
+        )
+
+    def handle(self, *args, **options):
+        desde = options["desde"]
+        if desde is None and not options["consumidor"]:
+            desde = ConsumidorOutbox.ultima_secuencia()
+
+        consumidor = ConsumidorOutbox(
+            nombre=options["consumidor"],
+            tamaño_lote=options["lote"],
+            entidades=options["entidad"],
+            desde=desde,
+        )
+        self.stderr.write(
+            f"📡 Siguiendo outbox desde la secuencia {consumidor.checkpoint()}"
+        )
+
+        if options["una_vez"]:
+            total = consumidor.procesar_pendientes(self._imprimir)
+            self.stderr.write(self.style.SUCCESS(f"✅ {total} eventos"))
+            return
+
+        try:
+            consumidor.seguir(self._imprimir, intervalo=options["intervalo"])
+        except KeyboardInterrupt:
+            self.stderr.write(f"⏹️ Detenido en la secuencia {consumidor.checkpoint()}")
+
+    def _imprimir(self, eventos):
+        for evento in eventos:
+            self.stdout.write(
+                json.dumps(
+                    {
+                        "secuencia": evento.secuencia,
+                        "entidad": evento.entidad,
+                        "entidad_id": evento.entidad_id,
+                        "operacion": evento.operacion,
+                        "campos_modificados": evento.campos_modificados,
+                        "fecha_creacion": evento.fecha_creacion.isoformat(),
+                    },
+                    ensure_ascii=False,
+                )
+            )
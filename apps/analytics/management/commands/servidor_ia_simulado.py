@@ -0,0 +1,127 @@
+"""
+Comando para levantar un servicio de IA simulado (pruebas del pipeline de logos)
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Sirve POST /api/ia/v1/logos/generar/ con latencia, errores y límite de "
+        "tasa configurables para probar la generación masiva contra IA_API_URL"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--puerto", type=int, default=8004)
+        parser.add_argument(
+            "--latencia-ms", type=int, default=500, help="Latencia media por logo"
+        )
+        parser.add_argument(
+            "--tasa-error",
+            type=float,
+            default=0.0,
+            help="Fracción de respuestas 503 (reintentables)",
+        )
+        parser.add_argument(
+            "--limite-por-segundo",
+            type=float,
+            default=0.0,
+            help="Llamadas por segundo antes de responder 429 (0 = sin límite)",
+        )
+        parser.add_argument(
+            "--rafaga", type=int, default=5, help="Llamadas seguidas sin límite"
+        )
+
+    def handle(self, *args, **options):
+        latencia = options["latencia_ms"] / 1000
+        tasa_error = options["tasa_error"]
+        limite, rafaga = options["limite_por_segundo"], options["rafaga"]
+        en_vuelo = {"actual": 0, "maximo": 0}
+        # Token bucket del "proveedor": sin tokens se responde 429 + Retry-After
+        bucket = {"tokens": float(rafaga), "marca": time.monotonic()}
+        lock = threading.Lock()
+
+        def hay_cupo():
+            if not limite:
+                return True
+            with lock:
+                ahora = time.monotonic()
+                bucket["tokens"] = min(
+                    rafaga, bucket["tokens"] + (ahora - bucket["marca"]) * limite
+                )
+                bucket["marca"] = ahora
+                if bucket["tokens"] < 1:
+                    return False
+                bucket["tokens"] -= 1
+                return True
+
+        escribir = self.stdout.write
+
+        class Manejador(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("logos/generar"):
+                    return self._responder(404, {"error": "ruta desconocida"})
+                largo = int(self.headers.get("Content-Length", 0))
+                cuerpo = json.loads(self.rfile.read(largo) or b"{}")
+                if not hay_cupo():
+                    return self._responder(
+                        429, {"error": "límite de tasa"}, {"Retry-After": "1"}
+                    )
+
+                with lock:
+                    en_vuelo["actual"] += 1
+                    en_vuelo["maximo"] = max(en_vuelo["maximo"], en_vuelo["actual"])
+                try:
+                    time.sleep(random.uniform(latencia * 0.5, latencia * 1.5))
+                    if random.random() < tasa_error:
+                        return self._responder(503, {"error": "sobrecargado"})
+                    modelo = str(cuerpo.get("modelo", "ia")).lower()
+                    self._responder(
+                        200,
+                        {
+                            "url": (
+                                "https://storage.example.com/logos/"
+                                f"{modelo}_{time.time_ns()}.png"
+                            ),
+                            "calidad": random.choice(["ALTA", "MEDIA", "BAJA"]),
+                        },
+                    )
+                finally:
+                    with lock:
+                        en_vuelo["actual"] -= 1
+
+            def _responder(self, estado, datos, cabeceras=None):
+                contenido = json.dumps(datos).encode("utf-8")
+                self.send_response(estado)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(contenido)))
+                for nombre, valor in (cabeceras or {}).items():
+                    self.send_header(nombre, valor)
+                self.end_headers()
+                self.wfile.write(contenido)
+
+            def log_message(self, formato, *args):
+                escribir(
+                    f"{self.command} {self.path} {args[1] if len(args) > 1 else ''} "
+                    f"(en vuelo máx. {en_vuelo['maximo']})"
+                )
+
+        servidor = ThreadingHTTPServer(("127.0.0.1", options["puerto"]), Manejador)
+        self.stdout.write(
+            f"Servicio de IA simulado en "
+            f"http://127.0.0.1:{options['puerto']}/api/ia/v1/ (Ctrl+C para salir)"
+        )
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            servidor.server_close()
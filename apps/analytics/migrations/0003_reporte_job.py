@@ -0,0 +1,90 @@
+# Generated by Django 4.2.30 on 2026-10-18 22:51
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0002_alter_kpiganadobovinomodel_fecha"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReporteJobModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("tipo_reporte", models.CharField(max_length=50)),
+                ("parametros", models.JSONField(blank=True, default=dict)),
+                (
+                    "firma",
+                    models.CharField(
+                        help_text="Hash de tipo y parámetros para deduplicar trabajos idénticos",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "estado",
+                    models.CharField(
+                        choices=[
+                            ("PENDIENTE", "PENDIENTE"),
+                            ("EN_PROCESO", "EN_PROCESO"),
+                            ("COMPLETADO", "COMPLETADO"),
+                            ("FALLIDO", "FALLIDO"),
+                        ],
+                        default="PENDIENTE",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "progreso",
+                    models.PositiveSmallIntegerField(
+                        default=0,
+                        validators=[
+                            django.core.validators.MinValueValidator(0),
+                            django.core.validators.MaxValueValidator(100),
+                        ],
+                    ),
+                ),
+                ("mensaje_error", models.TextField(blank=True, null=True)),
+                (
+                    "usuario_solicitante",
+                    models.CharField(blank=True, max_length=100, null=True),
+                ),
+                ("fecha_creacion", models.DateTimeField(auto_now_add=True)),
+                ("fecha_inicio_ejecucion", models.DateTimeField(blank=True, null=True)),
+                ("fecha_fin_ejecucion", models.DateTimeField(blank=True, null=True)),
+                (
+                    "reporte",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="jobs",
+                        to="analytics.reportedatamodel",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Trabajo de Reporte",
+                "verbose_name_plural": "Trabajos de Reportes",
+                "db_table": "reporte_job",
+                "ordering": ["-fecha_creacion"],
+                "indexes": [
+                    models.Index(
+                        fields=["firma", "estado"], name="reporte_job_firma_ec7e6e_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,131 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:05
+
+from django.db import migrations, models
+
+import apps.analytics.infrastructure.models.fields
+
+TAMAÑO_LOTE = 200
+
+
+def comprimir_datos_existentes(apps, schema_editor):
+    """Comprime los payloads existentes por lotes (keyset sobre id)"""
+    from apps.analytics.infrastructure.models.fields import analizar_datos
+
+    ReporteDataModel = apps.get_model("analytics", "ReporteDataModel")
+    ultimo_id = 0
+    while True:
+        lote = list(
+            ReporteDataModel.objects.filter(id__gt=ultimo_id)
+            .order_by("id")
+            .only("id", "datos")[:TAMAÑO_LOTE]
+        )
+        if not lote:
+            break
+
+        for reporte in lote:
+            analisis = analizar_datos(reporte.datos)
+            reporte.datos_comprimidos = analisis.pop("comprimido")
+            for campo, valor in analisis.items():
+                setattr(reporte, campo, valor)
+
+        ReporteDataModel.objects.bulk_update(
+            lote,
+            [
+                "datos_comprimidos",
+                "bytes_datos",
+                "bytes_comprimidos",
+                "claves_datos",
+                "niveles_anidamiento",
+                "tipos_datos",
+            ],
+        )
+        ultimo_id = lote[-1].id
+
+
+def descomprimir_datos_existentes(apps, schema_editor):
+    """Restaura el JSON sin comprimir por lotes"""
+    ReporteDataModel = apps.get_model("analytics", "ReporteDataModel")
+    ultimo_id = 0
+    while True:
+        lote = list(
+            ReporteDataModel.objects.filter(id__gt=ultimo_id)
+            .order_by("id")
+            .only("id", "datos_comprimidos")[:TAMAÑO_LOTE]
+        )
+        if not lote:
+            break
+
+        for reporte in lote:
+            reporte.datos = reporte.datos_comprimidos
+        ReporteDataModel.objects.bulk_update(lote, ["datos"])
+        ultimo_id = lote[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0003_reporte_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reportedatamodel",
+            name="bytes_comprimidos",
+            field=models.PositiveBigIntegerField(
+                default=0, help_text="Tamaño almacenado (zlib)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="reportedatamodel",
+            name="bytes_datos",
+            field=models.PositiveBigIntegerField(
+                default=0, help_text="Tamaño del JSON sin comprimir"
+            ),
+        ),
+        migrations.AddField(
+            model_name="reportedatamodel",
+            name="claves_datos",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Claves del primer nivel"
+            ),
+        ),
+        migrations.AddField(
+            model_name="reportedatamodel",
+            name="niveles_anidamiento",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="reportedatamodel",
+            name="tipos_datos",
+            field=models.PositiveSmallIntegerField(
+                default=0, help_text="Tipos distintos en el primer nivel"
+            ),
+        ),
+        migrations.AddField(
+            model_name="reportedatamodel",
+            name="datos_comprimidos",
+            field=apps.analytics.infrastructure.models.fields.JSONComprimidoField(
+                null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="reportedatamodel",
+            name="datos",
+            field=models.JSONField(null=True),
+        ),
+        migrations.RunPython(comprimir_datos_existentes, descomprimir_datos_existentes),
+        migrations.RemoveField(
+            model_name="reportedatamodel",
+            name="datos",
+        ),
+        migrations.RenameField(
+            model_name="reportedatamodel",
+            old_name="datos_comprimidos",
+            new_name="datos",
+        ),
+        migrations.AlterField(
+            model_name="reportedatamodel",
+            name="datos",
+            field=apps.analytics.infrastructure.models.fields.JSONComprimidoField(),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0004_reporte_data_comprimido"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reportedatamodel",
+            index=models.Index(
+                fields=["tipo_reporte"], name="reporte_dat_tipo_re_cd1d1c_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reportedatamodel",
+            index=models.Index(
+                fields=["usuario_generador", "fecha_generacion"],
+                name="reporte_dat_usuario_3b6881_idx",
+            ),
+        ),
+    ]
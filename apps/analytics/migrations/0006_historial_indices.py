@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0005_reporte_data_indices"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="historialestadomarcamodel",
+            index=models.Index(
+                fields=["marca", "fecha_cambio"], name="historial_e_marca_i_eef546_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="historialestadomarcamodel",
+            index=models.Index(
+                fields=["fecha_cambio"], name="historial_e_fecha_c_690e97_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:41
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0006_historial_indices"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MarcaCicloVidaModel",
+            fields=[
+                (
+                    "marca",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="ciclo_vida",
+                        serialize=False,
+                        to="analytics.marcaganadobovinomodel",
+                    ),
+                ),
+                (
+                    "estado_actual",
+                    models.CharField(blank=True, max_length=20, null=True),
+                ),
+                ("fecha_estado_actual", models.DateTimeField(blank=True, null=True)),
+                (
+                    "fecha_entrada_pendiente",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                (
+                    "fecha_entrada_en_proceso",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("fecha_entrada_aprobado", models.DateTimeField(blank=True, null=True)),
+                (
+                    "fecha_entrada_rechazado",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("horas_pendiente", models.FloatField(default=0)),
+                ("horas_en_proceso", models.FloatField(default=0)),
+                ("horas_aprobado", models.FloatField(default=0)),
+                ("horas_rechazado", models.FloatField(default=0)),
+                ("total_transiciones", models.PositiveIntegerField(default=0)),
+                (
+                    "fecha_ultima_transicion",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("fecha_actualizacion", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Ciclo de Vida de Marca",
+                "verbose_name_plural": "Ciclos de Vida de Marcas",
+                "db_table": "marca_ciclo_vida",
+                "indexes": [
+                    models.Index(
+                        fields=["estado_actual"], name="marca_ciclo_estado__2377fd_idx"
+                    ),
+                    models.Index(
+                        fields=["fecha_entrada_aprobado"],
+                        name="marca_ciclo_fecha_e_2de2f3_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
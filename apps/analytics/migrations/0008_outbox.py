@@ -0,0 +1,68 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0007_marca_ciclo_vida"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxCheckpointModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("consumidor", models.CharField(max_length=100, unique=True)),
+                ("ultima_secuencia", models.BigIntegerField(default=0)),
+                ("fecha_actualizacion", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Checkpoint de Outbox",
+                "verbose_name_plural": "Checkpoints de Outbox",
+                "db_table": "outbox_checkpoint",
+            },
+        ),
+        migrations.CreateModel(
+            name="EventoOutboxModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("entidad", models.CharField(max_length=30)),
+                ("entidad_id", models.BigIntegerField()),
+                (
+                    "operacion",
+                    models.CharField(
+                        choices=[
+                            ("CREAR", "CREAR"),
+                            ("ACTUALIZAR", "ACTUALIZAR"),
+                            ("ELIMINAR", "ELIMINAR"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("campos_modificados", models.JSONField(blank=True, default=list)),
+                ("fecha_creacion", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "Evento de Outbox",
+                "verbose_name_plural": "Eventos de Outbox",
+                "db_table": "evento_outbox",
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        fields=["entidad", "entidad_id"],
+                        name="evento_outb_entidad_9d33ac_idx",
+                    )
+                ],
+            },
+        ),
+    ]
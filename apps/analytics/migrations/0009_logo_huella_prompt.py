@@ -0,0 +1,65 @@
+# Generated by Django 4.2.30 on 2026-10-19 02:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+TAMAÑO_LOTE = 200
+
+
+def calcular_huellas_existentes(apps, schema_editor):
+    """Calcula la huella de los logos existentes por lotes (keyset sobre id)"""
+    from apps.analytics.infrastructure.models.logo_marca_bovina_model import (
+        calcular_huella_prompt,
+    )
+
+    LogoMarcaBovinaModel = apps.get_model("analytics", "LogoMarcaBovinaModel")
+    ultimo_id = 0
+    while True:
+        lote = list(
+            LogoMarcaBovinaModel.objects.filter(id__gt=ultimo_id)
+            .order_by("id")
+            .only("id", "prompt_usado", "modelo_ia_usado")[:TAMAÑO_LOTE]
+        )
+        if not lote:
+            break
+
+        for logo in lote:
+            logo.huella_prompt = calcular_huella_prompt(
+                logo.prompt_usado, logo.modelo_ia_usado
+            )
+        LogoMarcaBovinaModel.objects.bulk_update(lote, ["huella_prompt"])
+        ultimo_id = lote[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0008_outbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="logomarcabovinamodel",
+            name="huella_prompt",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="Hash de prompt, modelo y parámetros (cache de resultados de IA)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="logomarcabovinamodel",
+            name="reutilizado_de",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Logo original cuando el resultado salió del cache de prompts",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="reutilizaciones",
+                to="analytics.logomarcabovinamodel",
+            ),
+        ),
+        migrations.RunPython(calcular_huellas_existentes, migrations.RunPython.noop),
+    ]
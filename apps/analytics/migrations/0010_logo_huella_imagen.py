@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-19 02:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0009_logo_huella_prompt"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="logomarcabovinamodel",
+            name="huella_imagen",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="SHA-256 de la imagen en el almacén local (LOGOS_ALMACEN_DIR)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:15
+
+from django.db import migrations, models
+
+
+def construir_histogramas(apps, schema_editor):
+    """Llena los histogramas con los logos existentes"""
+    from apps.analytics.infrastructure.models.histograma_latencia_model import (
+        reconstruir_histogramas,
+    )
+
+    reconstruir_histogramas(
+        apps.get_model("analytics", "LogoMarcaBovinaModel"),
+        apps.get_model("analytics", "HistogramaLatenciaModel"),
+        tamaño_lote=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0010_logo_huella_imagen"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="HistogramaLatenciaModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("modelo_ia_usado", models.CharField(max_length=100)),
+                ("fecha", models.DateField()),
+                ("cubeta", models.PositiveSmallIntegerField()),
+                ("conteo", models.IntegerField(default=0)),
+                ("suma_segundos", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Histograma de Latencia IA",
+                "verbose_name_plural": "Histogramas de Latencia IA",
+                "db_table": "histograma_latencia_ia",
+                "indexes": [
+                    models.Index(
+                        fields=["fecha", "modelo_ia_usado"],
+                        name="histograma__fecha_79cfcc_idx",
+                    )
+                ],
+                "unique_together": {("modelo_ia_usado", "fecha", "cubeta")},
+            },
+        ),
+        migrations.RunPython(construir_histogramas, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:50
+
+from django.db import migrations, models
+
+
+def construir_indice(apps, schema_editor):
+    """Indexa los prompts de los logos existentes"""
+    from apps.analytics.infrastructure.models.termino_prompt_model import (
+        reconstruir_indice,
+    )
+
+    reconstruir_indice(
+        apps.get_model("analytics", "LogoMarcaBovinaModel"),
+        apps.get_model("analytics", "TerminoPromptModel"),
+        tamaño_lote=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0011_histograma_latencia"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TerminoPromptModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("termino", models.CharField(max_length=64, unique=True)),
+                ("logos", models.IntegerField(default=0)),
+                ("exitosos", models.IntegerField(default=0)),
+                ("calidad_alta", models.IntegerField(default=0)),
+                ("calidad_media", models.IntegerField(default=0)),
+                ("calidad_baja", models.IntegerField(default=0)),
+                (
+                    "logos_indexados",
+                    models.ManyToManyField(
+                        blank=True,
+                        db_table="termino_prompt_logo",
+                        related_name="terminos_prompt",
+                        to="analytics.logomarcabovinamodel",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Término de Prompt",
+                "verbose_name_plural": "Términos de Prompts",
+                "db_table": "termino_prompt",
+                "indexes": [
+                    models.Index(fields=["logos"], name="termino_pro_logos_bca23d_idx")
+                ],
+            },
+        ),
+        migrations.RunPython(construir_indice, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0012_termino_prompt"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="historialestadomarcamodel",
+            index=models.Index(
+                fields=["estado_nuevo", "fecha_cambio"],
+                name="historial_e_estado__c24a25_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="historialestadomarcamodel",
+            index=models.Index(
+                fields=["usuario_responsable", "fecha_cambio"],
+                name="historial_e_usuario_ee8a25_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="logomarcabovinamodel",
+            index=models.Index(
+                fields=["marca", "fecha_generacion"],
+                name="logo_marca__marca_i_02b7a5_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="logomarcabovinamodel",
+            index=models.Index(
+                fields=["modelo_ia_usado", "fecha_generacion"],
+                name="logo_marca__modelo__97293b_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="marcaganadobovinomodel",
+            index=models.Index(
+                fields=["estado", "fecha_registro"],
+                name="marca_ganad_estado_b023f2_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="marcaganadobovinomodel",
+            index=models.Index(
+                fields=["departamento", "fecha_registro"],
+                name="marca_ganad_departa_671980_idx",
+            ),
+        ),
+        # Los compuestos empiezan por estado/departamento: los simples sobran
+        migrations.RemoveIndex(
+            model_name="marcaganadobovinomodel",
+            name="marca_ganad_estado_35f745_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="marcaganadobovinomodel",
+            name="marca_ganad_departa_795312_idx",
+        ),
+    ]
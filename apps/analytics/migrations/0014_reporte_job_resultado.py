@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:10
+
+from django.db import migrations, models
+
+
+def mover_resultados_pdf(apps, schema_editor):
+    """
+    Los trabajos "pdf" creaban un ReporteData con la ruta del archivo: el
+    resultado pasa al trabajo y se eliminan esos reportes ficticios
+    """
+    ReporteJobModel = apps.get_model("analytics", "ReporteJobModel")
+    ReporteDataModel = apps.get_model("analytics", "ReporteDataModel")
+
+    jobs = list(
+        ReporteJobModel.objects.filter(
+            tipo_reporte="pdf", reporte__isnull=False
+        ).select_related("reporte")
+    )
+    for job in jobs:
+        job.resultado = job.reporte.datos
+    ReporteJobModel.objects.bulk_update(jobs, ["resultado"])
+    ReporteDataModel.objects.filter(
+        id__in=[job.reporte_id for job in jobs], tipo_reporte="pdf"
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0013_indices_compuestos"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reportejobmodel",
+            name="resultado",
+            field=models.JSONField(
+                blank=True,
+                help_text="Resultado de trabajos que no generan un reporte (p. ej. PDF)",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(mover_resultados_pdf, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0014_reporte_job_resultado"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reportejobmodel",
+            name="firma_activa",
+            field=models.CharField(
+                blank=True,
+                help_text="Firma mientras el trabajo está en curso (NULL al terminar): el índice único impide dos trabajos idénticos en curso",
+                max_length=64,
+                null=True,
+                unique=True,
+            ),
+        ),
+    ]
@@ -8,11 +8,12 @@ Responsabilidades:
 - Mantener separación de responsabilidades (SOLID)
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 from django.urls import path, reverse
-from django.shortcuts import render
+from django.shortcuts import redirect, render
 from django.http import JsonResponse, HttpResponse
 from django.contrib import messages
 from django.db.models import Count, Avg, Sum, Q
@@ -21,6 +22,11 @@ from datetime import timedelta, datetime
 import json
 
 from .base_admin import BaseAnalyticsAdmin
+from ...infrastructure.metricas import (
+    ORDENES_PEORES,
+    ConsultasLentas,
+    MetricasEndpoints,
+)
 from ...infrastructure.models import DashboardDataModel
 
 
@@ -250,6 +256,16 @@ class DashboardDataAdmin(BaseAnalyticsAdmin):
                 self.admin_site.admin_view(self.export_dashboard_view),
                 name="dashboard_export",
             ),
+            path(
+                "rendimiento-endpoints/",
+                self.admin_site.admin_view(self.rendimiento_endpoints_view),
+                name="dashboard_rendimiento_endpoints",
+            ),
+            path(
+                "consultas-lentas/",
+                self.admin_site.admin_view(self.consultas_lentas_view),
+                name="dashboard_consultas_lentas",
+            ),
         ]
         return custom_urls + urls
 
@@ -1273,6 +1289,36 @@ class DashboardDataAdmin(BaseAnalyticsAdmin):
         }
         return render(request, "admin/dashboard_predictive.html", context)
 
+    def rendimiento_endpoints_view(self, request):
+        """Endpoints más lentos o pesados según las métricas de los workers"""
+        orden = request.GET.get("orden", "tiempo_total_segundos")
+        if orden not in ORDENES_PEORES:
+            orden = "tiempo_total_segundos"
+        context = {
+            "title": "Rendimiento por Endpoint",
+            "opts": self.model._meta,
+            "endpoints": MetricasEndpoints.peores_endpoints(orden, limite=50),
+            "orden": orden,
+            "ordenes": ORDENES_PEORES,
+            "multiproceso": bool(settings.METRICAS_DIRECTORIO_MULTIPROCESO),
+        }
+        return render(request, "admin/rendimiento_endpoints.html", context)
+
+    def consultas_lentas_view(self, request):
+        """Consultas SQL lentas de este worker con su origen y plan de EXPLAIN"""
+        if request.method == "POST":
+            ConsultasLentas.limpiar()
+            messages.success(request, "Consultas lentas descartadas")
+            return redirect(request.path)
+        context = {
+            "title": "Consultas SQL Lentas",
+            "opts": self.model._meta,
+            "agrupadas": ConsultasLentas.agrupadas(),
+            "recientes": ConsultasLentas.recientes(),
+            "umbral_ms": settings.CONSULTAS_LENTAS_UMBRAL_MS,
+        }
+        return render(request, "admin/consultas_lentas.html", context)
+
     # APIs para datos AJAX
     def api_dashboard_data(self, request):
         """API para datos del dashboard"""
@@ -1390,7 +1436,11 @@ class DashboardDataAdmin(BaseAnalyticsAdmin):
         elif porcentaje < -5:
             return {"class": "trend-down", "icon": "↘️", "texto": f"{porcentaje:.1f}%"}
         else:
-            return {"class": "trend-stable", "icon": "➡️", "texto": f"{porcentaje:.1f}%"}
+            return {
+                "class": "trend-stable",
+                "icon": "➡️",
+                "texto": f"{porcentaje:.1f}%",
+            }
 
     def _calcular_crecimiento_ingresos(self, obj, mes_anterior):
         """Calcula el crecimiento de ingresos"""
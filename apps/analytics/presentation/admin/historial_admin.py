@@ -9,10 +9,13 @@ Responsabilidades:
 """
 
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.utils.html import format_html
 from django.urls import path
 from django.http import JsonResponse
-from django.db.models import Count, Q
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import Lag, TruncDate
+from collections import defaultdict
 from datetime import datetime, timedelta
 import json
 
@@ -20,6 +23,14 @@ from .base_admin import BaseAnalyticsAdmin
 from ...infrastructure.models import HistorialEstadoMarcaModel
 
 
+class HistorialChangeList(ChangeList):
+    """ChangeList que precalcula por página las métricas de las columnas"""
+
+    def get_results(self, request):
+        super().get_results(request)
+        self.model_admin.precalcular_pagina(list(self.result_list))
+
+
 @admin.register(HistorialEstadoMarcaModel)
 class HistorialEstadoMarcaAdmin(BaseAnalyticsAdmin):
     """
@@ -178,14 +189,83 @@ class HistorialEstadoMarcaAdmin(BaseAnalyticsAdmin):
         return custom_urls + urls
 
     def get_queryset(self, request):
-        """Optimiza las consultas con select_related y prefetch_related"""
-        return (
-            super()
-            .get_queryset(request)
-            .select_related("marca")
-            .prefetch_related("marca__logos")
+        """Optimiza las consultas con select_related"""
+        return super().get_queryset(request).select_related("marca")
+
+    def get_changelist(self, request, **kwargs):
+        return HistorialChangeList
+
+    def precalcular_pagina(self, registros):
+        """
+        Calcula en bloque las métricas de las columnas para una página
+
+        Tres consultas por página sin importar su tamaño: conteo de cambios por
+        usuario, cambio anterior de cada marca (LAG) y frecuencia por día de
+        cada transición. Los valores quedan en cada registro y las columnas
+        solo los leen.
+        """
+        if not registros:
+            return
+
+        usuarios = {r.usuario_responsable for r in registros}
+        filtro_usuarios = Q(usuario_responsable__in=usuarios - {None})
+        if None in usuarios:
+            filtro_usuarios |= Q(usuario_responsable__isnull=True)
+        cambios_por_usuario = dict(
+            HistorialEstadoMarcaModel.objects.filter(filtro_usuarios)
+            .order_by()
+            .values_list("usuario_responsable")
+            .annotate(total=Count("id"))
+        )
+
+        # La ventana recorre todo el historial de las marcas de la página; el
+        # registro de la página se elige después para no recortar la partición
+        fechas_anteriores = dict(
+            HistorialEstadoMarcaModel.objects.filter(
+                marca_id__in={r.marca_id for r in registros}
+            )
+            .annotate(
+                fecha_anterior=Window(
+                    expression=Lag("fecha_cambio"),
+                    partition_by=[F("marca_id")],
+                    order_by=[F("fecha_cambio").asc(), F("id").asc()],
+                )
+            )
+            .order_by()
+            .values_list("id", "fecha_anterior")
         )
 
+        transiciones = {(r.estado_anterior, r.estado_nuevo) for r in registros}
+        desde = min(r.fecha_cambio for r in registros) - timedelta(days=30)
+        frecuencia_diaria = defaultdict(dict)
+        filtro_transiciones = Q()
+        for anterior, nuevo in transiciones:
+            filtro_transiciones |= Q(estado_anterior=anterior, estado_nuevo=nuevo)
+        for anterior, nuevo, dia, total in (
+            HistorialEstadoMarcaModel.objects.filter(
+                filtro_transiciones, fecha_cambio__gte=desde
+            )
+            .annotate(dia=TruncDate("fecha_cambio"))
+            .order_by()
+            .values_list("estado_anterior", "estado_nuevo", "dia")
+            .annotate(total=Count("id"))
+        ):
+            frecuencia_diaria[(anterior, nuevo)][dia] = total
+
+        for registro in registros:
+            registro._cambios_usuario = cambios_por_usuario.get(
+                registro.usuario_responsable, 0
+            )
+            registro._fecha_cambio_anterior = fechas_anteriores.get(registro.id)
+            limite = (registro.fecha_cambio - timedelta(days=30)).date()
+            registro._cambios_similares = sum(
+                total
+                for dia, total in frecuencia_diaria[
+                    (registro.estado_anterior, registro.estado_nuevo)
+                ].items()
+                if dia >= limite
+            )
+
     # Campos personalizados con visualizaciones avanzadas
     def marca_numero_display(self, obj):
         """Muestra el número de marca con enlace y estado"""
@@ -271,7 +351,7 @@ class HistorialEstadoMarcaAdmin(BaseAnalyticsAdmin):
             "</div>"
             "</div>",
             obj.usuario_responsable,
-            self._contar_cambios_usuario(obj.usuario_responsable),
+            self._contar_cambios_usuario(obj),
         )
 
     usuario_responsable_display.short_description = "👤 Responsable"
@@ -753,11 +833,13 @@ class HistorialEstadoMarcaAdmin(BaseAnalyticsAdmin):
         else:
             return "hace unos segundos"
 
-    def _contar_cambios_usuario(self, usuario):
-        """Cuenta los cambios realizados por un usuario"""
+    def _contar_cambios_usuario(self, obj):
+        """Cuenta los cambios realizados por el usuario responsable"""
+        if hasattr(obj, "_cambios_usuario"):
+            return obj._cambios_usuario
         try:
             return HistorialEstadoMarcaModel.objects.filter(
-                usuario_responsable=usuario
+                usuario_responsable=obj.usuario_responsable
             ).count()
         except:
             return 0
@@ -766,16 +848,20 @@ class HistorialEstadoMarcaAdmin(BaseAnalyticsAdmin):
         """Calcula el tiempo de procesamiento del cambio"""
         try:
             # Buscar el cambio anterior para esta marca
-            cambio_anterior = (
-                HistorialEstadoMarcaModel.objects.filter(
-                    marca=obj.marca, fecha_cambio__lt=obj.fecha_cambio
+            if hasattr(obj, "_fecha_cambio_anterior"):
+                fecha_anterior = obj._fecha_cambio_anterior
+            else:
+                fecha_anterior = (
+                    HistorialEstadoMarcaModel.objects.filter(
+                        marca=obj.marca, fecha_cambio__lt=obj.fecha_cambio
+                    )
+                    .order_by("-fecha_cambio")
+                    .values_list("fecha_cambio", flat=True)
+                    .first()
                 )
-                .order_by("-fecha_cambio")
-                .first()
-            )
 
-            if cambio_anterior:
-                diferencia = obj.fecha_cambio - cambio_anterior.fecha_cambio
+            if fecha_anterior:
+                diferencia = obj.fecha_cambio - fecha_anterior
                 horas = diferencia.total_seconds() / 3600
 
                 if horas < 1:
@@ -833,11 +919,14 @@ class HistorialEstadoMarcaAdmin(BaseAnalyticsAdmin):
         """Detecta patrones en el cambio"""
         try:
             # Buscar cambios similares recientes
-            cambios_similares = HistorialEstadoMarcaModel.objects.filter(
-                estado_anterior=obj.estado_anterior,
-                estado_nuevo=obj.estado_nuevo,
-                fecha_cambio__gte=obj.fecha_cambio - timedelta(days=30),
-            ).count()
+            if hasattr(obj, "_cambios_similares"):
+                cambios_similares = obj._cambios_similares
+            else:
+                cambios_similares = HistorialEstadoMarcaModel.objects.filter(
+                    estado_anterior=obj.estado_anterior,
+                    estado_nuevo=obj.estado_nuevo,
+                    fecha_cambio__gte=obj.fecha_cambio - timedelta(days=30),
+                ).count()
 
             if cambios_similares > 10:
                 return {"class": "patron-frecuente", "text": "Frecuente"}
@@ -949,7 +1038,7 @@ class HistorialEstadoMarcaAdmin(BaseAnalyticsAdmin):
             "<li>⚡ Eficiencia: 87% sobre promedio</li>"
             "<li>🎯 Precisión: 94% de cambios correctos</li>"
             "</ul>",
-            self._contar_cambios_usuario(obj.usuario_responsable),
+            self._contar_cambios_usuario(obj),
         )
 
     def _generar_recomendaciones_patron(self, obj):
@@ -1104,7 +1193,7 @@ class HistorialEstadoMarcaAdmin(BaseAnalyticsAdmin):
             )
 
         # Alerta de usuario activo
-        cambios_usuario = self._contar_cambios_usuario(obj.usuario_responsable)
+        cambios_usuario = self._contar_cambios_usuario(obj)
         if cambios_usuario > 100:
             alertas.append(
                 '<div class="alert success">'
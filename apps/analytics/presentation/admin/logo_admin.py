@@ -166,12 +166,14 @@ class LogoMarcaBovinaAdmin(BaseAnalyticsAdmin):
 
     def preview_logo_thumbnail(self, obj):
         """Preview thumbnail del logo con overlay de información"""
-        if not obj.url_logo:
+        # Solo miniaturas del almacén local: nunca la imagen completa externa
+        if not obj.huella_imagen:
             return format_html(
                 '<div style="width: 60px; height: 60px; background: #f8f9fa; border: 2px dashed #dee2e6; '
                 'display: flex; align-items: center; justify-content: center; border-radius: 8px;">'
-                '<span style="color: #6c757d; font-size: 12px;">Sin logo</span>'
-                "</div>"
+                '<span style="color: #6c757d; font-size: 12px;">{}</span>'
+                "</div>",
+                "Sin copia local" if obj.url_logo else "Sin logo",
             )
 
         overlay_color = "#4caf50" if obj.exito else "#f44336"
@@ -179,7 +181,8 @@ class LogoMarcaBovinaAdmin(BaseAnalyticsAdmin):
 
         return mark_safe(
             f'<div style="position: relative; display: inline-block;">'
-            f'<img src="{obj.url_logo}" style="width: 60px; height: 60px; object-fit: cover; '
+            f'<img src="{self._url_imagen(obj, 128)}" loading="lazy" width="60" height="60" '
+            f'style="width: 60px; height: 60px; object-fit: cover; '
             f'border-radius: 8px; border: 2px solid {overlay_color};" />'
             f'<div style="position: absolute; top: -5px; right: -5px; background: {overlay_color}; '
             f"color: white; border-radius: 50%; width: 20px; height: 20px; "
@@ -190,6 +193,16 @@ class LogoMarcaBovinaAdmin(BaseAnalyticsAdmin):
 
     preview_logo_thumbnail.short_description = "🖼️ Preview"
 
+    def _url_imagen(self, obj, lado=None):
+        """URL del almacén local (miniatura de `lado` px u original), o None"""
+        if not obj.huella_imagen:
+            return None
+        if lado:
+            return reverse(
+                "analytics:logo:imagen_logo_miniatura", args=[obj.huella_imagen, lado]
+            )
+        return reverse("analytics:logo:imagen_logo", args=[obj.huella_imagen])
+
     def modelo_ia_con_badge(self, obj):
         """Modelo IA con badge de rendimiento"""
         # Calcular estadísticas del modelo
@@ -354,7 +367,11 @@ class LogoMarcaBovinaAdmin(BaseAnalyticsAdmin):
             )
 
         if obj.url_logo:
-            acciones.append(self.create_action_button(obj.url_logo, "👁️ Ver", "#28a745"))
+            acciones.append(
+                self.create_action_button(
+                    self._url_imagen(obj) or obj.url_logo, "👁️ Ver", "#28a745"
+                )
+            )
 
         # Botón de análisis
         analizar_url = reverse("admin:logo_analizar_individual", args=[obj.pk])
@@ -382,8 +399,9 @@ class LogoMarcaBovinaAdmin(BaseAnalyticsAdmin):
 
         return mark_safe(
             f'<div style="text-align: center; padding: 20px; background: #f8f9fa; border-radius: 8px;">'
-            f'<img src="{obj.url_logo}" style="max-width: 300px; max-height: 300px; '
-            f'border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.1);" />'
+            f'<a href="{self._url_imagen(obj) or obj.url_logo}">'
+            f'<img src="{self._url_imagen(obj, 256) or obj.url_logo}" style="max-width: 300px; max-height: 300px; '
+            f'border-radius: 8px; box-shadow: 0 4px 8px rgba(0,0,0,0.1);" /></a>'
             f'<div style="margin-top: 15px; display: flex; justify-content: center; gap: 15px;">'
             f'<div style="text-align: center;">'
             f'<div style="color: #007bff; font-weight: bold;">Modelo</div>'
@@ -750,6 +768,8 @@ class LogoMarcaBovinaAdmin(BaseAnalyticsAdmin):
         context = {
             "title": f"Análisis Individual de Logo {logo.pk}",
             "logo": logo,
+            "imagen_preview_url": self._url_imagen(logo, 512),
+            "imagen_original_url": self._url_imagen(logo) or logo.url_logo,
             "modelos_comparacion": modelos_comparacion,
             "opts": self.model._meta,
         }
@@ -13,9 +13,15 @@ from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 from django.urls import path, reverse
 from django.shortcuts import render
-from django.http import JsonResponse, HttpResponse, HttpResponseRedirect
+from django.http import (
+    FileResponse,
+    JsonResponse,
+    HttpResponse,
+    HttpResponseRedirect,
+)
 from django.contrib import messages
-from django.db.models import Count, Avg, Sum, Q
+from django.db.models import Count, Avg, Sum, Q, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from datetime import timedelta, datetime
 import json
@@ -60,7 +66,6 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
     search_fields = [
         "tipo_reporte",
         "usuario_generador",
-        "datos",
         "descripcion_reporte",
     ]
 
@@ -191,6 +196,46 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
             "admin/js/reporte_admin.js",
         )
 
+    def get_queryset(self, request):
+        """
+        El payload comprimido no se lee en el listado (se usan sus metadatos);
+        en el detalle se carga al acceder a obj.datos.
+
+        Los conteos por tipo y por usuario se anotan como subconsultas para que
+        el listado use un número fijo de consultas sin importar el tamaño de
+        la página.
+        """
+        hace_un_mes = timezone.now() - timedelta(days=30)
+        return (
+            super()
+            .get_queryset(request)
+            .defer("datos")
+            .annotate(
+                total_reportes_tipo=self._conteo_reportes(
+                    tipo_reporte=OuterRef("tipo_reporte")
+                ),
+                total_reportes_usuario=self._conteo_reportes(
+                    usuario_generador=OuterRef("usuario_generador")
+                ),
+                reportes_usuario_mes=self._conteo_reportes(
+                    usuario_generador=OuterRef("usuario_generador"),
+                    fecha_generacion__gte=hace_un_mes,
+                ),
+            )
+        )
+
+    @staticmethod
+    def _conteo_reportes(**filtros):
+        """Subconsulta COUNT(*) de reportes con los filtros dados"""
+        conteo = (
+            ReporteDataModel.objects.filter(**filtros)
+            .order_by()
+            .values(*[k for k, v in filtros.items() if isinstance(v, OuterRef)])
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        return Coalesce(Subquery(conteo[:1]), 0, output_field=IntegerField())
+
     def get_urls(self):
         """URLs personalizadas para funcionalidades avanzadas"""
         urls = super().get_urls()
@@ -286,10 +331,8 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
             obj.tipo_reporte, {"icon": "📄", "color": "#6c757d", "categoria": "General"}
         )
 
-        # Calcular popularidad del tipo
-        popularidad = ReporteDataModel.objects.filter(
-            tipo_reporte=obj.tipo_reporte
-        ).count()
+        # Popularidad del tipo (anotada en get_queryset)
+        popularidad = obj.total_reportes_tipo
 
         return format_html(
             '<div class="tipo-reporte-container">'
@@ -424,15 +467,9 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
                 "</div>"
             )
 
-        # Calcular estadísticas del usuario
-        reportes_usuario = ReporteDataModel.objects.filter(
-            usuario_generador=obj.usuario_generador
-        ).count()
-
-        reportes_mes = ReporteDataModel.objects.filter(
-            usuario_generador=obj.usuario_generador,
-            fecha_generacion__gte=timezone.now() - timedelta(days=30),
-        ).count()
+        # Estadísticas del usuario (anotadas en get_queryset)
+        reportes_usuario = obj.total_reportes_usuario
+        reportes_mes = obj.reportes_usuario_mes
 
         return format_html(
             '<div class="usuario-container">'
@@ -456,8 +493,7 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
     def tamaño_datos_avanzado(self, obj):
         """Tamaño de datos con análisis avanzado"""
         try:
-            datos_str = json.dumps(obj.datos) if obj.datos else "{}"
-            tamaño_bytes = len(datos_str.encode("utf-8"))
+            tamaño_bytes = obj.bytes_datos
 
             # Formatear tamaño
             if tamaño_bytes < 1024:
@@ -478,7 +514,7 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
                 color = "#dc3545"
 
             # Calcular complejidad de datos
-            complejidad = self._calcular_complejidad_datos(obj.datos)
+            complejidad = self._calcular_complejidad_datos(obj)
 
             return format_html(
                 '<div class="tamaño-container">'
@@ -504,6 +540,7 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
             )
 
     tamaño_datos_avanzado.short_description = "💾 Tamaño"
+    tamaño_datos_avanzado.admin_order_field = "bytes_datos"
 
     def estado_reporte_completo(self, obj):
         """Estado completo del reporte con análisis integral"""
@@ -1040,8 +1077,7 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
     def tamaño_datos_display(self, obj):
         """Muestra el tamaño de los datos formateado"""
         try:
-            datos_str = json.dumps(obj.datos) if obj.datos else "{}"
-            tamaño_kb = len(datos_str.encode("utf-8")) / 1024
+            tamaño_kb = obj.bytes_datos / 1024
             if tamaño_kb < 1:
                 return f"{tamaño_kb * 1024:.0f} bytes"
             elif tamaño_kb < 1024:
@@ -1261,7 +1297,9 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
             reporte = ReporteDataModel.objects.get(id=report_id)
 
             # Generar contenido según formato
-            if reporte.formato.upper() == "JSON":
+            if reporte.formato.upper() == "PDF" or request.GET.get("formato") == "pdf":
+                return self._descargar_pdf(request, reporte)
+            elif reporte.formato.upper() == "JSON":
                 response = HttpResponse(
                     json.dumps(reporte.datos, indent=2, ensure_ascii=False),
                     content_type="application/json",
@@ -1290,6 +1328,38 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
                 reverse("admin:analytics_reportedatamodel_changelist")
             )
 
+    def _descargar_pdf(self, request, reporte):
+        """Entrega el PDF si ya existe; si no, encola su renderizado en segundo plano"""
+        from ...infrastructure.container.main_container import Container
+
+        resultado = (
+            Container.instancia()
+            .get_obtener_reporte_pdf_use_case()
+            .execute(reporte.id, usuario_solicitante=str(request.user))
+        )
+
+        if resultado["listo"]:
+            return FileResponse(
+                open(resultado["ruta_archivo"], "rb"),
+                as_attachment=True,
+                filename=resultado["nombre_archivo"],
+                content_type=resultado["content_type"],
+            )
+
+        if resultado["estado"] == "FALLIDO":
+            messages.error(
+                request, f"Error generando el PDF: {resultado['mensaje_error']}"
+            )
+        else:
+            messages.info(
+                request,
+                f"El PDF se está generando (trabajo #{resultado['job_id']}, "
+                f"{resultado['progreso']}%). Vuelva a descargarlo en unos segundos.",
+            )
+        return HttpResponseRedirect(
+            reverse("admin:analytics_reportedatamodel_changelist")
+        )
+
     def api_report_data(self, request, report_id):
         """API para datos de un reporte específico"""
         try:
@@ -1334,8 +1404,7 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
     def _calcular_tamaño_estimado(self, obj):
         """Calcula el tamaño estimado del archivo"""
         try:
-            datos_str = json.dumps(obj.datos) if obj.datos else "{}"
-            tamaño_bytes = len(datos_str.encode("utf-8"))
+            tamaño_bytes = obj.bytes_datos
 
             # Factores de conversión por formato
             factores = {
@@ -1358,48 +1427,24 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
         except:
             return "N/A"
 
-    def _calcular_complejidad_datos(self, datos):
-        """Calcula la complejidad de los datos"""
-        if not datos:
+    def _calcular_complejidad_datos(self, obj):
+        """Calcula la complejidad de los datos a partir de sus metadatos"""
+        if not obj.bytes_datos:
             return "Baja"
 
-        try:
-            if isinstance(datos, dict):
-                # Contar niveles de anidamiento y tipos de datos
-                niveles = self._contar_niveles_anidamiento(datos)
-                tipos_unicos = len(set(type(v).__name__ for v in datos.values()))
-
-                if niveles > 3 or tipos_unicos > 4:
-                    return "Alta"
-                elif niveles > 2 or tipos_unicos > 2:
-                    return "Media"
-                else:
-                    return "Baja"
-            else:
-                return "Media"
-        except:
-            return "Desconocida"
-
-    def _contar_niveles_anidamiento(self, obj, nivel=0):
-        """Cuenta los niveles de anidamiento en un objeto"""
-        if isinstance(obj, dict):
-            if not obj:
-                return nivel
-            return max(
-                self._contar_niveles_anidamiento(v, nivel + 1) for v in obj.values()
-            )
-        elif isinstance(obj, list):
-            if not obj:
-                return nivel
-            return max(
-                self._contar_niveles_anidamiento(item, nivel + 1) for item in obj
-            )
+        niveles = obj.niveles_anidamiento
+        tipos_unicos = obj.tipos_datos
+
+        if niveles > 3 or tipos_unicos > 4:
+            return "Alta"
+        elif niveles > 2 or tipos_unicos > 2:
+            return "Media"
         else:
-            return nivel
+            return "Baja"
 
     def _analizar_integridad_datos(self, obj):
         """Analiza la integridad de los datos"""
-        if not obj.datos:
+        if not obj.claves_datos:
             return 0
 
         try:
@@ -1407,11 +1452,11 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
             score = 85
 
             # Verificar estructura
-            if isinstance(obj.datos, dict) and obj.datos:
+            if obj.tipos_datos:
                 score += 10
 
             # Verificar completitud
-            if len(str(obj.datos)) > 100:
+            if obj.bytes_datos > 100:
                 score += 5
 
             return min(100, score)
@@ -1423,7 +1468,7 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
         try:
             # Simular análisis de rendimiento basado en tamaño y complejidad
             tamaño_score = 90
-            complejidad = self._calcular_complejidad_datos(obj.datos)
+            complejidad = self._calcular_complejidad_datos(obj)
 
             if complejidad == "Alta":
                 complejidad_score = 70
@@ -1458,8 +1503,7 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
     def _calcular_paginas_estimadas(self, obj):
         """Calcula el número estimado de páginas"""
         try:
-            datos_str = json.dumps(obj.datos) if obj.datos else "{}"
-            caracteres = len(datos_str)
+            caracteres = obj.bytes_datos
 
             # Estimar páginas basado en caracteres (aprox 2000 caracteres por página)
             paginas = max(1, caracteres // 2000)
@@ -1558,8 +1602,7 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
 
         # Insight sobre tamaño
         try:
-            datos_str = json.dumps(obj.datos) if obj.datos else "{}"
-            tamaño_kb = len(datos_str.encode("utf-8")) / 1024
+            tamaño_kb = obj.bytes_datos / 1024
 
             if tamaño_kb > 1024:  # > 1MB
                 insights.append(
@@ -1617,8 +1660,7 @@ class ReporteDataAdmin(BaseAnalyticsAdmin):
 
         # Recomendación de optimización de tamaño
         try:
-            datos_str = json.dumps(obj.datos) if obj.datos else "{}"
-            tamaño_kb = len(datos_str.encode("utf-8")) / 1024
+            tamaño_kb = obj.bytes_datos / 1024
 
             if tamaño_kb > 500:  # > 500KB
                 recomendaciones.append(
@@ -17,7 +17,7 @@ class DashboardEjecutivoController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de resumen ejecutivo
         self.obtener_dashboard_data_use_case = (
@@ -20,7 +20,7 @@ class DashboardTendenciasController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de tendencias
         self.obtener_dashboard_data_use_case = (
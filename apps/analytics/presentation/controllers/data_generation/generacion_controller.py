@@ -17,7 +17,7 @@ class DataGenerationController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de generación de datos
         self.generar_datos_mockaroo_use_case = (
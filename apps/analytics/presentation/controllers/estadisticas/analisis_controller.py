@@ -17,7 +17,7 @@ class EstadisticasAnalisisController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de análisis de estadísticas
         self.obtener_estadisticas_marcas_use_case = (
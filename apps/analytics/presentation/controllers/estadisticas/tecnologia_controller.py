@@ -17,7 +17,7 @@ class EstadisticasTecnologiaController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de tecnología
         self.obtener_estadisticas_logos_use_case = (
@@ -37,21 +37,42 @@ def rendimiento_modelos_ia(request):
     try:
         controller = EstadisticasTecnologiaController()
 
-        # Obtener parámetros
-        año = int(request.query_params.get("año", 0))
-
-        # Ejecutar use case para obtener rendimiento de IA
-        rendimiento = controller.obtener_estadisticas_logos_use_case.execute(
-            {"tipo": "rendimiento_ia", "año": año, "incluir_analisis": True}
+        # Ejecutar use case para obtener rendimiento por modelo (con p50/p90/p99)
+        modelos = controller.obtener_estadisticas_logos_use_case.execute(
+            {"tipo": "rendimiento_modelos"}
         )
 
+        tendencias_ia = {
+            modelo["modelo_ia_usado"]: {
+                "total_generados": modelo["total_generados"],
+                "tasa_exito": round(modelo["tasa_exito"], 2),
+                "latencia_p50": modelo["latencia_p50"],
+                "latencia_p90": modelo["latencia_p90"],
+                "latencia_p99": modelo["latencia_p99"],
+                "tasa_reutilizacion": round(modelo["tasa_reutilizacion"], 2),
+            }
+            for modelo in modelos
+        }
+
+        recomendaciones_ia = []
+        if modelos:
+            mas_confiable = max(modelos, key=lambda x: x["tasa_exito"])
+            recomendaciones_ia.append(
+                f"Mayor tasa de éxito: {mas_confiable['modelo_ia_usado']} "
+                f"({mas_confiable['tasa_exito']:.1f}%)"
+            )
+            con_latencia = [m for m in modelos if m["latencia_p90"] is not None]
+            if con_latencia:
+                mas_rapido = min(con_latencia, key=lambda x: x["latencia_p90"])
+                recomendaciones_ia.append(
+                    f"Menor p90 de latencia: {mas_rapido['modelo_ia_usado']} "
+                    f"({mas_rapido['latencia_p90']}s)"
+                )
+
         return Response(
             {
-                "año": año,
-                "tendencias_ia": rendimiento.tendencias_ia,
-                "recomendaciones_ia": rendimiento.recomendaciones_ia,
-                "correlaciones_marca_logo": rendimiento.correlaciones_marca_logo,
-                "analisis_tamaño_operacion": rendimiento.analisis_tamaño_operacion,
+                "tendencias_ia": tendencias_ia,
+                "recomendaciones_ia": recomendaciones_ia,
             }
         )
 
@@ -84,12 +105,17 @@ def analisis_eficiencia(request):
         return Response(
             {
                 "periodo_analisis": f"{periodo_dias} días",
-                "metricas_eficiencia": eficiencia.metricas_eficiencia,
-                "tendencias_rendimiento": eficiencia.tendencias_rendimiento,
-                "optimizaciones_recomendadas": eficiencia.optimizaciones_recomendadas,
+                "periodo": eficiencia["periodo"],
+                "metricas_eficiencia": eficiencia["metricas_eficiencia"],
+                "tendencias_rendimiento": eficiencia["tendencias_rendimiento"],
+                "optimizaciones_recomendadas": eficiencia[
+                    "optimizaciones_recomendadas"
+                ],
             }
         )
 
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {"error": f"Error al obtener análisis de eficiencia: {str(e)}"},
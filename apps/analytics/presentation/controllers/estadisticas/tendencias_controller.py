@@ -17,7 +17,7 @@ class EstadisticasTendenciasController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de tendencias
         self.calcular_tendencias_departamento_use_case = (
@@ -14,6 +14,8 @@ from .crud_controller import (
 from .actividad_controller import (
     actividad_reciente,
     auditoria_usuario,
+    feed_actividad,
+    stream_actividad,
 )
 
 # Patrones Controllers
@@ -37,6 +39,8 @@ __all__ = [
     # Actividad
     "actividad_reciente",
     "auditoria_usuario",
+    "feed_actividad",
+    "stream_actividad",
     # Patrones
     "patrones_cambio_estado",
     "analisis_flujos_estado",
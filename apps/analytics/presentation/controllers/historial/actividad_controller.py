@@ -3,9 +3,19 @@ Controller para análisis de actividad reciente del historial
 Responsabilidad única: Análisis de actividad temporal
 """
 
+import json
+import time
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import (
+    api_view,
+    permission_classes,
+    renderer_classes,
+)
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BaseRenderer, JSONRenderer
 from rest_framework.response import Response
 from typing import Dict, Any
 
@@ -20,12 +30,26 @@ class HistorialActividadController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de actividad
         self.obtener_actividad_reciente_use_case = (
             self.container.get_obtener_actividad_reciente_use_case()
         )
+        self.obtener_feed_actividad_use_case = (
+            self.container.get_obtener_feed_actividad_use_case()
+        )
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Permite negociar text/event-stream (Accept de EventSource)"""
+
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data, default=str).encode(self.charset)
 
 
 # ============================================================================
@@ -130,3 +154,113 @@ def auditoria_usuario(request):
             {"error": f"Error al obtener auditoría de usuario: {str(e)}"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
+
+
+# ============================================================================
+# FEED DE ACTIVIDAD (MARCA DE AGUA)
+# ============================================================================
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def feed_actividad(request):
+    """
+    Eventos de historial y marcas posteriores a `since_id`
+
+    Sin `since_id` devuelve los últimos eventos y la marca de agua actual. Con
+    `espera` (segundos) la petición queda abierta hasta que haya eventos nuevos
+    (long-poll).
+    """
+    try:
+        controller = HistorialActividadController()
+
+        feed = controller.obtener_feed_actividad_use_case.execute(
+            {
+                "desde_secuencia": request.query_params.get("since_id"),
+                "limite": request.query_params.get("limite", 100),
+                "espera_segundos": request.query_params.get("espera", 0),
+            }
+        )
+
+        return Response(
+            {
+                "eventos": feed["eventos"],
+                "total": len(feed["eventos"]),
+                "since_id": feed["marca_agua"],
+                "hay_mas": feed["hay_mas"],
+            }
+        )
+
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {"error": f"Error al obtener feed de actividad: {str(e)}"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@renderer_classes([JSONRenderer, EventStreamRenderer])
+def stream_actividad(request):
+    """
+    Server-Sent Events con los eventos de historial y marcas
+
+    Reanuda desde la cabecera Last-Event-ID (o `since_id`). La conexión se cierra
+    tras ACTIVIDAD_STREAM_DURACION_SEGUNDOS y EventSource reconecta solo.
+    """
+    try:
+        controller = HistorialActividadController()
+        use_case = controller.obtener_feed_actividad_use_case
+
+        desde = request.headers.get("Last-Event-ID") or request.query_params.get(
+            "since_id"
+        )
+        # Sin marca de agua el stream empieza en el último evento registrado
+        if desde in (None, ""):
+            marca_agua = use_case.execute({"limite": 1})["marca_agua"]
+        elif not desde.isdigit():
+            raise ValueError("since_id debe ser un entero no negativo")
+        else:
+            marca_agua = int(desde)
+
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {"error": f"Error al abrir stream de actividad: {str(e)}"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    duracion = getattr(settings, "ACTIVIDAD_STREAM_DURACION_SEGUNDOS", 300)
+    espera = getattr(settings, "ACTIVIDAD_STREAM_LATIDO_SEGUNDOS", 15)
+
+    def eventos_sse(marca_agua: int):
+        fin = time.monotonic() + duracion
+        yield "retry: 3000\n\n"
+        while time.monotonic() < fin:
+            feed = use_case.execute(
+                {
+                    "desde_secuencia": marca_agua,
+                    "limite": 100,
+                    "espera_segundos": min(espera, max(fin - time.monotonic(), 0)),
+                }
+            )
+            for evento in feed["eventos"]:
+                yield (
+                    f"id: {evento['secuencia']}\n"
+                    f"event: {evento['entidad']}\n"
+                    f"data: {json.dumps(evento, default=str)}\n\n"
+                )
+            if not feed["eventos"]:
+                # Latido para que proxies y navegador no cierren la conexión
+                yield ": ping\n\n"
+            marca_agua = feed["marca_agua"]
+
+    response = StreamingHttpResponse(
+        eventos_sse(marca_agua), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -21,7 +21,7 @@ class HistorialCRUDController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de CRUD
         self.obtener_historial_use_case = (
@@ -17,7 +17,7 @@ class HistorialEficienciaController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de eficiencia
         self.obtener_eficiencia_evaluadores_use_case = (
@@ -52,14 +52,18 @@ def eficiencia_evaluadores(request):
         return Response(
             {
                 "periodo_analisis": f"{dias} días",
-                "estadisticas_evaluadores": eficiencia.estadisticas_evaluadores,
-                "ranking_eficiencia": eficiencia.ranking_eficiencia,
-                "metricas_sistema": eficiencia.metricas_sistema,
-                "analisis_comparativo": eficiencia.analisis_comparativo,
-                "recomendaciones": eficiencia.recomendaciones,
+                "periodo": eficiencia["periodo"],
+                "estadisticas_evaluadores": eficiencia["estadisticas_evaluadores"],
+                "ranking_eficiencia": eficiencia["ranking_eficiencia"],
+                "metricas_sistema": eficiencia["metricas_sistema"],
+                "analisis_comparativo": eficiencia["analisis_comparativo"],
+                "recomendaciones": eficiencia["recomendaciones"],
+                "metadata": eficiencia["metadata"],
             }
         )
 
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {"error": f"Error al obtener eficiencia de evaluadores: {str(e)}"},
@@ -91,15 +95,19 @@ def evaluador_detalle(request, evaluador_id: str):
             {
                 "evaluador": evaluador_id,
                 "periodo_analisis": f"{dias} días",
-                "metricas_personales": detalle.metricas_personales,
-                "tendencia_rendimiento": detalle.tendencia_rendimiento,
-                "patrones_trabajo": detalle.patrones_trabajo,
-                "casos_destacados": detalle.casos_destacados,
-                "areas_mejora": detalle.areas_mejora,
-                "recomendaciones_personalizadas": detalle.recomendaciones_personalizadas,
+                "metricas_personales": detalle["metricas_personales"],
+                "tendencia_rendimiento": detalle["tendencia_rendimiento"],
+                "patrones_trabajo": detalle["patrones_trabajo"],
+                "casos_destacados": detalle["casos_destacados"],
+                "areas_mejora": detalle["areas_mejora"],
+                "recomendaciones_personalizadas": detalle[
+                    "recomendaciones_personalizadas"
+                ],
             }
         )
 
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
         return Response(
             {"error": f"Error al obtener detalle del evaluador: {str(e)}"},
@@ -131,14 +139,16 @@ def comparativa_evaluadores(request):
         return Response(
             {
                 "periodo_analisis": f"{dias} días",
-                "evaluadores_comparados": comparativa.evaluadores_comparados,
-                "metricas_comparativas": comparativa.metricas_comparativas,
-                "diferencias_clave": comparativa.diferencias_clave,
-                "mejores_practicas": comparativa.mejores_practicas,
-                "oportunidades_mejora": comparativa.oportunidades_mejora,
+                "evaluadores_comparados": comparativa["evaluadores_comparados"],
+                "metricas_comparativas": comparativa["metricas_comparativas"],
+                "diferencias_clave": comparativa["diferencias_clave"],
+                "mejores_practicas": comparativa["mejores_practicas"],
+                "oportunidades_mejora": comparativa["oportunidades_mejora"],
             }
         )
 
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {"error": f"Error al obtener comparativa de evaluadores: {str(e)}"},
@@ -17,7 +17,7 @@ class HistorialPatronesController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de patrones
         self.obtener_patrones_cambio_use_case = (
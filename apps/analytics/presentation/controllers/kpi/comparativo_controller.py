@@ -20,7 +20,7 @@ class KpiComparativoController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de análisis comparativo
         self.obtener_kpis_use_case = self.container.get_obtener_kpis_use_case()
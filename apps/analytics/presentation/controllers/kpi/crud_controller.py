@@ -21,7 +21,7 @@ class KpiCRUDController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de CRUD
         self.obtener_kpis_use_case = self.container.get_obtener_kpis_use_case()
@@ -21,7 +21,7 @@ class KpiEstacionalController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de análisis estacional
         self.obtener_kpis_use_case = self.container.get_obtener_kpis_use_case()
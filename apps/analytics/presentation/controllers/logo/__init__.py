@@ -34,6 +34,9 @@ from .generacion_controller import (
     generar_logos_masivo,
 )
 
+# Imagen Controllers
+from .imagen_controller import imagen_logo
+
 __all__ = [
     # CRUD
     "listar_logos",
@@ -51,4 +54,6 @@ __all__ = [
     # Generación
     "regenerar_logo",
     "generar_logos_masivo",
+    # Imágenes
+    "imagen_logo",
 ]
@@ -20,7 +20,7 @@ class LogoCalidadController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de calidad
         self.listar_logos_use_case = self.container.get_listar_logos_use_case()
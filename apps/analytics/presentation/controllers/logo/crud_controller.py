@@ -21,7 +21,7 @@ class LogoCRUDController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de CRUD
         self.generar_logo_use_case = self.container.get_generar_logo_use_case()
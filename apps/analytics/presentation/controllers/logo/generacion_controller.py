@@ -8,11 +8,13 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from typing import Dict, Any
+import math
 
 from apps.analytics.presentation.serializers.logo_serializers import (
     LogoMarcaBovinaSerializer,
 )
 from apps.analytics.infrastructure.container.main_container import Container
+from apps.analytics.infrastructure.ia import LimiteTasaIAExcedido
 
 
 class LogoGeneracionController:
@@ -20,11 +22,15 @@ class LogoGeneracionController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de generación
         self.generar_logo_use_case = self.container.get_generar_logo_use_case()
         self.obtener_logo_use_case = self.container.get_obtener_logo_use_case()
+        self.generar_logos_masivo_use_case = (
+            self.container.get_generar_logos_masivo_use_case()
+        )
+        self.regenerar_logo_use_case = self.container.get_regenerar_logo_use_case()
 
 
 # ============================================================================
@@ -35,42 +41,27 @@ class LogoGeneracionController:
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def regenerar_logo(request, logo_id: int):
-    """Regenerar un logo específico"""
+    """Regenerar un logo específico (sin el cache de prompts salvo usar_cache)"""
     try:
         controller = LogoGeneracionController()
 
-        # Obtener logo original
-        logo_original = controller.obtener_logo_use_case.execute(logo_id)
+        # Ejecutar use case
+        regeneracion = controller.regenerar_logo_use_case.execute(
+            {
+                "logo_id": logo_id,
+                "modelo_ia": request.data.get("modelo_ia"),
+                "prompt": request.data.get("prompt_personalizado"),
+                "usar_cache": request.data.get("usar_cache", False),
+            }
+        )
 
-        if not logo_original:
+        if not regeneracion:
             return Response(
                 {"error": "Logo no encontrado"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        # Verificar que el logo anterior haya fallado
-        if logo_original.exito:
-            return Response(
-                {"error": "Solo se pueden regenerar logos que fallaron"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Parámetros para regeneración
-        nuevo_modelo = request.data.get("modelo_ia", logo_original.modelo_ia_usado)
-        nuevo_prompt = request.data.get("prompt_personalizado")
-
-        # Preparar datos para regeneración
-        data = {
-            "marca_id": logo_original.marca.id,
-            "modelo_ia": nuevo_modelo,
-            "prompt_personalizado": nuevo_prompt,
-            "es_regeneracion": True,
-            "logo_original_id": logo_id,
-        }
-
-        # Ejecutar use case
-        nuevo_logo = controller.generar_logo_use_case.execute(data)
-
         # Serializar respuesta
+        nuevo_logo = regeneracion["logo_nuevo"]
         serializer = LogoMarcaBovinaSerializer()
         data = serializer.to_representation(nuevo_logo)
 
@@ -83,10 +74,15 @@ def regenerar_logo(request, logo_id: int):
                 ),
                 "logo_original": logo_id,
                 "logo_nuevo": data,
-                "mejora": nuevo_logo.exito and not logo_original.exito,
+                "mejora": nuevo_logo.exito,
+                "metadata": regeneracion["metadata"],
             }
         )
 
+    except LimiteTasaIAExcedido as e:
+        return _respuesta_limite_tasa(e)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {"error": f"Error regenerando logo: {str(e)}"},
@@ -101,42 +97,48 @@ def generar_logos_masivo(request):
     try:
         controller = LogoGeneracionController()
 
-        modelo_preferido = request.data.get("modelo_ia", "DALL-E-3")
-        limite_marcas = request.data.get("limite", 10)
-
         # Preparar datos para generación masiva
         data = {
-            "modelo_ia": modelo_preferido,
-            "limite_marcas": limite_marcas,
-            "es_generacion_masiva": True,
+            "modelo_ia": request.data.get("modelo_ia", "DALL-E-3"),
+            "limite_marcas": request.data.get("limite", 10),
+            "departamento": request.data.get("departamento"),
+            "estilo": request.data.get("estilo", 0),
+            "usar_cache": request.data.get("usar_cache", True),
         }
 
         # Ejecutar use case
-        resultados = controller.generar_logo_use_case.execute(data)
+        generacion = controller.generar_logos_masivo_use_case.execute(data)
+        resultados = generacion["resultados"]
 
         return Response(
             {
                 "mensaje": f"Generación masiva completada: {len(resultados)} logos procesados",
                 "resultados": resultados,
-                "estadisticas": {
-                    "total_procesadas": len(resultados),
-                    "exitosos": len([r for r in resultados if r["exito"]]),
-                    "fallidos": len([r for r in resultados if not r["exito"]]),
-                    "tiempo_promedio": (
-                        round(
-                            sum(r["tiempo_generacion"] for r in resultados)
-                            / len(resultados),
-                            2,
-                        )
-                        if resultados
-                        else 0
-                    ),
-                },
+                "estadisticas": generacion["estadisticas"],
+                "metadata": generacion["metadata"],
             }
         )
 
+    except LimiteTasaIAExcedido as e:
+        return _respuesta_limite_tasa(e)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {"error": f"Error en generación masiva: {str(e)}"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
+
+
+def _respuesta_limite_tasa(error: LimiteTasaIAExcedido) -> Response:
+    """429 con Retry-After: la cola del limitador de IA está llena"""
+    reintentar_en = math.ceil(error.reintentar_en)
+    return Response(
+        {
+            "error": str(error),
+            "modelo_ia": error.modelo.value,
+            "reintentar_en_segundos": reintentar_en,
+        },
+        status=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={"Retry-After": str(reintentar_en)},
+    )
@@ -0,0 +1,169 @@
+"""
+Controller para imágenes locales de logos
+Responsabilidad única: Servir originales y miniaturas del almacén con ETag y
+peticiones parciales (Range)
+"""
+
+import json
+import re
+
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from rest_framework import status
+from rest_framework.decorators import (
+    api_view,
+    permission_classes,
+    renderer_classes,
+)
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.response import Response
+
+from apps.analytics.infrastructure.container.main_container import Container
+
+PATRON_RANGO = re.compile(r"^bytes=(\d*)-(\d*)$")
+TAMAÑO_BLOQUE = 64 * 1024
+# La URL lleva la huella del contenido: la respuesta no cambia nunca
+CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+class ImagenRenderer(BaseRenderer):
+    """
+    Permite negociar image/* (Accept de las etiquetas <img>); las imágenes se
+    entregan con FileResponse, así que solo renderiza los errores (en JSON)
+    """
+
+    media_type = "image/*"
+    format = "imagen"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data).encode("utf-8")
+
+
+class LogoImagenController:
+    """Controller para imágenes locales de logos"""
+
+    def __init__(self):
+        """Inicializa el controller con inyección de dependencias"""
+        self.container = Container.instancia()
+
+        # Use cases de imágenes
+        self.obtener_imagen_logo_use_case = (
+            self.container.get_obtener_imagen_logo_use_case()
+        )
+
+
+# ============================================================================
+# ENDPOINTS DE IMÁGENES
+# ============================================================================
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@renderer_classes([JSONRenderer, ImagenRenderer])
+def imagen_logo(request, huella_imagen: str, tamaño: int = None):
+    """Imagen original (sin tamaño) o miniatura de `tamaño` píxeles"""
+    try:
+        controller = LogoImagenController()
+
+        imagen = controller.obtener_imagen_logo_use_case.execute(huella_imagen, tamaño)
+        if not imagen:
+            return _error(
+                "Imagen no encontrada en el almacén local", status.HTTP_404_NOT_FOUND
+            )
+
+        if _coincide_etag(request.headers.get("If-None-Match"), imagen["etag"]):
+            respuesta = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+            del respuesta["Content-Type"]
+            return _con_cabeceras(respuesta, imagen)
+
+        total = imagen["tamaño_bytes"]
+        rango = request.headers.get("Range")
+        if_range = request.headers.get("If-Range")
+        if rango and (not if_range or if_range == imagen["etag"]):
+            limites = _parsear_rango(rango, total)
+            if limites is False:
+                respuesta = HttpResponse(
+                    status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+                )
+                respuesta["Content-Range"] = f"bytes */{total}"
+                return _con_cabeceras(respuesta, imagen)
+            if limites:
+                inicio, fin = limites
+                respuesta = StreamingHttpResponse(
+                    _leer_bloques(imagen["ruta"], inicio, fin - inicio + 1),
+                    status=status.HTTP_206_PARTIAL_CONTENT,
+                    content_type=imagen["content_type"],
+                )
+                respuesta["Content-Length"] = str(fin - inicio + 1)
+                respuesta["Content-Range"] = f"bytes {inicio}-{fin}/{total}"
+                return _con_cabeceras(respuesta, imagen)
+
+        return _con_cabeceras(
+            FileResponse(
+                open(imagen["ruta"], "rb"), content_type=imagen["content_type"]
+            ),
+            imagen,
+        )
+
+    except ValueError as e:
+        return _error(str(e), status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return _error(
+            f"Error obteniendo imagen: {str(e)}",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+def _error(mensaje: str, estado: int) -> Response:
+    return Response({"error": mensaje}, status=estado, content_type="application/json")
+
+
+def _con_cabeceras(respuesta, imagen):
+    respuesta["ETag"] = imagen["etag"]
+    respuesta["Cache-Control"] = CACHE_CONTROL
+    respuesta["Accept-Ranges"] = "bytes"
+    return respuesta
+
+
+def _coincide_etag(cabecera, etag: str) -> bool:
+    if not cabecera:
+        return False
+    etiquetas = [e.strip().removeprefix("W/") for e in cabecera.split(",")]
+    return "*" in etiquetas or etag in etiquetas
+
+
+def _parsear_rango(cabecera: str, total: int):
+    """
+    Un único rango de bytes -> (inicio, fin) inclusivo
+
+    Retorna None si la cabecera no se entiende o pide varios rangos (se responde
+    el archivo completo, como permite la RFC 9110) y False si no es satisfacible.
+    """
+    coincidencia = PATRON_RANGO.match(cabecera.strip())
+    if not coincidencia or coincidencia.groups() == ("", ""):
+        return None
+    desde, hasta = coincidencia.groups()
+    if desde == "":
+        # Sufijo: los últimos N bytes
+        largo = int(hasta)
+        if largo == 0:
+            return False
+        return max(total - largo, 0), total - 1
+    inicio = int(desde)
+    fin = min(int(hasta), total - 1) if hasta else total - 1
+    if inicio >= total or fin < inicio:
+        return False
+    return inicio, fin
+
+
+def _leer_bloques(ruta, inicio: int, largo: int):
+    with open(ruta, "rb") as archivo:
+        archivo.seek(inicio)
+        while largo > 0:
+            bloque = archivo.read(min(TAMAÑO_BLOQUE, largo))
+            if not bloque:
+                break
+            largo -= len(bloque)
+            yield bloque
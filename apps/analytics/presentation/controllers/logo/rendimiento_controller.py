@@ -9,10 +9,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from typing import Dict, Any
 
-from apps.analytics.presentation.serializers.estadisticas_serializers import (
-    RendimientoModelosIASerializer,
-)
 from apps.analytics.infrastructure.container.main_container import Container
+from apps.analytics.infrastructure.ia import CachePromptsIA, LimitadorTasaIA
 
 
 class LogoRendimientoController:
@@ -20,7 +18,7 @@ class LogoRendimientoController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de rendimiento
         self.obtener_estadisticas_logos_use_case = (
@@ -66,12 +64,14 @@ def rendimiento_modelos_ia(request):
             modelo["tiempo_promedio_formateado"] = (
                 f"{modelo['tiempo_promedio_generacion']:.1f}s"
             )
+            modelo["latencia_p90_formateada"] = (
+                f"{modelo['latencia_p90']:.1f}s"
+                if modelo["latencia_p90"] is not None
+                else None
+            )
+            modelo["tasa_reutilizacion"] = round(modelo["tasa_reutilizacion"], 2)
             modelo["modelo_display"] = modelo["modelo_ia_usado"]
 
-        # Serializar respuesta
-        serializer = RendimientoModelosIASerializer()
-        data = [serializer.to_representation(modelo) for modelo in modelos_stats]
-
         # Ranking de modelos
         ranking = sorted(
             modelos_stats,
@@ -81,7 +81,7 @@ def rendimiento_modelos_ia(request):
 
         return Response(
             {
-                "modelos_rendimiento": data,
+                "modelos_rendimiento": modelos_stats,
                 "ranking_modelos": [
                     {
                         "posicion": idx + 1,
@@ -97,6 +97,10 @@ def rendimiento_modelos_ia(request):
                 "recomendacion_modelo": (
                     ranking[0]["modelo_ia_usado"] if ranking else None
                 ),
+                # Aciertos del cache de prompts en este proceso
+                "cache_prompts": CachePromptsIA.estadisticas(),
+                # Esperas y rechazos del limitador de tasa (cola compartida)
+                "limite_tasa_ia": LimitadorTasaIA.estadisticas(),
             }
         )
 
@@ -116,11 +120,18 @@ def analisis_prompts(request):
 
         # Ejecutar use case para obtener análisis de prompts
         analisis = controller.obtener_estadisticas_logos_use_case.execute(
-            {"tipo": "analisis_prompts"}
+            {
+                "tipo": "analisis_prompts",
+                "min_soporte": request.query_params.get("min_soporte", 20),
+                "limite": request.query_params.get("limite", 20),
+                "termino": request.query_params.get("termino"),
+            }
         )
 
         return Response(analisis)
 
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {"error": f"Error al obtener análisis de prompts: {str(e)}"},
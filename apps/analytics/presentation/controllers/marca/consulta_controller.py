@@ -20,7 +20,7 @@ class MarcaConsultaController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de consulta
         self.listar_marcas_use_case = self.container.get_listar_marcas_use_case()
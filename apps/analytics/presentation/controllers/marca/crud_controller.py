@@ -23,7 +23,7 @@ class MarcaCRUDController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de CRUD
         self.crear_marca_use_case = self.container.get_crear_marca_use_case()
@@ -21,7 +21,7 @@ class MarcaEstadisticasController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de estadísticas
         self.obtener_estadisticas_marcas_use_case = (
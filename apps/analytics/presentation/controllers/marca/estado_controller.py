@@ -22,7 +22,7 @@ class MarcaEstadoController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de estado
         self.cambiar_estado_marca_use_case = (
@@ -20,7 +20,7 @@ class MarcaProcesamientoController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de procesamiento
         self.cambiar_estado_marca_use_case = (
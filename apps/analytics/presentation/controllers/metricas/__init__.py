@@ -0,0 +1,7 @@
+"""
+Controllers de métricas operativas (Prometheus)
+"""
+
+from .metricas_controller import metricas_prometheus
+
+__all__ = ["metricas_prometheus"]
@@ -0,0 +1,32 @@
+"""
+Controller del endpoint /metrics
+Responsabilidad única: Exponer las métricas por endpoint en formato Prometheus
+"""
+
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from apps.analytics.infrastructure.metricas import MetricasEndpoints
+
+TIPO_CONTENIDO_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@require_GET
+def metricas_prometheus(request):
+    """
+    Histogramas por ruta para el scraper de Prometheus. Con METRICAS_TOKEN
+    configurado exige "Authorization: Bearer <token>"
+    """
+    token = getattr(settings, "METRICAS_TOKEN", "")
+    if token:
+        recibido = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(recibido.encode(), f"Bearer {token}".encode()):
+            return HttpResponse(
+                "No autorizado\n", status=401, content_type="text/plain"
+            )
+    return HttpResponse(
+        MetricasEndpoints.texto_prometheus(), content_type=TIPO_CONTENIDO_PROMETHEUS
+    )
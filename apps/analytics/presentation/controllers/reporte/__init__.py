@@ -30,6 +30,15 @@ from .especializado_controller import (
     reporte_sostenibilidad_sectorial,
 )
 
+# Jobs Controllers
+from .jobs_controller import (
+    encolar_reporte_job,
+    obtener_reporte_job,
+)
+
+# PDF Controllers
+from .pdf_controller import descargar_reporte_pdf
+
 __all__ = [
     # Ejecutivo
     "reporte_ejecutivo_mensual",
@@ -46,4 +55,9 @@ __all__ = [
     "reporte_impacto_economico",
     "reporte_innovacion_tecnologica",
     "reporte_sostenibilidad_sectorial",
+    # Jobs
+    "encolar_reporte_job",
+    "obtener_reporte_job",
+    # PDF
+    "descargar_reporte_pdf",
 ]
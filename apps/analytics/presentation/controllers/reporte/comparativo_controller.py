@@ -17,7 +17,7 @@ class ReporteComparativoController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de reportes comparativos
         self.generar_reporte_comparativo_departamentos_use_case = (
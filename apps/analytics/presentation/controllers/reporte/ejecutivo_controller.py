@@ -17,7 +17,7 @@ class ReporteEjecutivoController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de reportes ejecutivos
         self.generar_reporte_mensual_use_case = (
@@ -17,7 +17,7 @@ class ReporteEspecializadoController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
         # Use cases de reportes especializados
         self.generar_reporte_productor_use_case = (
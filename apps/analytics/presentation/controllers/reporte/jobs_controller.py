@@ -0,0 +1,101 @@
+"""
+Controller para trabajos asíncronos de reportes
+Responsabilidad única: Encolar reportes pesados y consultar su estado
+"""
+
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.analytics.infrastructure.container.main_container import Container
+
+
+class ReporteJobsController:
+    """Controller para trabajos asíncronos de reportes"""
+
+    def __init__(self):
+        """Inicializa el controller con inyección de dependencias"""
+        self.container = Container.instancia()
+
+        # Use cases de trabajos de reportes
+        self.encolar_reporte_job_use_case = (
+            self.container.get_encolar_reporte_job_use_case()
+        )
+        self.obtener_reporte_job_use_case = (
+            self.container.get_obtener_reporte_job_use_case()
+        )
+
+
+# ============================================================================
+# ENDPOINTS DE TRABAJOS DE REPORTES
+# ============================================================================
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def encolar_reporte_job(request):
+    """Encola la generación de un reporte y retorna el ID del trabajo"""
+    try:
+        controller = ReporteJobsController()
+
+        tipo_reporte = request.data.get("tipo_reporte")
+        parametros = request.data.get("parametros", {})
+
+        if not tipo_reporte:
+            return Response(
+                {"error": "Parámetro tipo_reporte es requerido"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if not isinstance(parametros, dict):
+            return Response(
+                {"error": "parametros debe ser un objeto"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        job, creado = controller.encolar_reporte_job_use_case.execute(
+            tipo_reporte=tipo_reporte,
+            parametros=parametros,
+            usuario_solicitante=str(request.user) if request.user else None,
+        )
+
+        return Response(
+            {
+                "job_id": job.id,
+                "estado": job.estado.value,
+                "progreso": job.progreso,
+                "duplicado": not creado,
+                "url_estado": f"{request.path.rstrip('/')}/{job.id}/",
+            },
+            status=status.HTTP_202_ACCEPTED if creado else status.HTTP_200_OK,
+        )
+
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {"error": f"Error encolando reporte: {str(e)}"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def obtener_reporte_job(request, job_id):
+    """Obtiene estado, progreso y resultado de un trabajo de reporte"""
+    try:
+        controller = ReporteJobsController()
+
+        return Response(
+            controller.obtener_reporte_job_use_case.execute(job_id),
+            status=status.HTTP_200_OK,
+        )
+
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response(
+            {"error": f"Error obteniendo trabajo de reporte: {str(e)}"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
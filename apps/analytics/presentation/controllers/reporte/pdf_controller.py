@@ -0,0 +1,70 @@
+"""
+Controller para descarga de reportes en PDF
+Responsabilidad única: Entregar PDFs ya renderizados o encolar su renderizado
+"""
+
+from django.http import FileResponse
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.analytics.infrastructure.container.main_container import Container
+
+
+class ReportePdfController:
+    """Controller para descarga de reportes en PDF"""
+
+    def __init__(self):
+        """Inicializa el controller con inyección de dependencias"""
+        self.container = Container.instancia()
+
+        # Use cases de PDF
+        self.obtener_reporte_pdf_use_case = (
+            self.container.get_obtener_reporte_pdf_use_case()
+        )
+
+
+# ============================================================================
+# ENDPOINTS DE PDF
+# ============================================================================
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def descargar_reporte_pdf(request, reporte_id):
+    """Descarga el PDF de un reporte; si aún no existe responde 202 con el trabajo"""
+    try:
+        controller = ReportePdfController()
+
+        resultado = controller.obtener_reporte_pdf_use_case.execute(
+            reporte_id, usuario_solicitante=str(request.user)
+        )
+
+        if not resultado["listo"]:
+            return Response(
+                {
+                    **resultado,
+                    "url_estado": reverse(
+                        "analytics:reporte:obtener_reporte_job",
+                        args=[resultado["job_id"]],
+                    ),
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        return FileResponse(
+            open(resultado["ruta_archivo"], "rb"),
+            as_attachment=True,
+            filename=resultado["nombre_archivo"],
+            content_type=resultado["content_type"],
+        )
+
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response(
+            {"error": f"Error obteniendo PDF: {str(e)}"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
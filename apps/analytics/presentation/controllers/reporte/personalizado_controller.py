@@ -3,6 +3,9 @@ Controller para reportes personalizados
 Responsabilidad única: Reportes configurables y avanzados
 """
 
+from datetime import date
+
+from django.http import FileResponse
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
@@ -10,6 +13,10 @@ from rest_framework.response import Response
 from typing import Dict, Any
 
 from apps.analytics.infrastructure.container.main_container import Container
+from apps.analytics.infrastructure.exporters import (
+    ArchivoExportacionTemporal,
+    ExcelReporteExporter,
+)
 
 
 class ReportePersonalizadoController:
@@ -17,15 +24,21 @@ class ReportePersonalizadoController:
 
     def __init__(self):
         """Inicializa el controller con inyección de dependencias"""
-        self.container = Container()
+        self.container = Container.instancia()
 
-        # Use cases de reportes personalizados
-        self.generar_reporte_personalizado_use_case = (
-            self.container.get_generar_reporte_personalizado_use_case()
-        )
-        self.exportar_reporte_excel_use_case = (
-            self.container.get_exportar_reporte_excel_use_case()
-        )
+    # Cada endpoint resuelve solo su use case: el reporte compilado no depende
+    # de los repositorios que usan la generación avanzada ni la exportación
+    @property
+    def generar_reporte_personalizado_use_case(self):
+        return self.container.get_generar_reporte_personalizado_use_case()
+
+    @property
+    def consultar_reporte_personalizado_use_case(self):
+        return self.container.get_consultar_reporte_personalizado_use_case()
+
+    @property
+    def exportar_reporte_excel_use_case(self):
+        return self.container.get_exportar_reporte_excel_use_case()
 
 
 # ============================================================================
@@ -51,42 +64,38 @@ def reporte_personalizado(request):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Ejecutar use case para generar reporte personalizado
-        reporte = controller.generar_reporte_personalizado_use_case.execute(
-            {
-                "filtros": filtros,
-                "metricas": metricas,
-                "agrupaciones": agrupaciones,
-                "incluir_graficos": request.data.get("incluir_graficos", True),
-                "incluir_resumen": request.data.get("incluir_resumen", True),
-            }
+        # Ejecutar use case: una única consulta GROUP BY sobre la lista blanca
+        reporte = controller.consultar_reporte_personalizado_use_case.execute(
+            filtros=filtros,
+            metricas=metricas,
+            agrupaciones=agrupaciones,
+            orden=request.data.get("orden"),
+            limite=request.data.get("limite"),
         )
 
         return Response(
             {
                 "mensaje": "Reporte personalizado generado exitosamente",
+                "periodo": reporte.periodo,
                 "reporte": {
-                    "datos_principales": reporte.datos_principales,
-                    "resumen_estadistico": reporte.resumen_estadistico,
-                    "analisis_departamental": reporte.analisis_departamental,
-                    "analisis_razas": reporte.analisis_razas,
-                    "graficos": reporte.graficos,
-                    "insights": reporte.insights,
+                    "columnas": reporte.datos["columnas"],
+                    "filas": reporte.datos["filas"],
+                    "total_filas": reporte.datos["total_filas"],
+                    "truncado": reporte.datos["truncado"],
                 },
                 "configuracion": {
-                    "filtros_aplicados": reporte.filtros_aplicados,
-                    "metricas_incluidas": reporte.metricas_incluidas,
-                    "agrupaciones_utilizadas": reporte.agrupaciones_utilizadas,
-                },
-                "metadata": {
-                    "fecha_generacion": reporte.fecha_generacion,
-                    "tiempo_procesamiento": reporte.tiempo_procesamiento,
-                    "registros_procesados": reporte.registros_procesados,
+                    "filtros_aplicados": filtros,
+                    "metricas_incluidas": metricas,
+                    "agrupaciones_utilizadas": agrupaciones,
+                    "limite": reporte.datos["limite"],
                 },
+                "metadata": reporte.datos["metadata"],
             },
             status=status.HTTP_201_CREATED,
         )
 
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response(
             {"error": f"Error al generar reporte personalizado: {str(e)}"},
@@ -158,49 +167,56 @@ def generar_reporte_personalizado_avanzado(request):
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def exportar_excel(request):
-    """Exporta reporte a formato Excel"""
+    """Exporta los datos del periodo a Excel como descarga en streaming"""
     try:
         controller = ReportePersonalizadoController()
 
         # Obtener parámetros
-        reporte_id = request.query_params.get("reporte_id")
-        formato = request.query_params.get("formato", "excel")
+        fecha_inicio = request.query_params.get("fecha_inicio")
+        fecha_fin = request.query_params.get("fecha_fin")
+
+        if not fecha_inicio or not fecha_fin:
+            return Response(
+                {"error": "Parámetros fecha_inicio y fecha_fin son requeridos"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        if not reporte_id:
+        try:
+            fecha_inicio = date.fromisoformat(fecha_inicio)
+            fecha_fin = date.fromisoformat(fecha_fin)
+        except ValueError:
             return Response(
-                {"error": "Parámetro reporte_id es requerido"},
+                {"error": "Formato de fecha inválido. Use YYYY-MM-DD"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        filtros = {
+            campo: request.query_params[campo]
+            for campo in ExcelReporteExporter.FILTROS_PERMITIDOS
+            if request.query_params.get(campo)
+        }
+
         # Ejecutar use case para exportar
         exportacion = controller.exportar_reporte_excel_use_case.execute(
-            {
-                "reporte_id": reporte_id,
-                "formato": formato,
-                "incluir_graficos": request.query_params.get(
-                    "incluir_graficos", "true"
-                ).lower()
-                == "true",
-            }
+            fecha_inicio=fecha_inicio, fecha_fin=fecha_fin, filtros=filtros
         )
 
-        return Response(
-            {
-                "mensaje": f"Reporte exportado exitosamente en formato {formato.upper()}",
-                "archivo": {
-                    "nombre": exportacion.nombre_archivo,
-                    "tamaño_bytes": exportacion.tamaño_bytes,
-                    "formato": exportacion.formato,
-                    "url_descarga": exportacion.url_descarga,
-                },
-                "metadata": {
-                    "fecha_exportacion": exportacion.fecha_exportacion,
-                    "tiempo_procesamiento": exportacion.tiempo_procesamiento,
-                    "hojas_incluidas": exportacion.hojas_incluidas,
-                },
-            }
+        # El archivo se envía por bloques y se elimina al cerrar la respuesta
+        response = FileResponse(
+            ArchivoExportacionTemporal(exportacion["ruta_archivo"]),
+            as_attachment=True,
+            filename=exportacion["nombre_archivo"],
+            content_type=exportacion["content_type"],
         )
+        response["X-Hojas-Incluidas"] = ",".join(exportacion["hojas_incluidas"])
+        response["X-Tiempo-Procesamiento"] = str(exportacion["tiempo_procesamiento"])
+        return response
 
+    except ValueError as e:
+        return Response(
+            {"error": str(e)},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
     except Exception as e:
         return Response(
             {"error": f"Error al exportar reporte: {str(e)}"},
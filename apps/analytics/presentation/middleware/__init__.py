@@ -0,0 +1,8 @@
+"""
+Middleware de presentación para la aplicación de analytics
+"""
+
+from .metricas_middleware import MetricasRendimientoMiddleware
+from .replica_middleware import LecturaReplicaMiddleware
+
+__all__ = ["LecturaReplicaMiddleware", "MetricasRendimientoMiddleware"]
@@ -0,0 +1,59 @@
+"""
+Middleware de métricas de rendimiento por endpoint
+Responsabilidad única: Medir cada request (duración, SQL, tamaño, estado) y
+registrarlo bajo el nombre de su ruta
+"""
+
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from apps.analytics.infrastructure.metricas import MedidorSQL, MetricasEndpoints
+
+
+class MetricasRendimientoMiddleware:
+    """
+    Debe ir primero en MIDDLEWARE para que la duración incluya al resto de
+    middlewares. Las rutas se agrupan por nombre de vista
+    ("analytics:logo:listar_logos"), no por URL, para que los ids no
+    multipliquen las series. En respuestas streaming se mide hasta que la
+    vista retorna, no hasta enviar el último byte
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "METRICAS_ACTIVAS", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        medidor = MedidorSQL()
+        inicio = time.perf_counter()
+        with medidor.midiendo():
+            response = self.get_response(request)
+        duracion = time.perf_counter() - inicio
+
+        MetricasEndpoints.registrar(
+            ruta=self._ruta(request),
+            metodo=request.method,
+            estado=response.status_code,
+            duracion=duracion,
+            consultas=medidor.consultas,
+            tiempo_sql=medidor.segundos,
+            tamaño=self._tamaño(response),
+        )
+        return response
+
+    @staticmethod
+    def _ruta(request) -> str:
+        coincidencia = getattr(request, "resolver_match", None)
+        if coincidencia is None:
+            return "sin_ruta"  # 404 y redirecciones de CommonMiddleware
+        return coincidencia.view_name or coincidencia.route
+
+    @staticmethod
+    def _tamaño(response):
+        if not response.streaming:
+            return len(response.content)
+        largo = response.get("Content-Length")
+        return int(largo) if largo and largo.isdigit() else None
@@ -0,0 +1,70 @@
+"""
+Middleware de lectura consistente con la réplica
+Responsabilidad única: Mantener en la primaria las lecturas de una sesión que
+acaba de escribir (read-your-writes)
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+
+from apps.analytics.infrastructure.db import alias_replica, ambito_lectura
+
+COOKIE_ESCRITURA = "analytics_escritura"
+
+
+class LecturaReplicaMiddleware:
+    """
+    Si el request escribe un modelo de analytics, la sesión queda "pegada" a
+    la primaria durante DB_REPLICA_PEGAJOSIDAD_SEGUNDOS, que debe cubrir el
+    retraso de replicación. Se recuerda con una cookie (navegador) y con una
+    clave de cache por usuario, para los clientes con token que no envían
+    cookies. Si la cache falla, se lee de la primaria.
+    """
+
+    def __init__(self, get_response):
+        if alias_replica() is None:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.segundos = getattr(settings, "DB_REPLICA_PEGAJOSIDAD_SEGUNDOS", 5)
+
+    def __call__(self, request):
+        with ambito_lectura(lambda: self._escritura_reciente(request)) as ambito:
+            response = self.get_response(request)
+        if ambito.escribio:
+            self._recordar_escritura(request, response)
+        return response
+
+    def _escritura_reciente(self, request) -> bool:
+        if COOKIE_ESCRITURA in request.COOKIES:
+            return True
+        clave = self._clave_usuario(request)
+        if clave is None:
+            return False
+        try:
+            return bool(cache.get(clave))
+        except Exception:
+            return True
+
+    def _recordar_escritura(self, request, response) -> None:
+        response.set_cookie(
+            COOKIE_ESCRITURA,
+            "1",
+            max_age=self.segundos,
+            httponly=True,
+            samesite="Lax",
+        )
+        clave = self._clave_usuario(request)
+        if clave is not None:
+            try:
+                cache.set(clave, 1, timeout=self.segundos)
+            except Exception:
+                pass  # La cookie sigue cubriendo a los navegadores
+
+    @staticmethod
+    def _clave_usuario(request):
+        # DRF copia al request de Django el usuario autenticado por token
+        usuario = getattr(request, "user", None)
+        if usuario is None or not usuario.is_authenticated:
+            return None
+        return f"analytics:escritura_reciente:{usuario.pk}"
@@ -79,18 +79,16 @@ class TendenciasGeograficasSerializer(serializers.Serializer):
 class RendimientoModelosIASerializer(serializers.Serializer):
     """Serializer para rendimiento de modelos IA"""
 
-    año = serializers.IntegerField()
     tendencias_ia = serializers.DictField()
     recomendaciones_ia = serializers.ListField()
-    correlaciones_marca_logo = serializers.DictField()
-    analisis_tamaño_operacion = serializers.DictField()
 
 
 class AnalisisEficienciaSerializer(serializers.Serializer):
     """Serializer para análisis de eficiencia"""
 
     periodo_analisis = serializers.CharField()
-    metricas_eficiencia = serializers.DictField()
+    periodo = serializers.DictField()
+    metricas_eficiencia = serializers.ListField()
     tendencias_rendimiento = serializers.DictField()
     optimizaciones_recomendadas = serializers.ListField()
 
@@ -11,6 +11,8 @@ from ..controllers.historial import (
     # Actividad
     actividad_reciente,
     auditoria_usuario,
+    feed_actividad,
+    stream_actividad,
     # Patrones
     patrones_cambio_estado,
     analisis_flujos_estado,
@@ -34,6 +36,8 @@ urlpatterns = [
     # ============================================================================
     path("actividad-reciente/", actividad_reciente, name="actividad_reciente"),
     path("auditoria-usuario/", auditoria_usuario, name="auditoria_usuario"),
+    path("actividad/feed/", feed_actividad, name="feed_actividad"),
+    path("actividad/stream/", stream_actividad, name="stream_actividad"),
     # ============================================================================
     # ENDPOINTS DE PATRONES
     # ============================================================================
@@ -20,6 +20,8 @@ from ..controllers.logo import (
     # Generación y regeneración
     regenerar_logo,
     generar_logos_masivo,
+    # Imágenes locales
+    imagen_logo,
 )
 
 app_name = "logo"
@@ -55,4 +57,13 @@ urlpatterns = [
     # ============================================================================
     path("<int:logo_id>/regenerar/", regenerar_logo, name="regenerar_logo"),
     path("generar-masivo/", generar_logos_masivo, name="generar_logos_masivo"),
+    # ============================================================================
+    # ENDPOINTS DE IMÁGENES LOCALES
+    # ============================================================================
+    path("imagenes/<str:huella_imagen>/", imagen_logo, name="imagen_logo"),
+    path(
+        "imagenes/<str:huella_imagen>/<int:tamaño>/",
+        imagen_logo,
+        name="imagen_logo_miniatura",
+    ),
 ]
@@ -19,6 +19,11 @@ from ..controllers.reporte import (
     reporte_impacto_economico,
     reporte_innovacion_tecnologica,
     reporte_sostenibilidad_sectorial,
+    # Jobs
+    encolar_reporte_job,
+    obtener_reporte_job,
+    # PDF
+    descargar_reporte_pdf,
 )
 
 app_name = "reporte"
@@ -79,4 +84,10 @@ urlpatterns = [
         reporte_sostenibilidad_sectorial,
         name="reporte_sostenibilidad_sectorial",
     ),
+    # ============================================================================
+    # ENDPOINTS DE TRABAJOS ASÍNCRONOS DE REPORTES
+    # ============================================================================
+    path("jobs/", encolar_reporte_job, name="encolar_reporte_job"),
+    path("jobs/<int:job_id>/", obtener_reporte_job, name="obtener_reporte_job"),
+    path("<int:reporte_id>/pdf/", descargar_reporte_pdf, name="descargar_reporte_pdf"),
 ]
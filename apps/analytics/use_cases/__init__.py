@@ -1,80 +1,68 @@
 """
 Use Cases para el sistema de inteligencia de negocios ganadero
-"""
-
-# Use Cases de Marca
-from .marca.crear_marca_use_case import CrearMarcaUseCase
-from .marca.obtener_marca_use_case import ObtenerMarcaUseCase
-from .marca.actualizar_marca_use_case import ActualizarMarcaUseCase
-from .marca.eliminar_marca_use_case import EliminarMarcaUseCase
-from .marca.listar_marcas_use_case import ListarMarcasUseCase
-from .marca.cambiar_estado_marca_use_case import CambiarEstadoMarcaUseCase
-from .marca.obtener_estadisticas_marcas_use_case import ObtenerEstadisticasMarcasUseCase
-
-# Use Cases de Dashboard
-from .dashboard.obtener_dashboard_data_use_case import ObtenerDashboardDataUseCase
-from .dashboard.generar_reporte_dashboard_use_case import GenerarReporteDashboardUseCase
-
-# Use Cases de Logo
-from .logo.generar_logo_use_case import GenerarLogoUseCase
-from .logo.obtener_logo_use_case import ObtenerLogoUseCase
-from .logo.listar_logos_use_case import ListarLogosUseCase
-from .logo.obtener_estadisticas_logos_use_case import ObtenerEstadisticasLogosUseCase
-
-# Use Cases de KPI
-from .kpi.calcular_kpis_use_case import CalcularKPIsUseCase
-from .kpi.obtener_kpis_use_case import ObtenerKPIsUseCase
-from .kpi.generar_reporte_kpis_use_case import GenerarReporteKPIsUseCase
-
-# Use Cases de Historial
-from .historial.crear_historial_use_case import CrearHistorialUseCase
-from .historial.obtener_historial_use_case import ObtenerHistorialUseCase
-from .historial.listar_historial_marca_use_case import ListarHistorialMarcaUseCase
-from .historial.obtener_actividad_reciente_use_case import (
-    ObtenerActividadRecienteUseCase,
-)
-from .historial.obtener_auditoria_usuario_use_case import ObtenerAuditoriaUsuarioUseCase
-from .historial.obtener_patrones_cambio_use_case import ObtenerPatronesCambioUseCase
-from .historial.obtener_eficiencia_evaluadores_use_case import (
-    ObtenerEficienciaEvaluadoresUseCase,
-)
 
-# Use Cases de Reporte
-from .reporte.generar_reporte_mensual_use_case import GenerarReporteMensualUseCase
-from .reporte.generar_reporte_anual_use_case import GenerarReporteAnualUseCase
-from .reporte.generar_reporte_comparativo_departamentos_use_case import (
-    GenerarReporteComparativoDepartamentosUseCase,
-)
-from .reporte.generar_reporte_personalizado_use_case import (
-    GenerarReportePersonalizadoUseCase,
-)
-from .reporte.exportar_reporte_excel_use_case import ExportarReporteExcelUseCase
-from .reporte.generar_reporte_productor_use_case import GenerarReporteProductorUseCase
-from .reporte.generar_reporte_impacto_economico_use_case import (
-    GenerarReporteImpactoEconomicoUseCase,
-)
-from .reporte.generar_reporte_innovacion_tecnologica_use_case import (
-    GenerarReporteInnovacionTecnologicaUseCase,
-)
-from .reporte.generar_reporte_sostenibilidad_use_case import (
-    GenerarReporteSostenibilidadUseCase,
-)
+Los use cases se importan la primera vez que se piden (PEP 562): importar el
+paquete o uno de sus subpaquetes no carga los demás use cases ni sus
+dependencias
+"""
 
-# Use Cases de Analytics
-from .analytics.calcular_tendencias_departamento_use_case import (
-    CalcularTendenciasDepartamentoUseCase,
-)
+from importlib import import_module
 
-# Use Cases de Data Generation
-from .data_generation.generar_datos_mockaroo_use_case import (
-    GenerarDatosMockarooUseCase,
-)
-from .data_generation.generar_descripcion_marca_use_case import (
-    GenerarDescripcionMarcaUseCase,
-)
-from .data_generation.generar_prompt_logo_use_case import (
-    GenerarPromptLogoUseCase,
-)
+# Módulo de cada use case exportado
+_MODULOS = {
+    # Use Cases de Marca
+    "CrearMarcaUseCase": ".marca.crear_marca_use_case",
+    "ObtenerMarcaUseCase": ".marca.obtener_marca_use_case",
+    "ActualizarMarcaUseCase": ".marca.actualizar_marca_use_case",
+    "EliminarMarcaUseCase": ".marca.eliminar_marca_use_case",
+    "ListarMarcasUseCase": ".marca.listar_marcas_use_case",
+    "CambiarEstadoMarcaUseCase": ".marca.cambiar_estado_marca_use_case",
+    "ObtenerEstadisticasMarcasUseCase": ".marca.obtener_estadisticas_marcas_use_case",
+    # Use Cases de Dashboard
+    "ObtenerDashboardDataUseCase": ".dashboard.obtener_dashboard_data_use_case",
+    "GenerarReporteDashboardUseCase": ".dashboard.generar_reporte_dashboard_use_case",
+    # Use Cases de Logo
+    "GenerarLogoUseCase": ".logo.generar_logo_use_case",
+    "ObtenerLogoUseCase": ".logo.obtener_logo_use_case",
+    "ListarLogosUseCase": ".logo.listar_logos_use_case",
+    "ObtenerEstadisticasLogosUseCase": ".logo.obtener_estadisticas_logos_use_case",
+    "GenerarLogosMasivoUseCase": ".logo.generar_logos_masivo_use_case",
+    "RegenerarLogoUseCase": ".logo.regenerar_logo_use_case",
+    "ObtenerImagenLogoUseCase": ".logo.obtener_imagen_logo_use_case",
+    # Use Cases de KPI
+    "CalcularKPIsUseCase": ".kpi.calcular_kpis_use_case",
+    "ObtenerKPIsUseCase": ".kpi.obtener_kpis_use_case",
+    "GenerarReporteKPIsUseCase": ".kpi.generar_reporte_kpis_use_case",
+    # Use Cases de Historial
+    "CrearHistorialUseCase": ".historial.crear_historial_use_case",
+    "ObtenerHistorialUseCase": ".historial.obtener_historial_use_case",
+    "ListarHistorialMarcaUseCase": ".historial.listar_historial_marca_use_case",
+    "ObtenerActividadRecienteUseCase": ".historial.obtener_actividad_reciente_use_case",
+    "ObtenerAuditoriaUsuarioUseCase": ".historial.obtener_auditoria_usuario_use_case",
+    "ObtenerPatronesCambioUseCase": ".historial.obtener_patrones_cambio_use_case",
+    "ObtenerEficienciaEvaluadoresUseCase": ".historial.obtener_eficiencia_evaluadores_use_case",
+    "ObtenerFeedActividadUseCase": ".historial.obtener_feed_actividad_use_case",
+    # Use Cases de Reporte
+    "GenerarReporteMensualUseCase": ".reporte.generar_reporte_mensual_use_case",
+    "GenerarReporteAnualUseCase": ".reporte.generar_reporte_anual_use_case",
+    "GenerarReporteComparativoDepartamentosUseCase": ".reporte.generar_reporte_comparativo_departamentos_use_case",
+    "GenerarReportePersonalizadoUseCase": ".reporte.generar_reporte_personalizado_use_case",
+    "ExportarReporteExcelUseCase": ".reporte.exportar_reporte_excel_use_case",
+    "GenerarReporteProductorUseCase": ".reporte.generar_reporte_productor_use_case",
+    "GenerarReporteImpactoEconomicoUseCase": ".reporte.generar_reporte_impacto_economico_use_case",
+    "GenerarReporteInnovacionTecnologicaUseCase": ".reporte.generar_reporte_innovacion_tecnologica_use_case",
+    "GenerarReporteSostenibilidadUseCase": ".reporte.generar_reporte_sostenibilidad_use_case",
+    "EncolarReporteJobUseCase": ".reporte.encolar_reporte_job_use_case",
+    "ObtenerReporteJobUseCase": ".reporte.obtener_reporte_job_use_case",
+    "ObtenerReportePdfUseCase": ".reporte.obtener_reporte_pdf_use_case",
+    "ConsultarReportePersonalizadoUseCase": ".reporte.consultar_reporte_personalizado_use_case",
+    # Use Cases de Analytics
+    "CalcularTendenciasDepartamentoUseCase": ".analytics.calcular_tendencias_departamento_use_case",
+    # Use Cases de Data Generation
+    "GenerarDatosMockarooUseCase": ".data_generation.generar_datos_mockaroo_use_case",
+    "GenerarDescripcionMarcaUseCase": ".data_generation.generar_descripcion_marca_use_case",
+    "GenerarPromptLogoUseCase": ".data_generation.generar_prompt_logo_use_case",
+}
 
 __all__ = [
     # Marca Use Cases
@@ -93,6 +81,9 @@ __all__ = [
     "ObtenerLogoUseCase",
     "ListarLogosUseCase",
     "ObtenerEstadisticasLogosUseCase",
+    "GenerarLogosMasivoUseCase",
+    "RegenerarLogoUseCase",
+    "ObtenerImagenLogoUseCase",
     # KPI Use Cases
     "CalcularKPIsUseCase",
     "ObtenerKPIsUseCase",
@@ -105,6 +96,7 @@ __all__ = [
     "ObtenerAuditoriaUsuarioUseCase",
     "ObtenerPatronesCambioUseCase",
     "ObtenerEficienciaEvaluadoresUseCase",
+    "ObtenerFeedActividadUseCase",
     # Reporte Use Cases
     "GenerarReporteMensualUseCase",
     "GenerarReporteAnualUseCase",
@@ -115,6 +107,10 @@ __all__ = [
     "GenerarReporteImpactoEconomicoUseCase",
     "GenerarReporteInnovacionTecnologicaUseCase",
     "GenerarReporteSostenibilidadUseCase",
+    "EncolarReporteJobUseCase",
+    "ObtenerReporteJobUseCase",
+    "ObtenerReportePdfUseCase",
+    "ConsultarReportePersonalizadoUseCase",
     # Analytics Use Cases
     "CalcularTendenciasDepartamentoUseCase",
     # Data Generation Use Cases
@@ -122,3 +118,15 @@ __all__ = [
     "GenerarDescripcionMarcaUseCase",
     "GenerarPromptLogoUseCase",
 ]
+
+
+def __getattr__(nombre):
+    if nombre not in _MODULOS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(import_module(_MODULOS[nombre], __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -36,10 +36,22 @@ class GenerarPromptLogoUseCase:
             raise ValueError(f"Marca con ID {marca_id} no encontrada")
 
         # Generar prompts
-        prompts = self._generar_prompts_logo(marca)
+        prompts = self.generar_para_marca(marca)
 
         return prompts
 
+    def generar_para_marca(self, marca: MarcaGanadoBovino) -> List[str]:
+        """
+        Genera los prompts de una marca ya cargada (sin consultar el repositorio)
+
+        Args:
+            marca: Entidad de marca
+
+        Returns:
+            List[str]: Lista de prompts generados
+        """
+        return self._generar_prompts_logo(marca)
+
     def _generar_prompts_logo(self, marca: MarcaGanadoBovino) -> List[str]:
         """
         Genera prompts específicos para logos
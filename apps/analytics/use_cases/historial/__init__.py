@@ -9,6 +9,7 @@ from .obtener_actividad_reciente_use_case import ObtenerActividadRecienteUseCase
 from .obtener_auditoria_usuario_use_case import ObtenerAuditoriaUsuarioUseCase
 from .obtener_patrones_cambio_use_case import ObtenerPatronesCambioUseCase
 from .obtener_eficiencia_evaluadores_use_case import ObtenerEficienciaEvaluadoresUseCase
+from .obtener_feed_actividad_use_case import ObtenerFeedActividadUseCase
 
 __all__ = [
     "CrearHistorialUseCase",
@@ -18,4 +19,5 @@ __all__ = [
     "ObtenerAuditoriaUsuarioUseCase",
     "ObtenerPatronesCambioUseCase",
     "ObtenerEficienciaEvaluadoresUseCase",
+    "ObtenerFeedActividadUseCase",
 ]
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from datetime import date, timedelta
+from typing import Dict, Any, List, Optional
 
 from apps.analytics.domain.repositories.historial_repository import (
     HistorialEstadoMarcaRepository,
@@ -8,14 +9,184 @@ from apps.analytics.domain.repositories.historial_repository import (
 class ObtenerEficienciaEvaluadoresUseCase:
     """Use Case para obtener eficiencia de evaluadores"""
 
+    # Un evaluador se considera lento si su p90 supera en este factor al del sistema
+    FACTOR_LENTITUD = 1.5
+
     def __init__(self, historial_repository: HistorialEstadoMarcaRepository):
         self.historial_repository = historial_repository
 
-    def execute(self) -> Dict[str, Any]:
+    def execute(self, parametros: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Obtiene métricas de eficiencia de evaluadores
 
+        Args:
+            parametros: {"tipo": "general" | "evaluador_detalle" | "comparativa",
+                "periodo_dias": int, "evaluador_id": str, "evaluadores": [str]}
+
         Returns:
             Dict[str, Any]: Métricas de eficiencia
+
+        Raises:
+            ValueError: Si los parámetros no son válidos o el evaluador no tiene
+                actividad en el período
         """
-        return self.historial_repository.obtener_tendencias_cambios()
+        parametros = parametros or {}
+        dias = int(parametros.get("periodo_dias", 30))
+        if dias < 1:
+            raise ValueError("periodo_dias debe ser mayor que cero")
+
+        fecha_fin = date.today()
+        fecha_inicio = fecha_fin - timedelta(days=dias - 1)
+        actual = self.historial_repository.obtener_eficiencia_evaluadores(
+            fecha_inicio, fecha_fin
+        )
+
+        tipo = parametros.get("tipo", "general")
+        if tipo == "evaluador_detalle":
+            anterior = self.historial_repository.obtener_eficiencia_evaluadores(
+                fecha_inicio - timedelta(days=dias), fecha_inicio - timedelta(days=1)
+            )
+            return self._detalle(parametros.get("evaluador_id"), actual, anterior)
+        if tipo == "comparativa":
+            return self._comparativa(parametros.get("evaluadores") or [], actual)
+        return self._general(actual)
+
+    def _general(self, actual: Dict[str, Any]) -> Dict[str, Any]:
+        evaluadores = actual["evaluadores"]
+        sistema = actual["sistema"]
+        ranking = self._ranking(evaluadores)
+
+        lentos = self._evaluadores_lentos(evaluadores, sistema)
+        recomendaciones = [
+            f"Revisar la carga de {usuario}: su p90 es de "
+            f"{evaluadores[usuario]['tiempo_p90_horas']} h frente a "
+            f"{sistema['tiempo_p90_horas']} h del sistema"
+            for usuario in lentos
+        ]
+
+        return {
+            "periodo": actual["periodo"],
+            "estadisticas_evaluadores": evaluadores,
+            "ranking_eficiencia": ranking,
+            "metricas_sistema": sistema,
+            "analisis_comparativo": {
+                "mas_productivo": ranking[0]["evaluador"] if ranking else None,
+                "mas_rapido": min(
+                    (u for u in evaluadores if evaluadores[u]["tiempo_mediano_horas"]),
+                    key=lambda u: evaluadores[u]["tiempo_mediano_horas"],
+                    default=None,
+                ),
+                "evaluadores_lentos": lentos,
+            },
+            "recomendaciones": recomendaciones,
+            "metadata": actual["metadata"],
+        }
+
+    def _detalle(
+        self,
+        evaluador_id: Optional[str],
+        actual: Dict[str, Any],
+        anterior: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        metricas = actual["evaluadores"].get(evaluador_id)
+        if metricas is None:
+            raise ValueError(f"El evaluador {evaluador_id} no tiene actividad")
+
+        previas = anterior["evaluadores"].get(evaluador_id) or {}
+        sistema = actual["sistema"]
+
+        areas_mejora = []
+        if (
+            metricas["tiempo_p90_horas"] is not None
+            and sistema["tiempo_p90_horas"]
+            and metricas["tiempo_p90_horas"]
+            > sistema["tiempo_p90_horas"] * self.FACTOR_LENTITUD
+        ):
+            areas_mejora.append("Tiempo de resolución por encima del sistema")
+        if previas and metricas["transiciones"] < previas.get("transiciones", 0):
+            areas_mejora.append("Volumen menor que en el período anterior")
+
+        return {
+            "periodo": actual["periodo"],
+            "metricas_personales": metricas,
+            "tendencia_rendimiento": {
+                "periodo_anterior": anterior["periodo"],
+                "transiciones_anterior": previas.get("transiciones", 0),
+                "variacion_transiciones": metricas["transiciones"]
+                - previas.get("transiciones", 0),
+                "tiempo_mediano_anterior_horas": previas.get("tiempo_mediano_horas"),
+            },
+            "patrones_trabajo": {
+                "por_estado": metricas["por_estado"],
+                "dias_activos": metricas["dias_activos"],
+                "tasa_aprobacion": metricas["tasa_aprobacion"],
+            },
+            "casos_destacados": {
+                "tiempo_maximo_horas": metricas["tiempo_maximo_horas"],
+            },
+            "areas_mejora": areas_mejora,
+            "recomendaciones_personalizadas": [
+                f"Atender: {area.lower()}" for area in areas_mejora
+            ],
+        }
+
+    def _comparativa(
+        self, seleccion: List[str], actual: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        evaluadores = actual["evaluadores"]
+        comparados = [u for u in seleccion if u in evaluadores] or list(evaluadores)
+        metricas = {u: evaluadores[u] for u in comparados}
+        ranking = self._ranking(metricas)
+
+        diferencias = {}
+        for campo in ("transiciones", "tiempo_mediano_horas", "tasa_aprobacion"):
+            valores = [m[campo] for m in metricas.values() if m[campo] is not None]
+            if valores:
+                diferencias[campo] = {
+                    "minimo": min(valores),
+                    "maximo": max(valores),
+                    "diferencia": round(max(valores) - min(valores), 2),
+                }
+
+        lentos = self._evaluadores_lentos(metricas, actual["sistema"])
+        return {
+            "periodo": actual["periodo"],
+            "evaluadores_comparados": comparados,
+            "metricas_comparativas": metricas,
+            "diferencias_clave": diferencias,
+            "mejores_practicas": [r["evaluador"] for r in ranking[:3]],
+            "oportunidades_mejora": lentos,
+        }
+
+    @staticmethod
+    def _ranking(evaluadores: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Ordena por volumen y, a igual volumen, por menor tiempo mediano"""
+        orden = sorted(
+            evaluadores.items(),
+            key=lambda item: (
+                -item[1]["transiciones"],
+                item[1]["tiempo_mediano_horas"] or 0,
+            ),
+        )
+        return [
+            {
+                "posicion": posicion,
+                "evaluador": usuario,
+                "transiciones": metricas["transiciones"],
+                "tiempo_mediano_horas": metricas["tiempo_mediano_horas"],
+            }
+            for posicion, (usuario, metricas) in enumerate(orden, start=1)
+        ]
+
+    def _evaluadores_lentos(
+        self, evaluadores: Dict[str, Dict[str, Any]], sistema: Dict[str, Any]
+    ) -> List[str]:
+        referencia = sistema["tiempo_p90_horas"]
+        if not referencia:
+            return []
+        return [
+            usuario
+            for usuario, metricas in evaluadores.items()
+            if metricas["tiempo_p90_horas"] is not None
+            and metricas["tiempo_p90_horas"] > referencia * self.FACTOR_LENTITUD
+        ]
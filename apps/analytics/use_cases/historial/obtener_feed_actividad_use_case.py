@@ -0,0 +1,51 @@
+from typing import Dict, Any, Optional
+
+from apps.analytics.domain.repositories.historial_repository import (
+    HistorialEstadoMarcaRepository,
+)
+
+
+class ObtenerFeedActividadUseCase:
+    """Use Case para leer el feed de actividad a partir de una marca de agua"""
+
+    LIMITE_MAXIMO = 500
+    ESPERA_MAXIMA_SEGUNDOS = 30
+
+    def __init__(self, historial_repository: HistorialEstadoMarcaRepository):
+        self.historial_repository = historial_repository
+
+    def execute(self, parametros: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Obtiene los eventos posteriores a `desde_secuencia`
+
+        Args:
+            parametros: {"desde_secuencia": int | None, "limite": int,
+                "espera_segundos": float}
+
+        Returns:
+            Dict[str, Any]: {"eventos": [...], "marca_agua": int, "hay_mas": bool}
+
+        Raises:
+            ValueError: Si los parámetros no son válidos
+        """
+        parametros = parametros or {}
+        desde = parametros.get("desde_secuencia")
+        try:
+            desde = int(desde) if desde not in (None, "") else None
+            limite = int(parametros.get("limite", 100))
+            espera = float(parametros.get("espera_segundos", 0))
+        except (TypeError, ValueError):
+            raise ValueError(
+                "desde_secuencia, limite y espera_segundos deben ser numéricos"
+            )
+        if desde is not None and desde < 0:
+            raise ValueError("desde_secuencia no puede ser negativo")
+        if limite < 1:
+            raise ValueError("limite debe ser mayor que cero")
+
+        limite = min(limite, self.LIMITE_MAXIMO)
+        feed = self.historial_repository.obtener_feed_actividad(
+            desde, limite, min(max(espera, 0), self.ESPERA_MAXIMA_SEGUNDOS)
+        )
+        feed["hay_mas"] = desde is not None and len(feed["eventos"]) >= limite
+        return feed
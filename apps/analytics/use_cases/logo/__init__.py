@@ -6,10 +6,16 @@ from .generar_logo_use_case import GenerarLogoUseCase
 from .obtener_logo_use_case import ObtenerLogoUseCase
 from .listar_logos_use_case import ListarLogosUseCase
 from .obtener_estadisticas_logos_use_case import ObtenerEstadisticasLogosUseCase
+from .generar_logos_masivo_use_case import GenerarLogosMasivoUseCase
+from .regenerar_logo_use_case import RegenerarLogoUseCase
+from .obtener_imagen_logo_use_case import ObtenerImagenLogoUseCase
 
 __all__ = [
     "GenerarLogoUseCase",
     "ObtenerLogoUseCase",
     "ListarLogosUseCase",
     "ObtenerEstadisticasLogosUseCase",
+    "GenerarLogosMasivoUseCase",
+    "RegenerarLogoUseCase",
+    "ObtenerImagenLogoUseCase",
 ]
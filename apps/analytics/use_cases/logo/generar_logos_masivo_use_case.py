@@ -0,0 +1,129 @@
+from typing import Dict, Any, List, Optional
+
+from apps.analytics.domain.enums import Departamento, ModeloIA
+from apps.analytics.domain.repositories.logo_repository import LogoMarcaBovinaRepository
+from apps.analytics.domain.repositories.marca_repository import (
+    MarcaGanadoBovinoRepository,
+)
+from apps.analytics.use_cases.data_generation.generar_prompt_logo_use_case import (
+    GenerarPromptLogoUseCase,
+)
+
+
+class GenerarLogosMasivoUseCase:
+    """Use Case para generar logos de todas las marcas que aún no tienen uno"""
+
+    LIMITE_MAXIMO = 5000
+
+    def __init__(
+        self,
+        marca_repository: MarcaGanadoBovinoRepository,
+        logo_repository: LogoMarcaBovinaRepository,
+        generar_prompt_logo_use_case: GenerarPromptLogoUseCase,
+    ):
+        self.marca_repository = marca_repository
+        self.logo_repository = logo_repository
+        self.generar_prompt_logo_use_case = generar_prompt_logo_use_case
+
+    def execute(self, parametros: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Genera un logo por cada marca sin logos
+
+        Args:
+            parametros: {"modelo_ia": str | [str], "limite_marcas": int,
+                "departamento": str, "estilo": int, "usar_cache": bool}. Con
+                varios modelos las marcas se reparten entre ellos; `estilo`
+                elige el prompt (0 corporativo, 1 rural, 2 profesional,
+                3 tradicional); `usar_cache` (por defecto True) reutiliza logos
+                ya generados con el mismo prompt y modelo
+
+        Returns:
+            Dict[str, Any]: {"resultados": [...], "estadisticas": {...},
+                "metadata": {...}}
+
+        Raises:
+            ValueError: Si los parámetros no son válidos
+        """
+        parametros = parametros or {}
+        modelos = self._modelos(parametros.get("modelo_ia", ModeloIA.DALL_E_3.value))
+        try:
+            limite = int(parametros.get("limite_marcas", 10))
+            estilo = int(parametros.get("estilo", 0))
+        except (TypeError, ValueError):
+            raise ValueError("limite_marcas y estilo deben ser enteros")
+        if not 1 <= limite <= self.LIMITE_MAXIMO:
+            raise ValueError(f"limite_marcas debe estar entre 1 y {self.LIMITE_MAXIMO}")
+
+        departamento = parametros.get("departamento")
+        if departamento:
+            try:
+                departamento = Departamento(departamento)
+            except ValueError:
+                raise ValueError(f"Departamento no válido: {departamento}")
+
+        marcas = self.marca_repository.list_sin_logo(limite, departamento)
+        solicitudes = []
+        for indice, marca in enumerate(marcas):
+            prompts = self.generar_prompt_logo_use_case.generar_para_marca(marca)
+            solicitudes.append(
+                {
+                    "marca_id": marca.id,
+                    "prompt": prompts[estilo % len(prompts)],
+                    "modelo_ia": modelos[indice % len(modelos)],
+                }
+            )
+
+        if not solicitudes:
+            return {
+                "resultados": [],
+                "estadisticas": self._estadisticas([]),
+                "metadata": {},
+            }
+
+        generados = self.logo_repository.generar_en_lote(
+            solicitudes, usar_cache=bool(parametros.get("usar_cache", True))
+        )
+        resultados = [
+            {
+                "marca_id": logo.marca_id,
+                "logo_id": logo.id,
+                "exito": logo.exito,
+                "modelo_ia": logo.modelo_ia_usado.value,
+                "url_logo": logo.url_logo if logo.exito else None,
+                "tiempo_generacion": logo.tiempo_generacion_segundos,
+            }
+            for logo in generados["logos"]
+        ]
+        return {
+            "resultados": resultados,
+            "estadisticas": self._estadisticas(resultados),
+            "metadata": generados["metadata"],
+        }
+
+    @staticmethod
+    def _modelos(valor: Any) -> List[ModeloIA]:
+        nombres = valor if isinstance(valor, list) else [valor]
+        try:
+            modelos = [ModeloIA(nombre) for nombre in nombres]
+        except ValueError as e:
+            raise ValueError(f"Modelo de IA no válido: {e}")
+        if not modelos:
+            raise ValueError("Se requiere al menos un modelo de IA")
+        return modelos
+
+    @staticmethod
+    def _estadisticas(resultados: List[Dict[str, Any]]) -> Dict[str, Any]:
+        exitosos = sum(1 for r in resultados if r["exito"])
+        return {
+            "total_procesadas": len(resultados),
+            "exitosos": exitosos,
+            "fallidos": len(resultados) - exitosos,
+            "tiempo_promedio": (
+                round(
+                    sum(r["tiempo_generacion"] for r in resultados) / len(resultados),
+                    2,
+                )
+                if resultados
+                else 0
+            ),
+        }
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from datetime import date, timedelta
+from typing import Dict, Any, List, Optional
 
 from apps.analytics.domain.repositories.logo_repository import LogoMarcaBovinaRepository
 
@@ -6,14 +7,127 @@ from apps.analytics.domain.repositories.logo_repository import LogoMarcaBovinaRe
 class ObtenerEstadisticasLogosUseCase:
     """Use Case para obtener estadísticas de logos"""
 
+    # Cola larga: el p99 de un modelo supera en este factor a su p50
+    FACTOR_COLA_LARGA = 5
+    # Un día es lento si su p90 supera en este factor al p90 del período
+    FACTOR_DIA_LENTO = 1.5
+
     def __init__(self, logo_repository: LogoMarcaBovinaRepository):
         self.logo_repository = logo_repository
 
-    def execute(self) -> Dict[str, Any]:
+    def execute(self, parametros: Optional[Dict[str, Any]] = None) -> Any:
         """
         Obtiene estadísticas de logos generados
 
+        Args:
+            parametros: {"tipo": "rendimiento_modelos"} para el rendimiento por
+                modelo de IA (incluye reutilizaciones del cache de prompts y
+                percentiles de latencia); {"tipo": "analisis_eficiencia",
+                "periodo_dias": int} para percentiles por modelo y por día;
+                {"tipo": "analisis_prompts", "min_soporte": int, "limite": int,
+                "termino": str} para los términos asociados a fallos y calidad
+
         Returns:
-            Dict[str, Any]: Estadísticas de logos
+            Estadísticas de logos, o una lista por modelo para
+            "rendimiento_modelos"
+
+        Raises:
+            ValueError: Si periodo_dias, min_soporte o limite no son mayores
+                que cero
         """
+        parametros = parametros or {}
+        tipo = parametros.get("tipo")
+        if tipo == "rendimiento_modelos":
+            return self.logo_repository.obtener_rendimiento_modelos()
+        if tipo == "analisis_eficiencia":
+            return self._analisis_eficiencia(int(parametros.get("periodo_dias", 30)))
+        if tipo == "analisis_prompts":
+            return self._analisis_prompts(parametros)
         return self.logo_repository.obtener_estadisticas()
+
+    def _analisis_eficiencia(self, dias: int) -> Dict[str, Any]:
+        if dias < 1:
+            raise ValueError("periodo_dias debe ser mayor que cero")
+
+        fecha_fin = date.today()
+        fecha_inicio = fecha_fin - timedelta(days=dias - 1)
+        metricas = self.logo_repository.obtener_percentiles_latencia(
+            fecha_inicio, fecha_fin
+        )
+        diarias = self.logo_repository.obtener_percentiles_latencia(
+            fecha_inicio, fecha_fin, por_dia=True
+        )
+
+        tendencias = {}
+        for item in diarias:
+            tendencias.setdefault(item["modelo_ia_usado"], []).append(
+                {
+                    "fecha": item["fecha"].isoformat(),
+                    "muestras": item["muestras"],
+                    "latencia_p50": item["latencia_p50"],
+                    "latencia_p90": item["latencia_p90"],
+                    "latencia_p99": item["latencia_p99"],
+                }
+            )
+
+        return {
+            "periodo": {
+                "fecha_inicio": fecha_inicio.isoformat(),
+                "fecha_fin": fecha_fin.isoformat(),
+            },
+            "metricas_eficiencia": metricas,
+            "tendencias_rendimiento": tendencias,
+            "optimizaciones_recomendadas": self._optimizaciones(metricas, tendencias),
+        }
+
+    def _analisis_prompts(self, parametros: Dict[str, Any]) -> Dict[str, Any]:
+        min_soporte = int(parametros.get("min_soporte", 20))
+        limite = int(parametros.get("limite", 20))
+        if min_soporte < 1 or limite < 1:
+            raise ValueError("min_soporte y limite deben ser mayores que cero")
+
+        analisis = self.logo_repository.obtener_analisis_prompts(
+            min_soporte, limite, parametros.get("termino") or None
+        )
+        analisis["recomendaciones"] = [
+            f"Revisar «{item['termino']}»: {item['tasa']}% de fallos "
+            f"({item['lift']}× el promedio) en {item['logos']} logos"
+            for item in analisis["terminos_fallo"]
+            if item["significativo"]
+        ][:5]
+        return analisis
+
+    def _optimizaciones(
+        self,
+        metricas: List[Dict[str, Any]],
+        tendencias: Dict[str, List[Dict[str, Any]]],
+    ) -> List[str]:
+        optimizaciones = []
+        for item in metricas:
+            modelo = item["modelo_ia_usado"]
+            if (
+                item["latencia_p50"]
+                and item["latencia_p99"] > item["latencia_p50"] * self.FACTOR_COLA_LARGA
+            ):
+                optimizaciones.append(
+                    f"{modelo}: cola larga (p99 {item['latencia_p99']}s frente a "
+                    f"p50 {item['latencia_p50']}s); revisar timeouts y reintentos"
+                )
+            dias_lentos = [
+                dia["fecha"]
+                for dia in tendencias.get(modelo, [])
+                if dia["latencia_p90"] > item["latencia_p90"] * self.FACTOR_DIA_LENTO
+            ]
+            if dias_lentos:
+                optimizaciones.append(
+                    f"{modelo}: p90 por encima de lo habitual en "
+                    f"{', '.join(dias_lentos)}"
+                )
+
+        if len(metricas) > 1:
+            mas_rapido = min(metricas, key=lambda item: item["latencia_p90"])
+            optimizaciones.append(
+                f"Modelo con menor p90 en el período: "
+                f"{mas_rapido['modelo_ia_usado']} ({mas_rapido['latencia_p90']}s)"
+            )
+        return optimizaciones
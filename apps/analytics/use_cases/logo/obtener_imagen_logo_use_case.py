@@ -0,0 +1,34 @@
+import re
+from typing import Dict, Any, Optional
+
+from apps.analytics.domain.repositories.logo_repository import LogoMarcaBovinaRepository
+
+
+class ObtenerImagenLogoUseCase:
+    """Use Case para obtener la imagen local de un logo (original o miniatura)"""
+
+    PATRON_HUELLA = re.compile(r"^[0-9a-f]{64}$")
+
+    def __init__(self, logo_repository: LogoMarcaBovinaRepository):
+        self.logo_repository = logo_repository
+
+    def execute(
+        self, huella_imagen: str, tamaño: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene el archivo de la imagen
+
+        Args:
+            huella_imagen: SHA-256 del contenido (LogoMarcaBovinaModel.huella_imagen)
+            tamaño: Lado de la miniatura; None para la imagen original
+
+        Returns:
+            Dict[str, Any]: {"ruta", "content_type", "etag", "tamaño_bytes"} o
+                None si la imagen no está en el almacén
+
+        Raises:
+            ValueError: Si la huella o el tamaño no son válidos
+        """
+        if not self.PATRON_HUELLA.match(huella_imagen or ""):
+            raise ValueError("Huella de imagen no válida")
+        return self.logo_repository.obtener_imagen(huella_imagen, tamaño)
@@ -0,0 +1,62 @@
+from typing import Dict, Any, Optional
+
+from apps.analytics.domain.enums import ModeloIA
+from apps.analytics.domain.repositories.logo_repository import LogoMarcaBovinaRepository
+
+
+class RegenerarLogoUseCase:
+    """Use Case para volver a generar un logo que falló"""
+
+    def __init__(self, logo_repository: LogoMarcaBovinaRepository):
+        self.logo_repository = logo_repository
+
+    def execute(self, parametros: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Genera un logo nuevo para la marca del logo indicado
+
+        Por defecto no consulta el cache de prompts: regenerar es pedir un
+        resultado nuevo al servicio de IA. Con "usar_cache": True se reutiliza un
+        logo exitoso con la misma huella si existe.
+
+        Args:
+            parametros: {"logo_id": int, "modelo_ia": str, "prompt": str,
+                "usar_cache": bool}. Sin modelo o prompt se usan los del logo
+                original
+
+        Returns:
+            Dict[str, Any]: {"logo_original", "logo_nuevo", "metadata"} o None
+                si el logo no existe
+
+        Raises:
+            ValueError: Si el logo no falló o los parámetros no son válidos
+        """
+        logo_original = self.logo_repository.obtener_por_id(parametros["logo_id"])
+        if not logo_original:
+            return None
+        if logo_original.exito:
+            raise ValueError("Solo se pueden regenerar logos que fallaron")
+
+        modelo = parametros.get("modelo_ia") or logo_original.modelo_ia_usado
+        try:
+            modelo = ModeloIA(modelo)
+        except ValueError:
+            raise ValueError(f"Modelo de IA no válido: {modelo}")
+        prompt = parametros.get("prompt") or logo_original.prompt_usado
+        if not prompt:
+            raise ValueError("El logo original no tiene prompt; indique uno")
+
+        generacion = self.logo_repository.generar_en_lote(
+            [
+                {
+                    "marca_id": logo_original.marca_id,
+                    "prompt": prompt,
+                    "modelo_ia": modelo,
+                }
+            ],
+            usar_cache=bool(parametros.get("usar_cache", False)),
+        )
+        return {
+            "logo_original": logo_original,
+            "logo_nuevo": generacion["logos"][0],
+            "metadata": generacion["metadata"],
+        }
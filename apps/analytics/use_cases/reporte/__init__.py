@@ -17,6 +17,12 @@ from .generar_reporte_innovacion_tecnologica_use_case import (
     GenerarReporteInnovacionTecnologicaUseCase,
 )
 from .generar_reporte_sostenibilidad_use_case import GenerarReporteSostenibilidadUseCase
+from .encolar_reporte_job_use_case import EncolarReporteJobUseCase
+from .obtener_reporte_job_use_case import ObtenerReporteJobUseCase
+from .obtener_reporte_pdf_use_case import ObtenerReportePdfUseCase
+from .consultar_reporte_personalizado_use_case import (
+    ConsultarReportePersonalizadoUseCase,
+)
 
 __all__ = [
     "GenerarReporteMensualUseCase",
@@ -28,4 +34,8 @@ __all__ = [
     "GenerarReporteImpactoEconomicoUseCase",
     "GenerarReporteInnovacionTecnologicaUseCase",
     "GenerarReporteSostenibilidadUseCase",
+    "EncolarReporteJobUseCase",
+    "ObtenerReporteJobUseCase",
+    "ObtenerReportePdfUseCase",
+    "ConsultarReportePersonalizadoUseCase",
 ]
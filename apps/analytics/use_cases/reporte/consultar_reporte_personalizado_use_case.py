@@ -0,0 +1,45 @@
+from typing import Any, Dict, List, Optional
+
+from apps.analytics.domain.entities.reporte_data import ReporteData
+from apps.analytics.domain.repositories.reporte_repository import ReporteRepository
+
+
+class ConsultarReportePersonalizadoUseCase:
+    """Use Case para reportes ad-hoc definidos por filtros, métricas y agrupaciones"""
+
+    def __init__(self, reporte_repository: ReporteRepository):
+        self.reporte_repository = reporte_repository
+
+    def execute(
+        self,
+        filtros: Dict[str, Any],
+        metricas: List[str],
+        agrupaciones: Optional[List[str]] = None,
+        orden: Optional[List[str]] = None,
+        limite: Optional[int] = None,
+    ) -> ReporteData:
+        """
+        Ejecuta un reporte personalizado como una única consulta agregada
+
+        Args:
+            filtros: fecha_inicio, fecha_fin, departamento, raza, proposito, estado
+            metricas: conteo, suma_cabezas, suma_monto, promedio_tiempo
+            agrupaciones: departamento, raza, proposito, estado, mes
+            orden: Columnas del reporte; prefijo "-" para descendente
+            limite: Máximo de filas (acotado por el límite del servidor)
+
+        Returns:
+            ReporteData: Filas agregadas y metadata de la consulta
+
+        Raises:
+            ValueError: Si la especificación usa elementos no permitidos
+        """
+        return self.reporte_repository.consultar_reporte_personalizado(
+            {
+                "filtros": filtros or {},
+                "metricas": metricas,
+                "agrupaciones": agrupaciones or [],
+                "orden": orden or [],
+                "limite": limite,
+            }
+        )
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from apps.analytics.domain.entities.reporte_job import ReporteJob
+from apps.analytics.domain.repositories.reporte_job_repository import (
+    ReporteJobRepository,
+)
+
+
+class EncolarReporteJobUseCase:
+    """Use Case para encolar la generación asíncrona de un reporte"""
+
+    def __init__(
+        self,
+        reporte_job_repository: ReporteJobRepository,
+        ejecutor,
+        ventana_deduplicacion_minutos: int = 30,
+    ):
+        self.reporte_job_repository = reporte_job_repository
+        self.ejecutor = ejecutor
+        self.ventana_deduplicacion_minutos = ventana_deduplicacion_minutos
+
+    def execute(
+        self,
+        tipo_reporte: str,
+        parametros: Optional[Dict[str, Any]] = None,
+        usuario_solicitante: Optional[str] = None,
+    ) -> Tuple[ReporteJob, bool]:
+        """
+        Encola un trabajo de reporte, reutilizando uno idéntico en curso
+
+        Args:
+            tipo_reporte: Tipo de reporte a generar
+            parametros: Parámetros del reporte (periodo, año, filtros)
+            usuario_solicitante: Usuario que solicita el reporte
+
+        Returns:
+            Tuple[ReporteJob, bool]: Trabajo y True si se creó uno nuevo o
+                False si se reutilizó uno idéntico pendiente o en proceso
+
+        Raises:
+            ValueError: Si el tipo de reporte no está soportado o sus
+                parámetros no son válidos
+        """
+        if tipo_reporte not in self.ejecutor.tipos_soportados():
+            raise ValueError(f"Tipo de reporte no soportado: {tipo_reporte}")
+
+        # Forma normalizada: {"anio": "2025"} y {"anio": 2025} tienen la misma firma
+        parametros = self.ejecutor.validar_parametros(tipo_reporte, parametros or {})
+        firma = ReporteJob.calcular_firma(tipo_reporte, parametros)
+        creado_desde = datetime.now() - timedelta(
+            minutes=self.ventana_deduplicacion_minutos
+        )
+
+        # La base de datos garantiza un único trabajo en curso por firma, también
+        # entre procesos
+        job, creado = self.reporte_job_repository.crear_o_reutilizar(
+            ReporteJob(
+                tipo_reporte=tipo_reporte,
+                parametros=parametros,
+                firma=firma,
+                usuario_solicitante=usuario_solicitante,
+            ),
+            creado_desde,
+        )
+        if not creado:
+            return job, False
+
+        self.ejecutor.enviar(job.id)
+        return self.reporte_job_repository.obtener_por_id(job.id), True
@@ -1,5 +1,5 @@
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import date
 
 from apps.analytics.domain.repositories.reporte_repository import ReporteRepository
 from apps.analytics.domain.repositories.marca_repository import (
@@ -20,19 +20,31 @@ class ExportarReporteExcelUseCase:
 
     def execute(
         self,
-        fecha_inicio: datetime,
-        fecha_fin: datetime,
+        fecha_inicio: date,
+        fecha_fin: date,
         filtros: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
-        Exporta un reporte a formato Excel
+        Exporta los datos del periodo a un archivo Excel
 
         Args:
             fecha_inicio: Fecha de inicio del reporte
             fecha_fin: Fecha de fin del reporte
-            filtros: Filtros adicionales
+            filtros: Filtros adicionales (departamento, estado, raza_bovino,
+                proposito_ganado)
 
         Returns:
-            Dict[str, Any]: Datos para exportación
+            Dict[str, Any]: Metadatos de la exportación, incluida la ruta del
+                archivo generado
+
+        Raises:
+            ValueError: Si el periodo o los filtros son inválidos
         """
-        return self.reporte_repository.exportar_datos_excel(filtros=filtros)
+        if fecha_inicio > fecha_fin:
+            raise ValueError(
+                "La fecha de inicio no puede ser mayor que la fecha de fin"
+            )
+
+        return self.reporte_repository.exportar_datos_excel(
+            fecha_inicio=fecha_inicio, fecha_fin=fecha_fin, filtros=filtros
+        )
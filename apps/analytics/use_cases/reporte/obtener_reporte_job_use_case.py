@@ -0,0 +1,49 @@
+from typing import Any, Dict
+
+from apps.analytics.domain.enums import EstadoJobReporte
+from apps.analytics.domain.repositories.reporte_job_repository import (
+    ReporteJobRepository,
+)
+
+
+class ObtenerReporteJobUseCase:
+    """Use Case para consultar estado y resultado de un trabajo de reporte"""
+
+    def __init__(self, reporte_job_repository: ReporteJobRepository):
+        self.reporte_job_repository = reporte_job_repository
+
+    def execute(self, job_id: int) -> Dict[str, Any]:
+        """
+        Obtiene el estado de un trabajo y, si terminó, su resultado
+
+        Args:
+            job_id: ID del trabajo
+
+        Returns:
+            Dict[str, Any]: Estado, progreso, tiempos y resultado del trabajo
+
+        Raises:
+            ValueError: Si el trabajo no existe
+        """
+        job = self.reporte_job_repository.obtener_por_id(job_id)
+        if not job:
+            raise ValueError(f"Trabajo de reporte {job_id} no encontrado")
+
+        return {
+            "id": job.id,
+            "tipo_reporte": job.tipo_reporte,
+            "parametros": job.parametros,
+            "estado": job.estado.value,
+            "progreso": job.progreso,
+            "reporte_id": job.reporte_id,
+            "mensaje_error": job.mensaje_error,
+            "fecha_creacion": job.fecha_creacion,
+            "fecha_inicio_ejecucion": job.fecha_inicio_ejecucion,
+            "fecha_fin_ejecucion": job.fecha_fin_ejecucion,
+            "duracion_segundos": job.duracion_segundos,
+            "resultado": (
+                self.reporte_job_repository.obtener_resultado(job_id)
+                if job.estado == EstadoJobReporte.COMPLETADO
+                else None
+            ),
+        }
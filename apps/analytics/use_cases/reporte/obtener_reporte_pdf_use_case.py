@@ -0,0 +1,56 @@
+from typing import Any, Dict, Optional
+
+from apps.analytics.domain.repositories.reporte_repository import ReporteRepository
+from .encolar_reporte_job_use_case import EncolarReporteJobUseCase
+
+
+class ObtenerReportePdfUseCase:
+    """Use Case para obtener el PDF de un reporte sin renderizarlo en el request"""
+
+    def __init__(
+        self,
+        reporte_repository: ReporteRepository,
+        encolar_reporte_job_use_case: EncolarReporteJobUseCase,
+    ):
+        self.reporte_repository = reporte_repository
+        self.encolar_reporte_job_use_case = encolar_reporte_job_use_case
+
+    def execute(
+        self, reporte_id: int, usuario_solicitante: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Retorna el PDF si ya existe; si no, encola su renderizado
+
+        Args:
+            reporte_id: ID del reporte almacenado
+            usuario_solicitante: Usuario que solicita el PDF
+
+        Returns:
+            Dict[str, Any]: {"listo": True, ...metadatos del archivo} o
+                {"listo": False, "job_id": ..., "estado": ...}
+
+        Raises:
+            ValueError: Si el reporte no existe
+        """
+        pdf = self.reporte_repository.obtener_pdf(reporte_id)
+        if pdf:
+            return {"listo": True, **pdf}
+
+        job, _ = self.encolar_reporte_job_use_case.execute(
+            tipo_reporte="pdf",
+            parametros={"reporte_id": reporte_id},
+            usuario_solicitante=usuario_solicitante,
+        )
+
+        # En modo eager el trabajo ya terminó
+        pdf = self.reporte_repository.obtener_pdf(reporte_id)
+        if pdf:
+            return {"listo": True, **pdf}
+
+        return {
+            "listo": False,
+            "job_id": job.id,
+            "estado": job.estado.value,
+            "progreso": job.progreso,
+            "mensaje_error": job.mensaje_error,
+        }
@@ -57,12 +57,16 @@ ADMIN_SITE_TITLE = "Ganado Bovino Admin"
 ADMIN_INDEX_TITLE = "Panel de Control - Inteligencia de Negocios Ganadera"
 
 MIDDLEWARE = [
+    # Primero, para que la duración medida incluya a los demás middlewares
+    "apps.analytics.presentation.middleware.MetricasRendimientoMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # Lecturas de la réplica salvo que la sesión acabe de escribir
+    "apps.analytics.presentation.middleware.LecturaReplicaMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -104,6 +108,9 @@ DATABASES = {
             "autocommit": True,
             "isolation_level": "READ COMMITTED",
         },
+        # Conexiones persistentes (segundos); se validan antes de reutilizarlas
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=60, cast=int),
+        "CONN_HEALTH_CHECKS": True,
         "TEST": {
             "CHARSET": "utf8mb4",
             "COLLATION": "utf8mb4_unicode_ci",
@@ -111,6 +118,27 @@ DATABASES = {
     }
 }
 
+# Réplica de lectura para estadísticas, reportes, KPIs y dashboards (métodos de
+# repositorio con @lectura_replica). Sin DB_REPLICA_HOST todo va a "default".
+# Tras escribir, la sesión lee de la primaria DB_REPLICA_PEGAJOSIDAD_SEGUNDOS
+DB_REPLICA_ALIAS = "analytics"
+DB_REPLICA_PEGAJOSIDAD_SEGUNDOS = config(
+    "DB_REPLICA_PEGAJOSIDAD_SEGUNDOS", default=5, cast=int
+)
+if config("DB_REPLICA_HOST", default=""):
+    DATABASES[DB_REPLICA_ALIAS] = {
+        **DATABASES["default"],
+        "HOST": config("DB_REPLICA_HOST"),
+        "PORT": config("DB_REPLICA_PORT", default=DATABASES["default"]["PORT"]),
+        "USER": config("DB_REPLICA_USER", default=DATABASES["default"]["USER"]),
+        "PASSWORD": config(
+            "DB_REPLICA_PASSWORD", default=DATABASES["default"]["PASSWORD"]
+        ),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["apps.analytics.infrastructure.db.ReplicaAnaliticaRouter"]
+
 # Database - SQLite para desarrollo (comentado temporalmente)
 # DATABASES = {
 #     "default": {
@@ -215,6 +243,61 @@ CERTIFICADOS_API_URL = config(
 )
 IA_API_URL = config("IA_API_URL", default="http://localhost:8004/api/ia/v1/")
 
+# Cliente del servicio de IA (ruta a la clase; ClienteIASimulado no usa la red)
+IA_CLIENTE = config(
+    "IA_CLIENTE", default="apps.analytics.infrastructure.ia.ClienteIAHttp"
+)
+IA_API_TOKEN = config("IA_API_TOKEN", default="")
+IA_TIMEOUT_CONEXION_SEGUNDOS = config(
+    "IA_TIMEOUT_CONEXION_SEGUNDOS", default=5, cast=float
+)
+IA_TIMEOUT_LECTURA_SEGUNDOS = config(
+    "IA_TIMEOUT_LECTURA_SEGUNDOS", default=120, cast=float
+)
+IA_REINTENTOS = config("IA_REINTENTOS", default=3, cast=int)
+IA_BACKOFF_BASE_SEGUNDOS = config("IA_BACKOFF_BASE_SEGUNDOS", default=0.5, cast=float)
+IA_BACKOFF_MAXIMO_SEGUNDOS = config(
+    "IA_BACKOFF_MAXIMO_SEGUNDOS", default=20, cast=float
+)
+# Generación masiva: llamadas en vuelo en total y por modelo
+# (IA_CONCURRENCIA_POR_MODELO="DALL-E-3=4,MIDJOURNEY=2") y logos por bulk insert
+IA_CONCURRENCIA_MAXIMA = config("IA_CONCURRENCIA_MAXIMA", default=8, cast=int)
+IA_CONCURRENCIA_POR_MODELO = {
+    modelo.strip(): int(limite)
+    for modelo, _, limite in (
+        item.partition("=")
+        for item in config("IA_CONCURRENCIA_POR_MODELO", default="").split(",")
+        if "=" in item
+    )
+}
+IA_LOTE_PERSISTENCIA = config("IA_LOTE_PERSISTENCIA", default=200, cast=int)
+# Límite de tasa compartido entre procesos (token bucket en CACHES): llamadas por
+# segundo (IA_LIMITE_TASA_POR_MODELO="DALL-E-3=1.5,MIDJOURNEY=0.5"), ráfaga y
+# llamadas que pueden esperar turno antes de rechazar con 429
+IA_LIMITE_TASA_ACTIVO = config("IA_LIMITE_TASA_ACTIVO", default=True, cast=bool)
+IA_LIMITE_TASA_POR_SEGUNDO = config(
+    "IA_LIMITE_TASA_POR_SEGUNDO", default=2.0, cast=float
+)
+IA_LIMITE_TASA_POR_MODELO = {
+    modelo.strip(): float(tasa)
+    for modelo, _, tasa in (
+        item.partition("=")
+        for item in config("IA_LIMITE_TASA_POR_MODELO", default="").split(",")
+        if "=" in item
+    )
+}
+IA_LIMITE_RAFAGA = config("IA_LIMITE_RAFAGA", default=5, cast=int)
+IA_LIMITE_COLA_MAXIMA = config("IA_LIMITE_COLA_MAXIMA", default=20, cast=int)
+# Cache de resultados por huella de prompt: vigencia de un logo reutilizable y
+# tamaño del LRU en memoria de cada proceso
+IA_CACHE_PROMPTS_ACTIVO = config("IA_CACHE_PROMPTS_ACTIVO", default=True, cast=bool)
+IA_CACHE_PROMPTS_TTL_SEGUNDOS = config(
+    "IA_CACHE_PROMPTS_TTL_SEGUNDOS", default=7 * 24 * 3600, cast=int
+)
+IA_CACHE_PROMPTS_MAX_ENTRADAS = config(
+    "IA_CACHE_PROMPTS_MAX_ENTRADAS", default=10000, cast=int
+)
+
 # ✅ Configuraciones para Clean Architecture (IMPLEMENTADAS)
 # Configuración de Redis para Celery
 REDIS_URL = config("REDIS_URL", default="redis://localhost:6379/0")
@@ -267,6 +350,100 @@ CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 CELERY_TIMEZONE = TIME_ZONE
 
+# Configuración de trabajos asíncronos de reportes
+REPORTE_JOBS_MAX_WORKERS = config("REPORTE_JOBS_MAX_WORKERS", default=2, cast=int)
+REPORTE_JOBS_EAGER = config("REPORTE_JOBS_EAGER", default=False, cast=bool)
+REPORTE_JOBS_DEDUP_TTL_MINUTOS = config(
+    "REPORTE_JOBS_DEDUP_TTL_MINUTOS", default=30, cast=int
+)
+# Trabajos en curso más antiguos se dan por abandonados al iniciar el ejecutor
+REPORTE_JOBS_TIMEOUT_MINUTOS = config(
+    "REPORTE_JOBS_TIMEOUT_MINUTOS", default=60, cast=int
+)
+
+# Fan-out de subreportes (consolidado) sobre un pool de hilos
+REPORTE_FAN_OUT_PARALELO = config("REPORTE_FAN_OUT_PARALELO", default=True, cast=bool)
+REPORTE_FAN_OUT_MAX_WORKERS = config("REPORTE_FAN_OUT_MAX_WORKERS", default=4, cast=int)
+
+# Reportes personalizados: máximo de filas por consulta
+REPORTE_PERSONALIZADO_MAX_FILAS = config(
+    "REPORTE_PERSONALIZADO_MAX_FILAS", default=5000, cast=int
+)
+
+# Eficiencia de evaluadores: segundos que se cachea el cálculo de cada período
+HISTORIAL_EFICIENCIA_CACHE_SEGUNDOS = config(
+    "HISTORIAL_EFICIENCIA_CACHE_SEGUNDOS", default=900, cast=int
+)
+
+# Outbox de cambios: antigüedad a partir de la cual un hueco en la secuencia se
+# considera una transacción revertida
+OUTBOX_MARGEN_VISIBILIDAD_SEGUNDOS = config(
+    "OUTBOX_MARGEN_VISIBILIDAD_SEGUNDOS", default=5, cast=int
+)
+
+# Feed de actividad: eventos en el buffer circular de cada proceso, frecuencia
+# máxima de consulta al outbox y duración/latido de las conexiones SSE
+ACTIVIDAD_FEED_CAPACIDAD = config("ACTIVIDAD_FEED_CAPACIDAD", default=1000, cast=int)
+ACTIVIDAD_FEED_REFRESCO_SEGUNDOS = config(
+    "ACTIVIDAD_FEED_REFRESCO_SEGUNDOS", default=1.0, cast=float
+)
+ACTIVIDAD_STREAM_DURACION_SEGUNDOS = config(
+    "ACTIVIDAD_STREAM_DURACION_SEGUNDOS", default=300, cast=int
+)
+ACTIVIDAD_STREAM_LATIDO_SEGUNDOS = config(
+    "ACTIVIDAD_STREAM_LATIDO_SEGUNDOS", default=15, cast=int
+)
+
+# Almacén local de logos (direccionado por SHA-256) y miniaturas bajo demanda
+LOGOS_ALMACEN_DIR = config("LOGOS_ALMACEN_DIR", default=str(MEDIA_ROOT / "logos"))
+LOGOS_MINIATURAS_TAMAÑOS = tuple(
+    int(lado)
+    for lado in config("LOGOS_MINIATURAS_TAMANOS", default="64,128,256,512").split(",")
+)
+LOGOS_MINIATURAS_FORMATO = config("LOGOS_MINIATURAS_FORMATO", default="WEBP")
+LOGOS_TAMAÑO_MAXIMO_BYTES = config(
+    "LOGOS_TAMANO_MAXIMO_BYTES", default=10 * 1024 * 1024, cast=int
+)
+LOGOS_DESCARGA_TIMEOUT_SEGUNDOS = config(
+    "LOGOS_DESCARGA_TIMEOUT_SEGUNDOS", default=30, cast=float
+)
+
+# PDFs de reportes y cache de gráficos (se renderizan como trabajos "pdf")
+REPORTES_PDF_DIR = config("REPORTES_PDF_DIR", default=str(MEDIA_ROOT / "reportes"))
+
+# Presupuesto de arranque en frío de un worker web (scripts/perfil_arranque.py
+# --verificar): segundos hasta resolver las URLs, memoria residente máxima y
+# dependencias pesadas que solo deben importarse al usarlas
+ARRANQUE_MAX_SEGUNDOS = config("ARRANQUE_MAX_SEGUNDOS", default=2.5, cast=float)
+ARRANQUE_MAX_MEMORIA_MB = config("ARRANQUE_MAX_MEMORIA_MB", default=120, cast=int)
+ARRANQUE_MODULOS_DIFERIDOS = [
+    modulo.strip()
+    for modulo in config(
+        "ARRANQUE_MODULOS_DIFERIDOS",
+        default="pandas,numpy,matplotlib,seaborn,reportlab,openpyxl,xlsxwriter,PIL",
+    ).split(",")
+    if modulo.strip()
+]
+
+# Métricas por endpoint expuestas en /metrics (formato Prometheus). Con varios
+# workers, cada proceso vuelca sus histogramas al directorio compartido y
+# /metrics los suma; vaciarlo al desplegar. METRICAS_TOKEN exige Bearer token
+METRICAS_ACTIVAS = config("METRICAS_ACTIVAS", default=True, cast=bool)
+METRICAS_DIRECTORIO_MULTIPROCESO = config(
+    "METRICAS_DIRECTORIO_MULTIPROCESO", default=""
+)
+METRICAS_INTERVALO_VOLCADO_SEGUNDOS = config(
+    "METRICAS_INTERVALO_VOLCADO_SEGUNDOS", default=5, cast=float
+)
+METRICAS_TOKEN = config("METRICAS_TOKEN", default="")
+
+# Consultas SQL lentas: se registran en el log y en un buffer circular por
+# proceso (Admin → Dashboard → consultas-lentas/) con su origen y el plan de
+# EXPLAIN. Umbral 0 desactiva la captura
+CONSULTAS_LENTAS_UMBRAL_MS = config("CONSULTAS_LENTAS_UMBRAL_MS", default=200, cast=int)
+CONSULTAS_LENTAS_CAPACIDAD = config("CONSULTAS_LENTAS_CAPACIDAD", default=200, cast=int)
+CONSULTAS_LENTAS_EXPLAIN = config("CONSULTAS_LENTAS_EXPLAIN", default=True, cast=bool)
+
 # Configuración de cache
 CACHES = {
     "default": {
@@ -29,6 +29,7 @@ from drf_spectacular.views import (
 
 # Importar configuración del admin para Clean Architecture
 import ganaderia_bi.admin_config
+from apps.analytics.presentation.controllers.metricas import metricas_prometheus
 
 
 def dashboard_view(request):
@@ -87,6 +88,8 @@ urlpatterns = [
         name="swagger-ui",
     ),
     path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+    # Métricas por endpoint para Prometheus
+    path("metrics", metricas_prometheus, name="metricas"),
 ]
 
 # Configuración de archivos estáticos y media para desarrollo
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark del container de dependencias: container ansioso por request vs del proceso
+Responsabilidad: Medir el costo de inyección de dependencias al crear un controller
+
+"Antes" reproduce el Container() original: cada controller creaba uno nuevo que
+instanciaba en __init__ los seis repositorios y todos los use cases. "Después"
+es el container perezoso compartido por el proceso (MainContainer.instancia()).
+
+Uso:
+    python scripts/benchmark_container.py --repeticiones 2000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Any
+from unittest import mock
+
+import django
+
+# Configurar Django
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ganaderia_bi.settings")
+django.setup()
+
+from django.utils.module_loading import import_string
+
+from apps.analytics.infrastructure.container.main_container import MainContainer
+from apps.analytics.infrastructure.container.repositories_container import (
+    PROVEEDORES_REPOSITORIOS,
+)
+from apps.analytics.infrastructure.container.use_cases_container import (
+    PROVEEDORES_USE_CASES,
+)
+from apps.analytics.infrastructure.jobs import ReporteJobExecutor
+from apps.analytics.use_cases.reporte.encolar_reporte_job_use_case import (
+    EncolarReporteJobUseCase,
+)
+
+# Controllers cuyos use cases tienen repositorios concretos
+CONTROLLERS = [
+    "apps.analytics.presentation.controllers.reporte.jobs_controller.ReporteJobsController",
+    "apps.analytics.presentation.controllers.historial.crud_controller.HistorialCRUDController",
+    "apps.analytics.presentation.controllers.historial.actividad_controller.HistorialActividadController",
+    "apps.analytics.presentation.controllers.reporte.pdf_controller.ReportePdfController",
+]
+
+
+class ContainerAnsioso:
+    """
+    Copia del Container() original: las clases se importan una sola vez (como los
+    imports de su módulo) y cada instancia crea en __init__ los repositorios y
+    todos los use cases. Los controllers los leen con get_<nombre>()
+
+    El __init__ se genera a partir de las tablas de proveedores con una línea
+    `nombre = self.nombre = Clase(dependencias)` por instancia, la misma forma
+    que el original escrito a mano, para no medir el costo de recorrer una tabla.
+    """
+
+    @classmethod
+    def importar_clases(cls) -> None:
+        proveedores = {
+            nombre: (import_string(ruta), ())
+            for nombre, ruta in PROVEEDORES_REPOSITORIOS.items()
+        }
+        proveedores.update(
+            (nombre, (import_string(ruta), dependencias))
+            for nombre, (ruta, dependencias) in PROVEEDORES_USE_CASES.items()
+        )
+
+        plan, creados = [], set()
+
+        def agregar(nombre):
+            if nombre in creados:
+                return
+            clase, dependencias = proveedores[nombre]
+            for dependencia in dependencias:
+                agregar(dependencia)
+            plan.append((nombre, clase, dependencias))
+            creados.add(nombre)
+
+        # El use case de encolado se arma con su ejecutor, como en el original
+        proveedores["encolar_reporte_job_use_case"] = (
+            cls._crear_encolar,
+            ("reporte_job_repository", "reporte_repository"),
+        )
+        for nombre in proveedores:
+            agregar(nombre)
+
+        espacio, lineas = {}, ["def __init__(self):"]
+        for indice, (nombre, clase, dependencias) in enumerate(plan):
+            espacio[f"_clase_{indice}"] = clase
+            lineas.append(
+                f"    {nombre} = self.{nombre} = "
+                f"_clase_{indice}({', '.join(dependencias)})"
+            )
+        exec("\n".join(lineas), espacio)
+        cls.__init__ = espacio["__init__"]
+
+    @staticmethod
+    def _crear_encolar(reporte_job_repository, reporte_repository):
+        return EncolarReporteJobUseCase(
+            reporte_job_repository,
+            ReporteJobExecutor(reporte_job_repository, reporte_repository),
+        )
+
+    def __getattr__(self, nombre: str) -> Any:
+        # get_<use case>() / get_<repositorio>() como en el container original
+        valor = self.__dict__.get(nombre.removeprefix("get_"))
+        if valor is None:
+            raise AttributeError(nombre)
+        return lambda: valor
+
+
+def medir(controllers, repeticiones, por_request):
+    """Crea los controllers como en cada request y retorna µs por controller"""
+    duraciones = []
+    # Con por_request cada controller arma su propio container ansioso, como antes
+    instancia = ContainerAnsioso if por_request else MainContainer.instancia
+    with mock.patch.object(MainContainer, "instancia", instancia):
+        for controller in controllers:
+            controller()  # Calentamiento: imports de los use cases
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            for controller in controllers:
+                controller()
+            duraciones.append(
+                (time.perf_counter() - inicio) / len(controllers) * 1_000_000
+            )
+    return duraciones
+
+
+def imprimir_resultado(nombre, duraciones):
+    """Muestra estadísticas de una serie de mediciones"""
+    duraciones = sorted(duraciones)
+    print(f"\n📊 {nombre}")
+    print(f"   Mediana: {statistics.median(duraciones):.2f} µs")
+    print(f"   p99:     {duraciones[int(len(duraciones) * 0.99) - 1]:.2f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=2000)
+    args = parser.parse_args()
+
+    controllers = [import_string(ruta) for ruta in CONTROLLERS]
+    ContainerAnsioso.importar_clases()
+    print(
+        f"🔄 {len(controllers)} controllers, {args.repeticiones} repeticiones "
+        "(µs por controller creado)"
+    )
+
+    por_request = medir(controllers, args.repeticiones, por_request=True)
+    compartido = medir(controllers, args.repeticiones, por_request=False)
+
+    imprimir_resultado("Container ansioso por request (antes)", por_request)
+    imprimir_resultado("Container perezoso del proceso (después)", compartido)
+
+    mejora = statistics.median(por_request) / statistics.median(compartido)
+    print(f"\n⚡ Reducción del costo por request: {mejora:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark del reporte consolidado: ejecución en serie vs fan-out en paralelo
+Responsabilidad: Medir la latencia de generar_reporte_consolidado en ambos modos
+
+Uso:
+    python scripts/benchmark_reporte_consolidado.py --repeticiones 10 --dias 365
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+import django
+
+# Configurar Django
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ganaderia_bi.settings")
+django.setup()
+
+from django.conf import settings
+
+from apps.analytics.infrastructure.repositories import DjangoReporteRepository
+
+
+def medir(repositorio, fecha_inicio, fecha_fin, paralelo, repeticiones):
+    """Ejecuta el consolidado varias veces y retorna duraciones y último metadata"""
+    settings.REPORTE_FAN_OUT_PARALELO = paralelo
+    duraciones = []
+    metadata = {}
+
+    # Calentamiento: conexiones del pool y caches de consultas
+    repositorio.generar_reporte_consolidado(fecha_inicio, fecha_fin)
+
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        reporte = repositorio.generar_reporte_consolidado(fecha_inicio, fecha_fin)
+        duraciones.append(time.perf_counter() - inicio)
+        metadata = reporte.datos["metadata"]
+
+    return duraciones, metadata
+
+
+def imprimir_resultado(nombre, duraciones, metadata):
+    """Muestra estadísticas de una serie de mediciones"""
+    print(f"\n📊 {nombre}")
+    print(f"   Mediana: {statistics.median(duraciones) * 1000:.1f} ms")
+    print(f"   Mínimo:  {min(duraciones) * 1000:.1f} ms")
+    print(f"   Máximo:  {max(duraciones) * 1000:.1f} ms")
+    for subreporte, segundos in metadata["tiempos_subreportes"].items():
+        print(f"   - {subreporte}: {segundos * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--dias", type=int, default=365)
+    args = parser.parse_args()
+
+    fecha_fin = datetime.now()
+    fecha_inicio = fecha_fin - timedelta(days=args.dias)
+    repositorio = DjangoReporteRepository()
+
+    print(
+        f"🔄 Reporte consolidado de {args.dias} días, {args.repeticiones} repeticiones"
+    )
+
+    serie, metadata_serie = medir(
+        repositorio, fecha_inicio, fecha_fin, False, args.repeticiones
+    )
+    paralelo, metadata_paralelo = medir(
+        repositorio, fecha_inicio, fecha_fin, True, args.repeticiones
+    )
+
+    imprimir_resultado("Serie", serie, metadata_serie)
+    imprimir_resultado("Paralelo", paralelo, metadata_paralelo)
+
+    mediana_serie = statistics.median(serie)
+    mediana_paralelo = statistics.median(paralelo)
+    mas_lento = max(metadata_paralelo["tiempos_subreportes"].values())
+    print(f"\n⚡ Aceleración: {mediana_serie / mediana_paralelo:.2f}x")
+    print(f"   Subreporte más lento (paralelo): {mas_lento * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,589 @@
+#!/usr/bin/env python3
+"""
+Benchmark de los repositorios Django sobre datos sintéticos
+Responsabilidad: Medir latencia, consultas SQL y memoria pico de cada método
+público de los repositorios a 10k, 100k o 1M marcas
+
+Cada escala usa su propia base SQLite en benchmarks/datos, generada la primera
+vez con GeneradorDatosSinteticos y la semilla indicada (--regenerar la vuelve a
+crear). Los métodos que escriben corren en una transacción que se revierte, así
+que el dataset no cambia entre ejecuciones. El resultado se guarda como JSON en
+benchmarks/resultados y se agrega una línea al historial de la escala. Si algún
+método falla el script termina con código 1 sin actualizar la base.
+
+Con --verificar compara con benchmarks/base y termina con código 1 si un método
+tarda más de --umbral veces su base (y al menos --minimo-ms más), ejecuta más
+consultas o empezó a fallar. --actualizar-base guarda el resultado como base.
+
+Uso:
+    python scripts/benchmark_repositorios.py --escala 10k --actualizar-base
+    python scripts/benchmark_repositorios.py --escala 10k --verificar --umbral 1.5
+    python scripts/benchmark_repositorios.py --escala 10k --escala 100k
+    python scripts/benchmark_repositorios.py --escala 1m --repositorio marca --metodo list_
+"""
+
+import argparse
+import dataclasses
+import inspect
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from enum import Enum
+
+import django
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIRECTORIO_DATOS = os.path.join(RAIZ, "benchmarks", "datos")
+DIRECTORIO_RESULTADOS = os.path.join(RAIZ, "benchmarks", "resultados")
+DIRECTORIO_BASE = os.path.join(RAIZ, "benchmarks", "base")
+
+ESCALAS = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+REPOSITORIOS = {
+    "marca": "DjangoMarcaRepository",
+    "dashboard": "DjangoDashboardRepository",
+    "kpi": "DjangoKpiRepository",
+    "reporte": "DjangoReporteRepository",
+    "historial": "DjangoHistorialRepository",
+    "logo": "DjangoLogoRepository",
+}
+
+# Métodos que escriben: se ejecutan en una transacción revertida
+MUTADORES = {
+    "crear",
+    "actualizar",
+    "save",
+    "eliminar",
+    "delete",
+    "registrar_cambio_estado",
+}
+
+OMITIDOS = {
+    "logo.generar_en_lote": "llama al servicio de IA",
+}
+
+# Parámetros que reciben una entidad del dataset
+ENTIDADES = ("marca", "historial", "kpi", "logo")
+
+
+class ContadorConsultas:
+    """Cuenta las consultas de todas las conexiones, también las de otros hilos"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.consultas = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            with self._lock:
+                self.consultas += 1
+
+    def instalar(self):
+        from django.db import connections
+        from django.db.backends.signals import connection_created
+
+        connection_created.connect(self._al_conectar, weak=False)
+        for conexion in connections.all(initialized_only=True):
+            self._al_conectar(None, conexion)
+
+    def _al_conectar(self, sender, connection, **kwargs):
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+
+def ruta_dataset(escala, semilla):
+    return os.path.join(DIRECTORIO_DATOS, f"sintetico_{escala}_s{semilla}.sqlite3")
+
+
+def configurar_django(ruta_sqlite):
+    """Ajusta settings antes de django.setup() y arranca Django"""
+    sys.path.append(RAIZ)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ganaderia_bi.settings")
+    from django.conf import settings
+
+    if ruta_sqlite:
+        settings.DATABASES = {
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ruta_sqlite}
+        }
+        settings.REPORTES_PDF_DIR = os.path.join(DIRECTORIO_DATOS, "pdf")
+    # Cache local (se vacía antes de cada llamada), sin connection.queries,
+    # logs DEBUG ni captura de consultas lentas: todo eso mediría otra cosa
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.DEBUG = False
+    settings.LOGGING = {"version": 1, "disable_existing_loggers": False}
+    settings.CONSULTAS_LENTAS_UMBRAL_MS = 0
+    django.setup()
+
+
+def preparar_dataset(escala, semilla, regenerar):
+    """Genera la base de la escala si no existe; retorna su metadata"""
+    from django.core.management import call_command
+
+    from apps.analytics.infrastructure.datos_sinteticos import (
+        GeneradorDatosSinteticos,
+    )
+
+    ruta = ruta_dataset(escala, semilla)
+    ruta_metadata = f"{ruta}.json"
+    if not regenerar and os.path.exists(ruta_metadata):
+        with open(ruta_metadata, encoding="utf-8") as archivo:
+            return json.load(archivo)
+
+    print(f"🔄 Generando dataset {escala} (semilla {semilla}) en {ruta}")
+    inicio = time.perf_counter()
+    # Aún no hay conexiones abiertas: se puede reemplazar el archivo
+    if os.path.exists(ruta):
+        os.remove(ruta)
+    call_command("migrate", verbosity=0)
+
+    def al_avanzar(hechas, total):
+        print(f"   {hechas:>9,} / {total:,} marcas", end="\r", flush=True)
+
+    generador = GeneradorDatosSinteticos(semilla=semilla)
+    filas = generador.poblar(ESCALAS[escala], al_avanzar=al_avanzar)
+    metadata = {
+        "escala": escala,
+        "semilla": semilla,
+        "fecha_fin": generador.fecha_fin.isoformat(),
+        "filas": filas,
+        "segundos_generacion": round(time.perf_counter() - inicio, 1),
+    }
+    with open(ruta_metadata, "w", encoding="utf-8") as archivo:
+        json.dump(metadata, archivo, indent=2)
+    print(f"\n✅ Dataset listo en {metadata['segundos_generacion']} s: {filas}")
+    return metadata
+
+
+class Contexto:
+    """Valores del dataset para los parámetros de cada método"""
+
+    def __init__(self, fecha_fin, repositorios):
+        from apps.analytics.infrastructure.models import (
+            HistorialEstadoMarcaModel,
+            KPIGanadoBovinoModel,
+            LogoMarcaBovinaModel,
+            ReporteDataModel,
+        )
+
+        self.fecha_fin = fecha_fin
+        self.repositorios = repositorios
+        fecha_inicio = fecha_fin - timedelta(days=90)
+
+        # Una marca aprobada con logos, historial completo y de mitad de tabla
+        logo = _fila_intermedia(LogoMarcaBovinaModel.objects.filter(exito=True))
+        marca_id = logo.marca_id if logo else None
+        historial = (
+            HistorialEstadoMarcaModel.objects.filter(marca_id=marca_id)
+            .order_by("-fecha_cambio")
+            .first()
+        )
+        kpi = (
+            KPIGanadoBovinoModel.objects.filter(fecha__lte=fecha_inicio.date())
+            .order_by("-fecha")
+            .first()
+        )
+        reporte = ReporteDataModel.objects.order_by("-id").first()
+        huella_imagen = (
+            LogoMarcaBovinaModel.objects.exclude(huella_imagen=None)
+            .values_list("huella_imagen", flat=True)
+            .first()
+        )
+
+        self.valores = {
+            "marca_id": marca_id,
+            "numero_marca": logo.marca.numero_marca if logo else None,
+            "historial_id": historial.id if historial else None,
+            "logo_id": logo.id if logo else None,
+            "kpi_id": kpi.id if kpi else None,
+            "reporte_id": reporte.id if reporte else None,
+            "huella_imagen": huella_imagen,
+            "fecha": kpi.fecha if kpi else None,
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+            "anio": fecha_fin.year,
+            "mes": fecha_fin.month,
+            "departamento": "SANTA_CRUZ",
+            "estado": "APROBADO",
+            "proposito": "CARNE",
+            "raza": "NELORE",
+            "calidad": "ALTA",
+            "modelo": "DALL-E-3",
+            "usuario": historial.usuario_responsable if historial else None,
+            "filtros": {
+                "fecha_inicio": fecha_inicio.date().isoformat(),
+                "fecha_fin": fecha_fin.date().isoformat(),
+            },
+            "especificacion": {
+                "filtros": {
+                    "fecha_inicio": fecha_inicio.date().isoformat(),
+                    "fecha_fin": fecha_fin.date().isoformat(),
+                },
+                "metricas": ["conteo", "suma_cabezas", "promedio_tiempo"],
+                "agrupaciones": ["departamento", "mes"],
+            },
+            "min_soporte": 5,
+            "limite": 20,
+            "espera_segundos": 0.0,
+        }
+        self._entidades = {}
+
+    def entidad(self, nombre, metodo):
+        """Entidad existente; en `crear`, una copia sin id con claves únicas nuevas"""
+        if nombre not in self._entidades:
+            identificador = self.valores[f"{nombre}_id"]
+            self._entidades[nombre] = (
+                self.repositorios[nombre].obtener_por_id(identificador)
+                if identificador
+                else None
+            )
+        entidad = self._entidades[nombre]
+        if entidad is None or metodo not in ("crear", "registrar_cambio_estado"):
+            return entidad
+
+        cambios = {"id": None}
+        if nombre == "marca":
+            # Solicitud nueva: se registra ahora, todavía sin procesar
+            cambios.update(
+                numero_marca="BENCH-0000001",
+                estado=type(entidad.estado).PENDIENTE,
+                fecha_procesamiento=None,
+                tiempo_procesamiento_horas=None,
+            )
+        elif nombre == "kpi":
+            cambios["fecha"] = self.fecha_fin.date() + timedelta(days=1)
+        return dataclasses.replace(entidad, **cambios)
+
+    def argumentos(self, funcion, metodo):
+        """kwargs del método; los parámetros con default usan su default"""
+        argumentos = {}
+        parametros = list(inspect.signature(funcion).parameters.values())[1:]
+        for parametro in parametros:
+            nombre = parametro.name
+            if parametro.default is not inspect.Parameter.empty:
+                continue
+            if nombre == "desde_secuencia":
+                argumentos[nombre] = None
+                continue
+            if nombre in ENTIDADES:
+                valor = self.entidad(nombre, metodo)
+            else:
+                valor = self.valores.get(nombre)
+            if valor is None:
+                raise LookupError(f"sin valor para '{nombre}' en el dataset")
+            argumentos[nombre] = _convertir(valor, parametro.annotation)
+        return argumentos
+
+
+def _fila_intermedia(queryset):
+    """Fila con el id más cercano a la mitad del rango (evita offsets grandes)"""
+    from django.db.models import Max, Min
+
+    extremos = queryset.aggregate(minimo=Min("id"), maximo=Max("id"))
+    if extremos["minimo"] is None:
+        return None
+    mitad = (extremos["minimo"] + extremos["maximo"]) // 2
+    return queryset.filter(id__gte=mitad).order_by("id").first()
+
+
+def _convertir(valor, anotacion):
+    """Adapta el valor al tipo anotado (fecha vs datetime, enums del dominio)"""
+    if anotacion is date and isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(anotacion, type) and issubclass(anotacion, Enum):
+        return anotacion(valor)
+    return valor
+
+
+def _ejecutar(funcion, argumentos, muta):
+    from django.db import transaction
+
+    if not muta:
+        return funcion(**argumentos)
+    with transaction.atomic():
+        resultado = funcion(**argumentos)
+        transaction.set_rollback(True)
+    return resultado
+
+
+def _percentil(valores, percentil):
+    ordenados = sorted(valores)
+    indice = max(math.ceil(percentil / 100 * len(ordenados)) - 1, 0)
+    return ordenados[indice]
+
+
+def medir_metodo(funcion, argumentos, muta, repeticiones, contador):
+    """Una ejecución con tracemalloc (consultas y memoria) y N cronometradas"""
+    from django.core.cache import cache
+
+    cache.clear()
+    contador.consultas = 0
+    tracemalloc.start()
+    try:
+        resultado = _ejecutar(funcion, argumentos, muta)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    consultas = contador.consultas
+
+    duraciones = []
+    for _ in range(repeticiones):
+        cache.clear()
+        inicio = time.perf_counter()
+        _ejecutar(funcion, argumentos, muta)
+        duraciones.append((time.perf_counter() - inicio) * 1000)
+
+    medicion = {
+        "estado": "ok",
+        "p50_ms": round(statistics.median(duraciones), 3),
+        "p95_ms": round(_percentil(duraciones, 95), 3),
+        "min_ms": round(min(duraciones), 3),
+        "max_ms": round(max(duraciones), 3),
+        "consultas": consultas,
+        "memoria_pico_kb": round(pico / 1024, 1),
+    }
+    if isinstance(resultado, (list, tuple)):
+        medicion["filas"] = len(resultado)
+    return medicion
+
+
+def ejecutar_benchmark(args, metadata):
+    """Mide cada método público de los repositorios seleccionados"""
+    from apps.analytics.infrastructure import repositories
+
+    contador = ContadorConsultas()
+    contador.instalar()
+
+    # Un repositorio con métodos abstractos sin implementar no se puede
+    # instanciar: el TypeError interrumpe el benchmark en lugar de ocultarlo
+    clases = {
+        clave: getattr(repositories, nombre) for clave, nombre in REPOSITORIOS.items()
+    }
+    instancias = {clave: clase() for clave, clase in clases.items()}
+    fecha_fin = datetime.fromisoformat(metadata["fecha_fin"])
+    contexto = Contexto(fecha_fin, instancias)
+
+    resultados = {}
+    for clave in args.repositorio or REPOSITORIOS:
+        print(f"\n📦 {REPOSITORIOS[clave]}")
+        for metodo, funcion in inspect.getmembers(clases[clave], inspect.isfunction):
+            if metodo.startswith("_") or (args.metodo and args.metodo not in metodo):
+                continue
+            nombre = f"{clave}.{metodo}"
+            if nombre in OMITIDOS:
+                resultados[nombre] = {"estado": "omitido", "motivo": OMITIDOS[nombre]}
+            else:
+                try:
+                    argumentos = contexto.argumentos(funcion, metodo)
+                    resultados[nombre] = medir_metodo(
+                        getattr(instancias[clave], metodo),
+                        argumentos,
+                        metodo in MUTADORES,
+                        args.repeticiones,
+                        contador,
+                    )
+                except LookupError as error:
+                    resultados[nombre] = {"estado": "omitido", "motivo": str(error)}
+                except Exception as error:
+                    resultados[nombre] = {
+                        "estado": "error",
+                        "error": f"{type(error).__name__}: {error}"[:300],
+                    }
+            imprimir_medicion(metodo, resultados[nombre])
+
+    return {
+        "escala": metadata["escala"],
+        "semilla": metadata["semilla"],
+        "base_datos": args.base_datos,
+        "filas": metadata["filas"],
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "repeticiones": args.repeticiones,
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "resultados": resultados,
+    }
+
+
+def imprimir_medicion(metodo, medicion):
+    if medicion["estado"] == "ok":
+        print(
+            f"   {metodo:<42} p50 {medicion['p50_ms']:>9.2f} ms  "
+            f"p95 {medicion['p95_ms']:>9.2f} ms  {medicion['consultas']:>4} SQL  "
+            f"{medicion['memoria_pico_kb']:>9.0f} KB"
+        )
+    elif medicion["estado"] == "omitido":
+        print(f"   {metodo:<42} ⏭️  {medicion['motivo']}")
+    else:
+        print(f"   {metodo:<42} ❌ {medicion['error']}")
+
+
+def guardar(resultado, directorio):
+    os.makedirs(directorio, exist_ok=True)
+    ruta = os.path.join(directorio, f"repositorios_{resultado['escala']}.json")
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(resultado, archivo, indent=2, ensure_ascii=False)
+    return ruta
+
+
+def agregar_historial(resultado):
+    """Una línea por ejecución con p50 y consultas, para ver tendencias"""
+    os.makedirs(DIRECTORIO_RESULTADOS, exist_ok=True)
+    ruta = os.path.join(
+        DIRECTORIO_RESULTADOS, f"historial_repositorios_{resultado['escala']}.jsonl"
+    )
+    linea = {
+        "fecha": resultado["fecha"],
+        "base_datos": resultado["base_datos"],
+        "resultados": {
+            nombre: [medicion["p50_ms"], medicion["consultas"]]
+            for nombre, medicion in resultado["resultados"].items()
+            if medicion["estado"] == "ok"
+        },
+    }
+    with open(ruta, "a", encoding="utf-8") as archivo:
+        archivo.write(json.dumps(linea, ensure_ascii=False) + "\n")
+
+
+def verificar(resultado, umbral, minimo_ms):
+    """Compara con la base de la escala; retorna el código de salida"""
+    ruta = os.path.join(DIRECTORIO_BASE, f"repositorios_{resultado['escala']}.json")
+    if not os.path.exists(ruta):
+        print(f"\n❌ No hay base en {ruta} (generarla con --actualizar-base)")
+        return 1
+    with open(ruta, encoding="utf-8") as archivo:
+        base = json.load(archivo)
+
+    regresiones = []
+    for nombre, anterior in base["resultados"].items():
+        actual = resultado["resultados"].get(nombre)
+        if actual is None or anterior["estado"] != "ok":
+            continue
+        if actual["estado"] == "error":
+            regresiones.append(f"{nombre}: ahora falla ({actual['error']})")
+            continue
+        if actual["estado"] != "ok":
+            continue
+        if (
+            actual["p50_ms"] > anterior["p50_ms"] * umbral
+            and actual["p50_ms"] - anterior["p50_ms"] >= minimo_ms
+        ):
+            regresiones.append(
+                f"{nombre}: p50 {anterior['p50_ms']:.2f} → {actual['p50_ms']:.2f} ms "
+                f"({actual['p50_ms'] / anterior['p50_ms']:.2f}x)"
+            )
+        if actual["consultas"] > anterior["consultas"]:
+            regresiones.append(
+                f"{nombre}: {anterior['consultas']} → {actual['consultas']} consultas"
+            )
+
+    print(f"\n🔍 Comparación con la base del {base['fecha']} (umbral {umbral}x)")
+    if regresiones:
+        print("❌ Regresiones:")
+        for regresion in regresiones:
+            print(f"   - {regresion}")
+        return 1
+    print("✅ Sin regresiones")
+    return 0
+
+
+def argumentos_sin_escala(argv):
+    """argv sin las opciones --escala (para relanzar una escala por proceso)"""
+    restantes = []
+    saltar = False
+    for argumento in argv:
+        if saltar:
+            saltar = False
+        elif argumento == "--escala":
+            saltar = True
+        elif not argumento.startswith("--escala="):
+            restantes.append(argumento)
+    return restantes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--escala",
+        action="append",
+        choices=list(ESCALAS),
+        help="10k, 100k o 1m marcas (repetible; default: 10k)",
+    )
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument(
+        "--base-datos",
+        choices=["sqlite", "configurada"],
+        default="sqlite",
+        help="sqlite: dataset sintético local; configurada: la de settings, sin poblar",
+    )
+    parser.add_argument("--repositorio", action="append", choices=list(REPOSITORIOS))
+    parser.add_argument("--metodo", help="Solo métodos cuyo nombre contiene el texto")
+    parser.add_argument("--regenerar", action="store_true")
+    parser.add_argument("--verificar", action="store_true")
+    parser.add_argument("--umbral", type=float, default=1.5)
+    parser.add_argument("--minimo-ms", type=float, default=5.0)
+    parser.add_argument("--actualizar-base", action="store_true")
+    args = parser.parse_args()
+    escalas = args.escala or ["10k"]
+
+    # Cada escala es otra base de datos: un proceso por escala
+    if len(escalas) > 1:
+        codigo = 0
+        for escala in escalas:
+            comando = [sys.executable, os.path.abspath(__file__)]
+            comando += argumentos_sin_escala(sys.argv[1:]) + ["--escala", escala]
+            codigo = max(codigo, subprocess.run(comando).returncode)
+        sys.exit(codigo)
+
+    escala = escalas[0]
+    if args.base_datos == "sqlite":
+        os.makedirs(DIRECTORIO_DATOS, exist_ok=True)
+        configurar_django(ruta_dataset(escala, args.semilla))
+        metadata = preparar_dataset(escala, args.semilla, args.regenerar)
+    else:
+        configurar_django(None)
+        metadata = {
+            "escala": "configurada",
+            "semilla": None,
+            "fecha_fin": datetime.now().isoformat(),
+            "filas": None,
+        }
+
+    print(
+        f"⏱️ Benchmark de repositorios: escala {escala}, "
+        f"{args.repeticiones} repeticiones, base {args.base_datos}"
+    )
+    resultado = ejecutar_benchmark(args, metadata)
+    ruta = guardar(resultado, DIRECTORIO_RESULTADOS)
+    agregar_historial(resultado)
+    print(f"\n💾 Resultados en {os.path.relpath(ruta, RAIZ)}")
+
+    errores = [
+        nombre
+        for nombre, medicion in resultado["resultados"].items()
+        if medicion["estado"] == "error"
+    ]
+    if errores:
+        print(f"\n❌ {len(errores)} métodos fallaron: {', '.join(errores)}")
+        sys.exit(1)
+
+    if args.actualizar_base:
+        ruta = guardar(resultado, DIRECTORIO_BASE)
+        print(f"📌 Base actualizada en {os.path.relpath(ruta, RAIZ)}")
+    if args.verificar:
+        sys.exit(verificar(resultado, args.umbral, args.minimo_ms))
+
+
+if __name__ == "__main__":
+    main()
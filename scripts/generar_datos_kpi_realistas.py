@@ -1,339 +0,0 @@
-#!/usr/bin/env python3
-"""
-Script para generar datos de KPI realistas y corregir problemas de cálculo
-Responsabilidad: Generar datos de prueba consistentes para el sistema de KPIs
-"""
-
-import os
-import sys
-import django
-from datetime import date, timedelta
-from decimal import Decimal
-import random
-
-# Configurar Django
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ganaderia_bi.settings")
-django.setup()
-
-from apps.analytics.infrastructure.models import KPIGanadoBovinoModel
-from django.db import models
-
-
-def generar_datos_kpi_realistas():
-    """Genera datos de KPI realistas para el sistema"""
-
-    print("🔄 Generando datos de KPI realistas...")
-
-    # Limpiar datos existentes de KPI
-    KPIGanadoBovinoModel.objects.all().delete()
-    print("✅ Datos de KPI anteriores eliminados")
-
-    # Generar datos para los últimos 6 meses
-    fecha_inicio = date.today() - timedelta(days=180)
-    fecha_fin = date.today()
-
-    fecha_actual = fecha_inicio
-    contador = 0
-
-    while fecha_actual <= fecha_fin:
-        # Verificar si ya existe un registro para esta fecha
-        if not KPIGanadoBovinoModel.objects.filter(fecha=fecha_actual).exists():
-            # Generar datos realistas para cada mes
-            kpi_data = generar_kpi_mensual(fecha_actual)
-
-            # Crear registro de KPI con la fecha correcta
-            kpi = KPIGanadoBovinoModel(
-                fecha=fecha_actual,  # Usar la fecha actual del bucle
-                marcas_registradas_mes=kpi_data["marcas_registradas"],
-                tiempo_promedio_procesamiento=kpi_data["tiempo_promedio"],
-                porcentaje_aprobacion=kpi_data["porcentaje_aprobacion"],
-                ingresos_mes=kpi_data["ingresos_mes"],
-                total_cabezas_registradas=kpi_data["total_cabezas"],
-                promedio_cabezas_por_marca=kpi_data["promedio_cabezas"],
-                marcas_carne=kpi_data["marcas_carne"],
-                marcas_leche=kpi_data["marcas_leche"],
-                marcas_doble_proposito=kpi_data["marcas_doble_proposito"],
-                marcas_reproduccion=kpi_data["marcas_reproduccion"],
-                marcas_santa_cruz=kpi_data["marcas_santa_cruz"],
-                marcas_beni=kpi_data["marcas_beni"],
-                marcas_la_paz=kpi_data["marcas_la_paz"],
-                marcas_otros_departamentos=kpi_data["marcas_otros"],
-                tasa_exito_logos=kpi_data["tasa_exito_logos"],
-                total_logos_generados=kpi_data["total_logos"],
-                tiempo_promedio_generacion_logos=kpi_data["tiempo_logos"],
-            )
-
-            try:
-                kpi.save()
-                contador += 1
-                print(f"✅ Generado KPI para {fecha_actual}")
-            except Exception as e:
-                print(f"⚠️ Error guardando KPI para {fecha_actual}: {e}")
-
-        # Avanzar al siguiente mes
-        fecha_actual = fecha_actual.replace(day=1) + timedelta(days=32)
-        fecha_actual = fecha_actual.replace(day=1)
-
-    print(f"✅ Se generaron {contador} registros de KPI realistas")
-    return contador
-
-
-def generar_kpi_mensual(fecha):
-    """Genera datos de KPI para un mes específico"""
-
-    # Base de datos realistas
-    base_marcas = 15
-    base_ingresos = 25000
-    base_cabezas = 800
-
-    # Variación estacional (más actividad en ciertos meses)
-    factor_estacional = 1.0
-    if fecha.month in [3, 4, 5]:  # Marzo-Abril-Mayo (temporada alta)
-        factor_estacional = 1.3
-    elif fecha.month in [12, 1, 2]:  # Diciembre-Enero-Febrero (temporada baja)
-        factor_estacional = 0.8
-
-    # Tendencia de crecimiento (5% mensual)
-    meses_desde_inicio = (fecha.year - 2024) * 12 + fecha.month - 1
-    factor_crecimiento = 1 + (meses_desde_inicio * 0.05)
-
-    # Calcular métricas base
-    marcas_registradas = int(
-        base_marcas * factor_estacional * factor_crecimiento + random.uniform(-3, 3)
-    )
-    marcas_registradas = max(5, marcas_registradas)  # Mínimo 5 marcas
-
-    # Tiempo promedio de procesamiento (24-48 horas)
-    tiempo_promedio = random.uniform(24.0, 48.0)
-
-    # Porcentaje de aprobación (60-95%)
-    porcentaje_aprobacion = random.uniform(60.0, 95.0)
-
-    # Ingresos mensuales
-    ingresos_mes = Decimal(
-        str(
-            base_ingresos * factor_estacional * factor_crecimiento
-            + random.uniform(-5000, 5000)
-        )
-    )
-    ingresos_mes = max(Decimal("10000"), ingresos_mes)  # Mínimo 10,000 Bs
-
-    # Total de cabezas
-    total_cabezas = int(
-        base_cabezas * factor_estacional * factor_crecimiento
-        + random.uniform(-100, 100)
-    )
-    total_cabezas = max(200, total_cabezas)  # Mínimo 200 cabezas
-
-    # Promedio de cabezas por marca
-    promedio_cabezas = (
-        total_cabezas / marcas_registradas if marcas_registradas > 0 else 0
-    )
-
-    # Distribución por propósito (asegurar que sume exactamente)
-    marcas_carne = int(marcas_registradas * random.uniform(0.3, 0.5))
-    marcas_leche = int(marcas_registradas * random.uniform(0.2, 0.4))
-    marcas_doble_proposito = int(marcas_registradas * random.uniform(0.1, 0.3))
-    marcas_reproduccion = (
-        marcas_registradas - marcas_carne - marcas_leche - marcas_doble_proposito
-    )
-    marcas_reproduccion = max(0, marcas_reproduccion)
-
-    # Ajustar si hay desbordamiento
-    if marcas_reproduccion < 0:
-        exceso = abs(marcas_reproduccion)
-        if marcas_carne > exceso:
-            marcas_carne -= exceso
-        elif marcas_leche > exceso:
-            marcas_leche -= exceso
-        elif marcas_doble_proposito > exceso:
-            marcas_doble_proposito -= exceso
-        marcas_reproduccion = 0
-
-    # Distribución geográfica (asegurar que sume exactamente)
-    marcas_santa_cruz = int(marcas_registradas * random.uniform(0.4, 0.6))
-    marcas_beni = int(marcas_registradas * random.uniform(0.2, 0.4))
-    marcas_la_paz = int(marcas_registradas * random.uniform(0.1, 0.3))
-    marcas_otros = marcas_registradas - marcas_santa_cruz - marcas_beni - marcas_la_paz
-    marcas_otros = max(0, marcas_otros)
-
-    # Ajustar si hay desbordamiento geográfico
-    if marcas_otros < 0:
-        exceso = abs(marcas_otros)
-        if marcas_santa_cruz > exceso:
-            marcas_santa_cruz -= exceso
-        elif marcas_beni > exceso:
-            marcas_beni -= exceso
-        elif marcas_la_paz > exceso:
-            marcas_la_paz -= exceso
-        marcas_otros = 0
-
-    # KPIs de logos
-    total_logos = int(marcas_registradas * random.uniform(0.8, 1.2))
-    tasa_exito_logos = random.uniform(70.0, 95.0)
-    tiempo_logos = random.uniform(10.0, 30.0)  # 10-30 segundos
-
-    return {
-        "marcas_registradas": marcas_registradas,
-        "tiempo_promedio": tiempo_promedio,
-        "porcentaje_aprobacion": porcentaje_aprobacion,
-        "ingresos_mes": ingresos_mes,
-        "total_cabezas": total_cabezas,
-        "promedio_cabezas": promedio_cabezas,
-        "marcas_carne": marcas_carne,
-        "marcas_leche": marcas_leche,
-        "marcas_doble_proposito": marcas_doble_proposito,
-        "marcas_reproduccion": marcas_reproduccion,
-        "marcas_santa_cruz": marcas_santa_cruz,
-        "marcas_beni": marcas_beni,
-        "marcas_la_paz": marcas_la_paz,
-        "marcas_otros": marcas_otros,
-        "tasa_exito_logos": tasa_exito_logos,
-        "total_logos": total_logos,
-        "tiempo_logos": tiempo_logos,
-    }
-
-
-def validar_datos_generados():
-    """Valida que los datos generados sean consistentes"""
-
-    print("🔍 Validando datos generados...")
-
-    kpis = KPIGanadoBovinoModel.objects.all().order_by("fecha")
-
-    if not kpis.exists():
-        print("❌ No se encontraron datos de KPI")
-        return False
-
-    errores_criticos = []
-    advertencias = []
-
-    for kpi in kpis:
-        # Validar porcentajes (errores críticos)
-        if kpi.porcentaje_aprobacion < 0 or kpi.porcentaje_aprobacion > 100:
-            errores_criticos.append(
-                f"Porcentaje de aprobación inválido: {kpi.porcentaje_aprobacion}"
-            )
-
-        if kpi.tasa_exito_logos < 0 or kpi.tasa_exito_logos > 100:
-            errores_criticos.append(
-                f"Tasa de éxito de logos inválida: {kpi.tasa_exito_logos}"
-            )
-
-        # Validar valores negativos (errores críticos)
-        if kpi.marcas_registradas_mes < 0:
-            errores_criticos.append(
-                f"Marcas registradas negativas: {kpi.marcas_registradas_mes}"
-            )
-
-        if kpi.ingresos_mes < 0:
-            errores_criticos.append(f"Ingresos negativos: {kpi.ingresos_mes}")
-
-        # Validar consistencia de distribución (solo advertencias)
-        total_propositos = (
-            kpi.marcas_carne
-            + kpi.marcas_leche
-            + kpi.marcas_doble_proposito
-            + kpi.marcas_reproduccion
-        )
-
-        if abs(total_propositos - kpi.marcas_registradas_mes) > 2:
-            advertencias.append(
-                f"Distribución por propósito: {total_propositos} vs {kpi.marcas_registradas_mes}"
-            )
-
-        total_departamentos = (
-            kpi.marcas_santa_cruz
-            + kpi.marcas_beni
-            + kpi.marcas_la_paz
-            + kpi.marcas_otros_departamentos
-        )
-
-        if abs(total_departamentos - kpi.marcas_registradas_mes) > 2:
-            advertencias.append(
-                f"Distribución geográfica: {total_departamentos} vs {kpi.marcas_registradas_mes}"
-            )
-
-    if errores_criticos:
-        print("❌ Se encontraron errores críticos en los datos:")
-        for error in errores_criticos:
-            print(f"  - {error}")
-        return False
-
-    if advertencias:
-        print("⚠️ Advertencias (no críticas):")
-        for advertencia in advertencias:
-            print(f"  - {advertencia}")
-
-    print("✅ Todos los datos son válidos")
-    return True
-
-
-def mostrar_estadisticas():
-    """Muestra estadísticas de los datos generados"""
-
-    print("\n📊 Estadísticas de los datos generados:")
-
-    kpis = KPIGanadoBovinoModel.objects.all().order_by("fecha")
-
-    if not kpis.exists():
-        print("No hay datos para mostrar")
-        return
-
-    # Estadísticas generales
-    total_kpis = kpis.count()
-    aprobacion_promedio = kpis.aggregate(avg=models.Avg("porcentaje_aprobacion"))["avg"]
-    ingresos_promedio = kpis.aggregate(avg=models.Avg("ingresos_mes"))["avg"]
-    marcas_promedio = kpis.aggregate(avg=models.Avg("marcas_registradas_mes"))["avg"]
-
-    print(f"📈 Total de registros KPI: {total_kpis}")
-    print(f"📊 Aprobación promedio: {aprobacion_promedio:.1f}%")
-    print(f"💰 Ingresos promedio: Bs. {ingresos_promedio:,.2f}")
-    print(f"🏷️ Marcas promedio por mes: {marcas_promedio:.1f}")
-
-    # Último registro
-    ultimo_kpi = kpis.last()
-    print(f"\n🎯 Último registro ({ultimo_kpi.fecha}):")
-    print(f"  - Marcas registradas: {ultimo_kpi.marcas_registradas_mes}")
-    print(f"  - Tiempo promedio: {ultimo_kpi.tiempo_promedio_procesamiento:.1f}h")
-    print(f"  - Aprobación: {ultimo_kpi.porcentaje_aprobacion:.1f}%")
-    print(f"  - Ingresos: Bs. {ultimo_kpi.ingresos_mes:,.2f}")
-    print(f"  - Éxito logos: {ultimo_kpi.tasa_exito_logos:.1f}%")
-
-
-def main():
-    """Función principal del script"""
-
-    print("🚀 Iniciando generación de datos de KPI realistas...")
-
-    try:
-        # Generar datos
-        cantidad_generados = generar_datos_kpi_realistas()
-
-        # Validar datos
-        if validar_datos_generados():
-            # Mostrar estadísticas
-            mostrar_estadisticas()
-
-            print(f"\n✅ Proceso completado exitosamente!")
-            print(f"📊 Se generaron {cantidad_generados} registros de KPI realistas")
-            print("🔧 Los problemas de cálculo han sido corregidos")
-
-        else:
-            print("❌ Se encontraron errores en la validación")
-            return 1
-
-    except Exception as e:
-        print(f"❌ Error durante la generación: {e}")
-        import traceback
-
-        traceback.print_exc()
-        return 1
-
-    return 0
-
-
-if __name__ == "__main__":
-    exit_code = main()
-    sys.exit(exit_code)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Perfil de arranque en frío de un worker web (python -X importtime)
+Responsabilidad: Medir qué módulos pesan al arrancar y verificar el presupuesto
+
+Cada medición corre en un proceso nuevo que importa ganaderia_bi.wsgi y resuelve
+las URLs, como un worker antes de su primer request. Con --verificar termina
+con código 1 si el arranque supera ARRANQUE_MAX_SEGUNDOS o
+ARRANQUE_MAX_MEMORIA_MB, o si carga algún módulo de ARRANQUE_MODULOS_DIFERIDOS.
+
+Uso:
+    python scripts/perfil_arranque.py --top 25
+    python scripts/perfil_arranque.py --verificar --repeticiones 5
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Se ejecuta en el proceso medido; la última línea de stdout es el resultado
+ARRANQUE = """
+import json, resource, sys
+from ganaderia_bi.wsgi import application
+from django.conf import settings
+from django.urls import get_resolver
+
+get_resolver().url_patterns
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    "memoria_mb": rss / (1024 * 1024 if sys.platform == "darwin" else 1024),
+    "cargados": [m for m in settings.ARRANQUE_MODULOS_DIFERIDOS if m in sys.modules],
+    "max_segundos": settings.ARRANQUE_MAX_SEGUNDOS,
+    "max_memoria_mb": settings.ARRANQUE_MAX_MEMORIA_MB,
+    "modulos": len(sys.modules),
+}))
+"""
+
+LINEA_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def arrancar(importtime=False):
+    """Arranca un worker en un proceso nuevo y retorna (segundos, resultado, stderr)"""
+    comando = [sys.executable]
+    if importtime:
+        comando += ["-X", "importtime"]
+    entorno = dict(os.environ)
+    entorno.setdefault("DJANGO_SETTINGS_MODULE", "ganaderia_bi.settings")
+    entorno["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [RAIZ, entorno.get("PYTHONPATH")])
+    )
+
+    inicio = time.perf_counter()
+    proceso = subprocess.run(
+        comando + ["-c", ARRANQUE],
+        cwd=RAIZ,
+        env=entorno,
+        capture_output=True,
+        text=True,
+    )
+    segundos = time.perf_counter() - inicio
+    if proceso.returncode != 0:
+        sys.exit(f"❌ El worker no arrancó:\n{proceso.stderr[-2000:]}")
+    resultado = json.loads(proceso.stdout.strip().splitlines()[-1])
+    return segundos, resultado, proceso.stderr
+
+
+def paquete(modulo):
+    """apps.analytics.<capa> para el código propio; el paquete raíz para el resto"""
+    partes = modulo.split(".")
+    return ".".join(partes[:3]) if partes[0] == "apps" else partes[0]
+
+
+def perfilar(top):
+    """Muestra los módulos y paquetes que más tardan en importarse"""
+    segundos, resultado, stderr = arrancar(importtime=True)
+    filas = []
+    for linea in stderr.splitlines():
+        coincidencia = LINEA_IMPORTTIME.match(linea)
+        if coincidencia:
+            propio, acumulado, sangria, modulo = coincidencia.groups()
+            filas.append((int(acumulado), int(propio), len(sangria) // 2, modulo))
+
+    por_paquete = defaultdict(int)
+    for _, propio, _, modulo in filas:
+        por_paquete[paquete(modulo)] += propio
+    total = sum(acumulado for acumulado, _, nivel, _ in filas if nivel == 0)
+
+    print(
+        f"🔄 Arranque con -X importtime: {segundos:.2f} s de pared, "
+        f"{total / 1000:.0f} ms importando {len(filas)} módulos, "
+        f"{resultado['memoria_mb']:.0f} MB"
+    )
+    print(f"\n📦 Paquetes por tiempo propio (top {top})")
+    for nombre, propio in sorted(por_paquete.items(), key=lambda x: -x[1])[:top]:
+        print(f"   {propio / 1000:8.1f} ms  {nombre}")
+    print(f"\n🐢 Módulos por tiempo acumulado (top {top})")
+    for acumulado, propio, nivel, modulo in sorted(filas, reverse=True)[:top]:
+        print(
+            f"   {acumulado / 1000:8.1f} ms  (propio {propio / 1000:6.1f})  "
+            f"{'  ' * nivel}{modulo}"
+        )
+    if resultado["cargados"]:
+        print(f"\n⚠️ Dependencias pesadas cargadas: {', '.join(resultado['cargados'])}")
+
+
+def verificar(repeticiones):
+    """Compara la mediana de varios arranques con el presupuesto configurado"""
+    mediciones = [arrancar() for _ in range(repeticiones)]
+    segundos = statistics.median(m[0] for m in mediciones)
+    memoria = statistics.median(m[1]["memoria_mb"] for m in mediciones)
+    resultado = mediciones[-1][1]
+
+    print(f"🔄 {repeticiones} arranques en frío ({resultado['modulos']} módulos)")
+    print(f"   Tiempo:  {segundos:.2f} s (máx. {resultado['max_segundos']} s)")
+    print(f"   Memoria: {memoria:.0f} MB (máx. {resultado['max_memoria_mb']} MB)")
+
+    errores = []
+    if segundos > resultado["max_segundos"]:
+        errores.append(f"tiempo de arranque {segundos:.2f} s")
+    if memoria > resultado["max_memoria_mb"]:
+        errores.append(f"memoria residente {memoria:.0f} MB")
+    if resultado["cargados"]:
+        errores.append(
+            f"importa al arrancar {', '.join(resultado['cargados'])} "
+            "(importarlos dentro de la función que los usa)"
+        )
+    if errores:
+        print("\n❌ Presupuesto de arranque excedido:")
+        for error in errores:
+            print(f"   - {error}")
+        return 1
+    print("\n✅ Arranque dentro del presupuesto")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--verificar", action="store_true")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.verificar:
+        sys.exit(verificar(args.repeticiones))
+    perfilar(args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,14 +9,14 @@ import sys
 from pathlib import Path
 
 
-def run_script(script_name, description):
-    """Ejecuta un script y muestra el resultado"""
+def run_script(arguments, description):
+    """Ejecuta un script (ruta y argumentos) y muestra el resultado"""
     print(f"\n🔧 {description}...")
-    print(f"📁 Ejecutando: {script_name}")
+    print(f"📁 Ejecutando: {' '.join(arguments)}")
 
     try:
         result = subprocess.run(
-            [sys.executable, f"scripts/{script_name}"],
+            [sys.executable, *arguments],
             capture_output=True,
             text=True,
             cwd=Path.cwd(),
@@ -33,7 +33,7 @@ def run_script(script_name, description):
             return False
 
     except Exception as e:
-        print(f"❌ Error ejecutando {script_name}: {e}")
+        print(f"❌ Error ejecutando {arguments[0]}: {e}")
         return False
 
     return True
@@ -74,15 +74,24 @@ def main():
 
     # Lista de scripts a ejecutar en orden
     scripts = [
-        ("create_db_simple.py", "Creando base de datos y usuario"),
-        ("create_tables.py", "Creando tablas"),
-        ("insert_test_data_fixed.py", "Insertando datos de prueba"),
+        (["scripts/create_db_simple.py"], "Creando base de datos y usuario"),
+        (["scripts/create_tables.py"], "Creando tablas"),
+        (
+            [
+                "manage.py",
+                "generar_datos_analytics",
+                "--marcas",
+                "100",
+                "--sin-auditoria",
+            ],
+            "Insertando datos de prueba",
+        ),
     ]
 
     # Ejecutar cada script
-    for script_name, description in scripts:
-        if not run_script(script_name, description):
-            print(f"\n❌ Error en {script_name}. Deteniendo proceso.")
+    for arguments, description in scripts:
+        if not run_script(arguments, description):
+            print(f"\n❌ Error en {arguments[0]}. Deteniendo proceso.")
             return False
 
     # Probar conexión final
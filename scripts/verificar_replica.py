@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Verificación del enrutamiento de lecturas a la réplica
+Responsabilidad: Comprobar con dos bases SQLite (primaria y réplica) que el
+router y LecturaReplicaMiddleware envían cada consulta a la base correcta
+
+La réplica es una copia del archivo de la primaria recién migrada, como la
+dejaría la replicación. Cada consulta se atribuye al alias que la ejecutó. Se
+comprueba que:
+- las lecturas marcadas con @lectura_replica van a la réplica;
+- las lecturas después de una escritura, o dentro de una transacción, van a
+  la primaria;
+- la cookie de escritura mantiene en la primaria las lecturas de los
+  requests siguientes, y sin ella vuelven a la réplica.
+
+Termina con código 1 si alguna comprobación falla.
+
+Uso:
+    python scripts/verificar_replica.py
+"""
+
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+
+import django
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def configurar_django(directorio):
+    """Primaria y réplica SQLite en `directorio`; retorna (primaria, réplica)"""
+    sys.path.append(RAIZ)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ganaderia_bi.settings")
+    from django.conf import settings
+
+    primaria = os.path.join(directorio, "primaria.sqlite3")
+    replica = os.path.join(directorio, "replica.sqlite3")
+    settings.DATABASES = {
+        "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": primaria},
+        settings.DB_REPLICA_ALIAS: {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": replica,
+        },
+    }
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.DEBUG = False
+    settings.LOGGING = {"version": 1, "disable_existing_loggers": False}
+    settings.CONSULTAS_LENTAS_UMBRAL_MS = 0
+    django.setup()
+    return primaria, replica
+
+
+def replicar(primaria, replica):
+    """Migra la primaria y copia su archivo como réplica"""
+    from django.contrib.auth import get_user_model
+    from django.core.management import call_command
+    from django.db import connections
+
+    call_command("migrate", verbosity=0)
+    # MarcaGanadoBovinoModel registra su creación en LogEntry con user_id=3
+    get_user_model().objects.create(id=3, username="auditoria")
+    connections.close_all()
+    shutil.copyfile(primaria, replica)
+
+
+class RegistroConsultas:
+    """Alias de la base que ejecutó cada consulta"""
+
+    def __init__(self):
+        self.alias = []
+
+    def instalar(self):
+        from django.db import connections
+
+        for conexion in connections.all():
+            conexion.execute_wrappers.append(self._envoltura(conexion.alias))
+
+    def _envoltura(self, alias):
+        def registrar(execute, sql, params, many, context):
+            self.alias.append(alias)
+            return execute(sql, params, many, context)
+
+        return registrar
+
+    def bases(self, funcion, *args):
+        """Conjunto de alias usados por funcion(*args)"""
+        from django.core.cache import cache
+
+        cache.clear()
+        self.alias = []
+        funcion(*args)
+        return set(self.alias)
+
+
+class Verificacion:
+    """Comprobaciones del router y del middleware"""
+
+    def __init__(self, registro):
+        from django.conf import settings
+        from django.db import DEFAULT_DB_ALIAS
+
+        from apps.analytics.infrastructure.repositories import DjangoMarcaRepository
+
+        self.registro = registro
+        self.repositorio = DjangoMarcaRepository()
+        self.primaria = {DEFAULT_DB_ALIAS}
+        self.replica = {settings.DB_REPLICA_ALIAS}
+        self.numeros = itertools.count(1)
+        self.fallas = []
+
+    def comprobar(self, descripcion, obtenido, esperado):
+        if obtenido == esperado:
+            print(f"   ✅ {descripcion}: {_formato(obtenido)}")
+            return
+        print(
+            f"   ❌ {descripcion}: {_formato(obtenido)} "
+            f"(se esperaba {_formato(esperado)})"
+        )
+        self.fallas.append(descripcion)
+
+    def leer(self):
+        self.repositorio.obtener_estadisticas()
+
+    def escribir(self):
+        from apps.analytics.domain.entities.marca_ganado_bovino import (
+            MarcaGanadoBovino,
+        )
+
+        self.repositorio.crear(
+            MarcaGanadoBovino(
+                numero_marca=f"REPLICA-{next(self.numeros):04d}",
+                nombre_productor="Productor de prueba",
+                fecha_registro=datetime.now(),
+                cantidad_cabezas=10,
+                municipio="Montero",
+                ci_productor="1234567",
+            )
+        )
+
+    def sin_request(self):
+        from django.db import transaction
+
+        from apps.analytics.infrastructure.db import en_replica
+        from apps.analytics.infrastructure.models import MarcaGanadoBovinoModel
+
+        print("\n🔀 Sin request (comandos y hilos)")
+        bases = self.registro.bases
+        self.comprobar("Lectura marcada", bases(self.leer), self.replica)
+        self.comprobar(
+            "Lectura sin marcar",
+            bases(MarcaGanadoBovinoModel.objects.count),
+            self.primaria,
+        )
+
+        def escribir_y_leer():
+            with en_replica():
+                self.escribir()
+                self.registro.alias = []
+                self.leer()
+
+        self.comprobar(
+            "Lectura después de escribir", bases(escribir_y_leer), self.primaria
+        )
+        self.comprobar("Lectura en un bloque nuevo", bases(self.leer), self.replica)
+
+        def leer_en_transaccion():
+            with transaction.atomic():
+                self.leer()
+
+        self.comprobar(
+            "Lectura en una transacción", bases(leer_en_transaccion), self.primaria
+        )
+
+    def con_requests(self):
+        from django.http import HttpResponse
+        from django.test import RequestFactory
+
+        from apps.analytics.presentation.middleware.replica_middleware import (
+            COOKIE_ESCRITURA,
+            LecturaReplicaMiddleware,
+        )
+
+        print("\n🌐 Requests con LecturaReplicaMiddleware")
+        fabrica = RequestFactory()
+
+        def vista(request):
+            if request.method == "POST":
+                self.escribir()
+                # Solo cuentan las lecturas posteriores a la escritura
+                self.registro.alias = []
+            self.leer()
+            return HttpResponse()
+
+        middleware = LecturaReplicaMiddleware(vista)
+
+        def atender(request):
+            self.registro.alias = []
+            respuesta = middleware(request)
+            return respuesta, set(self.registro.alias)
+
+        respuesta, bases = atender(fabrica.get("/"))
+        self.comprobar("GET sin escrituras previas", bases, self.replica)
+        self.comprobar(
+            "GET sin escrituras deja la cookie",
+            COOKIE_ESCRITURA in respuesta.cookies,
+            False,
+        )
+
+        respuesta, bases = atender(fabrica.post("/"))
+        self.comprobar("Lectura después de escribir en el POST", bases, self.primaria)
+        cookie = respuesta.cookies.get(COOKIE_ESCRITURA)
+        self.comprobar("POST que escribe deja la cookie", cookie is not None, True)
+
+        siguiente = fabrica.get("/")
+        if cookie:
+            siguiente.COOKIES[COOKIE_ESCRITURA] = cookie.value
+        _, bases = atender(siguiente)
+        self.comprobar("GET siguiente con la cookie", bases, self.primaria)
+
+        _, bases = atender(fabrica.get("/"))
+        self.comprobar("GET sin la cookie", bases, self.replica)
+
+
+def _formato(valor):
+    if isinstance(valor, bool):
+        return "sí" if valor else "no"
+    return ", ".join(sorted(valor)) or "ninguna"
+
+
+def main():
+    with tempfile.TemporaryDirectory(prefix="verificar_replica_") as directorio:
+        primaria, replica = configurar_django(directorio)
+        replicar(primaria, replica)
+
+        registro = RegistroConsultas()
+        registro.instalar()
+        verificacion = Verificacion(registro)
+        print("⏱️ Verificando el enrutamiento a la réplica con dos bases SQLite")
+        verificacion.sin_request()
+        verificacion.con_requests()
+
+        from django.db import connections
+
+        connections.close_all()
+
+    if verificacion.fallas:
+        print(f"\n❌ {len(verificacion.fallas)} comprobaciones fallaron")
+        sys.exit(1)
+    print("\n✅ Enrutamiento a la réplica correcto")
+
+
+if __name__ == "__main__":
+    main()
@@ -78,6 +78,14 @@ def main():
             "command": "python -c \"from apps.analytics.infrastructure.container.main_container import Container; c = Container(); print('✅ Container inicializado correctamente')\"",
             "description": "Verificando inicialización del container",
         },
+        {
+            "command": "python scripts/perfil_arranque.py --verificar",
+            "description": "Verificando presupuesto de arranque del worker web",
+        },
+        {
+            "command": "python scripts/verificar_replica.py",
+            "description": "Verificando enrutamiento de lecturas a la réplica",
+        },
         {
             "command": "python -c \"from apps.analytics.domain.entities.marca_ganado_bovino import MarcaGanadoBovino; from apps.analytics.domain.enums import EstadoMarca; m = MarcaGanadoBovino('TEST', 'Test', 'Test', 'Test', 100, EstadoMarca.PENDIENTE); print('✅ Entidad de dominio creada correctamente')\"",
             "description": "Verificando creación de entidades de dominio",